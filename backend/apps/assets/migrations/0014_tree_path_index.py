@@ -0,0 +1,56 @@
+# Generated by Django 5.0.1 on 2026-10-16 20:20
+
+from django.db import migrations, models
+
+
+def _backfill_tree_paths(model):
+    """Fill tree_path level by level, starting from the roots."""
+    rows = list(model.objects.values_list('id', 'parent_id'))
+    children_map = {}
+    for node_id, parent_id in rows:
+        children_map.setdefault(parent_id, []).append(node_id)
+
+    updates = []
+    known_ids = {node_id for node_id, _ in rows}
+    frontier = [
+        (node_id, f'/{node_id.hex}/')
+        for node_id, parent_id in rows
+        if parent_id is None or parent_id not in known_ids
+    ]
+    while frontier:
+        updates.extend(frontier)
+        frontier = [
+            (child_id, f'{path}{child_id.hex}/')
+            for node_id, path in frontier
+            for child_id in children_map.get(node_id, [])
+        ]
+
+    objs = [model(id=node_id, tree_path=path) for node_id, path in updates]
+    model.objects.bulk_update(objs, ['tree_path'], batch_size=500)
+
+
+def backfill_tree_paths(apps, schema_editor):
+    _backfill_tree_paths(apps.get_model('assets', 'AssetCategory'))
+    _backfill_tree_paths(apps.get_model('assets', 'Location'))
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0013_rename_asset_tag_org_code_idx_asset_tags_organiz_3ee556_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assetcategory',
+            name='tree_path',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, help_text='Materialized ancestor id path (e.g., /<root id>/<node id>/)', max_length=1000),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='tree_path',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, help_text='Materialized ancestor id path (e.g., /<root id>/<node id>/)', max_length=1000),
+        ),
+        migrations.RunPython(backfill_tree_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.1 on 2026-10-16 21:55
+
+from django.db import migrations
+
+
+def create_legacy_code_counter(apps, schema_editor):
+    """Create the row Asset.generate_legacy_codes locks while allocating codes."""
+    SequenceRule = apps.get_model('system', 'SequenceRule')
+    if SequenceRule._base_manager.filter(
+        code='LEGACY_ASSET_CODE', organization__isnull=True
+    ).exists():
+        return
+    SequenceRule._base_manager.create(
+        code='LEGACY_ASSET_CODE',
+        name='Legacy asset code counter',
+        prefix='ZC',
+        reset_period='monthly',
+        is_active=False,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0014_tree_path_index'),
+        ('system', '0054_rename_tag_assignme_organiz_28e2da_idx_tag_assignm_organiz_a460fa_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_legacy_code_counter, migrations.RunPython.noop),
+    ]
@@ -5,6 +5,7 @@ from django.db import models
 from django.db.models import Q
 from django.core.validators import MinValueValidator
 from apps.common.models import BaseModel
+from apps.common.mixins.tree_path import TreePathMixin
 from apps.common.mixins.workflow_status import WorkflowStatusMixin
 
 
@@ -15,13 +16,20 @@ def _fallback_status_label(value):
     return str(value).replace('_', ' ').title()
 
 
-class AssetCategory(BaseModel):
+class AssetCategory(BaseModel, TreePathMixin):
     """
     Asset Category Model
 
     Supports hierarchical tree structure with parent-child relationships.
     System categories (is_custom=False) are predefined; users can create custom categories.
     """
+    TREE_NODE_FIELDS = (
+        'id', 'parent_id', 'code', 'name', 'full_name', 'level', 'is_custom',
+        'depreciation_method', 'default_useful_life', 'residual_rate',
+        'sort_order', 'is_active',
+    )
+    TREE_NODE_ORDERING = ('sort_order', 'code')
+
     # Basic Information
     code = models.CharField(
         max_length=50,
@@ -122,52 +130,37 @@ class AssetCategory(BaseModel):
         Returns hierarchical tree structure with nested children.
         Includes is_leaf and asset_count for each category.
         """
-        categories = cls.objects.filter(
-            organization_id=organization_id,
-            is_deleted=False
-        ).order_by('sort_order', 'code')
-
-        # Build tree structure
-        from collections import defaultdict
-        children_map = defaultdict(list)
-        root_categories = []
-
-        for cat in categories:
-            if cat.parent_id:
-                children_map[cat.parent_id].append(cat)
-            else:
-                root_categories.append(cat)
-
-        def build_tree(category):
-            """Recursively build tree with children."""
-            # Get children for this category
-            children = children_map.get(category.id, [])
-
-            # Count assets in this category (non-deleted only)
-            asset_count = category.assets.filter(is_deleted=False).count()
-
-            data = {
-                'id': category.id,
-                'code': category.code,
-                'name': category.name,
-                'full_name': category.full_name,
-                'level': category.level,
-                'is_custom': category.is_custom,
-                'depreciation_method': category.depreciation_method,
-                'default_useful_life': category.default_useful_life,
-                'residual_rate': category.residual_rate,
-                'sort_order': category.sort_order,
-                'is_active': category.is_active,
+        nodes = cls.get_cached_tree_nodes(organization_id)
+
+        # Direct asset counts for every category in one GROUP BY
+        asset_counts = dict(
+            Asset.all_objects.filter(
+                organization_id=organization_id,
+                is_deleted=False,
+                asset_category_id__isnull=False,
+            ).order_by().values('asset_category_id').annotate(
+                total=models.Count('id')
+            ).values_list('asset_category_id', 'total')
+        )
+
+        def serialize(node, children):
+            return {
+                'id': node['id'],
+                'code': node['code'],
+                'name': node['name'],
+                'full_name': node['full_name'],
+                'level': node['level'],
+                'is_custom': node['is_custom'],
+                'depreciation_method': node['depreciation_method'],
+                'default_useful_life': node['default_useful_life'],
+                'residual_rate': node['residual_rate'],
+                'sort_order': node['sort_order'],
+                'is_active': node['is_active'],
                 'is_leaf': len(children) == 0,  # True if no children
-                'asset_count': asset_count,  # Count of assets in this category
-                'children': []
+                'asset_count': asset_counts.get(node['id'], 0),  # Count of assets in this category
             }
-            # Add children recursively
-            for child in children:
-                data['children'].append(build_tree(child))
-            return data
 
-        return [build_tree(cat) for cat in root_categories]
+        return cls.build_nested_tree(nodes, serialize)
 
     def can_delete(self):
         """
@@ -226,13 +219,16 @@ class Supplier(BaseModel):
         return f"{self.code} - {self.name}"
 
 
-class Location(BaseModel):
+class Location(BaseModel, TreePathMixin):
     """
     Location (Storage Place) Model
 
     Inherits from BaseModel, supports tree structure for
     building > floor > room hierarchy.
     """
+    TREE_NODE_FIELDS = ('id', 'parent_id', 'name', 'path', 'level', 'location_type')
+    TREE_NODE_ORDERING = ('path',)
+
     class Meta:
         db_table = 'locations'
         verbose_name = 'Location'
@@ -536,6 +532,9 @@ class Asset(BaseModel):
             models.Index(fields=['organization', 'department']),
         ]
 
+    # Inactive global SequenceRule whose row lock serializes the legacy code fallback
+    LEGACY_CODE_RULE = 'LEGACY_ASSET_CODE'
+
     # ========== Basic Information ==========
     asset_code = models.CharField(
         max_length=50,
@@ -777,16 +776,56 @@ class Asset(BaseModel):
             )
         except Exception:
             # Fallback to legacy generation if service fails
-            from django.utils import timezone
-            prefix = timezone.now().strftime('%Y%m')
-            last_asset = Asset.all_objects.filter(
-                asset_code__startswith=f"ZC{prefix}"
-            ).order_by('-asset_code').first()
-            if last_asset:
-                seq = int(last_asset.asset_code[-4:]) + 1
-            else:
-                seq = 1
-            return f"ZC{prefix}{seq:04d}"
+            return self.generate_legacy_codes(1)[0]
+
+    @classmethod
+    def generate_legacy_codes(cls, count):
+        """
+        Generate `count` consecutive codes with the legacy ZC + YYYYMM + NNNN scheme.
+
+        Used when no ASSET_CODE sequence rule applies. Allocation runs under
+        a row lock on the global LEGACY_CODE_RULE counter, which remembers
+        the codes handed out this month, and continues after the highest
+        existing code of the month compared by its full numeric suffix.
+        """
+        from django.db import transaction
+        from django.db.models.functions import Length
+        from django.utils import timezone
+        from apps.system.models import SequenceRule
+
+        now = timezone.now()
+        prefix = f"ZC{now:%Y%m}"
+        with transaction.atomic():
+            counters = SequenceRule.all_objects.select_for_update().filter(
+                code=cls.LEGACY_CODE_RULE, organization__isnull=True
+            ).order_by('created_at', 'pk')
+            counter = counters.first()
+            if counter is None:
+                # Normally created by migration assets.0015
+                SequenceRule.all_objects.create(
+                    code=cls.LEGACY_CODE_RULE,
+                    name='Legacy asset code counter',
+                    prefix='ZC',
+                    reset_period='monthly',
+                    is_active=False,
+                )
+                counter = counters.first()
+
+            # Longer suffixes are larger numbers; equal lengths sort numerically
+            last_code = cls.all_objects.filter(
+                asset_code__regex=rf'^{prefix}[0-9]+$'
+            ).order_by(
+                Length('asset_code').desc(), '-asset_code'
+            ).values_list('asset_code', flat=True).first()
+            last_value = int(last_code[len(prefix):]) if last_code else 0
+            if counter.last_reset_date and f"{counter.last_reset_date:%Y%m}" == f"{now:%Y%m}":
+                last_value = max(last_value, counter.current_value)
+
+            counter.current_value = last_value + count
+            counter.last_reset_date = now.date()
+            counter.save(update_fields=['current_value', 'last_reset_date', 'updated_at'])
+
+        return [f"{prefix}{seq:04d}" for seq in range(last_value + 1, last_value + count + 1)]
 
     def _generate_qr_code(self):
         """Generate QR code content (UUID)."""
@@ -803,16 +842,23 @@ class Asset(BaseModel):
         """Get estimated residual value."""
         return float(self.purchase_price) * float(self.residual_rate) / 100
 
-    def get_status_label(self, lang=None):
+    def get_status_label(self, lang=None, label_map=None):
         """
         Get status display label from Dictionary.
 
         Args:
             lang: Language code ('zh' or 'en')
+            label_map: Optional ASSET_STATUS label map from
+                DictionaryService.get_label_map, shared across a response
 
         Returns:
             Localized status label
         """
+        if label_map is not None:
+            label = label_map.get(self.asset_status)
+            if label and label != self.asset_status:
+                return label
+            return _fallback_status_label(self.asset_status)
         try:
             from apps.system.services import DictionaryService
             from django.utils.translation import get_language
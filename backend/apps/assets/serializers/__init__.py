@@ -22,6 +22,7 @@ from .asset import (
     AssetStatusSerializer,
     AssetSerializer,
     AssetBulkImportSerializer,
+    AssetImportRowSerializer,
     AssetBulkExportSerializer,
 )
 from .operation import (
@@ -91,6 +92,7 @@ __all__ = [
     'AssetStatusSerializer',
     'AssetSerializer',
     'AssetBulkImportSerializer',
+    'AssetImportRowSerializer',
     'AssetBulkExportSerializer',
     'AssetTagSummarySerializer',
     'TagGroupSerializer',
@@ -18,13 +18,37 @@ from apps.assets.models import (
     Supplier,
     Location,
     AssetStatusLog,
-    Asset
+    Asset,
+    AssetCategory
 )
+from apps.organizations.models import Department
 from .tag import AssetTagSummarySerializer
 
 User = get_user_model()
 
 
+def get_asset_status_label(serializer, asset):
+    """
+    Resolve an asset status label with one dictionary lookup per response.
+
+    The ASSET_STATUS label map is memoized in the serializer context, which
+    list serializers share across all rows.
+    """
+    from apps.system.services import DictionaryService
+
+    label_maps = serializer.context.setdefault('_asset_status_label_maps', {})
+    label_map = label_maps.get(asset.organization_id)
+    if label_map is None:
+        try:
+            label_map = DictionaryService.get_label_map(
+                'ASSET_STATUS', organization_id=asset.organization_id
+            )
+        except Exception:
+            label_map = {}
+        label_maps[asset.organization_id] = label_map
+    return asset.get_status_label(label_map=label_map)
+
+
 def serialize_asset_tags(asset):
     """Serialize active asset tags with tag-group metadata."""
     relations = getattr(asset, 'prefetched_asset_tag_relations', None)
@@ -214,7 +238,7 @@ class AssetListSerializer(BaseListSerializer):
 
     def get_asset_status_display(self, obj):
         """Get status label from DictionaryService."""
-        return obj.get_status_label()
+        return get_asset_status_label(self, obj)
 
     def get_tags(self, obj):
         """Return active asset tags for list rendering."""
@@ -311,7 +335,7 @@ class AssetDetailSerializer(BaseModelWithAuditSerializer):
 
     def get_asset_status_display(self, obj):
         """Get status label from DictionaryService."""
-        return obj.get_status_label()
+        return get_asset_status_label(self, obj)
 
     def get_tags(self, obj):
         """Return active asset tags for detail rendering."""
@@ -550,7 +574,7 @@ class AssetSerializer(BaseModelSerializer):
 
     def get_asset_status_display(self, obj):
         """Get status label from DictionaryService."""
-        return obj.get_status_label()
+        return get_asset_status_label(self, obj)
 
     def get_tags(self, obj):
         """Return active asset tags for generic CRUD payloads."""
@@ -563,20 +587,75 @@ class AssetBulkImportSerializer(serializers.Serializer):
     """
     Serializer for bulk asset import.
 
-    Accepts a list of asset objects for batch creation.
+    Accepts a list of asset objects for batch creation. Only the batch
+    envelope is validated here; rows are validated by AssetImportService
+    with AssetImportRowSerializer, and errors are reported per row
+    instead of rejecting the whole batch.
     """
 
     assets = serializers.ListField(
-        child=AssetCreateSerializer(),
+        child=serializers.DictField(),
         allow_empty=False
     )
 
     def validate_assets(self, value):
         """Ensure batch is not empty and within size limit."""
+        from apps.assets.services.import_service import AssetImportService
+
         if not value:
             raise serializers.ValidationError("Asset list cannot be empty.")
-        if len(value) > 1000:
-            raise serializers.ValidationError("Maximum 1000 assets per batch.")
+        if len(value) > AssetImportService.MAX_ROWS:
+            raise serializers.ValidationError(
+                f"Maximum {AssetImportService.MAX_ROWS} assets per batch."
+            )
+        return value
+
+
+class PreloadedRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key field resolved from instances preloaded into the context.
+
+    Reads ``context['references'][field_name][pk]`` instead of querying,
+    so many rows can be validated against one query per reference type.
+    """
+
+    def to_internal_value(self, data):
+        references = self.context.get('references', {}).get(self.field_name, {})
+        instance = references.get(data)
+        if instance is None:
+            self.fail('does_not_exist', pk_value=data)
+        return instance
+
+
+class AssetImportRowSerializer(AssetCreateSerializer):
+    """
+    Per-row validation for bulk asset import.
+
+    Applies the AssetCreateSerializer rules (field lengths, decimal
+    precision, organization scoping of references) to one import row.
+    References must be preloaded by AssetImportService; units are
+    validated by the service once per batch.
+    """
+
+    asset_category = PreloadedRelatedField(queryset=AssetCategory.objects.none())
+    supplier = PreloadedRelatedField(
+        queryset=Supplier.objects.none(), required=False, allow_null=True
+    )
+    location = PreloadedRelatedField(
+        queryset=Location.objects.none(), required=False, allow_null=True
+    )
+    department = PreloadedRelatedField(
+        queryset=Department.objects.none(), required=False, allow_null=True
+    )
+    custodian = PreloadedRelatedField(
+        queryset=User.objects.none(), required=False, allow_null=True
+    )
+    user = PreloadedRelatedField(
+        queryset=User.objects.none(), required=False, allow_null=True
+    )
+
+    def validate_unit(self, value):
+        """Units are checked against the UNIT dictionary per batch."""
         return value
 
 
@@ -8,6 +8,9 @@ from .asset_service import (
     AssetStatusLogService,
     AssetService,
 )
+from .export_service import AssetExportService
+from .import_service import AssetImportService
+from .qr_service import AssetQRCodeService
 from .lifecycle_coordinator import AssetLifecycleCoordinatorService
 from .operation_service import (
     AssetPickupService,
@@ -23,6 +26,9 @@ __all__ = [
     'LocationService',
     'AssetStatusLogService',
     'AssetService',
+    'AssetImportService',
+    'AssetExportService',
+    'AssetQRCodeService',
     'AssetLifecycleCoordinatorService',
     'AssetPickupService',
     'AssetTransferService',
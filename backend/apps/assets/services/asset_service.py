@@ -8,10 +8,8 @@ Provides:
 - QR code lookup
 """
 from typing import Dict, List, Optional, Any
-from django.db import transaction
 from django.db.models import Q, QuerySet, Sum, Count, F, DecimalField
 from django.db.models.functions import Coalesce
-from django.core.exceptions import ValidationError
 from apps.common.services.base_crud import BaseCRUDService
 from apps.assets.models import (
     Asset,
@@ -64,44 +62,19 @@ class LocationService(BaseCRUDService):
         Returns:
             List of location tree nodes with nested children
         """
-        locations = self.model_class.objects.filter(
-            organization_id=organization_id,
-            is_deleted=False
-        ).order_by('path')
-
-        # Build tree structure
-        from collections import defaultdict
-        children_map = defaultdict(list)
-        root_locations = []
-
-        for loc in locations:
-            if loc.parent_id:
-                children_map[loc.parent_id].append(loc)
-            else:
-                root_locations.append(loc)
-
-        def build_tree(location):
-            """Recursively build tree with children."""
-            data = {
-                'id': location.id,
-                'name': location.name,
-                'path': location.path,
-                'level': location.level,
-                'location_type': location.location_type,
-                'has_children': False,
-                'children': []
-            }
+        nodes = self.model_class.get_cached_tree_nodes(organization_id)
 
-            # Add children recursively
-            children = children_map.get(location.id, [])
-            if children:
-                data['has_children'] = True
-                for child in children:
-                    data['children'].append(build_tree(child))
-
-            return data
+        def serialize(node, children):
+            return {
+                'id': node['id'],
+                'name': node['name'],
+                'path': node['path'],
+                'level': node['level'],
+                'location_type': node['location_type'],
+                'has_children': bool(children),
+            }
 
-        return [build_tree(loc) for loc in root_locations]
+        return self.model_class.build_nested_tree(nodes, serialize)
 
     def get_by_path(self, path: str, organization_id: str) -> Optional[Location]:
         """
@@ -319,23 +292,10 @@ class AssetService(BaseCRUDService):
             QuerySet of matching assets
         """
         if include_children:
-            # Get all descendant category IDs
+            # Single prefix match on the category path index
             from apps.assets.models import AssetCategory
-            category_ids = [category_id]
-
-            def get_descendant_ids(cat_id):
-                children = AssetCategory.objects.filter(
-                    parent_id=cat_id,
-                    is_deleted=False
-                ).values_list('id', flat=True)
-                for child_id in children:
-                    category_ids.append(child_id)
-                    get_descendant_ids(child_id)
-
-            get_descendant_ids(category_id)
-
             return self.model_class.objects.filter(
-                asset_category_id__in=category_ids,
+                AssetCategory.descendant_filter('asset_category', category_id),
                 organization_id=organization_id,
                 is_deleted=False
             )
@@ -385,22 +345,9 @@ class AssetService(BaseCRUDService):
             QuerySet of matching assets
         """
         if include_children:
-            # Get all descendant location IDs
-            location_ids = [location_id]
-
-            def get_descendant_ids(loc_id):
-                children = Location.objects.filter(
-                    parent_id=loc_id,
-                    is_deleted=False
-                ).values_list('id', flat=True)
-                for child_id in children:
-                    location_ids.append(child_id)
-                    get_descendant_ids(child_id)
-
-            get_descendant_ids(location_id)
-
+            # Single prefix match on the location path index
             return self.model_class.objects.filter(
-                location_id__in=location_ids,
+                Location.descendant_filter('location', location_id),
                 organization_id=organization_id,
                 is_deleted=False
             )
@@ -441,9 +388,13 @@ class AssetService(BaseCRUDService):
         try:
             from apps.system.services import DictionaryService
             status_items = DictionaryService.get_items('ASSET_STATUS', organization_id=organization_id)
+            status_counts = dict(
+                queryset.order_by().values('asset_status').annotate(
+                    count=Count('id')
+                ).values_list('asset_status', 'count')
+            )
             for item in status_items:
-                count = queryset.filter(asset_status=item['code']).count()
-                by_status[item['name']] = count
+                by_status[item['name']] = status_counts.get(item['code'], 0)
         except Exception:
             # Fallback if dictionary service fails
             pass
@@ -480,7 +431,6 @@ class AssetService(BaseCRUDService):
             'by_category': by_category
         }
 
-    @transaction.atomic
     def bulk_create(
         self,
         assets_data: List[Dict],
@@ -490,6 +440,12 @@ class AssetService(BaseCRUDService):
         """
         Bulk create assets.
 
+        Delegates to AssetImportService, which resolves references and
+        reserves codes once per batch and inserts rows with bulk_create.
+        Each chunk commits in its own transaction, so a large import does
+        not hold one long transaction and rows of committed chunks stay
+        imported if a later chunk fails.
+
         Args:
             assets_data: List of asset data dictionaries
             user: User creating the assets
@@ -498,44 +454,27 @@ class AssetService(BaseCRUDService):
         Returns:
             Dictionary with bulk operation results
         """
-        results = []
-        succeeded = 0
-        failed = 0
-
-        for data in assets_data:
-            try:
-                # Auto-set organization
-                data['organization_id'] = organization_id
-
-                # Create asset
-                asset = self.create(data, user)
-                results.append({
-                    'success': True,
-                    'asset_code': asset.asset_code,
-                    'id': str(asset.id)
-                })
-                succeeded += 1
-            except ValidationError as e:
-                results.append({
-                    'success': False,
-                    'error': str(e),
-                    'data': data
-                })
-                failed += 1
-            except Exception as e:
-                results.append({
-                    'success': False,
-                    'error': str(e),
-                    'data': data
-                })
-                failed += 1
+        from apps.assets.services.import_service import AssetImportService
+        return AssetImportService().import_assets(assets_data, user, organization_id)
 
-        return {
-            'total': len(assets_data),
-            'succeeded': succeeded,
-            'failed': failed,
-            'results': results
-        }
+    def reserve_asset_codes(self, count: int, organization_id: str) -> List[str]:
+        """
+        Reserve `count` asset codes from the ASSET_CODE sequence at once.
+
+        Falls back to the legacy ZC + YYYYMM scheme when no sequence rule
+        applies, mirroring Asset._generate_asset_code.
+        """
+        if count <= 0:
+            return []
+        try:
+            from apps.system.services import SequenceService
+            return SequenceService.reserve_values(
+                'ASSET_CODE',
+                count,
+                organization_id=organization_id
+            )
+        except Exception:
+            return Asset.generate_legacy_codes(count)
 
     def search_assets(
         self,
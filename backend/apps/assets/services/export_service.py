@@ -0,0 +1,275 @@
+"""
+Streaming export engine for assets.
+
+Rows are read with ``.values().iterator()`` and written straight into a
+write-only openpyxl workbook (or CSV), so memory stays bounded by the
+chunk size instead of the number of exported assets. Small exports are
+returned in the response; large ones run as a Celery job that stores the
+file as a SystemFile and notifies the requesting user.
+"""
+import csv
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from apps.assets.models import Asset
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for streaming CSV."""
+
+    def write(self, value):
+        return value
+
+
+def _decimal_value(value) -> float:
+    return float(value) if value else 0
+
+
+def _date_value(value) -> str:
+    return value.strftime('%Y-%m-%d') if value else ''
+
+
+def _datetime_value(value) -> str:
+    return value.strftime('%Y-%m-%d %H:%M:%S') if value else ''
+
+
+class AssetExportService:
+    """Service for exporting assets to XLSX or CSV."""
+
+    FORMAT_XLSX = 'xlsx'
+    FORMAT_CSV = 'csv'
+    CONTENT_TYPES = {
+        FORMAT_XLSX: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        FORMAT_CSV: 'text/csv',
+    }
+
+    # Rows fetched per database round trip
+    CHUNK_SIZE = 2000
+    # Exports above this row count run as a background job
+    SYNC_ROW_LIMIT = 5000
+    # Spooled response buffer before spilling to a temporary file
+    SPOOL_MAX_SIZE = 10 * 1024 * 1024
+
+    DEFAULT_COLUMNS = [
+        'asset_code', 'asset_name', 'specification', 'brand', 'model',
+        'serial_number', 'asset_category', 'supplier', 'department',
+        'location', 'custodian', 'asset_status', 'purchase_date',
+        'original_value', 'net_value', 'useful_life', 'created_at'
+    ]
+
+    # Column -> (header, source fields, formatter, width)
+    COLUMNS: Dict[str, tuple] = {
+        'asset_code': ('Asset Code', ('asset_code',), None, 20),
+        'asset_name': ('Asset Name', ('asset_name',), None, 30),
+        'specification': ('Specification', ('specification',), None, 25),
+        'brand': ('Brand', ('brand',), None, 15),
+        'model': ('Model', ('model',), None, 15),
+        'serial_number': ('Serial Number', ('serial_number',), None, 20),
+        'asset_category': ('Category', ('asset_category__name',), None, 20),
+        'supplier': ('Supplier', ('supplier__name',), None, 25),
+        'department': ('Department', ('department__name',), None, 20),
+        'location': ('Location', ('location__path',), None, 30),
+        'custodian': ('Custodian', ('custodian__username',), None, 15),
+        'asset_status': ('Status', ('asset_status',), None, 12),
+        'purchase_date': ('Purchase Date', ('purchase_date',), _date_value, 14),
+        'original_value': ('Original Value', ('purchase_price',), _decimal_value, 15),
+        'net_value': (
+            'Net Value',
+            ('purchase_price', 'accumulated_depreciation'),
+            lambda price, depreciation: float(price or 0) - float(depreciation or 0),
+            15
+        ),
+        'useful_life': ('Useful Life (months)', ('useful_life',), lambda value: value or 0, 12),
+        'created_at': ('Created At', ('created_at',), _datetime_value, 20),
+    }
+
+    def get_queryset(
+        self,
+        organization_id: str,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> QuerySet:
+        """Build the export queryset for an organization and optional filters."""
+        queryset = Asset.all_objects.filter(
+            organization_id=organization_id,
+            is_deleted=False
+        )
+        filters = filters or {}
+        for field in ('asset_status', 'asset_category_id', 'department_id', 'location_id'):
+            if filters.get(field):
+                queryset = queryset.filter(**{field: filters[field]})
+        return queryset.order_by('id')
+
+    def normalize_columns(self, columns: Optional[List[str]]) -> List[str]:
+        """Keep known columns in requested order, falling back to defaults."""
+        columns = [column for column in (columns or []) if column in self.COLUMNS]
+        return columns or list(self.DEFAULT_COLUMNS)
+
+    def iter_rows(
+        self,
+        queryset: QuerySet,
+        columns: List[str],
+        organization_id=None
+    ) -> Iterator[List[Any]]:
+        """Yield formatted rows, reading the queryset in server-side chunks."""
+        source_fields = []
+        for column in columns:
+            for field in self.COLUMNS[column][1]:
+                if field not in source_fields:
+                    source_fields.append(field)
+
+        status_labels: Dict[str, str] = {}
+        if 'asset_status' in columns:
+            from apps.system.services import DictionaryService
+            status_labels = DictionaryService.get_label_map(
+                'ASSET_STATUS', organization_id=organization_id
+            )
+
+        extractors: List[Callable[[Dict[str, Any]], Any]] = []
+        for column in columns:
+            _, fields, formatter, _ = self.COLUMNS[column]
+            if column == 'asset_status':
+                extractors.append(
+                    lambda row: status_labels.get(row['asset_status'], row['asset_status'] or '')
+                )
+            elif formatter is None:
+                extractors.append(lambda row, field=fields[0]: row[field] or '')
+            else:
+                extractors.append(
+                    lambda row, fields=fields, formatter=formatter: formatter(
+                        *(row[field] for field in fields)
+                    )
+                )
+
+        for row in queryset.values(*source_fields).iterator(chunk_size=self.CHUNK_SIZE):
+            yield [extract(row) for extract in extractors]
+
+    def write_xlsx(
+        self,
+        queryset: QuerySet,
+        columns: List[str],
+        target: IO[bytes],
+        organization_id=None
+    ) -> int:
+        """
+        Write assets into a write-only workbook.
+
+        Column widths are fixed per column (write-only sheets cannot be
+        measured after the fact) and the header style is shared by all
+        header cells.
+
+        Returns:
+            Number of data rows written
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Font, PatternFill
+        from openpyxl.utils import get_column_letter
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Assets')
+        for index, column in enumerate(columns, 1):
+            worksheet.column_dimensions[get_column_letter(index)].width = self.COLUMNS[column][3]
+
+        header_font = Font(bold=True, size=11)
+        header_fill = PatternFill(start_color='CCE5FF', end_color='CCE5FF', fill_type='solid')
+        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(worksheet, value=self.COLUMNS[column][0])
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            header.append(cell)
+        worksheet.append(header)
+
+        count = 0
+        for row in self.iter_rows(queryset, columns, organization_id):
+            worksheet.append(row)
+            count += 1
+
+        workbook.save(target)
+        return count
+
+    def write_csv(
+        self,
+        queryset: QuerySet,
+        columns: List[str],
+        target: IO[str],
+        organization_id=None
+    ) -> int:
+        """Write assets as CSV; returns the number of data rows written."""
+        writer = csv.writer(target)
+        writer.writerow([self.COLUMNS[column][0] for column in columns])
+        count = 0
+        for row in self.iter_rows(queryset, columns, organization_id):
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def stream_csv(
+        self,
+        queryset: QuerySet,
+        columns: List[str],
+        organization_id=None
+    ) -> Iterator[str]:
+        """Yield CSV lines for a StreamingHttpResponse."""
+        writer = csv.writer(_Echo())
+        yield '\ufeff' + writer.writerow([self.COLUMNS[column][0] for column in columns])
+        for row in self.iter_rows(queryset, columns, organization_id):
+            yield writer.writerow(row)
+
+    def build_filename(self, file_format: str) -> str:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f'assets_export_{timestamp}.{file_format}'
+
+    def export_to_file(
+        self,
+        organization_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        file_format: str = FORMAT_XLSX,
+        user_id: Optional[str] = None
+    ):
+        """
+        Export assets into media storage and register a SystemFile.
+
+        Returns:
+            Tuple of (SystemFile, row count)
+        """
+        from apps.system.models import SystemFile
+        from apps.system.services.file_storage import FileStorageService
+
+        storage = FileStorageService()
+        columns = self.normalize_columns(columns)
+        queryset = self.get_queryset(organization_id, filters)
+        filename = self.build_filename(file_format)
+        storage_path = storage.get_storage_path(filename)
+        full_path = os.path.join(storage.upload_root, storage_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+        if file_format == self.FORMAT_CSV:
+            with open(full_path, 'w', newline='', encoding='utf-8-sig') as target:
+                count = self.write_csv(queryset, columns, target, organization_id)
+        else:
+            with open(full_path, 'wb') as target:
+                count = self.write_xlsx(queryset, columns, target, organization_id)
+
+        system_file = SystemFile.all_objects.create(
+            organization_id=organization_id,
+            created_by_id=user_id,
+            file_name=filename,
+            file_path=storage_path,
+            file_size=os.path.getsize(full_path),
+            file_type=self.CONTENT_TYPES[file_format],
+            file_extension=f'.{file_format}',
+            biz_type='asset_export',
+            description=f'Asset export ({count} rows)',
+        )
+        return system_file, count
+
+    def get_download_url(self, system_file) -> str:
+        return f"{getattr(settings, 'MEDIA_URL', '/media/')}{system_file.file_path}"
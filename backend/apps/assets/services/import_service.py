@@ -0,0 +1,480 @@
+"""
+Staged bulk import engine for assets.
+
+Imports large asset batches (e.g. migration spreadsheets) without
+per-row service calls:
+- Rows are normalized and validated in one pass
+- Foreign keys are resolved with one query per reference type and each
+  row is checked with AssetImportRowSerializer against those instances
+- Asset codes are reserved from the sequence in a single lock
+- Assets are inserted with chunked bulk_create
+- One batched search-index refresh is queued at the end
+
+Batches above SYNC_MAX_ROWS run in import_assets_task, which reports
+progress through the cache (get_progress).
+"""
+import uuid
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.apps import apps as django_apps
+from django.core.cache import cache
+from django.db import DatabaseError, models, transaction
+
+from apps.assets.models import Asset
+
+
+class AssetImportService:
+    """Service for staged bulk asset import with a per-row error report."""
+
+    # Rows inserted per transaction
+    CHUNK_SIZE = 1000
+    BULK_BATCH_SIZE = 500
+    MAX_ROWS = 50000
+    # Larger batches are imported by a Celery job instead of the web request
+    SYNC_MAX_ROWS = 1000
+
+    PROGRESS_CACHE_PREFIX = 'gzeams:asset_import'
+    PROGRESS_TIMEOUT = 24 * 60 * 60
+
+    REQUIRED_FIELDS = ('asset_name', 'purchase_price', 'purchase_date')
+
+    # Reference field -> (model label, natural key used by import files)
+    REFERENCE_FIELDS = {
+        'asset_category': ('assets.AssetCategory', 'code'),
+        'location': ('assets.Location', 'path'),
+        'department': ('organizations.Department', 'code'),
+        'supplier': ('assets.Supplier', 'code'),
+        'custodian': ('accounts.User', 'username'),
+        'user': ('accounts.User', 'username'),
+    }
+
+    TEXT_FIELDS = (
+        'asset_code', 'asset_name', 'specification', 'brand', 'model', 'unit',
+        'serial_number', 'supplier_order_no', 'invoice_no', 'asset_status',
+        'rfid_code', 'remarks',
+    )
+    DECIMAL_FIELDS = ('purchase_price', 'residual_rate')
+    DATE_FIELDS = ('purchase_date', 'depreciation_start_date')
+    INTEGER_FIELDS = ('useful_life',)
+    JSON_FIELDS = ('images', 'attachments', 'custom_fields')
+
+    def import_assets(
+        self,
+        rows: List[Dict[str, Any]],
+        user,
+        organization_id: str,
+        chunk_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Import asset rows.
+
+        Reference fields accept a model instance, a primary key
+        (``asset_category`` / ``asset_category_id``) or the natural key
+        (``asset_category_code``, ``location_path``, ``department_code``,
+        ``supplier_code``, ``custodian_username``, ``user_username``).
+
+        Args:
+            rows: List of asset row dictionaries
+            user: User performing the import
+            organization_id: Organization UUID
+            chunk_size: Rows inserted per transaction
+            progress_callback: Called with (inserted rows handled, valid rows)
+                after each chunk
+
+        Returns:
+            Dictionary with total/succeeded/failed counts and per-row results
+        """
+        if len(rows) > self.MAX_ROWS:
+            raise ValueError(f'Maximum {self.MAX_ROWS} assets per import.')
+
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        errors: Dict[int, Dict[str, str]] = {}
+
+        parsed = [self._parse_row(index, row, errors) for index, row in enumerate(rows)]
+        references = self._resolve_references(parsed, rows, organization_id, errors)
+        self._validate_codes(parsed, errors)
+        self._validate_units(parsed, organization_id, errors)
+        self._validate_rows(parsed, references, organization_id, errors)
+
+        valid_indexes = [index for index in range(len(rows)) if index not in errors]
+        self._assign_asset_codes(parsed, valid_indexes, organization_id)
+
+        created_by_id = getattr(user, 'id', None)
+        created: Dict[int, Asset] = {}
+        for start in range(0, len(valid_indexes), chunk_size):
+            chunk = [
+                (index, self._build_asset(parsed[index], organization_id, created_by_id))
+                for index in valid_indexes[start:start + chunk_size]
+            ]
+            created.update(self._insert_chunk(chunk, errors))
+            if progress_callback:
+                progress_callback(start + len(chunk), len(valid_indexes))
+
+        if created:
+            self._schedule_search_refresh([str(asset.id) for asset in created.values()])
+
+        results = []
+        for index, row in enumerate(rows):
+            if index in created:
+                asset = created[index]
+                results.append({
+                    'row': index,
+                    'success': True,
+                    'asset_code': asset.asset_code,
+                    'id': str(asset.id),
+                })
+            else:
+                row_errors = errors.get(index, {})
+                results.append({
+                    'row': index,
+                    'success': False,
+                    'errors': row_errors,
+                    'error': '; '.join(
+                        f'{field}: {message}' for field, message in row_errors.items()
+                    ),
+                    'data': row,
+                })
+
+        return {
+            'total': len(rows),
+            'succeeded': len(created),
+            'failed': len(rows) - len(created),
+            'results': results,
+        }
+
+    # ---- Background job progress ----
+
+    @classmethod
+    def _progress_key(cls, task_id: str) -> str:
+        return f'{cls.PROGRESS_CACHE_PREFIX}:{task_id}'
+
+    @classmethod
+    def set_progress(cls, task_id: str, organization_id: str, status: str, **state) -> None:
+        """Store the state of a background import job."""
+        cache.set(cls._progress_key(task_id), {
+            'task_id': task_id,
+            'organization_id': str(organization_id),
+            'status': status,
+            **state,
+        }, cls.PROGRESS_TIMEOUT)
+
+    @classmethod
+    def get_progress(cls, task_id: str, organization_id: str) -> Optional[Dict[str, Any]]:
+        """Get the state of a background import job of the organization."""
+        progress = cache.get(cls._progress_key(task_id))
+        if not progress or progress['organization_id'] != str(organization_id):
+            return None
+        return progress
+
+    # ---- Stage 1: parsing and field validation ----
+
+    def _parse_row(
+        self,
+        index: int,
+        row: Dict[str, Any],
+        errors: Dict[int, Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Normalize scalar fields of one row and record field errors."""
+        parsed: Dict[str, Any] = {}
+        row_errors: Dict[str, str] = {}
+
+        for field in self.TEXT_FIELDS:
+            value = row.get(field)
+            if value not in (None, ''):
+                parsed[field] = str(value).strip()
+
+        for field in self.DECIMAL_FIELDS:
+            value = row.get(field)
+            if value in (None, ''):
+                continue
+            try:
+                parsed[field] = Decimal(str(value))
+            except (InvalidOperation, ValueError):
+                row_errors[field] = 'A valid number is required.'
+
+        for field in self.DATE_FIELDS:
+            value = row.get(field)
+            if value in (None, ''):
+                continue
+            parsed_date = self._parse_date(value)
+            if parsed_date is None:
+                row_errors[field] = 'Date must be in YYYY-MM-DD format.'
+            else:
+                parsed[field] = parsed_date
+
+        for field in self.INTEGER_FIELDS:
+            value = row.get(field)
+            if value in (None, ''):
+                continue
+            try:
+                parsed[field] = int(value)
+            except (TypeError, ValueError):
+                row_errors[field] = 'A valid integer is required.'
+
+        for field in self.JSON_FIELDS:
+            if row.get(field) is not None:
+                parsed[field] = row[field]
+
+        for field in self.REQUIRED_FIELDS:
+            if field not in parsed and field not in row_errors:
+                row_errors[field] = 'This field is required.'
+
+        price = parsed.get('purchase_price')
+        if price is not None and price < 0:
+            row_errors['purchase_price'] = 'Purchase price cannot be negative.'
+
+        if row_errors:
+            errors.setdefault(index, {}).update(row_errors)
+        return parsed
+
+    def _parse_date(self, value) -> Optional[date]:
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        try:
+            return datetime.strptime(str(value).strip()[:10], '%Y-%m-%d').date()
+        except ValueError:
+            return None
+
+    # ---- Stage 2: reference resolution ----
+
+    def _reference_value(
+        self,
+        row: Dict[str, Any],
+        field: str,
+        natural_key: str
+    ) -> Optional[Tuple[str, Any]]:
+        """Get ('pk', id) or ('key', natural key) for a reference field."""
+        value = row.get(field)
+        if isinstance(value, models.Model):
+            return 'pk', value.pk
+        if value in (None, ''):
+            value = row.get(f'{field}_id')
+        if value not in (None, ''):
+            try:
+                return 'pk', uuid.UUID(str(value))
+            except ValueError:
+                return 'key', str(value).strip()
+        key_value = row.get(f'{field}_{natural_key}')
+        if key_value not in (None, ''):
+            return 'key', str(key_value).strip()
+        return None
+
+    def _resolve_references(
+        self,
+        parsed: List[Dict[str, Any]],
+        rows: List[Dict[str, Any]],
+        organization_id: str,
+        errors: Dict[int, Dict[str, str]]
+    ) -> Dict[str, Dict[Any, models.Model]]:
+        """
+        Resolve every reference field with one query per field.
+
+        Natural keys matching more than one record (e.g. a location path
+        shared by two locations) are rejected as ambiguous.
+
+        Returns:
+            {field: {pk: instance}} of the referenced records
+        """
+        references: Dict[str, Dict[Any, models.Model]] = {}
+        for field, (model_label, natural_key) in self.REFERENCE_FIELDS.items():
+            requested = {}
+            for index, row in enumerate(rows):
+                reference = self._reference_value(row, field, natural_key)
+                if reference is not None:
+                    requested[index] = reference
+
+            if not requested:
+                if field == 'asset_category':
+                    for index in range(len(rows)):
+                        errors.setdefault(index, {})['asset_category'] = 'This field is required.'
+                continue
+
+            pks = {value for kind, value in requested.values() if kind == 'pk'}
+            keys = {value for kind, value in requested.values() if kind == 'key'}
+            model_class = django_apps.get_model(model_label)
+            lookup = models.Q(pk__in=pks) | models.Q(**{f'{natural_key}__in': keys})
+            matches = model_class.objects.filter(lookup)
+            if hasattr(model_class, 'is_deleted'):
+                matches = matches.filter(is_deleted=False)
+            if model_label != 'accounts.User':
+                matches = matches.filter(organization_id=organization_id)
+
+            by_pk = {}
+            by_key = {}
+            ambiguous = set()
+            for instance in matches:
+                by_pk[instance.pk] = instance
+                key = getattr(instance, natural_key)
+                if key in by_key:
+                    ambiguous.add(key)
+                by_key[key] = instance.pk
+            references[field] = by_pk
+
+            label = field.replace('_', ' ')
+            for index in range(len(rows)):
+                reference = requested.get(index)
+                if reference is None:
+                    if field == 'asset_category':
+                        errors.setdefault(index, {})[field] = 'This field is required.'
+                    continue
+                kind, value = reference
+                if kind == 'key' and value in ambiguous:
+                    errors.setdefault(index, {})[field] = (
+                        f'Ambiguous {label}: {value} matches more than one record.'
+                    )
+                    continue
+                resolved = value if kind == 'pk' and value in by_pk else by_key.get(value)
+                if resolved is None:
+                    errors.setdefault(index, {})[field] = f'Unknown {label}: {value}'
+                else:
+                    parsed[index][f'{field}_id'] = resolved
+        return references
+
+    # ---- Stage 3: batch-level validation ----
+
+    def _validate_codes(
+        self,
+        parsed: List[Dict[str, Any]],
+        errors: Dict[int, Dict[str, str]]
+    ) -> None:
+        """Reject asset codes duplicated within the batch or already in use."""
+        seen = {}
+        for index, row in enumerate(parsed):
+            code = row.get('asset_code')
+            if not code:
+                continue
+            if code in seen:
+                errors.setdefault(index, {})['asset_code'] = (
+                    f'Duplicate asset code in import: {code}'
+                )
+            else:
+                seen[code] = index
+
+        if not seen:
+            return
+        existing = set(
+            Asset.all_objects.filter(asset_code__in=list(seen)).values_list('asset_code', flat=True)
+        )
+        for code in existing:
+            errors.setdefault(seen[code], {})['asset_code'] = f'Asset code already exists: {code}'
+
+    def _validate_units(
+        self,
+        parsed: List[Dict[str, Any]],
+        organization_id: str,
+        errors: Dict[int, Dict[str, str]]
+    ) -> None:
+        """Validate units against the UNIT dictionary with one lookup."""
+        units = {row['unit'] for row in parsed if row.get('unit')}
+        if not units:
+            return
+        from apps.system.services import DictionaryService
+        valid_units = set(DictionaryService.get_label_map('UNIT', organization_id=organization_id))
+        for index, row in enumerate(parsed):
+            unit = row.get('unit')
+            if unit and unit not in valid_units:
+                errors.setdefault(index, {})['unit'] = (
+                    f'Invalid unit code: {unit}. Please use a value from UNIT dictionary.'
+                )
+
+    def _validate_rows(
+        self,
+        parsed: List[Dict[str, Any]],
+        references: Dict[str, Dict[Any, models.Model]],
+        organization_id: str,
+        errors: Dict[int, Dict[str, str]]
+    ) -> None:
+        """Run the asset create rules on each remaining row without queries."""
+        from apps.assets.serializers import AssetImportRowSerializer
+
+        context = {'organization_id': organization_id, 'references': references}
+        reference_fields = [f'{field}_id' for field in self.REFERENCE_FIELDS]
+        for index, data in enumerate(parsed):
+            if index in errors:
+                continue
+            payload = {
+                field: value for field, value in data.items()
+                if field not in reference_fields
+            }
+            for field in self.REFERENCE_FIELDS:
+                if f'{field}_id' in data:
+                    payload[field] = data[f'{field}_id']
+            serializer = AssetImportRowSerializer(data=payload, context=context)
+            if not serializer.is_valid():
+                errors[index] = {
+                    field: ' '.join(str(message) for message in messages)
+                    if isinstance(messages, list) else str(messages)
+                    for field, messages in serializer.errors.items()
+                }
+
+    # ---- Stage 4: code reservation and insert ----
+
+    def _assign_asset_codes(
+        self,
+        parsed: List[Dict[str, Any]],
+        valid_indexes: List[int],
+        organization_id: str
+    ) -> None:
+        """Reserve codes for all valid rows without one in a single sequence lock."""
+        from apps.assets.services.asset_service import AssetService
+
+        missing = [index for index in valid_indexes if not parsed[index].get('asset_code')]
+        codes = AssetService().reserve_asset_codes(len(missing), organization_id)
+        for index, code in zip(missing, codes):
+            parsed[index]['asset_code'] = code
+
+    def _build_asset(self, data: Dict[str, Any], organization_id: str, created_by_id) -> Asset:
+        """Build an unsaved Asset applying the defaults of Asset.save()."""
+        asset = Asset(
+            organization_id=organization_id,
+            created_by_id=created_by_id,
+            **data
+        )
+        if not asset.qr_code:
+            asset.qr_code = asset._generate_qr_code()
+        if not asset.depreciation_start_date and asset.purchase_date:
+            asset.depreciation_start_date = asset.purchase_date
+        return asset
+
+    def _insert_chunk(
+        self,
+        chunk: List[Tuple[int, Asset]],
+        errors: Dict[int, Dict[str, str]]
+    ) -> Dict[int, Asset]:
+        """
+        Insert one chunk with bulk_create.
+
+        If the chunk hits a database error (e.g. a concurrently created
+        code or a value the column rejects), rows are retried one by one
+        to isolate and report the failing rows.
+        """
+        try:
+            with transaction.atomic():
+                Asset.objects.bulk_create(
+                    [asset for _, asset in chunk], batch_size=self.BULK_BATCH_SIZE
+                )
+            return dict(chunk)
+        except DatabaseError:
+            pass
+
+        created = {}
+        for index, asset in chunk:
+            try:
+                with transaction.atomic():
+                    Asset.objects.bulk_create([asset])
+                created[index] = asset
+            except DatabaseError as exc:
+                errors.setdefault(index, {})['non_field_errors'] = str(exc).strip()
+        return created
+
+    def _schedule_search_refresh(self, asset_ids: List[str]) -> None:
+        """Queue one batched search-index sync once the import commits."""
+        from apps.search.signals import run_after_commit
+        from apps.search.tasks import sync_assets_batch_to_search_index
+
+        run_after_commit(lambda: sync_assets_batch_to_search_index.delay(asset_ids))
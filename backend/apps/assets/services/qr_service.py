@@ -0,0 +1,239 @@
+"""
+Bulk QR-code label generation for assets.
+
+The ZIP archive is written incrementally: each batch of entries is
+flushed to the client (or to a stored file) as soon as it is rendered.
+Streamed responses render in the web process; PNG rendering is CPU
+bound, so background jobs (write_zip) render large batches in a process
+pool. Rendered PNGs are cached by (asset id, payload) so reprints skip
+rendering entirely.
+"""
+import hashlib
+import io
+import multiprocessing
+import os
+import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from zipfile import ZIP_STORED, ZipFile
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
+
+from apps.assets.models import Asset
+from apps.common.utils.qr_code import render_qr_png
+
+
+def sanitize_filename(name: str) -> str:
+    r"""
+    Sanitize a string to be safe for use as a filename.
+
+    Removes or replaces characters that are invalid in Windows filenames:
+    < > : " / \ | ? *
+
+    Args:
+        name: The string to sanitize
+
+    Returns:
+        A sanitized string safe for use as a filename
+    """
+    # Replace invalid filename characters with underscore
+    invalid_chars = r'[<>:"/\\|?*]'
+    return re.sub(invalid_chars, '_', name)
+
+
+class _ZipStream(io.RawIOBase):
+    """Non-seekable sink that lets ZipFile output be drained chunk by chunk."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class AssetQRCodeService:
+    """Service for rendering asset QR codes and packaging them as ZIP files."""
+
+    CACHE_PREFIX = 'gzeams:asset_qr_png'
+    CACHE_TIMEOUT = 7 * 24 * 3600
+
+    # Assets rendered (and flushed into the ZIP) per round
+    BATCH_SIZE = 200
+    # Batches with fewer cache misses are rendered in-process
+    POOL_THRESHOLD = 100
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or getattr(
+            settings, 'QR_RENDER_WORKERS', min(4, os.cpu_count() or 1)
+        )
+        self.frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:5173')
+
+    def build_payload(self, asset_id) -> str:
+        """Build the QR payload (asset detail URL) for an asset."""
+        return f'{self.frontend_url}/assets/{asset_id}'
+
+    def get_cache_key(self, asset_id, payload: str) -> str:
+        digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+        return f'{self.CACHE_PREFIX}:{asset_id}:{digest}'
+
+    def get_png(self, asset_id) -> bytes:
+        """Get the QR PNG for one asset, rendering it on a cache miss."""
+        payload = self.build_payload(asset_id)
+        key = self.get_cache_key(asset_id, payload)
+        png = cache.get(key)
+        if png is None:
+            png = render_qr_png(payload)
+            cache.set(key, png, self.CACHE_TIMEOUT)
+        return png
+
+    @contextmanager
+    def _renderer(self, use_pool: bool = False):
+        """
+        Yield a render function for lists of payloads.
+
+        With use_pool, the process pool is only started once a batch has
+        enough cache misses to be worth it, so fully cached reprints never
+        spawn workers. Web requests never use the pool.
+        """
+        executor = None
+
+        def render(payloads: List[str]) -> List[bytes]:
+            nonlocal executor
+            if not use_pool or self.max_workers <= 1 or len(payloads) < self.POOL_THRESHOLD:
+                return [render_qr_png(payload) for payload in payloads]
+            if executor is None:
+                # spawn avoids forking a process that holds DB connections and locks
+                executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return list(executor.map(render_qr_png, payloads, chunksize=16))
+
+        try:
+            yield render
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _render_batch(self, batch: List[Tuple], render) -> List[Tuple[str, bytes]]:
+        """Render one batch of (id, code) rows, using and filling the cache."""
+        keyed = []
+        for asset_id, asset_code in batch:
+            payload = self.build_payload(asset_id)
+            keyed.append((self.get_cache_key(asset_id, payload), payload, asset_id, asset_code))
+
+        cached: Dict[str, bytes] = cache.get_many([key for key, _, _, _ in keyed])
+        missing = [(key, payload) for key, payload, _, _ in keyed if key not in cached]
+        if missing:
+            rendered = dict(zip(
+                (key for key, _ in missing),
+                render([payload for _, payload in missing])
+            ))
+            cache.set_many(rendered, self.CACHE_TIMEOUT)
+            cached.update(rendered)
+
+        return [
+            (f'QR_{sanitize_filename(asset_code or str(asset_id))}.png', cached[key])
+            for key, _, asset_id, asset_code in keyed
+        ]
+
+    def iter_entries(self, assets: QuerySet,
+                     use_pool: bool = False) -> Iterator[List[Tuple[str, bytes]]]:
+        """Yield batches of (filename, png) entries for the given assets."""
+        rows = assets.values_list('id', 'asset_code').order_by('asset_code', 'id')
+        with self._renderer(use_pool=use_pool) as render:
+            batch = []
+            for row in rows.iterator(chunk_size=self.BATCH_SIZE):
+                batch.append(row)
+                if len(batch) >= self.BATCH_SIZE:
+                    yield self._render_batch(batch, render)
+                    batch = []
+            if batch:
+                yield self._render_batch(batch, render)
+
+    def _write_entries(self, zip_file: ZipFile, entries: Iterable[Tuple[str, bytes]]) -> int:
+        count = 0
+        for filename, png in entries:
+            # PNG data is already compressed
+            zip_file.writestr(filename, png, compress_type=ZIP_STORED)
+            count += 1
+        return count
+
+    def stream_zip(self, assets: QuerySet) -> Iterator[bytes]:
+        """Yield the ZIP archive in chunks as batches are rendered in-process."""
+        sink = _ZipStream()
+        with ZipFile(sink, 'w') as zip_file:
+            for entries in self.iter_entries(assets):
+                self._write_entries(zip_file, entries)
+                yield sink.drain()
+        yield sink.drain()
+
+    def write_zip(self, assets: QuerySet, target) -> int:
+        """Write the ZIP archive to a file object (background jobs); returns the entry count."""
+        count = 0
+        with ZipFile(target, 'w') as zip_file:
+            for entries in self.iter_entries(assets, use_pool=True):
+                count += self._write_entries(zip_file, entries)
+        return count
+
+    @staticmethod
+    def parse_ids(ids: Iterable) -> List[str]:
+        """Normalize asset ids; raises ValueError for anything that is not a UUID."""
+        return [str(uuid.UUID(str(asset_id))) for asset_id in ids]
+
+    def get_assets(self, organization_id: str, ids: List[str]) -> QuerySet:
+        return Asset.all_objects.filter(
+            id__in=ids,
+            organization_id=organization_id,
+            is_deleted=False
+        )
+
+    def export_to_file(self, organization_id: str, ids: List[str], user_id: Optional[str] = None):
+        """
+        Write a QR ZIP into media storage and register a SystemFile.
+
+        Returns:
+            Tuple of (SystemFile, entry count)
+        """
+        from apps.system.models import SystemFile
+        from apps.system.services.file_storage import FileStorageService
+
+        storage = FileStorageService()
+        filename = 'asset_qr_codes.zip'
+        storage_path = storage.get_storage_path(filename)
+        full_path = os.path.join(storage.upload_root, storage_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+        with open(full_path, 'wb') as target:
+            count = self.write_zip(self.get_assets(organization_id, ids), target)
+
+        system_file = SystemFile.all_objects.create(
+            organization_id=organization_id,
+            created_by_id=user_id,
+            file_name=filename,
+            file_path=storage_path,
+            file_size=os.path.getsize(full_path),
+            file_type='application/zip',
+            file_extension='.zip',
+            biz_type='asset_qr_codes',
+            description=f'Asset QR codes ({count} labels)',
+        )
+        return system_file, count
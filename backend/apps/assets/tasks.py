@@ -0,0 +1,169 @@
+"""
+Celery tasks for asset background jobs.
+"""
+import logging
+from typing import Optional
+
+from celery import shared_task
+
+from apps.accounts.models import User
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, acks_late=True, max_retries=1, default_retry_delay=60)
+def export_assets_task(
+    self,
+    organization_id: str,
+    user_id: Optional[str] = None,
+    filters: Optional[dict] = None,
+    columns: Optional[list] = None,
+    file_format: str = 'xlsx',
+):
+    """
+    Export assets to a stored file and notify the requesting user.
+
+    Returns:
+        Dict with the SystemFile id, download URL and row count
+    """
+    from apps.assets.services.export_service import AssetExportService
+
+    service = AssetExportService()
+    system_file, count = service.export_to_file(
+        organization_id=organization_id,
+        filters=filters,
+        columns=columns,
+        file_format=file_format,
+        user_id=user_id,
+    )
+    download_url = service.get_download_url(system_file)
+
+    _notify_file_ready(
+        user_id,
+        system_file,
+        notification_type='asset_export_ready',
+        title=f'Asset export ready: {system_file.file_name}',
+        content=f'{count} assets exported. Download: {download_url}',
+        download_url=download_url,
+        row_count=count,
+    )
+
+    return {
+        'file_id': str(system_file.id),
+        'file_name': system_file.file_name,
+        'download_url': download_url,
+        'row_count': count,
+    }
+
+
+@shared_task(bind=True, acks_late=True, max_retries=1, default_retry_delay=60)
+def generate_qr_codes_task(self, organization_id: str, asset_ids: list,
+                           user_id: Optional[str] = None):
+    """
+    Render QR codes for many assets into a stored ZIP and notify the user.
+
+    Returns:
+        Dict with the SystemFile id, download URL and label count
+    """
+    from apps.assets.services.export_service import AssetExportService
+    from apps.assets.services.qr_service import AssetQRCodeService
+
+    system_file, count = AssetQRCodeService().export_to_file(
+        organization_id=organization_id,
+        ids=asset_ids,
+        user_id=user_id,
+    )
+    download_url = AssetExportService().get_download_url(system_file)
+
+    _notify_file_ready(
+        user_id,
+        system_file,
+        notification_type='asset_qr_codes_ready',
+        title='Asset QR codes ready',
+        content=f'{count} QR code labels generated. Download: {download_url}',
+        download_url=download_url,
+        row_count=count,
+    )
+
+    return {
+        'file_id': str(system_file.id),
+        'file_name': system_file.file_name,
+        'download_url': download_url,
+        'row_count': count,
+    }
+
+
+@shared_task(bind=True)
+def import_assets_task(self, organization_id: str, rows: list, user_id: Optional[str] = None):
+    """
+    Import a large asset batch, reporting progress through AssetImportService.get_progress.
+
+    Not retried: a redelivered batch would insert its rows a second time.
+
+    Returns:
+        Dict with total/succeeded/failed counts
+    """
+    from apps.assets.services.import_service import AssetImportService
+
+    service = AssetImportService()
+    task_id = self.request.id
+    user = User.all_objects.filter(id=user_id, is_deleted=False).first() if user_id else None
+
+    def report(processed, total):
+        service.set_progress(task_id, organization_id, 'running', total=total, processed=processed)
+
+    report(0, len(rows))
+    try:
+        result = service.import_assets(rows, user, organization_id, progress_callback=report)
+    except Exception:
+        logger.exception('Asset import failed. task_id=%s', task_id)
+        service.set_progress(
+            task_id, organization_id, 'failed', total=len(rows), error='Asset import failed.'
+        )
+        raise
+
+    summary = {
+        'total': result['total'],
+        'succeeded': result['succeeded'],
+        'failed': result['failed'],
+    }
+    service.set_progress(
+        task_id,
+        organization_id,
+        'completed',
+        processed=result['total'],
+        # Successful rows are not repeated; only failures need attention
+        results=[item for item in result['results'] if not item['success']],
+        **summary,
+    )
+    return summary
+
+
+def _notify_file_ready(user_id: Optional[str], system_file, notification_type: str,
+                       title: str, content: str, **variables):
+    """Send an inbox notification for a generated file (best effort)."""
+    if not user_id:
+        return
+
+    recipient = User.all_objects.filter(id=user_id, is_deleted=False).first()
+    if not recipient:
+        return
+
+    from apps.notifications.services import notification_service
+
+    try:
+        notification_service.send(
+            recipient=recipient,
+            notification_type=notification_type,
+            variables={
+                'title': title,
+                'content': content,
+                'file_id': str(system_file.id),
+                'file_name': system_file.file_name,
+                **variables,
+            },
+            channels=['inbox'],
+            sender=recipient,
+        )
+    except Exception as exc:
+        logger.warning('File notification failed for file %s: %s', system_file.id, exc)
@@ -581,8 +581,15 @@ class AssetAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response['Content-Type'], 'application/zip')
         self.assertIn('attachment', response['Content-Disposition'])
-        # Verify ZIP file content is returned
-        self.assertGreater(len(response.content), 0)
+        # Verify the streamed ZIP contains one PNG per asset
+        import io
+        from zipfile import ZipFile
+        archive = ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(
+            sorted(archive.namelist()),
+            [f'QR_TEST{unique_suffix}001.png', f'QR_TEST{unique_suffix}002.png']
+        )
+        self.assertTrue(archive.read(f'QR_TEST{unique_suffix}001.png').startswith(b'\x89PNG'))
 
     def test_bulk_qr_codes_empty_ids(self):
         """Test bulk QR code generation with empty ids array."""
@@ -619,6 +626,58 @@ class AssetAPITest(APITestCase):
         self.assertEqual(response.data['error']['code'], 'VALIDATION_ERROR')
         self.assertIn('Cannot generate more than', response.data['error']['message'])
 
+    def test_bulk_qr_codes_invalid_ids(self):
+        """Test that malformed ids are rejected before the ZIP stream starts."""
+        url = '/api/assets/bulk-qr-codes/'
+        data = {'ids': [str(uuid.uuid4()), 'not-a-uuid']}
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error']['code'], 'VALIDATION_ERROR')
+
+    def test_bulk_qr_codes_async_too_many_ids(self):
+        """Test that async bulk QR generation enforces its own cap."""
+        from apps.assets.viewsets.asset import MAX_ASYNC_BULK_QR_LIMIT
+
+        url = '/api/assets/bulk-qr-codes/'
+        too_many_ids = [str(uuid.uuid4()) for _ in range(MAX_ASYNC_BULK_QR_LIMIT + 1)]
+        response = self.client.post(url, {'ids': too_many_ids, 'async': True}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('Cannot generate more than', response.data['error']['message'])
+
+    def test_bulk_qr_codes_async_has_no_sync_limit(self):
+        """Test async bulk QR generation stores a ZIP beyond the sync limit."""
+        import os
+        import tempfile
+        from zipfile import ZipFile
+        from django.test import override_settings
+        from apps.system.models import SystemFile
+
+        asset = Asset.objects.create(
+            organization=self.org,
+            asset_category=self.category,
+            asset_name='Label Asset',
+            purchase_price=Decimal('1000.00'),
+            purchase_date='2024-01-01',
+            created_by=self.user
+        )
+        ids = [str(asset.id)] + [str(uuid.uuid4()) for _ in range(1000)]
+
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            response = self.client.post(
+                '/api/assets/bulk-qr-codes/',
+                {'ids': ids, 'async': True},
+                format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+            system_file = SystemFile.all_objects.get(
+                organization=self.org, biz_type='asset_qr_codes'
+            )
+            with ZipFile(os.path.join(media_root, system_file.file_path)) as archive:
+                self.assertEqual(archive.namelist(), [f'QR_{asset.asset_code}.png'])
+
     def test_bulk_qr_codes_filename_sanitization(self):
         """Test that asset codes with invalid characters are sanitized in filenames."""
         unique_suffix = uuid.uuid4().hex[:8]
@@ -641,7 +700,77 @@ class AssetAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response['Content-Type'], 'application/zip')
         # Verify ZIP file is generated successfully (sanitization worked)
-        self.assertGreater(len(response.content), 0)
+        self.assertGreater(len(b''.join(response.streaming_content)), 0)
+
+    def _create_export_assets(self):
+        Asset.objects.create(
+            organization=self.org,
+            asset_name='Export Laptop',
+            asset_category=self.category,
+            department=self.department,
+            location=self.location,
+            supplier=self.supplier,
+            custodian=self.user,
+            purchase_price=Decimal('1000.00'),
+            purchase_date='2024-01-01',
+            created_by=self.user
+        )
+
+    def test_export_assets_streams_xlsx(self):
+        """Test POST /api/assets/export/ returns a write-only workbook."""
+        import io
+        import openpyxl
+
+        self._create_export_assets()
+        response = self.client.post(
+            '/api/assets/export/',
+            {'columns': ['asset_name', 'department', 'location', 'supplier', 'net_value']},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        workbook = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+        rows = list(workbook['Assets'].iter_rows(values_only=True))
+        self.assertEqual(rows[0], ('Asset Name', 'Department', 'Location', 'Supplier', 'Net Value'))
+        self.assertEqual(
+            rows[1], ('Export Laptop', 'IT Department', 'Server Room', 'Dell Inc.', 1000)
+        )
+
+    def test_export_assets_streams_csv(self):
+        """Test CSV export is streamed row by row."""
+        self._create_export_assets()
+        response = self.client.post(
+            '/api/assets/export/',
+            {'columns': ['asset_name', 'purchase_date'], 'format': 'csv'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        self.assertEqual(
+            content.splitlines(), ['Asset Name,Purchase Date', 'Export Laptop,2024-01-01']
+        )
+
+    def test_export_assets_async_stores_file(self):
+        """Test async export stores a SystemFile instead of returning the file."""
+        import os
+        import tempfile
+        from django.test import override_settings
+        from apps.system.models import SystemFile
+
+        self._create_export_assets()
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            response = self.client.post(
+                '/api/assets/export/',
+                {'async': True, 'format': 'csv'},
+                format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(response.data['data']['row_count'], 1)
+
+            system_file = SystemFile.all_objects.get(organization=self.org, biz_type='asset_export')
+            self.assertTrue(os.path.exists(os.path.join(media_root, system_file.file_path)))
+            self.assertEqual(system_file.created_by_id, self.user.id)
 
     def tearDown(self):
         """Clean up after each test."""
@@ -651,6 +780,37 @@ class AssetAPITest(APITestCase):
         # Call parent tearDown for proper Django TestCase cleanup
         super().tearDown()
 
+    def test_bulk_import_above_sync_limit_runs_as_job(self):
+        """Test large imports are queued and report progress through the status endpoint."""
+        from unittest import mock
+        from apps.assets.services.import_service import AssetImportService
+
+        rows = [
+            {
+                'asset_name': 'Imported Laptop',
+                'asset_category': str(self.category.id),
+                'purchase_price': '1000.00',
+                'purchase_date': '2024-01-01',
+            },
+            {'asset_name': 'Missing Price', 'asset_category': str(self.category.id)},
+        ]
+        with mock.patch.object(AssetImportService, 'SYNC_MAX_ROWS', 1):
+            response = self.client.post(
+                '/api/assets/bulk-import/', {'assets': rows}, format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        task_id = response.data['data']['task_id']
+        progress = self.client.get(f'/api/assets/bulk-import/{task_id}/')
+        self.assertEqual(progress.status_code, status.HTTP_200_OK)
+        self.assertEqual(progress.data['data']['status'], 'completed')
+        self.assertEqual(progress.data['data']['succeeded'], 1)
+        self.assertEqual([item['row'] for item in progress.data['data']['results']], [1])
+        self.assertTrue(Asset.objects.filter(asset_name='Imported Laptop').exists())
+
+        missing = self.client.get(f'/api/assets/bulk-import/{uuid.uuid4()}/')
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
 
 class SupplierAPITest(APITestCase):
     """Test Supplier API endpoints."""
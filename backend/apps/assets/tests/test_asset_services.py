@@ -69,6 +69,205 @@ class AssetServiceTest(TestCase):
         self.assertTrue(asset.asset_code.startswith('ZC'))
         self.assertIsNotNone(asset.qr_code)
 
+    def test_bulk_create_reserves_codes_in_one_range(self):
+        """Bulk creation takes all missing asset codes from one reservation."""
+        from apps.system.models import SequenceRule
+
+        SequenceRule.objects.create(
+            code='ASSET_CODE',
+            name='Asset Code',
+            prefix='BK',
+            pattern='{PREFIX}{SEQ}',
+            seq_length=5,
+            reset_period='never',
+            organization=self.org
+        )
+        rows = [
+            {
+                'asset_name': f'Bulk Laptop {index}',
+                'asset_category': self.category,
+                'purchase_price': Decimal('1000.00'),
+                'purchase_date': '2024-01-01',
+            }
+            for index in range(3)
+        ]
+
+        result = self.service.bulk_create(rows, self.user, str(self.org.id))
+
+        self.assertEqual(result['succeeded'], 3)
+        self.assertEqual(
+            [item['asset_code'] for item in result['results']],
+            ['BK00001', 'BK00002', 'BK00003']
+        )
+
+    def test_legacy_codes_continue_past_four_digits_without_reuse(self):
+        """The legacy fallback compares full numeric suffixes and keeps a locked counter."""
+        from django.utils import timezone
+
+        prefix = f"ZC{timezone.now():%Y%m}"
+        for suffix in ('9999', '10000'):
+            Asset.objects.create(
+                organization=self.org,
+                asset_code=f'{prefix}{suffix}',
+                asset_name=f'Legacy {suffix}',
+                asset_category=self.category,
+                purchase_price=Decimal('100.00'),
+                purchase_date='2024-01-01',
+                created_by=self.user
+            )
+
+        first = self.service.reserve_asset_codes(2, str(self.org.id))
+        second = self.service.reserve_asset_codes(1, str(self.org.id))
+
+        self.assertEqual(first, [f'{prefix}10001', f'{prefix}10002'])
+        self.assertEqual(second, [f'{prefix}10003'])
+
+    def test_bulk_create_resolves_references_and_reports_row_errors(self):
+        """Bulk import resolves references by code and reports failed rows."""
+        from unittest.mock import patch
+
+        department = Department.objects.create(
+            organization=self.org,
+            code='OPS',
+            name='Operations',
+        )
+        location = Location.objects.create(
+            organization=self.org,
+            name='Warehouse A',
+            location_type='warehouse',
+        )
+        supplier = Supplier.objects.create(
+            organization=self.org,
+            code='SUP001',
+            name='Supplier One',
+        )
+        Asset.objects.create(
+            organization=self.org,
+            asset_code='EXISTING-001',
+            asset_name='Existing',
+            asset_category=self.category,
+            purchase_price=Decimal('10.00'),
+            purchase_date='2024-01-01',
+        )
+        rows = [
+            {
+                'asset_name': 'Imported Laptop',
+                'asset_category_code': 'COMPUTER',
+                'department_code': 'OPS',
+                'location_path': 'Warehouse A',
+                'supplier_code': 'SUP001',
+                'custodian_username': 'testuser',
+                'purchase_price': '1200.50',
+                'purchase_date': '2024-02-01',
+            },
+            {
+                'asset_name': 'Unknown Category',
+                'asset_category_code': 'MISSING',
+                'purchase_price': '10',
+                'purchase_date': '2024-02-01',
+            },
+            {
+                'asset_code': 'EXISTING-001',
+                'asset_name': 'Duplicate Code',
+                'asset_category': str(self.category.id),
+                'purchase_price': '-1',
+                'purchase_date': 'not-a-date',
+            },
+        ]
+
+        with patch('apps.search.tasks.sync_assets_batch_to_search_index.delay') as mock_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                result = self.service.bulk_create(rows, self.user, str(self.org.id))
+
+        self.assertEqual(result['succeeded'], 1)
+        self.assertEqual(result['failed'], 2)
+
+        imported = Asset.objects.get(id=result['results'][0]['id'])
+        self.assertEqual(imported.department_id, department.id)
+        self.assertEqual(imported.location_id, location.id)
+        self.assertEqual(imported.supplier_id, supplier.id)
+        self.assertEqual(imported.custodian_id, self.user.id)
+        self.assertEqual(imported.purchase_price, Decimal('1200.50'))
+        self.assertEqual(str(imported.depreciation_start_date), '2024-02-01')
+        self.assertTrue(imported.qr_code)
+
+        self.assertIn('asset_category', result['results'][1]['errors'])
+        self.assertEqual(
+            set(result['results'][2]['errors']),
+            {'asset_code', 'purchase_price', 'purchase_date'}
+        )
+        mock_delay.assert_called_once_with([result['results'][0]['id']])
+
+    def test_bulk_create_validates_rows_and_rejects_ambiguous_keys(self):
+        """Bulk import applies create rules per row and rejects ambiguous paths."""
+        for _ in range(2):
+            Location.objects.create(
+                organization=self.org,
+                name='Shared Room',
+                location_type='room',
+            )
+        other_org = Organization.objects.create(name='Other Organization', code='OTHER_ORG')
+        other_supplier = Supplier.objects.create(
+            organization=other_org,
+            code='FOREIGN',
+            name='Foreign Supplier',
+        )
+        base = {
+            'asset_category': self.category,
+            'purchase_price': '100.00',
+            'purchase_date': '2024-01-01',
+        }
+        rows = [
+            {**base, 'asset_name': 'Ambiguous', 'location_path': 'Shared Room'},
+            {**base, 'asset_name': 'Long Brand', 'brand': 'B' * 101},
+            {**base, 'asset_name': 'Overflow', 'purchase_price': '1' * 20},
+            {**base, 'asset_name': 'Foreign Supplier', 'supplier': other_supplier.id},
+            {**base, 'asset_name': 'Valid'},
+        ]
+
+        result = self.service.bulk_create(rows, self.user, str(self.org.id))
+
+        self.assertEqual(result['succeeded'], 1)
+        errors = [item.get('errors', {}) for item in result['results']]
+        self.assertIn('Ambiguous location', errors[0]['location'])
+        self.assertIn('brand', errors[1])
+        self.assertIn('purchase_price', errors[2])
+        self.assertIn('supplier', errors[3])
+        self.assertTrue(result['results'][4]['success'])
+
+    def test_qr_service_streams_in_process_and_reuses_cached_pngs(self):
+        """Streamed QR rendering stays in-process and reprints come from the cache."""
+        import io
+        from unittest.mock import patch
+        from zipfile import ZipFile
+        from django.core.cache import cache
+        from apps.assets.services import AssetQRCodeService
+
+        cache.clear()
+        for index in range(3):
+            Asset.objects.create(
+                organization=self.org,
+                asset_code=f'LBL-{index}',
+                asset_name=f'Label {index}',
+                asset_category=self.category,
+                purchase_price=Decimal('10.00'),
+                purchase_date='2024-01-01',
+            )
+        service = AssetQRCodeService(max_workers=2)
+        service.POOL_THRESHOLD = 2
+        assets = Asset.objects.filter(organization=self.org)
+
+        with patch('apps.assets.services.qr_service.ProcessPoolExecutor') as mock_pool:
+            archive = ZipFile(io.BytesIO(b''.join(service.stream_zip(assets))))
+        mock_pool.assert_not_called()
+        self.assertEqual(archive.namelist(), ['QR_LBL-0.png', 'QR_LBL-1.png', 'QR_LBL-2.png'])
+
+        with patch('apps.assets.services.qr_service.render_qr_png') as mock_render:
+            target = io.BytesIO()
+            self.assertEqual(service.write_zip(assets, target), 3)
+        mock_render.assert_not_called()
+        self.assertEqual(ZipFile(target).read('QR_LBL-1.png'), archive.read('QR_LBL-1.png'))
+
     def test_get_by_code(self):
         """Test retrieving asset by code."""
         asset = Asset.objects.create(
@@ -259,6 +458,64 @@ class AssetServiceTest(TestCase):
         self.assertEqual(queryset.count(), 1)
         self.assertEqual(queryset.first().asset_name, 'Computer')
 
+    def test_query_by_location_includes_descendants(self):
+        """Descendant locations are matched through the tree path index."""
+        building = Location.objects.create(
+            organization=self.org,
+            name='Building B',
+            location_type='building',
+            created_by=self.user
+        )
+        floor = Location.objects.create(
+            organization=self.org,
+            name='Floor 2',
+            parent=building,
+            location_type='floor',
+            created_by=self.user
+        )
+        room = Location.objects.create(
+            organization=self.org,
+            name='Room 201',
+            parent=floor,
+            location_type='room',
+            created_by=self.user
+        )
+        for name, location in (('Rack', room), ('Printer', floor), ('Sofa', None)):
+            Asset.objects.create(
+                organization=self.org,
+                asset_name=name,
+                asset_category=self.category,
+                location=location,
+                purchase_price=Decimal('100.00'),
+                purchase_date='2024-01-01',
+                created_by=self.user
+            )
+
+        with_children = self.service.query_by_location(
+            location_id=str(building.id),
+            organization_id=str(self.org.id)
+        )
+        direct_only = self.service.query_by_location(
+            location_id=str(floor.id),
+            organization_id=str(self.org.id),
+            include_children=False
+        )
+
+        self.assertEqual(
+            set(with_children.values_list('asset_name', flat=True)),
+            {'Rack', 'Printer'}
+        )
+        self.assertEqual(list(direct_only.values_list('asset_name', flat=True)), ['Printer'])
+
+        # A soft-deleted location hides its whole branch
+        floor.soft_delete()
+        without_branch = self.service.query_by_location(
+            location_id=str(building.id),
+            organization_id=str(self.org.id)
+        )
+        self.assertFalse(without_branch.exists())
+        self.assertEqual(list(building.get_descendants()), [building])
+
     def test_search_assets(self):
         """Test searching assets by keyword."""
         Asset.objects.create(
@@ -131,6 +131,59 @@ class AssetCategoryModelTest(TestCase):
         self.assertEqual(tree[0]['asset_count'], 0, 'Parent should have 0 assets')
         self.assertEqual(tree[0]['children'][0]['asset_count'], 2, 'Child should have 2 assets')
 
+    def test_moving_category_rewrites_subtree_paths(self):
+        """Re-parenting a category moves its whole subtree in one update."""
+        old_root = AssetCategory.objects.create(
+            organization=self.org, code='OLD', name='Old', created_by=self.user
+        )
+        new_root = AssetCategory.objects.create(
+            organization=self.org, code='NEW', name='New', created_by=self.user
+        )
+        branch = AssetCategory.objects.create(
+            organization=self.org, code='BRANCH', name='Branch',
+            parent=old_root, created_by=self.user
+        )
+        leaf = AssetCategory.objects.create(
+            organization=self.org, code='LEAF', name='Leaf',
+            parent=branch, created_by=self.user
+        )
+        self.assertTrue(leaf.tree_path.startswith(old_root.tree_path))
+
+        # Warm the per-organization cache before the move
+        AssetCategory.get_tree(str(self.org.id))
+
+        branch.parent = new_root
+        branch.save()
+
+        leaf.refresh_from_db()
+        self.assertEqual(leaf.tree_path, f'{new_root.tree_path}{branch.id.hex}/{leaf.id.hex}/')
+        self.assertEqual(leaf.level, 2)
+        self.assertEqual(
+            set(new_root.get_descendants().values_list('code', flat=True)),
+            {'NEW', 'BRANCH', 'LEAF'}
+        )
+
+        tree = AssetCategory.get_tree(str(self.org.id))
+        codes = {node['code']: node for node in tree}
+        self.assertEqual(codes['OLD']['children'], [])
+        self.assertEqual(codes['NEW']['children'][0]['children'][0]['code'], 'LEAF')
+
+    def test_category_cannot_move_under_descendant(self):
+        """A category cannot become a child of its own descendant."""
+        from django.core.exceptions import ValidationError
+
+        root = AssetCategory.objects.create(
+            organization=self.org, code='ROOT', name='Root', created_by=self.user
+        )
+        child = AssetCategory.objects.create(
+            organization=self.org, code='CHILD', name='Child',
+            parent=root, created_by=self.user
+        )
+
+        root.parent = child
+        with self.assertRaises(ValidationError):
+            root.save()
+
     def test_get_tree_is_leaf_field(self):
         """Test is_leaf field in get_tree."""
         # Create multi-level category tree
@@ -7,8 +7,8 @@ Provides:
 - LocationViewSet: Location CRUD with tree support
 - AssetStatusLogViewSet: Status log viewing
 """
-import re
-from django.conf import settings
+import uuid
+
 from django.db.models import Prefetch
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -38,29 +38,13 @@ from apps.assets.serializers.tag import (
 )
 from apps.assets.filters import AssetFilter, SupplierFilter, LocationFilter, AssetStatusLogFilter
 from apps.assets.services import AssetService, AssetStatusLogService, LocationService, SupplierService
+from apps.assets.services.qr_service import AssetQRCodeService
 from apps.assets.services.tag_service import AssetTagRelationService
 from apps.lifecycle.services.closed_loop_service import LifecycleClosedLoopService
 
 # Maximum number of QR codes that can be generated in a single bulk request
 MAX_BULK_QR_LIMIT = 1000
-
-
-def sanitize_filename(name: str) -> str:
-    r"""
-    Sanitize a string to be safe for use as a filename.
-
-    Removes or replaces characters that are invalid in Windows filenames:
-    < > : " / \ | ? *
-
-    Args:
-        name: The string to sanitize
-
-    Returns:
-        A sanitized string safe for use as a filename
-    """
-    # Replace invalid filename characters with underscore
-    invalid_chars = r'[<>:"/\\|?*]'
-    return re.sub(invalid_chars, '_', name)
+MAX_ASYNC_BULK_QR_LIMIT = 20000
 
 
 class AssetViewSet(BaseModelViewSetWithBatch):
@@ -537,38 +521,11 @@ class AssetViewSet(BaseModelViewSetWithBatch):
         Returns a PNG image containing the QR code.
         The QR code contains the asset URL for quick scanning.
         """
-        import qrcode
-        from io import BytesIO
-
         asset = self.get_object()
-
-        # Build QR code data - asset detail URL
-        frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:5173')
-        qr_data = f'{frontend_url}/assets/{asset.id}'
-
-        # Generate QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-
-        # Create image
-        img = qr.make_image(fill_color='black', back_color='white')
-
-        # Convert to bytes
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        buffer.seek(0)
+        png = AssetQRCodeService().get_png(asset.id)
 
         # Return as image response
-        return HttpResponse(
-            buffer.read(),
-            content_type='image/png'
-        )
+        return HttpResponse(png, content_type='image/png')
 
     @action(detail=False, methods=['post'], url_path='bulk-qr-codes')
     def bulk_qr_codes(self, request):
@@ -581,14 +538,22 @@ class AssetViewSet(BaseModelViewSetWithBatch):
             "ids": ["uuid1", "uuid2", "uuid3"]
         }
 
-        Returns a ZIP file containing PNG images.
+        Returns a ZIP file containing PNG images, streamed as labels are
+        rendered. With "async": true the ZIP is generated in the background
+        up to MAX_ASYNC_BULK_QR_LIMIT labels, stored as a SystemFile, and the
+        user is notified when it is ready (HTTP 202).
 
         Validation:
-        - ids must be a list
-        - ids cannot exceed MAX_BULK_QR_LIMIT (1000)
+        - ids must be a list of UUIDs
+        - ids cannot exceed MAX_BULK_QR_LIMIT (1000) in synchronous mode
+          or MAX_ASYNC_BULK_QR_LIMIT (20000) in async mode
         - ids cannot be empty
         """
+        from django.http import StreamingHttpResponse
+        from apps.assets.tasks import generate_qr_codes_task
+
         ids = request.data.get('ids', [])
+        run_async = bool(request.data.get('async'))
 
         # Validate that ids is a list
         if not isinstance(ids, list):
@@ -605,58 +570,39 @@ class AssetViewSet(BaseModelViewSetWithBatch):
             )
 
         # Validate maximum limit
-        if len(ids) > MAX_BULK_QR_LIMIT:
+        limit = MAX_ASYNC_BULK_QR_LIMIT if run_async else MAX_BULK_QR_LIMIT
+        if len(ids) > limit:
             return BaseResponse.error(
                 code='VALIDATION_ERROR',
-                message=f'Cannot generate more than {MAX_BULK_QR_LIMIT} QR codes at once'
+                message=f'Cannot generate more than {limit} QR codes at once'
             )
 
-        import qrcode
-        from io import BytesIO
-        from zipfile import ZipFile
+        # Validate ids before the streamed response commits to HTTP 200
+        try:
+            ids = AssetQRCodeService.parse_ids(ids)
+        except ValueError:
+            return BaseResponse.error(
+                code='VALIDATION_ERROR',
+                message='ids must be valid asset UUIDs'
+            )
 
         organization_id = getattr(request, 'organization_id', None)
-        assets = Asset.objects.filter(
-            id__in=ids,
-            organization_id=organization_id,
-            is_deleted=False
-        )
-
-        # Create ZIP file in memory
-        zip_buffer = BytesIO()
-        frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:5173')
-
-        # Create reusable QRCode instance for better performance
-        qr_maker = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-
-        with ZipFile(zip_buffer, 'w') as zip_file:
-            for asset in assets:
-                # Sanitize asset code for safe filename usage
-                safe_code = sanitize_filename(asset.asset_code or str(asset.id))
-                qr_data = f'{frontend_url}/assets/{asset.id}'
-
-                # Clear and reuse QRCode instance
-                qr_maker.clear()
-                qr_maker.add_data(qr_data)
-                qr_maker.make(fit=True)
-                img = qr_maker.make_image(fill_color='black', back_color='white')
-
-                img_buffer = BytesIO()
-                img.save(img_buffer, format='PNG')
-                img_buffer.seek(0)
 
-                filename = f"QR_{safe_code}.png"
-                zip_file.writestr(filename, img_buffer.read())
-
-        zip_buffer.seek(0)
+        if run_async:
+            job = generate_qr_codes_task.delay(
+                organization_id=str(organization_id),
+                asset_ids=ids,
+                user_id=str(request.user.id),
+            )
+            return BaseResponse.success(
+                data={'task_id': job.id, 'count': len(ids), 'async': True},
+                message='QR code generation started. You will be notified when the file is ready.',
+                http_status=status.HTTP_202_ACCEPTED
+            )
 
-        return HttpResponse(
-            zip_buffer.read(),
+        service = AssetQRCodeService()
+        return StreamingHttpResponse(
+            service.stream_zip(service.get_assets(organization_id, ids)),
             content_type='application/zip',
             headers={
                 'Content-Disposition': 'attachment; filename="asset_qr_codes.zip"'
@@ -672,20 +618,49 @@ class AssetViewSet(BaseModelViewSetWithBatch):
         Body:
         {
             "assets": [
-                {"asset_name": "...", "asset_category_id": "...", ...},
+                {"asset_name": "...", "asset_category_code": "...", ...},
                 ...
             ]
         }
+
+        Reference fields accept IDs or codes (asset_category_code,
+        location_path, department_code, supplier_code, custodian_username).
+        Rows that fail validation are reported individually (HTTP 207).
+
+        Batches above AssetImportService.SYNC_MAX_ROWS are imported by a
+        background job (HTTP 202); poll GET /api/assets/bulk-import/{task_id}/.
         """
         from apps.assets.serializers import AssetBulkImportSerializer
+        from apps.assets.services.import_service import AssetImportService
+        from apps.assets.tasks import import_assets_task
 
         serializer = AssetBulkImportSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         organization_id = getattr(request, 'organization_id', None)
+        assets_data = serializer.validated_data['assets']
+
+        if len(assets_data) > AssetImportService.SYNC_MAX_ROWS:
+            task_id = str(uuid.uuid4())
+            AssetImportService.set_progress(
+                task_id, organization_id, 'pending', total=len(assets_data), processed=0
+            )
+            import_assets_task.apply_async(
+                kwargs={
+                    'organization_id': str(organization_id),
+                    'rows': assets_data,
+                    'user_id': str(request.user.id),
+                },
+                task_id=task_id,
+            )
+            return BaseResponse.success(
+                data={'task_id': task_id, 'count': len(assets_data), 'async': True},
+                message='Asset import started. Poll the import status for progress.',
+                http_status=status.HTTP_202_ACCEPTED
+            )
 
         result = self.service.bulk_create(
-            assets_data=serializer.validated_data['assets'],
+            assets_data=assets_data,
             user=request.user,
             organization_id=organization_id
         )
@@ -698,6 +673,25 @@ class AssetViewSet(BaseModelViewSetWithBatch):
             http_status=http_status
         )
 
+    @action(detail=False, methods=['get'], url_path=r'bulk-import/(?P<task_id>[^/.]+)')
+    def bulk_import_status(self, request, task_id=None):
+        """
+        Get the progress of a background bulk import.
+
+        GET /api/assets/bulk-import/{task_id}/
+
+        Returns status (pending/running/completed/failed), total and
+        processed rows; completed imports add the counts and failed rows.
+        """
+        from apps.assets.services.import_service import AssetImportService
+
+        progress = AssetImportService.get_progress(
+            task_id, getattr(request, 'organization_id', None)
+        )
+        if progress is None:
+            return BaseResponse.not_found('Import job')
+        return BaseResponse.success(data=progress)
+
     @action(detail=False, methods=['post'], url_path='batch_change_status')
     def batch_change_status(self, request):
         """
@@ -755,188 +749,73 @@ class AssetViewSet(BaseModelViewSetWithBatch):
     @action(detail=False, methods=['post'], url_path='export')
     def export_assets(self, request):
         """
-        Export assets to Excel file.
+        Export assets to Excel or CSV.
 
         POST /api/assets/export/
         Body:
         {
             "filters": {...},  // Optional filters
-            "columns": ["asset_code", "asset_name", ...]  // Columns to export
+            "columns": ["asset_code", "asset_name", ...],  // Columns to export
+            "format": "xlsx",  // "xlsx" (default) or "csv"
+            "async": false  // Force a background export job
         }
 
-        Returns an Excel file (.xlsx) with the filtered assets.
+        Exports up to AssetExportService.SYNC_ROW_LIMIT rows are streamed in
+        the response. Larger exports (or "async": true) are queued as a
+        background job; the file is stored as a SystemFile and the user is
+        notified when it is ready (HTTP 202).
         """
-        import openpyxl
-        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-        from datetime import datetime
-        from io import BytesIO
-        from django.core.paginator import Paginator
-
-        # Get request parameters
-        filters = request.data.get('filters', {})
-        columns = request.data.get('columns', [])
-
-        # Default columns if not specified
-        if not columns:
-            columns = [
-                'asset_code', 'asset_name', 'specification', 'brand', 'model',
-                'serial_number', 'asset_category', 'supplier', 'department',
-                'location', 'custodian', 'asset_status', 'purchase_date',
-                'original_value', 'net_value', 'useful_life', 'created_at'
-            ]
-
-        # Column headers mapping
-        column_headers = {
-            'asset_code': 'Asset Code',
-            'asset_name': 'Asset Name',
-            'specification': 'Specification',
-            'brand': 'Brand',
-            'model': 'Model',
-            'serial_number': 'Serial Number',
-            'asset_category': 'Category',
-            'supplier': 'Supplier',
-            'department': 'Department',
-            'location': 'Location',
-            'custodian': 'Custodian',
-            'asset_status': 'Status',
-            'purchase_date': 'Purchase Date',
-            'original_value': 'Original Value',
-            'net_value': 'Net Value',
-            'useful_life': 'Useful Life (months)',
-            'created_at': 'Created At'
-        }
+        import tempfile
+        from django.http import FileResponse, StreamingHttpResponse
+        from apps.assets.services.export_service import AssetExportService
+        from apps.assets.tasks import export_assets_task
+
+        service = AssetExportService()
+        filters = request.data.get('filters') or {}
+        columns = service.normalize_columns(request.data.get('columns'))
+        file_format = request.data.get('format') or service.FORMAT_XLSX
+        if file_format not in service.CONTENT_TYPES:
+            return BaseResponse.error(
+                code='VALIDATION_ERROR',
+                message=f'Unsupported export format: {file_format}'
+            )
 
-        # Get base queryset
         organization_id = getattr(request, 'organization_id', None)
-        queryset = Asset.objects.filter(
-            organization_id=organization_id,
-            is_deleted=False
-        ).select_related(
-            'asset_category', 'supplier', 'department', 'location', 'custodian'
-        )
+        queryset = service.get_queryset(organization_id, filters)
+        row_count = queryset.count()
+
+        if request.data.get('async') or row_count > service.SYNC_ROW_LIMIT:
+            job = export_assets_task.delay(
+                organization_id=str(organization_id),
+                user_id=str(request.user.id),
+                filters=filters,
+                columns=columns,
+                file_format=file_format,
+            )
+            return BaseResponse.success(
+                data={'task_id': job.id, 'row_count': row_count, 'async': True},
+                message='Export started. You will be notified when the file is ready.',
+                http_status=status.HTTP_202_ACCEPTED
+            )
 
-        # Apply filters if provided
-        if filters:
-            # Filter by status
-            if 'asset_status' in filters:
-                queryset = queryset.filter(asset_status=filters['asset_status'])
-
-            # Filter by category
-            if 'asset_category_id' in filters:
-                queryset = queryset.filter(asset_category_id=filters['asset_category_id'])
-
-            # Filter by department
-            if 'department_id' in filters:
-                queryset = queryset.filter(department_id=filters['department_id'])
-
-            # Filter by location
-            if 'location_id' in filters:
-                queryset = queryset.filter(location_id=filters['location_id'])
-
-        # Create workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = 'Assets'
-
-        # Define header style
-        header_font = Font(bold=True, size=11)
-        header_fill = PatternFill(start_color='CCE5FF', end_color='CCE5FF', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        filename = service.build_filename(file_format)
+        if file_format == service.FORMAT_CSV:
+            response = StreamingHttpResponse(
+                service.stream_csv(queryset, columns, organization_id),
+                content_type=service.CONTENT_TYPES[file_format]
+            )
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            return response
 
-        # Write headers
-        for col_idx, column in enumerate(columns, 1):
-            cell = ws.cell(row=1, column=col_idx)
-            cell.value = column_headers.get(column, column)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = border
-
-        # Write data rows
-        row_idx = 2
-        for asset in queryset:
-            for col_idx, column in enumerate(columns, 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                cell.border = border
-
-                # Get value based on column
-                value = ''
-                if column == 'asset_code':
-                    value = asset.asset_code or ''
-                elif column == 'asset_name':
-                    value = asset.asset_name or ''
-                elif column == 'specification':
-                    value = asset.specification or ''
-                elif column == 'brand':
-                    value = asset.brand or ''
-                elif column == 'model':
-                    value = asset.model or ''
-                elif column == 'serial_number':
-                    value = asset.serial_number or ''
-                elif column == 'asset_category':
-                    value = asset.asset_category.name if asset.asset_category else ''
-                elif column == 'supplier':
-                    value = asset.supplier.supplier_name if asset.supplier else ''
-                elif column == 'department':
-                    value = asset.department.department_name if asset.department else ''
-                elif column == 'location':
-                    value = asset.location.full_name if hasattr(asset.location, 'full_name') else (asset.location.location_name if asset.location else '')
-                elif column == 'custodian':
-                    value = asset.custodian.username if asset.custodian else ''
-                elif column == 'asset_status':
-                    value = asset.get_asset_status_display() or ''
-                elif column == 'purchase_date':
-                    value = asset.purchase_date.strftime('%Y-%m-%d') if asset.purchase_date else ''
-                elif column == 'original_value':
-                    value = float(asset.original_value) if asset.original_value else 0
-                elif column == 'net_value':
-                    value = float(asset.net_value) if asset.net_value else 0
-                elif column == 'useful_life':
-                    value = asset.useful_life or 0
-                elif column == 'created_at':
-                    value = asset.created_at.strftime('%Y-%m-%d %H:%M:%S') if asset.created_at else ''
-
-                cell.value = value
-                cell.alignment = Alignment(vertical='center')
-
-            row_idx += 1
-
-        # Auto-adjust column widths
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column].width = adjusted_width
-
-        # Save to bytes buffer
-        buffer = BytesIO()
-        wb.save(buffer)
+        buffer = tempfile.SpooledTemporaryFile(max_size=service.SPOOL_MAX_SIZE)
+        service.write_xlsx(queryset, columns, buffer, organization_id)
         buffer.seek(0)
-
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'assets_export_{timestamp}.xlsx'
-
-        # Return as file download
-        response = HttpResponse(
-            buffer.read(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        return FileResponse(
+            buffer,
+            as_attachment=True,
+            filename=filename,
+            content_type=service.CONTENT_TYPES[file_format]
         )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
-        return response
 
 
 class SupplierViewSet(BaseModelViewSetWithBatch):
@@ -14,7 +14,9 @@ import logging
 
 from apps.common.services.i18n_service import (
     TranslationService,
+    activate_translation_context,
     clear_current_language,
+    deactivate_translation_context,
     set_current_language,
 )
 
@@ -241,6 +243,9 @@ class LanguageContextMiddleware(MiddlewareMixin):
     2. HTTP Header: `Accept-Language`
     3. User preference: `preferred_language` (authenticated user)
     4. System default language
+
+    Also opens a request-scoped translation context so labels resolved
+    while handling the request are memoized until the response is sent.
     """
 
     FALLBACK_LANGUAGE = TranslationService.DEFAULT_LANGUAGE
@@ -248,16 +253,19 @@ class LanguageContextMiddleware(MiddlewareMixin):
     def process_request(self, request):
         language = self._resolve_language(request)
         set_current_language(language)
+        activate_translation_context()
         request.language_code = language
         request.locale = language
         return None
 
     def process_response(self, request, response):
         clear_current_language()
+        deactivate_translation_context()
         return response
 
     def process_exception(self, request, exception):
         clear_current_language()
+        deactivate_translation_context()
         raise exception
 
     def _resolve_language(self, request) -> str:
@@ -2,17 +2,19 @@
 Rate Limiting Middleware.
 
 Protects API endpoints from abuse and DDoS attacks.
-Implements sliding window rate limiting with configurable limits.
+Implements sliding window rate limiting with configurable limits. Windows
+live in Redis sorted sets updated by one Lua script per request (atomic
+across workers); a per-process window is used while Redis is down.
 """
 
-import time
 import logging
-from typing import Dict, Any, Optional
-from django.core.cache import cache
+from typing import Dict, Any
 from django.http import JsonResponse
 from django.conf import settings
 from rest_framework import status
 
+from apps.common.utils.rate_limiter import get_rate_limiter, normalize_route
+
 logger = logging.getLogger(__name__)
 
 
@@ -162,7 +164,8 @@ class RateLimitMiddleware:
         """
         Check if request is within rate limits.
         
-        Uses sliding window algorithm for accurate rate limiting.
+        Uses sliding window algorithm for accurate rate limiting. The
+        bucket is keyed by route pattern rather than raw path.
         
         Returns:
             Dictionary with rate limit status
@@ -179,57 +182,11 @@ class RateLimitMiddleware:
         
         max_requests = limit_config['requests']
         window_size = limit_config['window']
-        
-        # Cache key for this client
-        cache_key = f"rate_limit:{client_id}:{path}:{method}"
-        
-        # Get current window data
-        now = time.time()
-        window_start = now - window_size
-        
-        window_data = cache.get(cache_key, {'requests': [], 'count': 0})
-        
-        # Clean up old requests outside the window
-        window_data['requests'] = [
-            req_time for req_time in window_data['requests']
-            if req_time > window_start
-        ]
-        
-        # Check if limit exceeded
-        current_count = len(window_data['requests'])
-        
-        if current_count >= max_requests:
-            # Find oldest request to calculate retry_after
-            oldest_request = min(window_data['requests']) if window_data['requests'] else now
-            retry_after = int(oldest_request + window_size - now) + 1
-            reset_time = int(oldest_request + window_size)
-            
-            return {
-                'allowed': False,
-                'limit': max_requests,
-                'remaining': 0,
-                'retry_after': retry_after,
-                'reset_time': reset_time
-            }
-        
-        # Add current request to window
-        window_data['requests'].append(now)
-        window_data['count'] = len(window_data['requests'])
-        
-        # Store updated window data
-        cache.set(cache_key, window_data, window_size)
-        
-        # Calculate reset time
-        oldest_request = min(window_data['requests']) if window_data['requests'] else now
-        reset_time = int(oldest_request + window_size)
-        
-        return {
-            'allowed': True,
-            'limit': max_requests,
-            'remaining': max_requests - current_count - 1,
-            'retry_after': 0,
-            'reset_time': reset_time
-        }
+
+        # Bucket per route pattern, so detail URLs share one window
+        cache_key = f"rate_limit:{client_id}:{normalize_route(path)}:{method}"
+
+        return get_rate_limiter().hit(cache_key, max_requests, window_size)
 
 
 class RateLimitExceeded(Exception):
@@ -251,47 +208,16 @@ def check_rate_limit(client_id: str, endpoint: str,
     Returns:
         Dictionary with rate limit status
     """
-    cache_key = f"rate_limit:{client_id}:{endpoint}"
-    now = time.time()
-    window_start = now - window
-    
-    window_data = cache.get(cache_key, {'requests': [], 'count': 0})
-    
-    # Clean up old requests
-    window_data['requests'] = [
-        req_time for req_time in window_data['requests']
-        if req_time > window_start
-    ]
-    
-    current_count = len(window_data['requests'])
-    
-    if current_count >= requests:
-        oldest_request = min(window_data['requests']) if window_data['requests'] else now
-        retry_after = int(oldest_request + window - now) + 1
-        
-        return {
-            'allowed': False,
-            'limit': requests,
-            'remaining': 0,
-            'retry_after': retry_after
-        }
-    
-    # Add current request
-    window_data['requests'].append(now)
-    cache.set(cache_key, window_data, window)
-    
-    return {
-        'allowed': True,
-        'limit': requests,
-        'remaining': requests - current_count - 1,
-        'retry_after': 0
-    }
+    cache_key = f"rate_limit:{client_id}:{normalize_route(endpoint)}"
+    result = get_rate_limiter().hit(cache_key, requests, window)
+    result.pop('reset_time', None)
+    return result
 
 
 def reset_rate_limit(client_id: str, endpoint: str) -> None:
     """Reset rate limit for a specific client and endpoint."""
-    cache_key = f"rate_limit:{client_id}:{endpoint}"
-    cache.delete(cache_key)
+    cache_key = f"rate_limit:{client_id}:{normalize_route(endpoint)}"
+    get_rate_limiter().reset(cache_key)
 
 
 def get_rate_limit_stats(client_id: str = None) -> Dict[str, Any]:
@@ -304,30 +230,25 @@ def get_rate_limit_stats(client_id: str = None) -> Dict[str, Any]:
     Returns:
         Rate limit statistics
     """
-    # Get all rate limit keys
-    all_keys = cache.keys('rate_limit:*')
-    
-    if client_id:
-        all_keys = [key for key in all_keys if f':{client_id}:' in key]
-    
+    prefix = 'rate_limit:'
+
+    # Keys are rate_limit:<client_id>:<route>..., and routes start with '/'
+    client_counts = {}
+    endpoint_count = 0
+    for key, count in get_rate_limiter().counts(prefix).items():
+        client = key[len(prefix):].split(':/', 1)[0]
+        if client_id and client != client_id:
+            continue
+        endpoint_count += 1
+        client_counts[client] = client_counts.get(client, 0) + count
+
     stats = {
-        'total_clients': len(set(key.split(':')[1] for key in all_keys)),
-        'total_endpoints': len(all_keys),
+        'total_clients': len(client_counts),
+        'total_endpoints': endpoint_count,
         'active_clients': 0,
         'top_clients': []
     }
-    
-    # Get top clients by request count
-    client_counts = {}
-    for key in all_keys:
-        try:
-            data = cache.get(key, {})
-            client = key.split(':')[1]
-            if data.get('count', 0) > 0:
-                client_counts[client] = client_counts.get(client, 0) + data['count']
-        except Exception:
-            continue
-    
+
     stats['active_clients'] = len(client_counts)
     stats['top_clients'] = sorted(
         client_counts.items(),
@@ -0,0 +1,257 @@
+"""
+Tree Path Mixin for hierarchical models.
+
+Maintains a materialized ancestor path of primary keys so subtree
+queries become a single indexed prefix match instead of one query
+per tree node, and caches the per-organization node list.
+"""
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
+
+
+class TreePathMixin(models.Model):
+    """
+    Mixin to add a materialized id path to self-referencing tree models.
+
+    The concrete model must define a ``parent`` foreign key to itself and
+    an integer ``level`` field. ``tree_path`` holds the hex ids from the
+    root down to the node, e.g. ``/<root>/<child>/<node>/``, so all
+    descendants of a node share its path as prefix.
+
+    Usage:
+        class Location(BaseModel, TreePathMixin):
+            TREE_NODE_FIELDS = ('id', 'parent_id', 'name', 'level')
+            ...
+
+        Location.descendant_filter('location', location_id)
+        Location.get_cached_tree_nodes(organization_id)
+    """
+
+    TREE_PATH_SEPARATOR = '/'
+    # Columns cached per organization by get_cached_tree_nodes()
+    TREE_NODE_FIELDS = ('id', 'parent_id', 'level')
+    TREE_NODE_ORDERING = ('tree_path',)
+    TREE_CACHE_TIMEOUT = 3600
+    # Denormalized fields built by prefixing the parent's value (e.g. a
+    # name path); descendants get their prefix rewritten on change.
+    TREE_PREFIXED_FIELDS = ()
+
+    tree_path = models.CharField(
+        max_length=1000,
+        blank=True,
+        default='',
+        db_index=True,
+        editable=False,
+        help_text='Materialized ancestor id path (e.g., /<root id>/<node id>/)'
+    )
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember stored prefixes so save() can rewrite them in the subtree
+        instance._loaded_tree_prefixes = {
+            field: getattr(instance, field)
+            for field in cls.TREE_PREFIXED_FIELDS
+            if field in instance.__dict__
+        }
+        return instance
+
+    def build_tree_path(self) -> str:
+        """Build this node's path from its parent's stored path."""
+        separator = self.TREE_PATH_SEPARATOR
+        parent_path = self.parent.tree_path if self.parent_id else ''
+        return f"{parent_path or separator}{self.pk.hex}{separator}"
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        tracks_parent = update_fields is None or bool(
+            {'parent', 'parent_id'} & set(update_fields)
+        )
+
+        previous_path = None
+        if tracks_parent:
+            previous_path = None if self._state.adding else self.tree_path
+            new_path = self.build_tree_path()
+            if previous_path and new_path != previous_path and new_path.startswith(previous_path):
+                raise ValidationError({'parent': ['Cannot set a descendant as parent.']})
+            self.tree_path = new_path
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'tree_path'}
+
+        super().save(*args, **kwargs)
+
+        prefix_changes = self._get_prefix_changes(kwargs.get('update_fields'))
+        if (previous_path and previous_path != self.tree_path) or prefix_changes:
+            self._move_descendants(previous_path or self.tree_path, prefix_changes)
+        self._loaded_tree_prefixes = {
+            field: getattr(self, field) for field in self.TREE_PREFIXED_FIELDS
+        }
+        self.invalidate_tree_cache(self.organization_id)
+
+    def _get_prefix_changes(self, update_fields=None) -> Dict[str, tuple]:
+        """Map each saved TREE_PREFIXED_FIELDS field that changed to (old, new)."""
+        loaded = getattr(self, '_loaded_tree_prefixes', None) or {}
+        changes = {}
+        for field in self.TREE_PREFIXED_FIELDS:
+            if update_fields is not None and field not in update_fields:
+                continue
+            old_value = loaded.get(field)
+            new_value = getattr(self, field)
+            if old_value and old_value != new_value:
+                changes[field] = (old_value, new_value)
+        return changes
+
+    def delete(self, *args, **kwargs):
+        organization_id = self.organization_id
+        result = super().delete(*args, **kwargs)
+        self.invalidate_tree_cache(organization_id)
+        return result
+
+    def _move_descendants(self, previous_path: str,
+                          prefix_changes: Optional[Dict[str, tuple]] = None) -> int:
+        """
+        Rewrite the subtree in one UPDATE.
+
+        Covers the tree_path prefix and level after a move, plus the
+        prefix of every changed TREE_PREFIXED_FIELDS field.
+        """
+        separator = self.TREE_PATH_SEPARATOR
+        updates = {
+            field: Concat(
+                Value(new_value),
+                Substr(field, len(old_value) + 1),
+                output_field=models.CharField(),
+            )
+            for field, (old_value, new_value) in (prefix_changes or {}).items()
+        }
+        if previous_path != self.tree_path:
+            level_delta = self.tree_path.count(separator) - previous_path.count(separator)
+            updates['tree_path'] = Concat(
+                Value(self.tree_path),
+                Substr('tree_path', len(previous_path) + 1),
+                output_field=models.CharField(),
+            )
+            updates['level'] = F('level') + level_delta
+        return type(self).all_objects.filter(
+            tree_path__startswith=previous_path
+        ).exclude(pk=self.pk).update(**updates)
+
+    def get_ancestor_ids_from_path(self) -> List[Any]:
+        """Get ancestor ids (root first) parsed from tree_path; no query."""
+        separator = self.TREE_PATH_SEPARATOR
+        pk_field = self._meta.pk
+        return [
+            pk_field.to_python(segment)
+            for segment in self.tree_path.strip(separator).split(separator)[:-1]
+            if segment
+        ]
+
+    @classmethod
+    def _deleted_subtree_paths(cls, tree_path: str) -> List[str]:
+        """Paths of the topmost soft-deleted nodes under (and including) tree_path."""
+        paths = []
+        for path in cls.all_objects.filter(
+            tree_path__startswith=tree_path, is_deleted=True
+        ).order_by('tree_path').values_list('tree_path', flat=True):
+            if not paths or not path.startswith(paths[-1]):
+                paths.append(path)
+        return paths
+
+    def get_descendants(self, include_self: bool = True) -> models.QuerySet:
+        """Get all live nodes in this node's subtree, skipping soft-deleted branches."""
+        queryset = type(self).objects.filter(
+            organization_id=self.organization_id,
+            tree_path__startswith=self.tree_path,
+            is_deleted=False,
+        )
+        for path in self._deleted_subtree_paths(self.tree_path):
+            queryset = queryset.exclude(tree_path__startswith=path)
+        if not include_self:
+            queryset = queryset.exclude(pk=self.pk)
+        return queryset
+
+    @classmethod
+    def descendant_filter(cls, relation: str, node_id) -> models.Q:
+        """
+        Build a Q matching rows whose ``relation`` lies in the node's subtree.
+
+        The node's path is looked up once; the returned filter is a prefix
+        match on the related table's indexed tree_path. Branches under a
+        soft-deleted node are excluded, as the tree endpoints hide them.
+        """
+        tree_path = cls.all_objects.filter(pk=node_id).values_list(
+            'tree_path', flat=True
+        ).first()
+        if not tree_path:
+            return models.Q(**{f'{relation}_id': node_id})
+        condition = models.Q(**{
+            f'{relation}__tree_path__startswith': tree_path,
+            f'{relation}__is_deleted': False,
+        })
+        for path in cls._deleted_subtree_paths(tree_path):
+            condition &= ~models.Q(**{f'{relation}__tree_path__startswith': path})
+        return condition
+
+    @classmethod
+    def get_tree_cache_key(cls, organization_id) -> str:
+        return f'tree_nodes:{cls._meta.label_lower}:{organization_id}'
+
+    @classmethod
+    def invalidate_tree_cache(cls, organization_id) -> None:
+        if organization_id:
+            cache.delete(cls.get_tree_cache_key(organization_id))
+
+    @classmethod
+    def get_cached_tree_nodes(cls, organization_id) -> List[Dict[str, Any]]:
+        """Get TREE_NODE_FIELDS rows for all live nodes of an organization."""
+        cache_key = cls.get_tree_cache_key(organization_id)
+        nodes = cache.get(cache_key)
+        if nodes is None:
+            nodes = list(
+                cls.all_objects.filter(
+                    organization_id=organization_id,
+                    is_deleted=False,
+                ).order_by(*cls.TREE_NODE_ORDERING).values(*cls.TREE_NODE_FIELDS)
+            )
+            cache.set(cache_key, nodes, cls.TREE_CACHE_TIMEOUT)
+        return nodes
+
+    @classmethod
+    def build_nested_tree(
+        cls,
+        nodes: List[Dict[str, Any]],
+        serialize,
+        children_key: str = 'children',
+    ) -> List[Dict[str, Any]]:
+        """
+        Assemble cached node rows into nested dictionaries.
+
+        ``serialize(node, children)`` returns the dict for one node given
+        its (already ordered) child rows; nested children are appended to
+        ``children_key``.
+        """
+        children_map: Dict[Optional[Any], List[Dict[str, Any]]] = {}
+        live_ids = {node['id'] for node in nodes}
+        roots = []
+        for node in nodes:
+            parent_id = node['parent_id']
+            if parent_id and parent_id in live_ids:
+                children_map.setdefault(parent_id, []).append(node)
+            elif not parent_id:
+                roots.append(node)
+
+        def build(node):
+            children = children_map.get(node['id'], [])
+            data = serialize(node, children)
+            data[children_key] = [build(child) for child in children]
+            return data
+
+        return [build(node) for node in roots]
@@ -0,0 +1,338 @@
+"""
+Rolling API metrics for APM monitoring.
+
+Recording a request appends one tuple to a fixed-size ring buffer
+(``collections.deque`` appends are atomic, so the hot path takes no
+lock). Events are folded into per-endpoint latency histograms kept per
+minute locally and per hour in Redis, so statistics are read from
+precomputed aggregates instead of raw events:
+
+- Local minute buckets back short windows (e.g. the 5-minute error rate
+  used for alerting) within one process.
+- Hour buckets are flushed to Redis periodically with one script call
+  per hour, and merged across workers when statistics are requested.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BOUNDS_MS = (
+    5, 10, 25, 50, 75, 100, 150, 200, 300, 500,
+    750, 1000, 1500, 2000, 3000, 5000, 10000,
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with counters for one endpoint.
+
+    Histograms merge by addition, so minute, hour and cross-worker
+    aggregates all use the same structure.
+    """
+
+    __slots__ = ('buckets', 'count', 'errors', 'total_ms', 'max_ms', 'min_ms')
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BOUNDS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms: Optional[float] = None
+        self.min_ms: Optional[float] = None
+
+    def add(self, duration_ms: float, is_error: bool) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if is_error:
+            self.errors += 1
+        if self.max_ms is None or duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        if self.min_ms is None or duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        for index, value in enumerate(other.buckets):
+            self.buckets[index] += value
+        self.count += other.count
+        self.errors += other.errors
+        self.total_ms += other.total_ms
+        if other.max_ms is not None and (self.max_ms is None or other.max_ms > self.max_ms):
+            self.max_ms = other.max_ms
+        if other.min_ms is not None and (self.min_ms is None or other.min_ms < self.min_ms):
+            self.min_ms = other.min_ms
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile (0-100) by interpolating inside its bucket."""
+        if not self.count:
+            return 0.0
+
+        rank = self.count * q / 100
+        seen = 0
+        for index, value in enumerate(self.buckets):
+            if value and seen + value >= rank:
+                lower = LATENCY_BOUNDS_MS[index - 1] if index else 0
+                upper = LATENCY_BOUNDS_MS[index] if index < len(LATENCY_BOUNDS_MS) else self.max_ms
+                estimate = lower + (upper - lower) * (rank - seen) / value
+                return round(min(max(estimate, self.min_ms), self.max_ms), 2)
+            seen += value
+        return float(self.max_ms)
+
+    def to_fields(self, endpoint: str) -> List[Tuple[str, str, float]]:
+        """Encode as (hash field, op, value) triples for the flush script."""
+        fields = [
+            (f'{endpoint}|c', 'incr', self.count),
+            (f'{endpoint}|e', 'incr', self.errors),
+            (f'{endpoint}|t', 'incr', self.total_ms),
+            (f'{endpoint}|x', 'max', self.max_ms),
+            (f'{endpoint}|n', 'min', self.min_ms),
+        ]
+        fields.extend(
+            (f'{endpoint}|h{index}', 'incr', value)
+            for index, value in enumerate(self.buckets) if value
+        )
+        return fields
+
+    @classmethod
+    def from_fields(cls, fields: Dict[str, str]) -> Dict[str, 'LatencyHistogram']:
+        """Decode a flushed Redis hash into per-endpoint histograms."""
+        histograms: Dict[str, LatencyHistogram] = {}
+        for field, value in fields.items():
+            if isinstance(field, bytes):
+                field = field.decode()
+            endpoint, _, name = field.rpartition('|')
+            histogram = histograms.get(endpoint)
+            if histogram is None:
+                histogram = histograms[endpoint] = cls()
+            value = float(value)
+            if name == 'c':
+                histogram.count = int(value)
+            elif name == 'e':
+                histogram.errors = int(value)
+            elif name == 't':
+                histogram.total_ms = value
+            elif name == 'x':
+                histogram.max_ms = value
+            elif name == 'n':
+                histogram.min_ms = value
+            elif name.startswith('h'):
+                histogram.buckets[int(name[1:])] = int(value)
+        return histograms
+
+
+# KEYS[1] = hour bucket hash; ARGV[1] = ttl, then (field, op, value) triples
+FLUSH_SCRIPT = """
+local key = KEYS[1]
+for i = 2, #ARGV, 3 do
+    local field, op, value = ARGV[i], ARGV[i + 1], tonumber(ARGV[i + 2])
+    if op == 'incr' then
+        redis.call('HINCRBYFLOAT', key, field, value)
+    else
+        local current = tonumber(redis.call('HGET', key, field))
+        if current == nil
+                or (op == 'max' and value > current)
+                or (op == 'min' and value < current) then
+            redis.call('HSET', key, field, value)
+        end
+    end
+end
+redis.call('EXPIRE', key, tonumber(ARGV[1]))
+return 1
+"""
+
+
+def _merge_into(target: Dict[str, LatencyHistogram], source: Dict[str, LatencyHistogram]) -> None:
+    for endpoint, histogram in source.items():
+        existing = target.get(endpoint)
+        if existing is None:
+            existing = target[endpoint] = LatencyHistogram()
+        existing.merge(histogram)
+
+
+class RollingAPIMetrics:
+    """
+    Bounded API metrics pipeline: ring buffer -> minute/hour histograms.
+
+    Usage:
+        metrics = RollingAPIMetrics()
+        metrics.record('/api/assets/', 'GET', 42, 200)
+        totals = metrics.local_window(300)
+        stats = metrics.aggregate(hours=1)
+    """
+
+    MINUTE = 60
+    HOUR = 3600
+
+    def __init__(self, cache_prefix: str = 'apm_stats', buffer_size: int = 10000,
+                 local_minutes: int = 60, flush_interval: int = 10,
+                 retention_hours: int = 48):
+        self.cache_prefix = cache_prefix
+        self.local_minutes = local_minutes
+        self.flush_interval = flush_interval
+        self.retention_hours = retention_hours
+        # Oldest events are dropped if folding falls behind
+        self._events: deque = deque(maxlen=buffer_size)
+        self._minutes: Dict[int, Dict[str, LatencyHistogram]] = {}
+        self._pending: Dict[int, Dict[str, LatencyHistogram]] = {}
+        self._fold_lock = threading.Lock()
+        self._next_flush_at = time.monotonic() + flush_interval
+        self._script = None
+        self._script_connection = None
+
+    def record(self, endpoint: str, method: str, duration_ms: float, status_code: int) -> None:
+        """Record one request in O(1); flushes opportunistically."""
+        self._events.append((time.time(), endpoint, duration_ms, status_code >= 400))
+        if time.monotonic() >= self._next_flush_at:
+            self.flush(blocking=False)
+
+    def fold(self, blocking: bool = True) -> bool:
+        """
+        Drain buffered events into minute and pending hour histograms.
+
+        Returns False when another thread is already folding and
+        blocking is False.
+        """
+        if not self._fold_lock.acquire(blocking=blocking):
+            return False
+        try:
+            self._fold_locked()
+        finally:
+            self._fold_lock.release()
+        return True
+
+    def _fold_locked(self) -> None:
+        events = self._events
+        minutes = self._minutes
+        pending = self._pending
+        while events:
+            try:
+                timestamp, endpoint, duration_ms, is_error = events.popleft()
+            except IndexError:
+                break
+            for buckets, size in ((minutes, self.MINUTE), (pending, self.HOUR)):
+                slot = int(timestamp // size) * size
+                histograms = buckets.get(slot)
+                if histograms is None:
+                    histograms = buckets[slot] = {}
+                histogram = histograms.get(endpoint)
+                if histogram is None:
+                    histogram = histograms[endpoint] = LatencyHistogram()
+                histogram.add(duration_ms, is_error)
+
+        oldest = (int(time.time() // self.MINUTE) - self.local_minutes) * self.MINUTE
+        for slot in [slot for slot in minutes if slot <= oldest]:
+            del minutes[slot]
+
+    def local_window(self, seconds: int) -> LatencyHistogram:
+        """Totals of this process over the last N seconds (minute resolution)."""
+        self.fold(blocking=False)
+        since = int((time.time() - seconds) // self.MINUTE) * self.MINUTE
+        total = LatencyHistogram()
+        for slot, histograms in list(self._minutes.items()):
+            if slot >= since:
+                for histogram in list(histograms.values()):
+                    total.merge(histogram)
+        return total
+
+    def _hour_key(self, slot: int) -> str:
+        return f'{self.cache_prefix}:api:{slot}'
+
+    def _get_script(self):
+        try:
+            from django_redis import get_redis_connection
+            connection = get_redis_connection('default')
+        except Exception:
+            return None
+        if self._script is None or self._script_connection is not connection:
+            self._script = connection.register_script(FLUSH_SCRIPT)
+            self._script_connection = connection
+        return self._script
+
+    def flush(self, blocking: bool = True) -> None:
+        """Fold buffered events and merge pending hour buckets into the shared store."""
+        if not self._fold_lock.acquire(blocking=blocking):
+            return
+        try:
+            self._next_flush_at = time.monotonic() + self.flush_interval
+            self._fold_locked()
+            pending, self._pending = self._pending, {}
+            if pending:
+                self._write(pending)
+        except Exception as e:
+            logger.warning(f"Failed to flush API metrics: {e}")
+        finally:
+            self._fold_lock.release()
+
+    def _write(self, pending: Dict[int, Dict[str, LatencyHistogram]]) -> None:
+        ttl = self.retention_hours * self.HOUR
+        script = self._get_script()
+        if script is not None:
+            for slot, histograms in pending.items():
+                args: List = [ttl]
+                for endpoint, histogram in histograms.items():
+                    for field, op, value in histogram.to_fields(endpoint):
+                        args.extend((field, op, value))
+                script(keys=[self._hour_key(slot)], args=args)
+            return
+
+        # Non-Redis cache backends: merge through the Django cache
+        for slot, histograms in pending.items():
+            key = self._hour_key(slot)
+            stored = LatencyHistogram.from_fields(cache.get(key) or {})
+            _merge_into(stored, histograms)
+            fields = {}
+            for endpoint, histogram in stored.items():
+                fields.update({field: value for field, _, value in histogram.to_fields(endpoint)})
+            cache.set(key, fields, ttl)
+
+    def _read(self, slots: Iterable[int]) -> Dict[str, LatencyHistogram]:
+        keys = [self._hour_key(slot) for slot in slots]
+        result: Dict[str, LatencyHistogram] = {}
+        script = self._get_script()
+        if script is not None:
+            pipe = self._script_connection.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            hashes = pipe.execute()
+        else:
+            hashes = list(cache.get_many(keys).values())
+
+        for fields in hashes:
+            if fields:
+                _merge_into(result, LatencyHistogram.from_fields(fields))
+        return result
+
+    def aggregate(self, hours: int = 1) -> Dict[str, LatencyHistogram]:
+        """
+        Per-endpoint histograms across all workers for the last N hours.
+
+        Hour buckets are read whole, so the window starts at the top of
+        the oldest hour.
+        """
+        self.flush()
+        current = int(time.time() // self.HOUR) * self.HOUR
+        slots = [current - offset * self.HOUR for offset in range(max(hours, 1))]
+        try:
+            return self._read(slots)
+        except Exception as e:
+            logger.warning(f"Failed to read API metrics: {e}")
+            return {}
+
+    def trim_local(self, minutes: int) -> int:
+        """Drop local minute buckets older than N minutes; return remaining buckets."""
+        with self._fold_lock:
+            self._fold_locked()
+            oldest = (int(time.time() // self.MINUTE) - minutes) * self.MINUTE
+            for slot in [slot for slot in self._minutes if slot <= oldest]:
+                del self._minutes[slot]
+            return len(self._minutes)
@@ -7,12 +7,13 @@ Includes automatic alert generation based on configurable thresholds.
 
 import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from django.conf import settings
 from django.core.cache import cache
 from django.db import connection
-import threading
+
+from apps.common.services.apm_metrics import LatencyHistogram, RollingAPIMetrics
 
 # TODO: Restore the psutil import after fixing the deployment dependency issue.
 # import psutil
@@ -38,8 +39,7 @@ class APMMonitor:
         self.enabled = getattr(settings, 'APM_ENABLED', True)
         self.cache_prefix = 'apm_stats'
         self.alert_thresholds = self._load_alert_thresholds()
-        self._metrics_buffer = []
-        self._lock = threading.Lock()
+        self.metrics = RollingAPIMetrics(cache_prefix=self.cache_prefix)
         
     def _load_alert_thresholds(self) -> Dict[str, Any]:
         """Load alert thresholds from configuration."""
@@ -61,18 +61,8 @@ class APMMonitor:
         if not self.enabled:
             return
             
-        metric_data = {
-            'timestamp': datetime.now().isoformat(),
-            'endpoint': endpoint,
-            'method': method,
-            'duration_ms': duration_ms,
-            'status_code': status_code,
-            'type': 'api_response_time'
-        }
-        
-        with self._lock:
-            self._metrics_buffer.append(metric_data)
-            
+        self.metrics.record(endpoint, method, duration_ms, status_code)
+
         # Check if this violates thresholds
         self._check_response_time_threshold(endpoint, duration_ms)
         self._check_error_rate_threshold(status_code)
@@ -122,25 +112,9 @@ class APMMonitor:
                 )
     
     def _get_recent_error_rate(self) -> float:
-        """Calculate error rate from recent requests."""
-        now = datetime.now()
-        five_minutes_ago = now - timedelta(minutes=5)
-        
-        recent_errors = 0
-        total_requests = 0
-        
-        with self._lock:
-            for metric in self._metrics_buffer:
-                try:
-                    metric_time = datetime.fromisoformat(metric['timestamp'].replace('Z', '+00:00'))
-                    if metric_time >= five_minutes_ago:
-                        total_requests += 1
-                        if metric['status_code'] >= 400:
-                            recent_errors += 1
-                except (ValueError, KeyError):
-                    continue
-        
-        return (recent_errors / total_requests * 100) if total_requests > 0 else 0.0
+        """Calculate error rate from this process's last five minutes of requests."""
+        recent = self.metrics.local_window(5 * 60)
+        return (recent.errors / recent.count * 100) if recent.count > 0 else 0.0
     
     def _create_alert(self, alert_type: str, severity: str, message: str, 
                      metadata: Dict[str, Any]) -> None:
@@ -237,67 +211,61 @@ class APMMonitor:
                 return {'error': str(e)}
     
     def get_api_stats(self, hours: int = 1) -> Dict[str, Any]:
-        """Get API performance statistics for the last N hours."""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        """
+        Get API performance statistics for the last N hours.
+
+        Read from hourly histograms aggregated across workers; the window
+        is rounded to whole hours.
+        """
+        endpoint_stats = self.metrics.aggregate(hours)
         
-        with self._lock:
-            recent_metrics = [
-                metric for metric in self._metrics_buffer
-                if datetime.fromisoformat(metric['timestamp'].replace('Z', '+00:00')) >= cutoff_time
-            ]
+        totals = LatencyHistogram()
+        for histogram in endpoint_stats.values():
+            totals.merge(histogram)
         
-        if not recent_metrics:
+        if not totals.count:
             return {'message': 'No metrics available for the specified time period'}
         
-        # Calculate statistics
-        response_times = [m['duration_ms'] for m in recent_metrics]
-        total_requests = len(recent_metrics)
-        error_count = sum(1 for m in recent_metrics if m['status_code'] >= 400)
-        
-        # Group by endpoint
-        endpoint_stats = {}
-        for metric in recent_metrics:
-            endpoint = metric['endpoint']
-            if endpoint not in endpoint_stats:
-                endpoint_stats[endpoint] = {
-                    'count': 0,
-                    'total_time': 0,
-                    'errors': 0
-                }
-            endpoint_stats[endpoint]['count'] += 1
-            endpoint_stats[endpoint]['total_time'] += metric['duration_ms']
-            if metric['status_code'] >= 400:
-                endpoint_stats[endpoint]['errors'] += 1
-        
         return {
             'time_period_hours': hours,
-            'total_requests': total_requests,
-            'error_count': error_count,
-            'error_rate': (error_count / total_requests * 100) if total_requests > 0 else 0,
-            'avg_response_time': sum(response_times) / len(response_times),
-            'max_response_time': max(response_times),
-            'min_response_time': min(response_times),
+            'total_requests': totals.count,
+            'error_count': totals.errors,
+            'error_rate': totals.errors / totals.count * 100,
+            'avg_response_time': totals.total_ms / totals.count,
+            'max_response_time': totals.max_ms,
+            'min_response_time': totals.min_ms,
+            'p50_response_time': totals.percentile(50),
+            'p95_response_time': totals.percentile(95),
+            'p99_response_time': totals.percentile(99),
             'endpoint_stats': {
                 endpoint: {
-                    'requests': stats['count'],
-                    'avg_time': stats['total_time'] / stats['count'],
-                    'error_rate': (stats['errors'] / stats['count'] * 100) if stats['count'] > 0 else 0
+                    'requests': stats.count,
+                    'avg_time': stats.total_ms / stats.count,
+                    'error_rate': stats.errors / stats.count * 100,
+                    'p50': stats.percentile(50),
+                    'p95': stats.percentile(95),
+                    'p99': stats.percentile(99),
                 }
                 for endpoint, stats in endpoint_stats.items()
+                if stats.count
             }
         }
     
+    def flush_metrics(self) -> None:
+        """Push this process's pending aggregates to the shared store."""
+        self.metrics.flush()
+    
     def cleanup_old_metrics(self, hours: int = 24) -> None:
-        """Clean up old metrics data."""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        with self._lock:
-            self._metrics_buffer = [
-                metric for metric in self._metrics_buffer
-                if datetime.fromisoformat(metric['timestamp'].replace('Z', '+00:00')) >= cutoff_time
-            ]
+        """
+        Clean up old local metrics data.
+
+        Shared hourly aggregates expire on their own.
+        """
+        remaining = self.metrics.trim_local(hours * 60)
         
-        logger.info(f"Cleaned up metrics older than {hours} hours. Remaining: {len(self._metrics_buffer)}")
+        logger.info(
+            f"Cleaned up metrics older than {hours} hours. Remaining minute buckets: {remaining}"
+        )
 
 
 # Global APM monitor instance
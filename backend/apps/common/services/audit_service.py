@@ -5,14 +5,20 @@ Comprehensive audit logging for compliance and security.
 Tracks all system actions, user activities, and data changes.
 """
 
+import atexit
 import logging
-import json
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
+
+from celery.signals import task_postrun, worker_process_shutdown
 from django.conf import settings
-from django.core.cache import cache
-from django.db import transaction
 from django.contrib.auth import get_user_model
+from django.core.signals import request_finished
+
+from apps.common.services.audit_store import CacheAuditStore, RedisAuditStore, event_score
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,12 @@ class AuditLogger:
     - Compliance reporting
     - Security event logging
     - Audit trail management
+
+    Events are appended to an in-process buffer and written to the
+    audit store in batches (see apps.common.services.audit_store).
+    High severity events are written immediately; the rest at the end of
+    each request and Celery task, and on worker shutdown. Queries read
+    the cache fallback store as well, since failed writes land there.
     """
     
     # Audit event types
@@ -61,6 +73,92 @@ class AuditLogger:
         self.enabled = getattr(settings, 'AUDIT_LOGGING_ENABLED', True)
         self.cache_prefix = 'audit_log'
         self.retention_days = getattr(settings, 'AUDIT_LOG_RETENTION_DAYS', 90)
+        self.max_events = getattr(settings, 'AUDIT_LOG_MAX_EVENTS', 1000000)
+        self.batch_size = getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 100)
+        self.flush_interval = getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 1.0)
+        self.max_buffered = getattr(settings, 'AUDIT_LOG_MAX_BUFFERED', 10000)
+        self._buffer: deque = deque()
+        self._flush_lock = threading.Lock()
+        self._next_flush_at = time.monotonic() + self.flush_interval
+        self._store = None
+        self._fallback_store = CacheAuditStore(self.cache_prefix, self.retention_days)
+
+    def _get_store(self):
+        """Redis stream store when available, hour-partitioned cache otherwise."""
+        if self._store is None:
+            try:
+                from django_redis import get_redis_connection
+                self._store = RedisAuditStore(
+                    get_redis_connection('default'), self.cache_prefix,
+                    self.retention_days, self.max_events
+                )
+            except Exception:
+                self._store = self._fallback_store
+        return self._store
+
+    def _stores(self) -> List[Any]:
+        """Stores queries read: the primary store and, if different, the fallback."""
+        store = self._get_store()
+        return [store] if store is self._fallback_store else [store, self._fallback_store]
+
+    def _query(self, index: str, value: str = '', since: Optional[float] = None) -> List[Dict]:
+        """Merge an index query over all stores, oldest first."""
+        events = {}
+        for store in self._stores():
+            try:
+                results = store.query(index, value, since=since)
+            except Exception as e:
+                logger.warning(f"Failed to query audit store {type(store).__name__}: {e}")
+                continue
+            for event in results:
+                events.setdefault(event['event_id'], event)
+        return sorted(events.values(), key=event_score)
+
+    def _scan(self, since: float, until: float) -> Iterator[Dict[str, Any]]:
+        """Iterate events within [since, until] over all stores."""
+        for store in self._stores():
+            yield from store.scan(since, until)
+
+    def flush(self) -> int:
+        """Write buffered events to the audit store; return the count written."""
+        with self._flush_lock:
+            self._next_flush_at = time.monotonic() + self.flush_interval
+            batch = []
+            while self._buffer:
+                try:
+                    batch.append(self._buffer.popleft())
+                except IndexError:
+                    break
+            if not batch:
+                return 0
+
+            store = self._get_store()
+            try:
+                store.append_many(batch)
+            except Exception as e:
+                logger.warning(f"Failed to write audit events, using cache store: {e}")
+                try:
+                    self._fallback_store.append_many(batch)
+                except Exception as fallback_error:
+                    self._requeue(batch, fallback_error)
+                    return 0
+            return len(batch)
+
+    def _requeue(self, batch: List[Dict[str, Any]], error: Exception) -> None:
+        """
+        Put a batch no store accepted back at the head of the buffer.
+
+        The buffer is capped at max_buffered events; the oldest events of
+        the batch are dropped (and counted in the log) beyond that.
+        """
+        room = max(self.max_buffered - len(self._buffer), 0)
+        kept = batch[len(batch) - room:] if room < len(batch) else batch
+        self._buffer.extendleft(reversed(kept))
+        dropped = len(batch) - len(kept)
+        logger.error(
+            f"Failed to write {len(batch)} audit events to any store, "
+            f"re-queued {len(kept)} and dropped {dropped}: {error}"
+        )
     
     def log(self, event_type: str, actor_id: Any, actor_type: str,
             action: str, details: Dict[str, Any] = None,
@@ -107,16 +205,11 @@ class AuditLogger:
             'severity': self._get_event_severity(event_type)
         }
         
-        # Store in cache (in production, this would go to a database or log service)
-        cache_key = f"{self.cache_prefix}_events"
-        events = cache.get(cache_key, [])
-        events.append(event)
-        
-        # Keep only last 10000 events in cache
-        if len(events) > 10000:
-            events = events[-10000:]
-        
-        cache.set(cache_key, events, 86400 * self.retention_days)
+        # O(1) append; the buffer is written to the store in batches
+        self._buffer.append(event)
+        if (event['severity'] == 'high' or len(self._buffer) >= self.batch_size
+                or time.monotonic() >= self._next_flush_at):
+            self.flush()
         
         # Log to standard logger for immediate visibility
         log_level = self._get_log_level(event['severity'])
@@ -158,12 +251,7 @@ class AuditLogger:
     
     def _handle_security_event(self, event: Dict[str, Any]) -> None:
         """Handle security event logging and alerting."""
-        # Store in dedicated security events cache
-        security_key = f"{self.cache_prefix}_security_events"
-        security_events = cache.get(security_key, [])
-        security_events.append(event)
-        cache.set(security_key, security_events, 86400 * 30)  # 30 days
-        
+        # Security events are indexed by the audit store
         # Could trigger additional alerting here
         logger.error(f"SECURITY EVENT: {event['action']}")
     
@@ -220,59 +308,21 @@ class AuditLogger:
         Returns:
             List of audit events
         """
-        cache_key = f"{self.cache_prefix}_events"
-        all_events = cache.get(cache_key, [])
-        
+        self.flush()
         cutoff_time = datetime.now().timestamp() - (hours * 3600)
-        
-        filtered_events = []
-        for event in all_events:
-            try:
-                event_time = datetime.fromisoformat(event['timestamp']).timestamp()
-                if event_time >= cutoff_time:
-                    if event.get('object_type') == object_type and \
-                       event.get('object_id') == str(object_id):
-                        filtered_events.append(event)
-            except (ValueError, KeyError):
-                continue
-        
-        return filtered_events
+        return self._query('object', f"{object_type}:{object_id}", since=cutoff_time)
     
     def get_user_activity(self, user_id: Any, hours: int = 24) -> List[Dict[str, Any]]:
         """Get audit trail for a specific user."""
-        cache_key = f"{self.cache_prefix}_events"
-        all_events = cache.get(cache_key, [])
-        
+        self.flush()
         cutoff_time = datetime.now().timestamp() - (hours * 3600)
-        
-        user_events = []
-        for event in all_events:
-            try:
-                event_time = datetime.fromisoformat(event['timestamp']).timestamp()
-                if event_time >= cutoff_time and event.get('actor_id') == str(user_id):
-                    user_events.append(event)
-            except (ValueError, KeyError):
-                continue
-        
-        return user_events
+        return self._query('actor', str(user_id), since=cutoff_time)
     
     def get_security_events(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get security events."""
-        security_key = f"{self.cache_prefix}_security_events"
-        all_events = cache.get(security_key, [])
-        
+        self.flush()
         cutoff_time = datetime.now().timestamp() - (hours * 3600)
-        
-        filtered_events = []
-        for event in all_events:
-            try:
-                event_time = datetime.fromisoformat(event['timestamp']).timestamp()
-                if event_time >= cutoff_time:
-                    filtered_events.append(event)
-            except (ValueError, KeyError):
-                continue
-        
-        return filtered_events
+        return self._query('security', since=cutoff_time)
     
     def generate_compliance_report(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """
@@ -285,25 +335,23 @@ class AuditLogger:
         Returns:
             Compliance report data
         """
-        cache_key = f"{self.cache_prefix}_events"
-        all_events = cache.get(cache_key, [])
-        
-        # Filter by date range
-        filtered_events = []
-        for event in all_events:
-            try:
-                event_time = datetime.fromisoformat(event['timestamp'])
-                if start_date <= event_time <= end_date:
-                    filtered_events.append(event)
-            except (ValueError, KeyError):
-                continue
-        
-        # Generate statistics
+        self.flush()
+
+        # Generate statistics over a range scan of the period
+        total_events = 0
+        high_severity = 0
+        medium_severity = 0
         event_types = {}
         actors = {}
         objects = {}
         
-        for event in filtered_events:
+        for event in self._scan(start_date.timestamp(), end_date.timestamp()):
+            total_events += 1
+            if event['severity'] == 'high':
+                high_severity += 1
+            elif event['severity'] == 'medium':
+                medium_severity += 1
+
             # Count by event type
             event_type = event['event_type']
             event_types[event_type] = event_types.get(event_type, 0) + 1
@@ -322,33 +370,20 @@ class AuditLogger:
                 'start': start_date.isoformat(),
                 'end': end_date.isoformat()
             },
-            'total_events': len(filtered_events),
+            'total_events': total_events,
             'by_event_type': event_types,
             'by_actor': actors,
             'by_object': objects,
-            'security_events': len([e for e in filtered_events if e['severity'] == 'high']),
-            'high_severity_events': len([e for e in filtered_events if e['severity'] == 'high']),
-            'medium_severity_events': len([e for e in filtered_events if e['severity'] == 'medium'])
+            'security_events': high_severity,
+            'high_severity_events': high_severity,
+            'medium_severity_events': medium_severity
         }
     
     def cleanup_old_logs(self) -> int:
         """Clean up audit logs older than retention period."""
-        cache_key = f"{self.cache_prefix}_events"
-        all_events = cache.get(cache_key, [])
-        
+        self.flush()
         cutoff_time = datetime.now().timestamp() - (self.retention_days * 86400)
-        
-        cleaned_events = []
-        for event in all_events:
-            try:
-                event_time = datetime.fromisoformat(event['timestamp']).timestamp()
-                if event_time >= cutoff_time:
-                    cleaned_events.append(event)
-            except (ValueError, KeyError):
-                continue
-        
-        removed_count = len(all_events) - len(cleaned_events)
-        cache.set(cache_key, cleaned_events, 86400 * self.retention_days)
+        removed_count = sum(store.cleanup(cutoff_time) for store in self._stores())
         
         logger.info(f"Cleaned up {removed_count} old audit log entries")
         
@@ -357,6 +392,25 @@ class AuditLogger:
 
 # Global audit logger instance
 audit_logger = AuditLogger()
+atexit.register(audit_logger.flush)
+
+
+def _flush_audit_buffer(**kwargs) -> None:
+    """
+    Write buffered events when a request or task ends.
+
+    The flush interval is only checked when the next event is logged, so
+    an idle process would otherwise hold events indefinitely; prefork
+    Celery children leave through os._exit, which skips atexit.
+    """
+    audit_logger.flush()
+
+
+request_finished.connect(_flush_audit_buffer, dispatch_uid='common.audit_logger.request_finished')
+task_postrun.connect(_flush_audit_buffer, dispatch_uid='common.audit_logger.task_postrun')
+worker_process_shutdown.connect(
+    _flush_audit_buffer, dispatch_uid='common.audit_logger.worker_process_shutdown'
+)
 
 
 def log_event(event_type: str, actor_id: Any, actor_type: str,
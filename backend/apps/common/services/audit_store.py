@@ -0,0 +1,252 @@
+"""
+Append-only audit event storage.
+
+Events are written in batches by AuditLogger's buffered writer and read
+back through indexes, so appends and queries never move the whole log:
+
+- RedisAuditStore appends to a capped Redis stream and adds each entry
+  id to sorted-set indexes (time, actor, object, security) scored by the
+  event timestamp. Queries are ZRANGEBYSCORE range scans over one index.
+- CacheAuditStore is the fallback for non-Redis cache backends. Events
+  are partitioned into hourly cache keys; a query only reads the
+  partitions overlapping its time range.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+# Event types kept in the security index
+SECURITY_EVENT_TYPES = ('security_event', 'rate_limit_exceeded')
+
+
+def event_score(event: Dict[str, Any]) -> float:
+    """Epoch seconds of an event's ISO timestamp."""
+    return datetime.fromisoformat(event['timestamp']).timestamp()
+
+
+def event_indexes(event: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(index, value) pairs an event is reachable through."""
+    indexes = [('time', '')]
+    if event.get('actor_id'):
+        indexes.append(('actor', event['actor_id']))
+    if event.get('object_type') and event.get('object_id'):
+        indexes.append(('object', f"{event['object_type']}:{event['object_id']}"))
+    if event.get('event_type') in SECURITY_EVENT_TYPES:
+        indexes.append(('security', ''))
+    return indexes
+
+
+# KEYS[1] = stream, KEYS[2..] = index sorted sets
+# ARGV[1] = approximate max stream length, ARGV[2] = index ttl,
+# ARGV[3] = oldest score to keep, then per event:
+# score, payload, n, followed by n positions into KEYS
+APPEND_SCRIPT = """
+local stream = KEYS[1]
+local maxlen, ttl, cutoff = ARGV[1], tonumber(ARGV[2]), ARGV[3]
+local i = 4
+while i <= #ARGV do
+    local score, payload, n = ARGV[i], ARGV[i + 1], tonumber(ARGV[i + 2])
+    local id = redis.call('XADD', stream, 'MAXLEN', '~', maxlen, '*', 'e', payload)
+    for j = 1, n do
+        redis.call('ZADD', KEYS[tonumber(ARGV[i + 2 + j])], score, id)
+    end
+    i = i + 3 + n
+end
+for k = 2, #KEYS do
+    redis.call('ZREMRANGEBYSCORE', KEYS[k], '-inf', '(' .. cutoff)
+    redis.call('EXPIRE', KEYS[k], ttl)
+end
+redis.call('EXPIRE', stream, ttl)
+return 1
+"""
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class RedisAuditStore:
+    """Capped Redis stream with sorted-set indexes scored by event time."""
+
+    def __init__(self, connection, prefix: str, retention_days: int, max_events: int):
+        self.connection = connection
+        self.prefix = prefix
+        self.retention_seconds = retention_days * 86400
+        self.max_events = max_events
+        self._script = connection.register_script(APPEND_SCRIPT)
+
+    def _index_key(self, index: str, value: str = '') -> str:
+        return f'{self.prefix}:idx:{index}:{value}' if value else f'{self.prefix}:idx:{index}'
+
+    def append_many(self, events: List[Dict[str, Any]]) -> None:
+        """Append a batch of events and index them in one script call."""
+        keys = [f'{self.prefix}:stream']
+        positions: Dict[str, int] = {}
+        args: List[Any] = []
+        for event in events:
+            refs = []
+            for index, value in event_indexes(event):
+                key = self._index_key(index, value)
+                if key not in positions:
+                    keys.append(key)
+                    positions[key] = len(keys)
+                refs.append(positions[key])
+            args.extend((event_score(event), json.dumps(event, default=str), len(refs)))
+            args.extend(refs)
+
+        oldest = datetime.now().timestamp() - self.retention_seconds
+        self._script(keys=keys, args=[self.max_events, self.retention_seconds, oldest] + args)
+
+    def _fetch(self, entry_ids: List[Any]) -> List[Dict[str, Any]]:
+        pipe = self.connection.pipeline(transaction=False)
+        for entry_id in entry_ids:
+            pipe.xrange(f'{self.prefix}:stream', entry_id, entry_id)
+        events = []
+        for entries in pipe.execute():
+            # Entries trimmed from the stream leave dangling index ids
+            for _, fields in entries:
+                payload = fields.get(b'e') or fields.get('e')
+                if payload:
+                    events.append(json.loads(_decode(payload)))
+        return events
+
+    def query(self, index: str, value: str = '', since: Optional[float] = None,
+              until: Optional[float] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Events of one index within [since, until], oldest first."""
+        kwargs = {'start': 0, 'num': limit} if limit else {}
+        entry_ids = self.connection.zrangebyscore(
+            self._index_key(index, value),
+            since if since is not None else '-inf',
+            until if until is not None else '+inf',
+            **kwargs
+        )
+        return self._fetch(entry_ids) if entry_ids else []
+
+    def scan(self, since: float, until: float, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Iterate all events within [since, until] in bounded chunks."""
+        offset = 0
+        while True:
+            entry_ids = self.connection.zrangebyscore(
+                self._index_key('time'), since, until, start=offset, num=chunk_size
+            )
+            if not entry_ids:
+                return
+            yield from self._fetch(entry_ids)
+            offset += len(entry_ids)
+
+    def cleanup(self, cutoff: float) -> int:
+        """Drop events older than cutoff from the time index and stream."""
+        time_key = self._index_key('time')
+        expired = self.connection.zrangebyscore(time_key, '-inf', f'({cutoff}')
+        if not expired:
+            return 0
+        # Stream ids are time ordered; everything before the newest expired id goes
+        newest = _decode(expired[-1])
+        milliseconds, _, sequence = newest.partition('-')
+        pipe = self.connection.pipeline(transaction=False)
+        pipe.zremrangebyscore(time_key, '-inf', f'({cutoff}')
+        pipe.xtrim(f'{self.prefix}:stream', minid=f'{milliseconds}-{int(sequence or 0) + 1}')
+        pipe.execute()
+        return len(expired)
+
+
+class CacheAuditStore:
+    """Hour-partitioned audit events in the Django cache."""
+
+    PARTITION_SECONDS = 3600
+
+    def __init__(self, prefix: str, retention_days: int):
+        self.prefix = prefix
+        self.retention_seconds = retention_days * 86400
+
+    def _partition_key(self, slot: int) -> str:
+        return f'{self.prefix}:events:{slot}'
+
+    def _slot(self, score: float) -> int:
+        return int(score // self.PARTITION_SECONDS) * self.PARTITION_SECONDS
+
+    def _slots_key(self) -> str:
+        return f'{self.prefix}:partitions'
+
+    def append_many(self, events: List[Dict[str, Any]]) -> None:
+        """Append a batch; only the touched hour partitions are rewritten."""
+        batches: Dict[int, List[Dict[str, Any]]] = {}
+        for event in events:
+            batches.setdefault(self._slot(event_score(event)), []).append(event)
+
+        keys = {self._partition_key(slot): slot for slot in batches}
+        stored = cache.get_many(list(keys))
+        cache.set_many(
+            {
+                key: stored.get(key, []) + batches[slot]
+                for key, slot in keys.items()
+            },
+            self.retention_seconds
+        )
+        slots = set(cache.get(self._slots_key(), ()))
+        if not slots.issuperset(batches):
+            cache.set(self._slots_key(), sorted(slots | set(batches)), self.retention_seconds)
+
+    def _read(self, since: Optional[float], until: Optional[float]) -> Iterator[Tuple[float, Dict]]:
+        slots = cache.get(self._slots_key(), [])
+        if since is not None:
+            slots = [slot for slot in slots if slot >= self._slot(since)]
+        if until is not None:
+            slots = [slot for slot in slots if slot <= until]
+        partitions = cache.get_many([self._partition_key(slot) for slot in slots])
+        for slot in slots:
+            matched = []
+            for event in partitions.get(self._partition_key(slot), []):
+                score = event_score(event)
+                if (since is None or score >= since) and (until is None or score <= until):
+                    matched.append((score, event))
+            matched.sort(key=lambda item: item[0])
+            yield from matched
+
+    def query(self, index: str, value: str = '', since: Optional[float] = None,
+              until: Optional[float] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Events of one index within [since, until], oldest first."""
+        events = []
+        for _, event in self._read(since, until):
+            if (index, value) in event_indexes(event):
+                events.append(event)
+                if limit and len(events) >= limit:
+                    break
+        return events
+
+    def scan(self, since: float, until: float, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Iterate all events within [since, until]."""
+        for _, event in self._read(since, until):
+            yield event
+
+    def cleanup(self, cutoff: float) -> int:
+        """Drop partitions older than cutoff and trim the boundary partition."""
+        slots = cache.get(self._slots_key(), [])
+        expired = [slot for slot in slots if slot + self.PARTITION_SECONDS <= cutoff]
+        boundary = self._slot(cutoff)
+        keys = [self._partition_key(slot) for slot in expired + [boundary]]
+        partitions = cache.get_many(keys)
+
+        removed = sum(len(partitions.get(self._partition_key(slot), [])) for slot in expired)
+        cache.delete_many([self._partition_key(slot) for slot in expired])
+
+        boundary_events = partitions.get(self._partition_key(boundary))
+        if boundary_events:
+            kept = [event for event in boundary_events if event_score(event) >= cutoff]
+            removed += len(boundary_events) - len(kept)
+            cache.set(self._partition_key(boundary), kept, self.retention_seconds)
+
+        if expired:
+            cache.set(
+                self._slots_key(),
+                [slot for slot in slots if slot not in expired],
+                self.retention_seconds
+            )
+        return removed
@@ -4,10 +4,12 @@ Translation service for internationalization (i18n).
 Provides:
 - Unified translation interface
 - Translation caching
+- Request-scoped batch translation resolution
 - Language pack generation
 - Missing translation tracking
 """
-from typing import Dict, Optional, Any, List
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, Any, List, Tuple
 from django.core.cache import cache
 import threading
 
@@ -32,19 +34,116 @@ def clear_current_language() -> None:
         del _thread_locals.language
 
 
+class TranslationContext:
+    """
+    Request-scoped memo of resolved translations.
+
+    Whole namespaces and per-object field maps are loaded once and kept
+    for the lifetime of the context, so repeated label lookups in one
+    request become dict lookups. Missing translations are memoized as
+    empty maps and never trigger another query.
+    """
+
+    def __init__(self):
+        self.cache_version: Optional[int] = None
+        self.namespaces: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self.objects: Dict[Tuple[int, str, str], Dict[str, str]] = {}
+
+    def clear(self) -> None:
+        self.cache_version = None
+        self.namespaces.clear()
+        self.objects.clear()
+
+
+def get_translation_context() -> Optional[TranslationContext]:
+    """Get the active request-scoped translation context, if any."""
+    return getattr(_thread_locals, 'translation_context', None)
+
+
+def activate_translation_context() -> TranslationContext:
+    """Start a fresh translation context for the current thread."""
+    context = TranslationContext()
+    _thread_locals.translation_context = context
+    return context
+
+
+def deactivate_translation_context() -> None:
+    """Drop the translation context of the current thread."""
+    if hasattr(_thread_locals, 'translation_context'):
+        del _thread_locals.translation_context
+
+
+@contextmanager
+def translation_context() -> Iterator[TranslationContext]:
+    """
+    Run a block inside a translation context.
+
+    Reuses the active context when nested (e.g. inside a request), so
+    memoized translations are shared with the caller.
+    """
+    context = get_translation_context()
+    if context is not None:
+        yield context
+        return
+
+    context = activate_translation_context()
+    try:
+        yield context
+    finally:
+        deactivate_translation_context()
+
+
 class TranslationCache:
     """
     Cache manager for translations.
+
+    Text, namespace and object entries are keyed under a global version
+    that is bumped whenever translations change, so invalidation works on
+    every cache backend. Misses are cached too (as ``MISSING`` or as empty
+    maps) so untranslated labels do not hit the database on every call.
     """
 
     CACHE_PREFIX = 'i18n'
     CACHE_TIMEOUT = 3600  # 1 hour
+    VERSION_KEY = 'i18n:version'
+    MISSING = '__i18n_missing__'
 
     @classmethod
     def _make_key(cls, *parts: str) -> str:
         """Generate cache key from parts."""
         return f'{cls.CACHE_PREFIX}:{":".join(str(p) for p in parts)}'
 
+    @classmethod
+    def get_version(cls) -> int:
+        """Get the translation cache version (memoized per request)."""
+        context = get_translation_context()
+        if context is not None and context.cache_version is not None:
+            return context.cache_version
+
+        version = cache.get(cls.VERSION_KEY)
+        if version is None:
+            version = 1
+            cache.add(cls.VERSION_KEY, version, None)
+        if context is not None:
+            context.cache_version = version
+        return version
+
+    @classmethod
+    def bump_version(cls) -> None:
+        """Invalidate all versioned translation entries."""
+        try:
+            cache.incr(cls.VERSION_KEY)
+        except ValueError:
+            cache.set(cls.VERSION_KEY, 1, None)
+
+        context = get_translation_context()
+        if context is not None:
+            context.clear()
+
+    @classmethod
+    def _versioned_key(cls, *parts: Any) -> str:
+        return cls._make_key(f'v{cls.get_version()}', *parts)
+
     @classmethod
     def get_translation(
         cls,
@@ -52,8 +151,8 @@ class TranslationCache:
         key: str,
         lang_code: str
     ) -> Optional[str]:
-        """Get single translation from cache."""
-        cache_key = cls._make_key('text', namespace, key, lang_code)
+        """Get single translation from cache (may be ``MISSING``)."""
+        cache_key = cls._versioned_key('text', namespace, key, lang_code)
         return cache.get(cache_key)
 
     @classmethod
@@ -65,9 +164,13 @@ class TranslationCache:
         text: str
     ) -> None:
         """Set single translation in cache."""
-        cache_key = cls._make_key('text', namespace, key, lang_code)
+        cache_key = cls._versioned_key('text', namespace, key, lang_code)
         cache.set(cache_key, text, cls.CACHE_TIMEOUT)
 
+    @classmethod
+    def namespace_key(cls, namespace: str, lang_code: str) -> str:
+        return cls._versioned_key('ns', namespace, lang_code)
+
     @classmethod
     def get_namespace(
         cls,
@@ -75,8 +178,7 @@ class TranslationCache:
         lang_code: str
     ) -> Optional[Dict[str, str]]:
         """Get all translations for a namespace."""
-        cache_key = cls._make_key('ns', namespace, lang_code)
-        return cache.get(cache_key)
+        return cache.get(cls.namespace_key(namespace, lang_code))
 
     @classmethod
     def set_namespace(
@@ -86,8 +188,12 @@ class TranslationCache:
         translations: Dict[str, str]
     ) -> None:
         """Set all translations for a namespace."""
-        cache_key = cls._make_key('ns', namespace, lang_code)
-        cache.set(cache_key, translations, cls.CACHE_TIMEOUT)
+        cache.set(cls.namespace_key(namespace, lang_code), translations, cls.CACHE_TIMEOUT)
+
+    @classmethod
+    def object_key(cls, content_type_id: int, object_id: Any, lang_code: str) -> str:
+        """Key of the {field_name: text} map of one object in one language."""
+        return cls._versioned_key('gfk', content_type_id, object_id, lang_code)
 
     @classmethod
     def get_language_pack(cls, lang_code: str) -> Optional[Dict]:
@@ -104,6 +210,7 @@ class TranslationCache:
     @classmethod
     def invalidate_namespace(cls, namespace: str) -> None:
         """Clear cache for a namespace."""
+        cls.bump_version()
         # Note: Pattern deletion only works with Redis
         try:
             from django_redis import get_redis_connection
@@ -123,6 +230,7 @@ class TranslationCache:
     @classmethod
     def invalidate_all(cls) -> None:
         """Clear all translation caches."""
+        cls.bump_version()
         try:
             from django_redis import get_redis_connection
             conn = get_redis_connection('default')
@@ -181,26 +289,32 @@ class TranslationService:
         lang_code = lang_code or get_current_language()
         default = default if default is not None else key
 
+        # Inside a request, resolve against the memoized namespace
+        if use_cache and get_translation_context() is not None:
+            return TranslationService.get_namespace(namespace, lang_code).get(key, default)
+
         # Check cache
         if use_cache:
             cached = TranslationCache.get_translation(namespace, key, lang_code)
             if cached is not None:
-                return cached
+                return default if cached == TranslationCache.MISSING else cached
 
         # Query database
         try:
             from apps.system.models import Translation
-            translation = Translation.objects.filter(
+            text = Translation.objects.filter(
                 namespace=namespace,
                 key=key,
                 language_code=lang_code,
                 is_deleted=False
-            ).first()
+            ).values_list('text', flat=True).first()
 
-            if translation:
-                text = translation.text
-                if use_cache:
-                    TranslationCache.set_translation(namespace, key, lang_code, text)
+            if use_cache:
+                TranslationCache.set_translation(
+                    namespace, key, lang_code,
+                    text if text is not None else TranslationCache.MISSING
+                )
+            if text is not None:
                 return text
         except Exception:
             pass
@@ -247,32 +361,83 @@ class TranslationService:
             Dict mapping keys to translated text
         """
         lang_code = lang_code or get_current_language()
+        if not use_cache:
+            try:
+                return TranslationService._load_namespaces([namespace], lang_code)[namespace]
+            except Exception:
+                return {}
+        return TranslationService.prefetch_namespaces([namespace], lang_code)[namespace]
 
-        # Check cache
-        if use_cache:
-            cached = TranslationCache.get_namespace(namespace, lang_code)
-            if cached is not None:
-                return cached
+    @staticmethod
+    def prefetch_namespaces(
+        namespaces: Iterable[str],
+        lang_code: Optional[str] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Resolve several namespaces with one cache get_many and one query.
 
-        # Query database
-        translations = {}
-        try:
-            from apps.system.models import Translation
-            qs = Translation.objects.filter(
-                namespace=namespace,
-                language_code=lang_code,
-                is_deleted=False
-            ).values('key', 'text')
+        Results (including empty namespaces) are cached and, inside a
+        translation context, memoized for the rest of the request.
 
-            for item in qs:
-                translations[item['key']] = item['text']
+        Returns:
+            Dict mapping namespace to {key: text}
+        """
+        lang_code = lang_code or get_current_language()
+        context = get_translation_context()
+        result: Dict[str, Dict[str, str]] = {}
+        pending = []
+        for namespace in dict.fromkeys(namespaces):
+            if context is not None and (namespace, lang_code) in context.namespaces:
+                result[namespace] = context.namespaces[(namespace, lang_code)]
+            else:
+                pending.append(namespace)
+
+        if pending:
+            keys = {
+                TranslationCache.namespace_key(namespace, lang_code): namespace
+                for namespace in pending
+            }
+            cached = cache.get_many(list(keys))
+            for cache_key, translations in cached.items():
+                result[keys[cache_key]] = translations
+
+            missing = [namespace for namespace in pending if namespace not in result]
+            if missing:
+                try:
+                    loaded = TranslationService._load_namespaces(missing, lang_code)
+                except Exception:
+                    # Do not cache or memoize anything on a failed load
+                    return {**result, **{namespace: {} for namespace in missing}}
+                cache.set_many(
+                    {
+                        TranslationCache.namespace_key(namespace, lang_code): loaded[namespace]
+                        for namespace in missing
+                    },
+                    TranslationCache.CACHE_TIMEOUT
+                )
+                result.update(loaded)
 
-            if use_cache and translations:
-                TranslationCache.set_namespace(namespace, lang_code, translations)
-        except Exception:
-            pass
+            if context is not None:
+                for namespace in pending:
+                    context.namespaces[(namespace, lang_code)] = result[namespace]
+
+        return result
+
+    @staticmethod
+    def _load_namespaces(namespaces: List[str], lang_code: str) -> Dict[str, Dict[str, str]]:
+        """Load namespaces from the database; every requested namespace gets a dict."""
+        from apps.system.models import Translation
+
+        loaded: Dict[str, Dict[str, str]] = {namespace: {} for namespace in namespaces}
+        qs = Translation.objects.filter(
+            namespace__in=namespaces,
+            language_code=lang_code,
+            is_deleted=False
+        ).values_list('namespace', 'key', 'text')
 
-        return translations
+        for namespace, key, text in qs:
+            loaded[namespace][key] = text
+        return loaded
 
     @staticmethod
     def get_language_pack(
@@ -468,6 +633,9 @@ class TranslationService:
         """
         Get translation for a dynamic object field via GenericForeignKey.
 
+        All translated fields of the object are resolved together, so the
+        other fields of the same object are served without another lookup.
+
         Args:
             obj: Model instance to translate
             field_name: Field name being translated (e.g., 'name', 'description')
@@ -477,40 +645,163 @@ class TranslationService:
         Returns:
             Translated text or None if not found
         """
+        lang_code = lang_code or get_current_language()
+
+        if not use_cache:
+            from django.contrib.contenttypes.models import ContentType
+            try:
+                content_type = ContentType.objects.get_for_model(obj)
+                return TranslationService._load_object_translations(
+                    content_type.id, [obj.pk], lang_code
+                )[str(obj.pk)].get(field_name)
+            except Exception:
+                return None
+
+        field_map = TranslationService.prefetch_object_translations(
+            [obj], lang_code
+        ).get(str(obj.pk), {})
+        return field_map.get(field_name)
+
+    @staticmethod
+    def prefetch_object_translations(
+        objects: Iterable,
+        lang_code: Optional[str] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Resolve the translations of many objects in one get_many and one
+        query per content type.
+
+        Objects without translations are cached as empty maps. Inside a
+        translation context the maps are memoized for the request, so later
+        get_object_translation()/get_localized_value() calls are free.
+
+        Args:
+            objects: Model instances (a queryset is evaluated)
+            lang_code: Target language code
+
+        Returns:
+            Dict mapping str(object pk) to {field_name: text}
+        """
         from django.contrib.contenttypes.models import ContentType
-        from apps.system.models import Translation
+        from django.db.models import Model
 
         lang_code = lang_code or get_current_language()
-        content_type = ContentType.objects.get_for_model(obj)
+        context = get_translation_context()
+        result: Dict[str, Dict[str, str]] = {}
 
-        # Check cache
-        if use_cache:
-            cache_key = TranslationCache._make_key(
-                'gfk', content_type.model, obj.pk, field_name, lang_code
-            )
-            cached = cache.get(cache_key)
-            if cached is not None:
-                return cached
+        pending: Dict[int, List[str]] = {}
+        for obj in objects:
+            # Skip unsaved instances and non-model placeholders
+            if not isinstance(obj, Model) or obj.pk is None:
+                continue
+            content_type_id = ContentType.objects.get_for_model(obj).id
+            object_id = str(obj.pk)
+            memo_key = (content_type_id, object_id, lang_code)
+            if context is not None and memo_key in context.objects:
+                result[object_id] = context.objects[memo_key]
+            elif object_id not in result:
+                pending.setdefault(content_type_id, []).append(object_id)
+
+        if not pending:
+            return result
+
+        keys = {
+            TranslationCache.object_key(content_type_id, object_id, lang_code):
+                (content_type_id, object_id)
+            for content_type_id, object_ids in pending.items()
+            for object_id in dict.fromkeys(object_ids)
+        }
+        resolved: Dict[Tuple[int, str], Dict[str, str]] = {
+            keys[cache_key]: field_map
+            for cache_key, field_map in cache.get_many(list(keys)).items()
+        }
+
+        to_cache = {}
+        for content_type_id, object_ids in pending.items():
+            missing = [
+                object_id for object_id in object_ids
+                if (content_type_id, object_id) not in resolved
+            ]
+            if not missing:
+                continue
+            try:
+                loaded = TranslationService._load_object_translations(
+                    content_type_id, missing, lang_code
+                )
+            except Exception:
+                # Serve originals for this request, but do not cache the failure
+                for object_id in missing:
+                    result[object_id] = {}
+                continue
+            for object_id, field_map in loaded.items():
+                resolved[(content_type_id, object_id)] = field_map
+                cache_key = TranslationCache.object_key(content_type_id, object_id, lang_code)
+                to_cache[cache_key] = field_map
 
-        # Query database
-        try:
-            translation = Translation.objects.filter(
-                content_type=content_type,
-                object_id=obj.pk,
-                field_name=field_name,
-                language_code=lang_code,
-                is_deleted=False
-            ).first()
+        if to_cache:
+            cache.set_many(to_cache, TranslationCache.CACHE_TIMEOUT)
 
-            if translation:
-                text = translation.text
-                if use_cache:
-                    cache.set(cache_key, text, TranslationCache.CACHE_TIMEOUT)
-                return text
-        except Exception:
-            pass
+        for (content_type_id, object_id), field_map in resolved.items():
+            result[object_id] = field_map
+            if context is not None:
+                context.objects[(content_type_id, object_id, lang_code)] = field_map
+
+        return result
+
+    @staticmethod
+    def _load_object_translations(
+        content_type_id: int,
+        object_ids: List[str],
+        lang_code: str
+    ) -> Dict[str, Dict[str, str]]:
+        """Load {field_name: text} maps for objects of one content type."""
+        from apps.system.models import Translation
+
+        loaded: Dict[str, Dict[str, str]] = {str(object_id): {} for object_id in object_ids}
+        qs = Translation.objects.filter(
+            content_type_id=content_type_id,
+            object_id__in=object_ids,
+            language_code=lang_code,
+            is_deleted=False
+        ).values_list('object_id', 'field_name', 'text')
+
+        for object_id, field_name, text in qs:
+            loaded[str(object_id)][field_name] = text
+        return loaded
+
+    @staticmethod
+    def translate_objects(
+        objects: Iterable,
+        fields: List[str],
+        lang_code: Optional[str] = None,
+        fallback_to_original: bool = True
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Localize fields of many objects with a constant number of lookups.
+
+        Args:
+            objects: Model instances or a queryset
+            fields: Field names to localize
+            lang_code: Target language code
+            fallback_to_original: Whether to fallback to original values
 
-        return None
+        Returns:
+            Dict mapping str(object pk) to {field_name: localized value}
+        """
+        lang_code = lang_code or get_current_language()
+        objects = list(objects)
+
+        with translation_context():
+            TranslationService.prefetch_object_translations(objects, lang_code)
+            return {
+                str(obj.pk): {
+                    field_name: TranslationService.get_localized_value(
+                        obj, field_name, lang_code, fallback_to_original
+                    )
+                    for field_name in fields
+                }
+                for obj in objects
+            }
 
     @staticmethod
     def get_localized_value(
@@ -574,32 +865,14 @@ class TranslationService:
         Returns:
             Dict mapping field names to translated values
         """
-        from django.contrib.contenttypes.models import ContentType
-        from apps.system.models import Translation
-
         lang_code = lang_code or get_current_language()
-        content_type = ContentType.objects.get_for_model(obj)
-
-        result = {}
-
-        # Query all translations for this object
-        try:
-            qs = Translation.objects.filter(
-                content_type=content_type,
-                object_id=obj.pk,
-                language_code=lang_code,
-                is_deleted=False
-            )
-
-            if field_names:
-                qs = qs.filter(field_name__in=field_names)
-
-            for trans in qs:
-                result[trans.field_name] = trans.text
-        except Exception:
-            pass
+        field_map = TranslationService.prefetch_object_translations(
+            [obj], lang_code
+        ).get(str(obj.pk), {})
 
-        return result
+        if field_names:
+            return {name: text for name, text in field_map.items() if name in field_names}
+        return dict(field_map)
 
     @staticmethod
     def set_object_translation(
@@ -697,35 +970,17 @@ class TranslationService:
         Returns:
             Dict mapping object IDs to translated values
         """
-        from django.contrib.contenttypes.models import ContentType
-        from apps.system.models import Translation
-
         if not objects:
             return {}
 
         lang_code = lang_code or get_current_language()
-        first_obj = objects[0]
-        content_type = ContentType.objects.get_for_model(first_obj)
+        field_maps = TranslationService.prefetch_object_translations(objects, lang_code)
 
-        # Get all object IDs
-        object_ids = [obj.pk for obj in objects]
-
-        # Query all translations in one go
         result = {}
-        try:
-            qs = Translation.objects.filter(
-                content_type=content_type,
-                object_id__in=object_ids,
-                field_name=field_name,
-                language_code=lang_code,
-                is_deleted=False
-            )
-
-            for trans in qs:
-                result[trans.object_id] = trans.text
-        except Exception:
-            pass
-
+        for obj in objects:
+            text = field_maps.get(str(obj.pk), {}).get(field_name)
+            if text is not None:
+                result[obj.pk] = text
         return result
 
 
@@ -59,6 +59,40 @@ class PermissionCache:
         key = cls._make_key('user_perms', user_id)
         cache.set(key, list(permissions), cls.CACHE_TIMEOUT)
 
+    @classmethod
+    def get_many_user_permissions(cls, user_ids: List[str]) -> Dict[str, Set[str]]:
+        """
+        Get cached permissions of several users in one round trip.
+
+        Args:
+            user_ids: User IDs
+
+        Returns:
+            Dict of user ID to permission codes (cached users only)
+        """
+        keys = {cls._make_key('user_perms', user_id): user_id for user_id in user_ids}
+        return {
+            keys[key]: set(data)
+            for key, data in cache.get_many(list(keys)).items()
+            if data is not None
+        }
+
+    @classmethod
+    def set_many_user_permissions(cls, permissions: Dict[str, Set[str]]) -> None:
+        """
+        Cache permissions of several users in one round trip.
+
+        Args:
+            permissions: Dict of user ID to permission codes
+        """
+        cache.set_many(
+            {
+                cls._make_key('user_perms', user_id): list(codes)
+                for user_id, codes in permissions.items()
+            },
+            cls.CACHE_TIMEOUT
+        )
+
     @classmethod
     def invalidate_user(cls, user_id: str) -> None:
         """
@@ -101,6 +101,95 @@ class PermissionService:
 
         return permissions
 
+    @staticmethod
+    def get_users_permissions(
+        users,
+        use_cache: bool = True
+    ) -> Dict[str, Set[str]]:
+        """
+        Get all permissions for many users with grouped queries.
+
+        Same result as get_user_permissions per user, but cached entries
+        are read with one get_many and the rest loaded with one query per
+        grant source (user, group, role) instead of per user.
+
+        Args:
+            users: Iterable of User instances
+            use_cache: Whether to use cache
+
+        Returns:
+            Dict mapping user ID (str) to set of permission codes
+        """
+        from django.contrib.auth.models import Permission
+
+        users = {
+            str(user.id): user for user in users
+            if user and user.is_authenticated
+        }
+        result: Dict[str, Set[str]] = {}
+        if use_cache and users:
+            result.update(PermissionCache.get_many_user_permissions(list(users)))
+
+        pending = {user_id: user for user_id, user in users.items() if user_id not in result}
+        if not pending:
+            return result
+
+        loaded = {user_id: set() for user_id in pending}
+
+        # 1. Django system permissions (ModelBackend semantics)
+        active = [user for user in pending.values() if user.is_active]
+        superuser_ids = [str(user.id) for user in active if user.is_superuser]
+        regular_ids = [user.id for user in active if not user.is_superuser]
+
+        if superuser_ids:
+            all_perms = {
+                f'{app_label}.{codename}'
+                for app_label, codename in Permission.objects.values_list(
+                    'content_type__app_label', 'codename'
+                )
+            }
+            for user_id in superuser_ids:
+                loaded[user_id].update(all_perms)
+
+        if regular_ids:
+            grants = (
+                Permission.objects.filter(user__id__in=regular_ids).values_list(
+                    'user__id', 'content_type__app_label', 'codename'
+                ),
+                Permission.objects.filter(group__user__id__in=regular_ids).values_list(
+                    'group__user__id', 'content_type__app_label', 'codename'
+                ),
+            )
+            for rows in grants:
+                for user_id, app_label, codename in rows:
+                    loaded[str(user_id)].add(f'{app_label}.{codename}')
+
+        # 2. Custom role permissions
+        try:
+            from apps.permissions.models import UserRole
+            user_roles = UserRole.objects.filter(
+                user__id__in=[user.id for user in pending.values()],
+                is_active=True
+            ).select_related('role')
+
+            for user_role in user_roles:
+                role = user_role.role
+                permissions = loaded[str(user_role.user_id)]
+                if hasattr(role, 'permissions') and role.permissions:
+                    if isinstance(role.permissions, list):
+                        permissions.update(role.permissions)
+                    elif isinstance(role.permissions, dict):
+                        permissions.update(role.permissions.keys())
+        except Exception:
+            pass
+
+        # Cache result
+        if use_cache:
+            PermissionCache.set_many_user_permissions(loaded)
+
+        result.update(loaded)
+        return result
+
     @staticmethod
     def get_user_roles(
         user,
@@ -0,0 +1,98 @@
+"""
+Tests for rolling APM metrics.
+"""
+import pytest
+from django.core.cache import cache
+
+from apps.common.services.apm_metrics import LatencyHistogram, RollingAPIMetrics
+from apps.common.services.apm_monitoring import APMMonitor
+
+
+class TestLatencyHistogram:
+    """Test histogram counters and percentiles."""
+
+    def test_percentiles_and_extremes(self):
+        histogram = LatencyHistogram()
+        for duration in range(1, 101):
+            histogram.add(duration, is_error=duration > 95)
+
+        assert histogram.count == 100
+        assert histogram.errors == 5
+        assert histogram.min_ms == 1
+        assert histogram.max_ms == 100
+        assert 40 <= histogram.percentile(50) <= 60
+        assert 90 <= histogram.percentile(99) <= 100
+
+    def test_field_round_trip_merges(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.add(20, False)
+        second.add(800, True)
+        first.merge(second)
+
+        fields = {field: value for field, _, value in first.to_fields('/api/assets/')}
+        decoded = LatencyHistogram.from_fields(fields)['/api/assets/']
+
+        assert decoded.count == 2
+        assert decoded.errors == 1
+        assert decoded.buckets == first.buckets
+        assert decoded.max_ms == 800
+
+
+class TestRollingAPIMetrics:
+    """Test the recording pipeline."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_buffer_is_bounded(self):
+        metrics = RollingAPIMetrics(cache_prefix='apm_test', buffer_size=10, flush_interval=3600)
+        for _ in range(50):
+            metrics.record('/api/a/', 'GET', 10, 200)
+
+        assert len(metrics._events) == 10
+        assert metrics.local_window(300).count == 10
+
+    def test_aggregate_merges_flushed_buckets(self):
+        first = RollingAPIMetrics(cache_prefix='apm_test', flush_interval=3600)
+        second = RollingAPIMetrics(cache_prefix='apm_test', flush_interval=3600)
+        first.record('/api/a/', 'GET', 10, 200)
+        second.record('/api/a/', 'GET', 30, 500)
+        second.flush()
+
+        stats = first.aggregate(hours=1)
+
+        assert stats['/api/a/'].count == 2
+        assert stats['/api/a/'].errors == 1
+
+
+class TestAPMMonitorStats:
+    """Test get_api_stats on precomputed aggregates."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_get_api_stats_reports_percentiles(self):
+        monitor = APMMonitor()
+        monitor.cache_prefix = 'apm_test_monitor'
+        monitor.metrics = RollingAPIMetrics(cache_prefix='apm_test_monitor', flush_interval=3600)
+        monitor._create_alert = lambda *args, **kwargs: None
+        for duration in (10, 20, 30, 40):
+            monitor.track_api_response_time('/api/assets/', 'GET', duration, 200)
+        monitor.track_api_response_time('/api/assets/', 'GET', 50, 500)
+
+        stats = monitor.get_api_stats(hours=1)
+
+        assert stats['total_requests'] == 5
+        assert stats['error_count'] == 1
+        assert stats['min_response_time'] == 10
+        assert stats['max_response_time'] == 50
+        assert stats['endpoint_stats']['/api/assets/']['requests'] == 5
+        assert 'p95_response_time' in stats
+
+    def test_recent_error_rate_uses_rolling_window(self):
+        monitor = APMMonitor()
+        monitor.metrics = RollingAPIMetrics(cache_prefix='apm_test_rate', flush_interval=3600)
+        monitor.metrics.record('/api/a/', 'GET', 10, 200)
+        monitor.metrics.record('/api/a/', 'GET', 10, 503)
+
+        assert monitor._get_recent_error_rate() == pytest.approx(50.0)
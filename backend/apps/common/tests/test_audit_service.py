@@ -0,0 +1,129 @@
+"""
+Tests for the buffered audit logger and its event store.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from django.core.cache import cache
+from django.core.signals import request_finished
+
+from apps.common.services import audit_service
+from apps.common.services.audit_service import AuditLogger
+from apps.common.services.audit_store import CacheAuditStore
+
+
+@pytest.fixture
+def audit():
+    cache.clear()
+    logger = AuditLogger()
+    logger.batch_size = 50
+    logger.flush_interval = 3600
+    return logger
+
+
+class TestAuditLogger:
+    """Test buffered writes and indexed queries."""
+
+    def test_events_are_buffered_until_flush(self, audit):
+        audit.log('user_updated', 1, 'user', 'Updated profile', object_type='user', object_id=1)
+
+        assert len(audit._buffer) == 1
+        assert audit.flush() == 1
+        assert len(audit._buffer) == 0
+
+    def test_high_severity_events_are_written_immediately(self, audit):
+        audit.log_security_event('Suspicious login')
+
+        assert len(audit._buffer) == 0
+        events = audit.get_security_events()
+        assert [event['action'] for event in events] == ['Suspicious login']
+
+    def test_queries_use_object_and_actor_indexes(self, audit):
+        for i in range(120):
+            audit.log('asset_updated', i % 3, 'user', f'Update {i}',
+                      object_type='asset', object_id=i % 4)
+
+        trail = audit.get_audit_trail('asset', 1)
+        activity = audit.get_user_activity(2)
+
+        assert len(trail) == 30
+        assert {event['object_id'] for event in trail} == {'1'}
+        assert [event['action'] for event in trail][:2] == ['Update 1', 'Update 5']
+        assert len(activity) == 40
+        assert {event['actor_id'] for event in activity} == {'2'}
+
+    def test_trail_excludes_events_outside_window(self, audit):
+        old = datetime.now() - timedelta(hours=48)
+        audit.log('user_updated', 1, 'user', 'Old', object_type='user', object_id=1, timestamp=old)
+        audit.log('user_updated', 1, 'user', 'New', object_type='user', object_id=1)
+
+        assert [event['action'] for event in audit.get_audit_trail('user', 1)] == ['New']
+        assert len(audit.get_audit_trail('user', 1, hours=72)) == 2
+
+    def test_compliance_report_scans_period(self, audit):
+        now = datetime.now()
+        audit.log('data_exported', 1, 'user', 'Export', timestamp=now - timedelta(days=10))
+        audit.log('workflow_rejected', 1, 'user', 'Reject',
+                  object_type='workflow_instance', object_id=7)
+        audit.log('user_deleted', 2, 'user', 'Delete', object_type='user', object_id=3)
+
+        report = audit.generate_compliance_report(
+            now - timedelta(hours=1), now + timedelta(hours=1)
+        )
+
+        assert report['total_events'] == 2
+        assert report['by_event_type'] == {'workflow_rejected': 1, 'user_deleted': 1}
+        assert report['by_actor'] == {'user:1': 1, 'user:2': 1}
+        assert report['high_severity_events'] == 1
+        assert report['medium_severity_events'] == 1
+
+    def test_cleanup_removes_expired_events(self, audit):
+        audit.retention_days = 30
+        audit.log('user_updated', 1, 'user', 'Expired',
+                  timestamp=datetime.now() - timedelta(days=40))
+        audit.log('user_updated', 1, 'user', 'Kept')
+
+        assert audit.cleanup_old_logs() == 1
+        assert [event['action'] for event in audit.get_user_activity(1, hours=24 * 60)] == ['Kept']
+
+    def test_failed_fallback_requeues_batch_without_raising(self, audit, monkeypatch):
+        def fail(batch):
+            raise ConnectionError('store down')
+
+        monkeypatch.setattr(audit, '_get_store', lambda: audit._fallback_store)
+        monkeypatch.setattr(audit._fallback_store, 'append_many', fail)
+        audit.log('user_updated', 1, 'user', 'First')
+        audit.log('user_updated', 1, 'user', 'Second')
+
+        assert audit.flush() == 0
+        assert [event['action'] for event in audit._buffer] == ['First', 'Second']
+
+    def test_requeue_drops_oldest_events_beyond_buffer_cap(self, audit):
+        audit.max_buffered = 3
+        audit.log('user_updated', 1, 'user', 'Buffered')
+        batch = [{'action': f'Event {i}'} for i in range(4)]
+
+        audit._requeue(batch, ConnectionError('store down'))
+
+        assert [event['action'] for event in audit._buffer] == ['Event 2', 'Event 3', 'Buffered']
+
+    def test_queries_read_events_written_to_fallback_store(self, audit, monkeypatch):
+        def fail(batch):
+            raise ConnectionError('stream down')
+
+        primary = CacheAuditStore('audit_primary', audit.retention_days)
+        monkeypatch.setattr(primary, 'append_many', fail)
+        audit._store = primary
+        audit.log('user_updated', 1, 'user', 'Fallback', object_type='user', object_id=1)
+
+        assert [event['action'] for event in audit.get_audit_trail('user', 1)] == ['Fallback']
+        assert [event['action'] for event in audit.get_user_activity(1)] == ['Fallback']
+
+    def test_request_finished_flushes_buffer(self, audit, monkeypatch):
+        monkeypatch.setattr(audit_service, 'audit_logger', audit)
+        audit.log('user_updated', 1, 'user', 'Buffered')
+        assert len(audit._buffer) == 1
+
+        request_finished.send(sender=None)
+
+        assert len(audit._buffer) == 0
@@ -0,0 +1,78 @@
+"""
+Tests for the sliding-window rate limiter.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from apps.common.utils.rate_limiter import (
+    LocalSlidingWindowLimiter,
+    SlidingWindowRateLimiter,
+    normalize_route,
+)
+
+
+class TestNormalizeRoute:
+    """Test route pattern keys."""
+
+    def test_collapses_uuid_and_numeric_segments(self):
+        assert normalize_route(
+            '/api/assets/0b6f3c6e-7f4e-4c83-9d0a-2a6a1f1c9b10/qr/'
+        ) == '/api/assets/{id}/qr/'
+        assert normalize_route('/api/system/objects/Asset/42') == '/api/system/objects/Asset/{id}'
+
+    def test_keeps_static_segments(self):
+        assert normalize_route('/api/v2/assets/export/') == '/api/v2/assets/export/'
+
+
+class TestLocalSlidingWindowLimiter:
+    """Test the in-process fallback limiter."""
+
+    def test_blocks_after_limit(self):
+        limiter = LocalSlidingWindowLimiter()
+
+        results = [limiter.hit('bucket', 3, 60) for _ in range(4)]
+
+        assert [r['allowed'] for r in results] == [True, True, True, False]
+        assert [r['remaining'] for r in results] == [2, 1, 0, 0]
+        assert results[-1]['retry_after'] >= 1
+
+    def test_counts_concurrent_hits_exactly(self):
+        limiter = LocalSlidingWindowLimiter()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: limiter.hit('bucket', 50, 60), range(200)))
+
+        assert sum(1 for r in results if r['allowed']) == 50
+
+    def test_reset_and_bounded_buckets(self):
+        limiter = LocalSlidingWindowLimiter(max_buckets=2)
+        limiter.hit('a', 1, 60)
+        limiter.hit('b', 1, 60)
+        limiter.hit('c', 1, 60)
+
+        assert set(limiter.counts()) == {'b', 'c'}
+        limiter.reset('b')
+        assert limiter.hit('b', 1, 60)['allowed'] is True
+
+
+class TestSlidingWindowRateLimiter:
+    """Test Redis script usage and fallback."""
+
+    def test_uses_script_result(self):
+        limiter = SlidingWindowRateLimiter()
+        script = Mock(return_value=[0, 5, 1_000_000])
+        limiter._get_script = Mock(return_value=script)
+
+        result = limiter.hit('bucket', 5, 60)
+
+        assert result['allowed'] is False
+        assert result['reset_time'] == 1000 + 60
+        assert script.call_count == 1
+
+    def test_falls_back_to_local_when_redis_fails(self):
+        limiter = SlidingWindowRateLimiter()
+        limiter._get_script = Mock(return_value=Mock(side_effect=ConnectionError('down')))
+
+        assert limiter.hit('bucket', 1, 60)['allowed'] is True
+        assert limiter.hit('bucket', 1, 60)['allowed'] is False
+        assert limiter.local.counts() == {'bucket': 1}
@@ -7,9 +7,17 @@ from .qr_code import (
     generate_qr_code_base64,
     generate_asset_qr_code,
     generate_asset_qr_url,
+    render_qr_png,
     validate_qr_data,
     decode_qr_data,
 )
+from .local_cache import LocalLRUCache
+from .rate_limiter import (
+    LocalSlidingWindowLimiter,
+    SlidingWindowRateLimiter,
+    get_rate_limiter,
+    normalize_route,
+)
 
 __all__ = [
     'QRCodeConfig',
@@ -17,6 +25,12 @@ __all__ = [
     'generate_qr_code_base64',
     'generate_asset_qr_code',
     'generate_asset_qr_url',
+    'render_qr_png',
     'validate_qr_data',
     'decode_qr_data',
+    'LocalLRUCache',
+    'LocalSlidingWindowLimiter',
+    'SlidingWindowRateLimiter',
+    'get_rate_limiter',
+    'normalize_route',
 ]
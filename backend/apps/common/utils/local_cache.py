@@ -0,0 +1,72 @@
+"""
+In-process LRU cache utility for GZEAMS.
+
+Provides a small, thread-safe cache that sits in front of the shared
+Django/Redis cache for hot, rarely-changing lookups (dictionaries,
+metadata). Entries expire after a short TTL so that changes made in
+other processes are picked up without cross-process messaging.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LocalLRUCache:
+    """
+    Size-bounded, thread-safe LRU cache with a per-entry TTL.
+
+    Usage:
+        _labels = LocalLRUCache(max_entries=1024, timeout=30)
+
+        value = _labels.get(key)
+        if value is None:
+            value = load()
+            _labels.set(key, value)
+    """
+
+    def __init__(self, max_entries: int = 512, timeout: Optional[float] = 30):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, timeout: Optional[float] = None) -> None:
+        timeout = self.timeout if timeout is None else timeout
+        expires_at = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Delete all entries whose key satisfies predicate; return the count."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -173,6 +173,24 @@ def generate_asset_qr_code(asset_code: str, qr_content: Optional[str] = None) ->
     return generate_qr_code(qr_content, config)
 
 
+def render_qr_png(data: str) -> bytes:
+    """
+    Render a plain asset-link QR code as PNG bytes.
+
+    Module-level and Django-free so it can run in worker processes for
+    bulk label generation.
+
+    Args:
+        data: Data to encode in QR code
+
+    Returns:
+        PNG image bytes
+    """
+    config = QRCodeConfig(error_correction='L', show_text=False)
+    image_bytes, _ = generate_qr_code(data, config)
+    return image_bytes
+
+
 def generate_asset_qr_url(qr_code: str, base_url: str = '') -> str:
     """
     Generate QR code content URL for asset lookup.
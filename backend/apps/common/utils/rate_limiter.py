@@ -0,0 +1,247 @@
+"""
+Sliding-window rate limiter for GZEAMS.
+
+The shared limiter keeps one Redis sorted set per bucket and updates it
+with a single Lua script, so trimming, counting and recording a hit is
+one atomic round-trip that stays correct when many workers share a
+bucket. When Redis is unavailable the limiter falls back to an
+in-process window until the connection comes back.
+"""
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Path segments that identify a record rather than a route
+_ID_SEGMENT = re.compile(
+    r'/(?:[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}'
+    r'|\d+)(?=/|$)'
+)
+
+
+def normalize_route(path: str) -> str:
+    """
+    Collapse record identifiers in a URL path into a route pattern.
+
+    Example:
+        /api/assets/3f2b.../qr/  ->  /api/assets/{id}/qr/
+    """
+    return _ID_SEGMENT.sub('/{id}', path)
+
+
+# KEYS[1] = bucket; ARGV = now_ms, window_ms, limit, member
+# Returns {allowed, count, oldest_ms}
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    count = count + 1
+    allowed = 1
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+local oldest_score = now
+if oldest[2] then
+    oldest_score = tonumber(oldest[2])
+end
+return {allowed, count, oldest_score}
+"""
+
+
+def _build_result(allowed: bool, count: int, limit: int, oldest: float,
+                  window: float, now: float) -> Dict[str, Any]:
+    """Translate a window state into the rate limit status dict."""
+    reset_time = int(oldest + window)
+    return {
+        'allowed': allowed,
+        'limit': limit,
+        'remaining': max(limit - count, 0) if allowed else 0,
+        'retry_after': 0 if allowed else int(oldest + window - now) + 1,
+        'reset_time': reset_time,
+    }
+
+
+class LocalSlidingWindowLimiter:
+    """
+    Thread-safe, in-process sliding window limiter.
+
+    Used when Redis cannot be reached. Limits are per process, so they are
+    looser than the shared limiter but still protect each worker. The
+    number of tracked buckets is bounded; the least recently used bucket
+    is dropped first.
+    """
+
+    def __init__(self, max_buckets: int = 10000):
+        self.max_buckets = max_buckets
+        self._buckets: 'OrderedDict[str, deque]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, window: int) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            hits = self._buckets.get(key)
+            if hits is None:
+                hits = self._buckets[key] = deque()
+            self._buckets.move_to_end(key)
+
+            while hits and hits[0] <= now - window:
+                hits.popleft()
+
+            allowed = len(hits) < limit
+            if allowed:
+                hits.append(now)
+            count = len(hits)
+            oldest = hits[0] if hits else now
+
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+
+        return _build_result(allowed, count, limit, oldest, window, now)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def counts(self, prefix: str = '') -> Dict[str, int]:
+        """Get the number of hits currently recorded per bucket."""
+        with self._lock:
+            return {key: len(hits) for key, hits in self._buckets.items()
+                    if key.startswith(prefix) and hits}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class SlidingWindowRateLimiter:
+    """
+    Atomic Redis sorted-set limiter with a local fallback.
+
+    Usage:
+        limiter = SlidingWindowRateLimiter()
+        result = limiter.hit('rate_limit:ip:1.2.3.4:/api/assets/:GET', 100, 60)
+        if not result['allowed']:
+            ...
+    """
+
+    # Seconds to wait before trying Redis again after a failure
+    REDIS_RETRY_INTERVAL = 5
+
+    def __init__(self, alias: str = 'default'):
+        self.alias = alias
+        self.local = LocalSlidingWindowLimiter()
+        self._script = None
+        self._script_connection = None
+        self._redis_retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def _get_script(self):
+        """Get the registered Lua script, or None when Redis is unavailable."""
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        try:
+            from django_redis import get_redis_connection
+            connection = get_redis_connection(self.alias)
+        except Exception:
+            # Not a Redis cache backend (or django_redis missing)
+            self._redis_retry_at = float('inf')
+            return None
+
+        with self._lock:
+            if self._script is None or self._script_connection is not connection:
+                self._script = connection.register_script(SLIDING_WINDOW_SCRIPT)
+                self._script_connection = connection
+            return self._script
+
+    def _mark_redis_down(self, exc: Exception) -> None:
+        if self._redis_retry_at <= time.monotonic():
+            logger.warning(f"Rate limiter falling back to local windows: {exc}")
+        self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_INTERVAL
+
+    def hit(self, key: str, limit: int, window: int) -> Dict[str, Any]:
+        """
+        Record one request in a bucket if it is within the limit.
+
+        Args:
+            key: Bucket key
+            limit: Maximum requests per window
+            window: Window size in seconds
+
+        Returns:
+            Dict with allowed, limit, remaining, retry_after, reset_time
+        """
+        script = self._get_script()
+        if script is not None:
+            now = time.time()
+            now_ms = int(now * 1000)
+            try:
+                allowed, count, oldest_ms = script(
+                    keys=[key],
+                    args=[now_ms, window * 1000, limit, f'{now_ms}-{uuid.uuid4().hex[:12]}'],
+                )
+            except Exception as exc:
+                self._mark_redis_down(exc)
+            else:
+                return _build_result(
+                    bool(allowed), int(count), limit, int(oldest_ms) / 1000, window, now
+                )
+
+        return self.local.hit(key, limit, window)
+
+    def _get_connection(self):
+        if self._get_script() is None:
+            return None
+        return self._script_connection
+
+    def reset(self, key: str) -> None:
+        """Forget all hits recorded in a bucket."""
+        self.local.reset(key)
+        connection = self._get_connection()
+        if connection is not None:
+            try:
+                connection.delete(key)
+            except Exception as exc:
+                self._mark_redis_down(exc)
+
+    def counts(self, prefix: str = '') -> Dict[str, int]:
+        """Get the number of hits currently recorded per bucket."""
+        counts = self.local.counts(prefix)
+        connection = self._get_connection()
+        if connection is None:
+            return counts
+
+        try:
+            keys = list(connection.scan_iter(match=f'{prefix}*', count=500))
+            pipe = connection.pipeline(transaction=False)
+            for key in keys:
+                pipe.zcard(key)
+            for key, count in zip(keys, pipe.execute()):
+                if count:
+                    key = key.decode() if isinstance(key, bytes) else key
+                    counts[key] = counts.get(key, 0) + count
+        except Exception as exc:
+            self._mark_redis_down(exc)
+        return counts
+
+
+_default_limiter: Optional[SlidingWindowRateLimiter] = None
+
+
+def get_rate_limiter() -> SlidingWindowRateLimiter:
+    """Get the process-wide rate limiter."""
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = SlidingWindowRateLimiter()
+    return _default_limiter
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-16 19:58
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('depreciation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='candidate_assets',
+            field=models.IntegerField(default=0, help_text='Number of assets selected for calculation in this run', validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='processed_assets',
+            field=models.IntegerField(default=0, help_text='Number of selected assets processed so far', validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.1 on 2026-10-16 20:07
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('depreciation', '0002_depreciation_run_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='chunk_stats',
+            field=models.JSONField(blank=True, default=list, help_text='Recent per-chunk statistics (assets, records, duration_ms)'),
+        ),
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='chunks_completed',
+            field=models.IntegerField(default=0, help_text='Number of committed chunks', validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, help_text='When chunk processing finished', null=True),
+        ),
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='last_asset_id',
+            field=models.UUIDField(blank=True, help_text='Last asset id committed by the previous chunk (keyset checkpoint)', null=True),
+        ),
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='started_at',
+            field=models.DateTimeField(blank=True, help_text='When chunk processing started', null=True),
+        ),
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='task_id',
+            field=models.CharField(blank=True, help_text='Celery task id of the latest dispatch', max_length=255),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-16 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('depreciation', '0003_depreciation_run_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='depreciationrun',
+            name='scope',
+            field=models.JSONField(blank=True, default=dict, help_text='Optional asset selection (category_ids, asset_ids); empty selects all'),
+        ),
+    ]
@@ -223,6 +223,56 @@ class DepreciationRun(BaseModel):
         help_text='Total depreciation amount for this run'
     )
 
+    # Batch progress
+    candidate_assets = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text='Number of assets selected for calculation in this run'
+    )
+    processed_assets = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text='Number of selected assets processed so far'
+    )
+
+    scope = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='Optional asset selection (category_ids, asset_ids); empty selects all'
+    )
+
+    # Chunk checkpoint for resumable execution
+    task_id = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text='Celery task id of the latest dispatch'
+    )
+    last_asset_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text='Last asset id committed by the previous chunk (keyset checkpoint)'
+    )
+    chunks_completed = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text='Number of committed chunks'
+    )
+    chunk_stats = models.JSONField(
+        default=list,
+        blank=True,
+        help_text='Recent per-chunk statistics (assets, records, duration_ms)'
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='When chunk processing started'
+    )
+    completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='When chunk processing finished'
+    )
+
     # Error information
     error_message = models.TextField(
         blank=True,
@@ -238,6 +288,33 @@ class DepreciationRun(BaseModel):
     def __str__(self):
         return f"Depreciation Run - {self.period} ({self.get_status_display()})"
 
+    def get_progress_percent(self):
+        """Get batch progress as a percentage of selected assets."""
+        if self.status == 'completed':
+            return 100
+        if not self.candidate_assets:
+            return 0
+        return min(int(self.processed_assets * 100 / self.candidate_assets), 100)
+
+    def get_throughput(self):
+        """Get assets processed per second over the recent chunks."""
+        stats = self.chunk_stats or []
+        assets = sum(int(item.get('assets') or 0) for item in stats)
+        duration_ms = sum(int(item.get('duration_ms') or 0) for item in stats)
+        if not assets or not duration_ms:
+            return 0.0
+        return round(assets * 1000 / duration_ms, 2)
+
+    def get_eta_seconds(self):
+        """Estimate seconds left from the recent chunk throughput."""
+        if self.status != 'in_progress':
+            return None
+        throughput = self.get_throughput()
+        if not throughput:
+            return None
+        remaining = max(int(self.candidate_assets or 0) - int(self.processed_assets or 0), 0)
+        return int(remaining / throughput)
+
     def get_success_count(self):
         """Get number of successfully processed records."""
         rejected_count = DepreciationRecord.objects.filter(
@@ -111,6 +111,9 @@ class DepreciationRunSerializer(BaseModelSerializer):
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     success_count = serializers.IntegerField(source='get_success_count', read_only=True)
     failed_count = serializers.IntegerField(source='get_failed_count', read_only=True)
+    progress_percent = serializers.IntegerField(source='get_progress_percent', read_only=True)
+    throughput = serializers.FloatField(source='get_throughput', read_only=True)
+    eta_seconds = serializers.IntegerField(source='get_eta_seconds', read_only=True)
 
     class Meta(BaseModelSerializer.Meta):
         model = DepreciationRun
@@ -118,19 +121,47 @@ class DepreciationRunSerializer(BaseModelSerializer):
             'period', 'run_date', 'status', 'status_display',
             'total_assets', 'total_amount', 'error_message',
             'success_count', 'failed_count', 'notes',
+            'candidate_assets', 'processed_assets', 'progress_percent',
+            'chunks_completed', 'throughput', 'eta_seconds',
+            'task_id', 'started_at', 'completed_at',
         ]
+        read_only_fields = BaseModelSerializer.Meta.read_only_fields + [
+            'candidate_assets', 'processed_assets', 'chunks_completed',
+            'task_id', 'started_at', 'completed_at',
+        ]
+
+
+class DepreciationRunProgressSerializer(serializers.ModelSerializer):
+    """Run progress serializer for polling chunked execution"""
+
+    progress_percent = serializers.IntegerField(source='get_progress_percent', read_only=True)
+    throughput = serializers.FloatField(source='get_throughput', read_only=True)
+    eta_seconds = serializers.IntegerField(source='get_eta_seconds', read_only=True)
+
+    class Meta:
+        model = DepreciationRun
+        fields = [
+            'id', 'period', 'status', 'task_id',
+            'candidate_assets', 'processed_assets', 'progress_percent',
+            'total_assets', 'total_amount', 'chunks_completed', 'chunk_stats',
+            'throughput', 'eta_seconds', 'started_at', 'completed_at',
+            'error_message', 'updated_at',
+        ]
+        read_only_fields = fields
 
 
 class DepreciationRunListSerializer(BaseModelSerializer):
     """Lightweight run serializer for lists"""
 
     status_display = serializers.CharField(source='get_status_display', read_only=True)
+    progress_percent = serializers.IntegerField(source='get_progress_percent', read_only=True)
 
     class Meta(BaseModelSerializer.Meta):
         model = DepreciationRun
         fields = [
             'id', 'period', 'run_date', 'status', 'status_display',
-            'total_assets', 'total_amount', 'created_at', 'updated_at',
+            'total_assets', 'total_amount', 'progress_percent',
+            'created_at', 'updated_at',
         ]
 
 
@@ -140,6 +171,9 @@ class DepreciationRunDetailSerializer(BaseModelSerializer):
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     success_count = serializers.IntegerField(source='get_success_count', read_only=True)
     failed_count = serializers.IntegerField(source='get_failed_count', read_only=True)
+    progress_percent = serializers.IntegerField(source='get_progress_percent', read_only=True)
+    throughput = serializers.FloatField(source='get_throughput', read_only=True)
+    eta_seconds = serializers.IntegerField(source='get_eta_seconds', read_only=True)
 
     class Meta(BaseModelSerializer.Meta):
         model = DepreciationRun
@@ -158,4 +192,5 @@ __all__ = [
     'DepreciationRunSerializer',
     'DepreciationRunListSerializer',
     'DepreciationRunDetailSerializer',
+    'DepreciationRunProgressSerializer',
 ]
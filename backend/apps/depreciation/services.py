@@ -4,16 +4,24 @@ Depreciation management service layer.
 Provides business logic for depreciation configuration, monthly
 depreciation runs, and individual asset depreciation calculations.
 """
-from decimal import Decimal
+import time
+import uuid
+from decimal import ROUND_HALF_UP, Decimal
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import Exists, F, OuterRef, Sum
 from django.utils import timezone
 
 from apps.common.services.base_crud import BaseCRUDService
 from .models import DepreciationConfig, DepreciationRecord, DepreciationRun
 
+CENT = Decimal('0.01')
+
+
+class RunCheckpointConflict(Exception):
+    """Another worker committed the chunk this worker was processing."""
+
 
 class DepreciationConfigService(BaseCRUDService):
     """Service layer for depreciation configuration management."""
@@ -68,41 +76,92 @@ class DepreciationRecordService(BaseCRUDService):
 class DepreciationRunService(BaseCRUDService):
     """Service layer for batch depreciation run execution."""
 
+    # Assets fetched, calculated and committed per chunk
+    CHUNK_SIZE = 2000
+    # Asset statuses that keep depreciating
+    DEPRECIABLE_STATUSES = ['in_use', 'idle']
+    # Fallback parameters when a category has no active config
+    DEFAULT_SALVAGE_RATE = Decimal('0.05')
+    DEFAULT_USEFUL_LIFE = 60  # months
+    # Statuses a run can be resumed from after a crash or failure
+    RESUMABLE_STATUSES = ['in_progress', 'failed']
+    # Number of recent per-chunk statistics kept on the run row
+    CHUNK_STATS_LIMIT = 20
+
     def __init__(self):
         super().__init__(DepreciationRun)
 
-    @transaction.atomic
-    def execute_run(self, run_id, organization_id=None, user=None):
-        """Execute a pending depreciation run.
+    def dispatch_run(self, run_id, organization_id=None, user=None, resume=False):
+        """Queue a run for chunked execution on the Celery workers.
 
-        Iterates all depreciable assets in the organization, calculates
-        depreciation for the run's period, and creates DepreciationRecord
-        entries. Updates run statistics on completion.
+        The task id is stored on the run before enqueueing so progress
+        polling can correlate the run with its worker task.
         """
+        from .tasks import execute_depreciation_run_task
+
         dep_run = self.get(run_id, organization_id=organization_id, user=user)
-        if dep_run.status != 'pending':
-            raise ValidationError({
-                'status': ['Only pending runs can be executed.']
-            })
+        self._validate_startable(dep_run, resume=resume)
+
+        dep_run.task_id = str(uuid.uuid4())
+        dep_run.save(update_fields=['task_id', 'updated_at'])
+        execute_depreciation_run_task.apply_async(
+            kwargs={
+                'run_id': str(dep_run.id),
+                'organization_id': str(dep_run.organization_id),
+            },
+            task_id=dep_run.task_id,
+        )
+        dep_run.refresh_from_db()
+        return dep_run
 
-        dep_run.status = 'in_progress'
-        dep_run.save(update_fields=['status', 'updated_at'])
+    def execute_run(self, run_id, organization_id=None, user=None, chunk_size=None, resume=False):
+        """Execute a pending depreciation run, or resume an interrupted one.
 
-        try:
-            records_created = self._calculate_period_depreciation(dep_run)
-            dep_run.status = 'completed'
-            dep_run.total_assets = records_created
-            agg = DepreciationRecord.objects.filter(
-                organization=dep_run.organization,
-                period=dep_run.period,
-                status='calculated',
-                is_deleted=False,
-            ).aggregate(total=Sum('depreciation_amount'))
-            dep_run.total_amount = agg['total'] or Decimal('0')
+        Walks all depreciable assets in the organization in keyset-ordered
+        chunks, calculates straight-line depreciation for the run's period
+        and bulk creates DepreciationRecord entries. Each chunk commits in
+        its own transaction together with the run's checkpoint and progress
+        counters, so a resumed run continues after the last committed chunk.
+        """
+        dep_run = self.get(run_id, organization_id=organization_id, user=user)
+        self._validate_startable(dep_run, resume=resume)
+
+        if resume:
+            dep_run.status = 'in_progress'
+            dep_run.error_message = ''
+            dep_run.completed_at = None
+            dep_run.save(update_fields=[
+                'status', 'error_message', 'completed_at', 'updated_at',
+            ])
+        else:
+            dep_run.status = 'in_progress'
+            dep_run.candidate_assets = self._get_candidate_assets(dep_run).count()
+            dep_run.processed_assets = 0
+            dep_run.total_assets = 0
+            dep_run.total_amount = Decimal('0')
+            dep_run.last_asset_id = None
+            dep_run.chunks_completed = 0
+            dep_run.chunk_stats = []
+            dep_run.started_at = timezone.now()
             dep_run.save(update_fields=[
-                'status', 'total_assets', 'total_amount', 'updated_at'
+                'status', 'candidate_assets', 'processed_assets',
+                'total_assets', 'total_amount', 'last_asset_id',
+                'chunks_completed', 'chunk_stats', 'started_at', 'updated_at',
             ])
+
+        try:
+            self._calculate_period_depreciation(dep_run, chunk_size=chunk_size)
+            dep_run.refresh_from_db()
+            dep_run.status = 'completed'
+            dep_run.error_message = ''
+            dep_run.completed_at = timezone.now()
+            dep_run.save(update_fields=['status', 'error_message', 'completed_at', 'updated_at'])
+        except RunCheckpointConflict:
+            # The worker that advanced the checkpoint owns the run now
+            dep_run.refresh_from_db()
+            return dep_run
         except Exception as e:
+            dep_run.refresh_from_db()
             dep_run.status = 'failed'
             dep_run.error_message = str(e)
             dep_run.save(update_fields=['status', 'error_message', 'updated_at'])
@@ -110,96 +169,193 @@ class DepreciationRunService(BaseCRUDService):
 
         return dep_run
 
-    def _calculate_period_depreciation(self, dep_run):
-        """Calculate depreciation for all qualifying assets in a period.
+    def _validate_startable(self, dep_run, resume=False):
+        """Ensure the run is in a state that can be executed or resumed."""
+        if resume:
+            if dep_run.status not in self.RESUMABLE_STATUSES:
+                raise ValidationError({
+                    'status': ['Only in-progress or failed runs can be resumed.']
+                })
+        elif dep_run.status != 'pending':
+            raise ValidationError({
+                'status': ['Only pending runs can be executed.']
+            })
 
-        Returns the number of records created.
+    def _get_candidate_assets(self, dep_run):
+        """Get depreciable assets in the run scope that have no record for the period yet.
+
+        The anti-join matches the (organization, asset, period) unique
+        constraint, so soft-deleted records also block recalculation.
         """
         from apps.assets.models import Asset
 
-        assets = Asset.objects.filter(
-            organization=dep_run.organization,
-            is_deleted=False,
-            status__in=['in_use', 'idle'],
+        existing_records = DepreciationRecord.all_objects.filter(
+            organization_id=dep_run.organization_id,
+            asset_id=OuterRef('pk'),
+            period=dep_run.period,
         )
+        assets = Asset.all_objects.filter(
+            organization_id=dep_run.organization_id,
+            is_deleted=False,
+            asset_status__in=self.DEPRECIABLE_STATUSES,
+        ).exclude(Exists(existing_records))
+
+        scope = dep_run.scope or {}
+        if scope.get('category_ids'):
+            assets = assets.filter(asset_category_id__in=scope['category_ids'])
+        if scope.get('asset_ids'):
+            assets = assets.filter(id__in=scope['asset_ids'])
+        return assets
+
+    def _load_category_configs(self, dep_run):
+        """Load active depreciation parameters keyed by category id."""
+        configs = DepreciationConfig.all_objects.filter(
+            organization_id=dep_run.organization_id,
+            is_active=True,
+            is_deleted=False,
+        ).values_list('category_id', 'salvage_value_rate', 'useful_life')
+        return {
+            category_id: (salvage_value_rate / Decimal('100'), useful_life)
+            for category_id, salvage_value_rate, useful_life in configs
+        }
 
-        records_created = 0
-        for asset in assets:
-            # Skip if a record already exists for this asset + period
-            exists = DepreciationRecord.objects.filter(
-                organization=dep_run.organization,
-                asset=asset,
-                period=dep_run.period,
-                is_deleted=False,
-            ).exists()
-            if exists:
-                continue
+    def _calculate_period_depreciation(self, dep_run, chunk_size=None):
+        """Calculate depreciation for all qualifying assets in a period.
 
-            record = self._calculate_single_asset(asset, dep_run)
-            if record:
-                records_created += 1
+        Starts after the run's checkpoint and returns the number of
+        records created by this invocation.
+        """
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        configs = self._load_category_configs(dep_run)
+        candidates = self._get_candidate_assets(dep_run).order_by('pk')
+
+        records_created = 0
+        while True:
+            started = time.monotonic()
+            chunk_qs = candidates
+            if dep_run.last_asset_id is not None:
+                chunk_qs = chunk_qs.filter(pk__gt=dep_run.last_asset_id)
+            chunk = list(
+                chunk_qs.values_list('pk', 'asset_category_id', 'purchase_price')[:chunk_size]
+            )
+            if not chunk:
+                break
+
+            records_created += self._process_chunk(dep_run, chunk, configs, started)
 
         return records_created
 
-    def _calculate_single_asset(self, asset, dep_run):
-        """Calculate depreciation for a single asset.
+    def _process_chunk(self, dep_run, chunk, configs, started):
+        """Calculate and persist one chunk of (asset_id, category_id, price) rows.
 
-        Uses straight-line depreciation by default. Looks up
-        DepreciationConfig for the asset's category if available.
+        Records, counters and the keyset checkpoint commit atomically. The
+        checkpoint update is conditional on the chunk counter so a second
+        worker resuming the same run cannot commit the same chunk twice.
         """
-        config_service = DepreciationConfigService()
-        config = config_service.get_config_for_category(
-            getattr(asset, 'category_id', None),
-            organization_id=dep_run.organization_id,
+        accumulated_map = dict(
+            DepreciationRecord.all_objects.filter(
+                organization_id=dep_run.organization_id,
+                asset_id__in=[asset_id for asset_id, _, _ in chunk],
+                status='calculated',
+                is_deleted=False,
+            ).order_by().values('asset_id').annotate(
+                total=Sum('depreciation_amount')
+            ).values_list('asset_id', 'total')
         )
 
-        # Determine depreciation parameters
-        original_value = getattr(asset, 'original_value', None) or getattr(
-            asset, 'purchase_price', Decimal('0')
-        )
-        original_value = Decimal(str(original_value or 0))
+        records = []
+        chunk_amount = Decimal('0')
+        for asset_id, category_id, purchase_price in chunk:
+            record = self._build_record(
+                dep_run,
+                asset_id,
+                purchase_price,
+                configs.get(category_id),
+                accumulated_map.get(asset_id) or Decimal('0'),
+            )
+            if record is not None:
+                records.append(record)
+                chunk_amount += record.depreciation_amount
+
+        chunk_number = dep_run.chunks_completed + 1
+        last_asset_id = chunk[-1][0]
+
+        with transaction.atomic():
+            # Claiming the checkpoint first locks the run row, so a second
+            # worker waits here instead of colliding on the record inserts
+            updated = DepreciationRun.all_objects.filter(
+                pk=dep_run.pk,
+                chunks_completed=dep_run.chunks_completed,
+            ).update(
+                processed_assets=F('processed_assets') + len(chunk),
+                total_assets=F('total_assets') + len(records),
+                total_amount=F('total_amount') + chunk_amount,
+                last_asset_id=last_asset_id,
+                chunks_completed=chunk_number,
+                updated_at=timezone.now(),
+            )
+            if not updated:
+                raise RunCheckpointConflict(
+                    f'Run checkpoint was advanced by another worker (chunk {chunk_number}).'
+                )
+            DepreciationRecord.objects.bulk_create(records, batch_size=500)
+
+            chunk_stats = list(dep_run.chunk_stats or [])
+            chunk_stats.append({
+                'chunk': chunk_number,
+                'assets': len(chunk),
+                'records': len(records),
+                'duration_ms': int((time.monotonic() - started) * 1000),
+            })
+            chunk_stats = chunk_stats[-self.CHUNK_STATS_LIMIT:]
+            DepreciationRun.all_objects.filter(pk=dep_run.pk).update(chunk_stats=chunk_stats)
+
+        dep_run.last_asset_id = last_asset_id
+        dep_run.chunks_completed = chunk_number
+        dep_run.chunk_stats = chunk_stats
+        return len(records)
+
+    def _build_record(self, dep_run, asset_id, purchase_price, config, accumulated):
+        """Build an unsaved straight-line DepreciationRecord for one asset.
+
+        Uses the category config (salvage rate, useful life) when available,
+        otherwise the service defaults. Returns None when the asset has no
+        value or is already fully depreciated.
+        """
+        original_value = Decimal(str(purchase_price or 0))
         if original_value <= 0:
             return None
 
         if config:
-            salvage_rate = config.salvage_value_rate / Decimal('100')
-            useful_life = config.useful_life  # months
+            salvage_rate, useful_life = config
         else:
-            salvage_rate = Decimal('0.05')
-            useful_life = 60  # Default 5 years
+            salvage_rate = self.DEFAULT_SALVAGE_RATE
+            useful_life = self.DEFAULT_USEFUL_LIFE
 
-        salvage_value = original_value * salvage_rate
-        depreciable_amount = original_value - salvage_value
-
-        # Monthly depreciation (straight line)
+        depreciable_amount = original_value - original_value * salvage_rate
         monthly_depreciation = depreciable_amount / Decimal(str(useful_life))
 
-        # Get accumulated depreciation so far
-        accumulated = DepreciationRecord.objects.filter(
-            organization=dep_run.organization,
-            asset=asset,
-            status='calculated',
-            is_deleted=False,
-        ).aggregate(total=Sum('depreciation_amount'))['total'] or Decimal('0')
-
         # Don't depreciate past the depreciable amount
         remaining = depreciable_amount - accumulated
         if remaining <= 0:
             return None
 
-        period_amount = min(monthly_depreciation, remaining)
+        period_amount = min(monthly_depreciation, remaining).quantize(
+            CENT, rounding=ROUND_HALF_UP
+        )
+        if period_amount <= 0:
+            return None
         new_accumulated = accumulated + period_amount
-        net_value = original_value - new_accumulated
 
-        return DepreciationRecord.objects.create(
-            organization=dep_run.organization,
-            asset=asset,
+        return DepreciationRecord(
+            organization_id=dep_run.organization_id,
+            asset_id=asset_id,
             period=dep_run.period,
             depreciation_amount=period_amount,
             accumulated_amount=new_accumulated,
-            net_value=net_value,
+            net_value=original_value - new_accumulated,
             status='calculated',
-            created_by=dep_run.created_by,
+            created_by_id=dep_run.created_by_id,
         )
 
     def get_run_summary(self, organization_id=None, user=None):
@@ -0,0 +1,46 @@
+"""
+Celery tasks for depreciation runs.
+"""
+import logging
+from typing import Optional
+
+from celery import shared_task
+
+from apps.depreciation.models import DepreciationRun
+from apps.depreciation.services import DepreciationRunService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True)
+def execute_depreciation_run_task(self, *, run_id: str, organization_id: Optional[str] = None):
+    """
+    Execute or resume a depreciation run in chunks.
+
+    Notes:
+    - acks_late + reject_on_worker_lost re-queue the task when a worker dies
+      mid-run; the redelivered task resumes from the run's chunk checkpoint.
+    - Completed runs are skipped so duplicate deliveries are harmless.
+    """
+    dep_run = DepreciationRun.all_objects.filter(id=run_id, is_deleted=False).first()
+    if not dep_run or dep_run.status == 'completed':
+        return {'run_id': run_id, 'status': dep_run.status if dep_run else 'missing'}
+
+    service = DepreciationRunService()
+    resume = dep_run.status in service.RESUMABLE_STATUSES
+    try:
+        dep_run = service.execute_run(
+            run_id,
+            organization_id=organization_id or dep_run.organization_id,
+            resume=resume,
+        )
+    except Exception:
+        logger.exception('Depreciation run failed. run_id=%s', run_id)
+        raise
+
+    return {
+        'run_id': run_id,
+        'status': dep_run.status,
+        'total_assets': dep_run.total_assets,
+        'chunks_completed': dep_run.chunks_completed,
+    }
@@ -7,7 +7,7 @@ from rest_framework.test import APITestCase, APIClient
 
 from apps.accounts.models import User, UserOrganization
 from apps.assets.models import Asset, AssetCategory
-from apps.depreciation.models import DepreciationConfig, DepreciationRecord
+from apps.depreciation.models import DepreciationConfig, DepreciationRecord, DepreciationRun
 from apps.organizations.models import Organization
 
 
@@ -306,8 +306,11 @@ class DepreciationApiCompatTest(APITestCase):
             useful_life=24,
             current_value=Decimal('1000.00'),
             accumulated_depreciation=Decimal('0.00'),
+            asset_status='in_use',
             created_by=self.user
         )
+        self.asset.asset_status = 'in_use'
+        self.asset.save(update_fields=['asset_status'])
         DepreciationConfig.objects.create(
             organization=self.org,
             category=other_category,
@@ -323,8 +326,11 @@ class DepreciationApiCompatTest(APITestCase):
             {'period': '2026-04', 'categoryIds': [str(self.category.id)]},
             format='json'
         )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         self.assertTrue(response.data['success'])
+        run = DepreciationRun.objects.get(organization=self.org, period='2026-04')
+        self.assertEqual(response.data['data']['task_id'], str(run.id))
+        self.assertEqual(run.status, 'completed')
         self.assertTrue(
             DepreciationRecord.objects.filter(
                 organization=self.org,
@@ -339,3 +345,38 @@ class DepreciationApiCompatTest(APITestCase):
                 period='2026-04',
             ).exists()
         )
+
+    def test_calculate_rejects_invalid_asset_ids(self):
+        response = self.client.post(
+            '/api/system/objects/DepreciationRun/calculate/',
+            {'period': '2026-04', 'assetIds': ['not-a-uuid']},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(DepreciationRun.objects.filter(organization=self.org).exists())
+
+    def test_run_execute_and_progress_endpoints(self):
+        run = DepreciationRun.objects.create(
+            organization=self.org,
+            period='2026-06',
+            run_date=date.today(),
+            status='pending',
+            created_by=self.user
+        )
+        self.asset.asset_status = 'in_use'
+        self.asset.save(update_fields=['asset_status'])
+
+        execute_response = self.client.post(f'/api/depreciation/runs/{run.id}/execute/')
+        self.assertEqual(execute_response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertTrue(execute_response.data['success'])
+
+        progress_response = self.client.get(f'/api/depreciation/runs/{run.id}/progress/')
+        self.assertEqual(progress_response.status_code, status.HTTP_200_OK)
+        progress = progress_response.data['data']
+        self.assertEqual(progress['status'], 'completed')
+        self.assertEqual(progress['progress_percent'], 100)
+        self.assertEqual(progress['chunks_completed'], 1)
+
+        resume_response = self.client.post(f'/api/depreciation/runs/{run.id}/resume/')
+        self.assertEqual(resume_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(resume_response.data['success'])
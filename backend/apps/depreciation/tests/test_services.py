@@ -0,0 +1,227 @@
+"""
+Tests for Depreciation Services.
+
+Tests cover:
+- DepreciationRunService batched run execution and progress reporting
+- Chunk checkpoints, resume and Celery dispatch
+"""
+import uuid
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from apps.accounts.models import User
+from apps.assets.models import Asset, AssetCategory
+from apps.depreciation.models import DepreciationConfig, DepreciationRecord, DepreciationRun
+from apps.depreciation.services import DepreciationRunService
+from apps.organizations.models import Organization
+
+
+class TestDepreciationRunService(TestCase):
+    """Tests for DepreciationRunService.execute_run"""
+
+    def setUp(self):
+        suffix = uuid.uuid4().hex[:8]
+        self.org = Organization.objects.create(
+            name=f'Run Org {suffix}',
+            code=f'RUN_ORG_{suffix}'
+        )
+        self.user = User.objects.create_user(
+            username=f'run_user_{suffix}',
+            password='pass123456',
+            organization=self.org
+        )
+        self.category = AssetCategory.objects.create(
+            organization=self.org,
+            code=f'RUN_CAT_{suffix}',
+            name='Run Category',
+            created_by=self.user
+        )
+        DepreciationConfig.objects.create(
+            organization=self.org,
+            category=self.category,
+            depreciation_method='straight_line',
+            useful_life=10,
+            salvage_value_rate=Decimal('10.00'),
+            is_active=True,
+            created_by=self.user
+        )
+        self.assets = [
+            self._create_asset(f'Run Asset {index}', Decimal('1000.00'))
+            for index in range(3)
+        ]
+        self.service = DepreciationRunService()
+
+    def tearDown(self):
+        from apps.common.middleware import clear_current_organization
+        clear_current_organization()
+        super().tearDown()
+
+    def _create_asset(self, name, price, asset_status='in_use'):
+        return Asset.objects.create(
+            organization=self.org,
+            asset_name=name,
+            asset_category=self.category,
+            purchase_price=price,
+            purchase_date=date.today(),
+            asset_status=asset_status,
+            created_by=self.user
+        )
+
+    def _create_run(self, period='2026-05'):
+        return DepreciationRun.objects.create(
+            organization=self.org,
+            period=period,
+            run_date=date.today(),
+            status='pending',
+            created_by=self.user
+        )
+
+    def test_execute_run_creates_records_in_chunks(self):
+        """Records are created per asset and progress counters are filled."""
+        self._create_asset('Disposed Asset', Decimal('1000.00'), asset_status='scrapped')
+        run = self._create_run()
+
+        result = self.service.execute_run(run.id, organization_id=self.org.id, chunk_size=2)
+
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual(result.candidate_assets, 3)
+        self.assertEqual(result.processed_assets, 3)
+        self.assertEqual(result.total_assets, 3)
+        self.assertEqual(result.total_amount, Decimal('270.00'))
+        self.assertEqual(result.get_progress_percent(), 100)
+        records = DepreciationRecord.objects.filter(organization=self.org, period='2026-05')
+        self.assertEqual(records.count(), 3)
+        self.assertEqual(
+            set(records.values_list('depreciation_amount', flat=True)),
+            {Decimal('90.00')}
+        )
+
+    def test_execute_run_skips_existing_and_uses_accumulated_amount(self):
+        """Existing period records are skipped and prior records cap the amount."""
+        first, second = self.assets[0], self.assets[1]
+        DepreciationRecord.objects.create(
+            organization=self.org,
+            asset=first,
+            period='2026-05',
+            depreciation_amount=Decimal('90.00'),
+            accumulated_amount=Decimal('90.00'),
+            net_value=Decimal('910.00'),
+            created_by=self.user
+        )
+        DepreciationRecord.objects.create(
+            organization=self.org,
+            asset=second,
+            period='2026-04',
+            depreciation_amount=Decimal('850.00'),
+            accumulated_amount=Decimal('850.00'),
+            net_value=Decimal('150.00'),
+            created_by=self.user
+        )
+        run = self._create_run()
+
+        result = self.service.execute_run(run.id, organization_id=self.org.id)
+
+        self.assertEqual(result.candidate_assets, 2)
+        self.assertEqual(result.total_assets, 2)
+        capped = DepreciationRecord.objects.get(asset=second, period='2026-05')
+        self.assertEqual(capped.depreciation_amount, Decimal('50.00'))
+        self.assertEqual(capped.accumulated_amount, Decimal('900.00'))
+        self.assertEqual(capped.net_value, Decimal('100.00'))
+
+    def test_execute_run_rejects_non_pending_run(self):
+        """Only pending runs can be executed."""
+        run = self._create_run()
+        run.status = 'completed'
+        run.save(update_fields=['status'])
+
+        with self.assertRaises(ValidationError):
+            self.service.execute_run(run.id, organization_id=self.org.id)
+
+    def test_failed_run_resumes_from_checkpoint(self):
+        """A failed run keeps committed chunks and resumes after the checkpoint."""
+        run = self._create_run()
+        original_build = DepreciationRunService._build_record
+        calls = {'count': 0}
+
+        def failing_build(service, *args, **kwargs):
+            calls['count'] += 1
+            if calls['count'] == 2:
+                raise RuntimeError('worker lost')
+            return original_build(service, *args, **kwargs)
+
+        with mock.patch.object(DepreciationRunService, '_build_record', failing_build):
+            with self.assertRaises(RuntimeError):
+                self.service.execute_run(run.id, organization_id=self.org.id, chunk_size=1)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, 'failed')
+        self.assertEqual(run.chunks_completed, 1)
+        self.assertEqual(run.processed_assets, 1)
+        self.assertIsNotNone(run.last_asset_id)
+
+        result = self.service.execute_run(
+            run.id, organization_id=self.org.id, chunk_size=1, resume=True
+        )
+
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual(result.chunks_completed, 3)
+        self.assertEqual(result.processed_assets, 3)
+        self.assertEqual(result.total_assets, 3)
+        self.assertEqual(len(result.chunk_stats), 3)
+        self.assertEqual(
+            DepreciationRecord.objects.filter(organization=self.org, period='2026-05').count(),
+            3
+        )
+
+    def test_lost_checkpoint_race_exits_without_failing_run(self):
+        """A worker whose chunk was committed by another worker leaves the run alone."""
+        run = self._create_run()
+        original_build = DepreciationRunService._build_record
+
+        def racing_build(service, *args, **kwargs):
+            DepreciationRun.all_objects.filter(pk=run.pk).update(chunks_completed=5)
+            return original_build(service, *args, **kwargs)
+
+        with mock.patch.object(DepreciationRunService, '_build_record', racing_build):
+            result = self.service.execute_run(run.id, organization_id=self.org.id)
+
+        self.assertEqual(result.status, 'in_progress')
+        self.assertEqual(result.error_message, '')
+        self.assertEqual(
+            DepreciationRecord.objects.filter(organization=self.org, period='2026-05').count(),
+            0
+        )
+
+    def test_completed_resume_clears_error_message(self):
+        """Completing a run clears an error recorded by an earlier attempt."""
+        run = self._create_run()
+        DepreciationRun.all_objects.filter(pk=run.pk).update(
+            status='failed', error_message='worker lost'
+        )
+
+        result = self.service.execute_run(run.id, organization_id=self.org.id, resume=True)
+
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual(result.error_message, '')
+
+    def test_resume_requires_interrupted_run(self):
+        """Pending runs cannot be resumed."""
+        run = self._create_run()
+
+        with self.assertRaises(ValidationError):
+            self.service.execute_run(run.id, organization_id=self.org.id, resume=True)
+
+    def test_dispatch_run_executes_task(self):
+        """Dispatch stores the task id and runs the task (eager in tests)."""
+        run = self._create_run()
+
+        result = self.service.dispatch_run(run.id, organization_id=self.org.id)
+
+        self.assertEqual(result.status, 'completed')
+        self.assertTrue(result.task_id)
+        self.assertEqual(result.total_assets, 3)
+        self.assertIsNotNone(result.completed_at)
@@ -1,8 +1,10 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
 from django.db.models import Sum, Q, Count, F
+import uuid
 from datetime import date
 from decimal import Decimal
 from apps.common.viewsets.base import BaseModelViewSetWithBatch
@@ -11,9 +13,11 @@ from apps.depreciation.models import DepreciationConfig, DepreciationRecord, Dep
 from apps.depreciation.serializers import (
     DepreciationConfigSerializer, DepreciationConfigListSerializer, DepreciationConfigDetailSerializer,
     DepreciationRecordSerializer, DepreciationRecordListSerializer, DepreciationRecordDetailSerializer,
-    DepreciationRunSerializer, DepreciationRunListSerializer, DepreciationRunDetailSerializer
+    DepreciationRunSerializer, DepreciationRunListSerializer, DepreciationRunDetailSerializer,
+    DepreciationRunProgressSerializer,
 )
 from apps.depreciation.filters import DepreciationConfigFilter, DepreciationRecordFilter, DepreciationRunFilter
+from apps.depreciation.services import DepreciationRunService
 
 
 # Base permission classes
@@ -689,6 +693,7 @@ class DepreciationRunViewSet(BaseModelViewSetWithBatch):
     - Batch operations (delete, restore, update)
     - Custom action: calculate (calculate depreciation for assets)
     - Custom action: report (generate depreciation run report)
+    - Custom actions: execute / resume / progress (chunked background runs)
     """
 
     queryset = DepreciationRun.objects.select_related(
@@ -711,21 +716,23 @@ class DepreciationRunViewSet(BaseModelViewSetWithBatch):
     @action(detail=False, methods=['post'])
     def calculate(self, request):
         """
-        Calculate depreciation for assets in a given period.
+        Create a depreciation run for a period and queue it for the workers.
 
         POST /api/depreciation/runs/calculate/
 
         Request body:
         {
-            "period": "2025-01",  // Required: YYYY-MM format
-            "category": "2001",   // Optional: category code to filter
+            "period": "2025-01",       // Required: YYYY-MM format
+            "category": "2001",        // Optional: category code to filter
+            "category_ids": ["..."],   // Optional: category ids to filter
+            "asset_ids": ["..."],      // Optional: asset ids to filter
             "notes": "Optional notes"
         }
 
-        Creates a DepreciationRun and generates DepreciationRecord entries
-        for all active assets with valid depreciation configurations.
+        Records are calculated by the chunked background run; the response
+        carries the run id as taskId for polling the run or its progress.
         """
-        from apps.assets.models import Asset
+        from apps.assets.models import AssetCategory
 
         period = request.data.get('period')
         category_code = request.data.get('category')
@@ -749,6 +756,34 @@ class DepreciationRunViewSet(BaseModelViewSetWithBatch):
                 }
             }, status=status.HTTP_400_BAD_REQUEST)
 
+        try:
+            category_ids = [str(uuid.UUID(str(item))) for item in category_ids]
+            asset_ids = [str(uuid.UUID(str(item))) for item in asset_ids]
+        except ValueError:
+            return Response({
+                'success': False,
+                'error': {
+                    'code': 'VALIDATION_ERROR',
+                    'message': 'category_ids and asset_ids must be valid UUIDs'
+                }
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if not category_ids and category_code:
+            category_ids = [
+                str(category_id) for category_id in AssetCategory.objects.filter(
+                    organization_id=request.organization_id,
+                    code=category_code,
+                ).values_list('id', flat=True)
+            ]
+            if not category_ids:
+                return Response({
+                    'success': False,
+                    'error': {
+                        'code': 'VALIDATION_ERROR',
+                        'message': f'Unknown category: {category_code}'
+                    }
+                }, status=status.HTTP_400_BAD_REQUEST)
+
         # Check if run already exists for this period
         existing_run = DepreciationRun.objects.filter(
             period=period,
@@ -764,128 +799,80 @@ class DepreciationRunViewSet(BaseModelViewSetWithBatch):
                 }
             }, status=status.HTTP_409_CONFLICT)
 
-        # Create depreciation run
         run = DepreciationRun.objects.create(
             period=period,
             run_date=date.today(),
-            status='in_progress',
+            status='pending',
+            scope={'category_ids': category_ids, 'asset_ids': asset_ids},
             organization_id=request.organization_id,
             created_by=request.user,
             notes=notes
         )
+        return self._queue_run(run, resume=False)
 
-        # Get assets to depreciate
-        assets = Asset.objects.filter(
-            organization_id=request.organization_id,
-            is_deleted=False
-        )
-
-        if category_ids:
-            assets = assets.filter(asset_category_id__in=category_ids)
-        elif category_code:
-            assets = assets.filter(asset_category__code=category_code)
-
-        if asset_ids:
-            assets = assets.filter(id__in=asset_ids)
-
-        # Only process assets with purchase price and active status
-        assets = assets.exclude(purchase_price__isnull=True).exclude(purchase_price=0)
-
-        records_created = 0
-        total_depreciation = Decimal('0.00')
-        failed_assets = []
+    @action(detail=True, methods=['post'])
+    def execute(self, request, pk=None):
+        """
+        Dispatch a pending run to the background workers.
 
-        for asset in assets:
-            try:
-                # Get depreciation config for asset's category
-                config = DepreciationConfig.objects.filter(
-                    category=asset.asset_category,
-                    organization_id=request.organization_id,
-                    is_active=True
-                ).first()
+        POST /api/depreciation/runs/{id}/execute/
 
-                if not config:
-                    failed_assets.append({
-                        'asset_code': asset.asset_code,
-                        'reason': 'No depreciation configuration found'
-                    })
-                    continue
+        The run is processed in committed chunks; poll the progress
+        endpoint for throughput and ETA.
+        """
+        return self._dispatch_run(request, resume=False)
 
-                # Check if record already exists for this period
-                existing_record = DepreciationRecord.objects.filter(
-                    asset=asset,
-                    period=period,
-                    organization_id=request.organization_id
-                ).first()
-
-                if existing_record:
-                    continue  # Skip if already calculated
-
-                # Get accumulated depreciation from previous periods
-                previous_accumulated = DepreciationRecord.objects.filter(
-                    asset=asset,
-                    period__lt=period,
-                    status='posted',
-                    organization_id=request.organization_id
-                ).aggregate(
-                    total=Sum('depreciation_amount')
-                )['total'] or Decimal('0.00')
-
-                # Calculate monthly depreciation using straight line method
-                monthly_rate = config.get_monthly_rate()
-                depreciation_amount = asset.purchase_price * Decimal(str(monthly_rate))
-
-                # Calculate accumulated and net value
-                accumulated_amount = previous_accumulated + depreciation_amount
-                net_value = asset.purchase_price - accumulated_amount
-
-                # Ensure net value doesn't go below salvage value
-                salvage_value = asset.purchase_price * (config.salvage_value_rate / Decimal('100'))
-                if net_value < salvage_value:
-                    net_value = salvage_value
-                    depreciation_amount = salvage_value - (asset.purchase_price - previous_accumulated)
-                    accumulated_amount = previous_accumulated + depreciation_amount
-
-                # Create depreciation record
-                DepreciationRecord.objects.create(
-                    asset=asset,
-                    period=period,
-                    depreciation_amount=depreciation_amount,
-                    accumulated_amount=accumulated_amount,
-                    net_value=net_value,
-                    status='calculated',
-                    organization_id=request.organization_id,
-                    created_by=request.user
-                )
+    @action(detail=True, methods=['post'])
+    def resume(self, request, pk=None):
+        """
+        Resume a failed or interrupted run from its last committed chunk.
 
-                records_created += 1
-                total_depreciation += depreciation_amount
+        POST /api/depreciation/runs/{id}/resume/
+        """
+        return self._dispatch_run(request, resume=True)
 
-            except Exception as e:
-                failed_assets.append({
-                    'asset_code': asset.asset_code,
-                    'reason': str(e)
-                })
+    @action(detail=True, methods=['get'])
+    def progress(self, request, pk=None):
+        """
+        Get chunk progress, throughput and ETA for a run.
 
-        # Update run status
-        run.total_assets = records_created
-        run.total_amount = total_depreciation
+        GET /api/depreciation/runs/{id}/progress/
+        """
+        run = self.get_object()
+        return Response({
+            'success': True,
+            'data': DepreciationRunProgressSerializer(run).data
+        })
 
-        if failed_assets:
-            run.status = 'completed'
-            run.notes = f"{notes}\n\nFailed assets ({len(failed_assets)}):\n" + \
-                        "\n".join([f"{a['asset_code']}: {a['reason']}" for a in failed_assets])
-        else:
-            run.status = 'completed'
+    def _dispatch_run(self, request, resume=False):
+        """Queue execution of the requested run."""
+        return self._queue_run(self.get_object(), resume=resume)
 
-        run.save()
+    def _queue_run(self, run, resume=False):
+        """Queue run execution and return its current progress."""
+        try:
+            run = DepreciationRunService().dispatch_run(
+                run.id,
+                organization_id=run.organization_id,
+                resume=resume,
+            )
+        except DjangoValidationError as exc:
+            return Response({
+                'success': False,
+                'error': {
+                    'code': 'VALIDATION_ERROR',
+                    'message': '; '.join(str(item) for item in exc.messages),
+                }
+            }, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer = DepreciationRunDetailSerializer(run)
+        data = DepreciationRunProgressSerializer(run).data
+        # Clients poll the run itself, so taskId is the run id rather than the Celery id
+        data['task_id'] = str(run.id)
         return Response({
             'success': True,
-            'message': f'Depreciation calculation completed. {records_created} records created.',
-            'data': serializer.data
-        })
+            'message': 'Depreciation run resumed.' if resume else 'Depreciation run queued.',
+            'data': data
+        }, status=status.HTTP_202_ACCEPTED)
 
     @action(detail=False, methods=['get'])
     def report(self, request):
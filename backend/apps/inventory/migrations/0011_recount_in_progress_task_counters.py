@@ -0,0 +1,45 @@
+# Generated by Django 5.0.1 on 2026-10-16 21:30
+
+from django.db import migrations
+
+
+def recount_in_progress_tasks(apps, schema_editor):
+    """Initialise the incrementally maintained counters of running tasks.
+
+    Tasks started before the counters were maintained on scan still hold
+    the values of their last full recount.
+    """
+    InventoryTask = apps.get_model('inventory', 'InventoryTask')
+    InventoryScan = apps.get_model('inventory', 'InventoryScan')
+    InventoryDifference = apps.get_model('inventory', 'InventoryDifference')
+
+    task_ids = InventoryTask._base_manager.filter(
+        status='in_progress',
+        is_deleted=False,
+    ).values_list('id', flat=True)
+
+    for task_id in task_ids.iterator():
+        scanned_count = InventoryScan._base_manager.filter(
+            task_id=task_id,
+            is_deleted=False,
+        ).count()
+        abnormal_count = InventoryDifference._base_manager.filter(
+            task_id=task_id,
+            status='pending',
+            difference_type__in=['missing', 'surplus', 'damaged'],
+            is_deleted=False,
+        ).count()
+        InventoryTask._base_manager.filter(id=task_id).update(
+            scanned_count=scanned_count,
+            normal_count=scanned_count - abnormal_count,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('inventory', '0010_inventorytask_workflow_binding'),
+    ]
+
+    operations = [
+        migrations.RunPython(recount_in_progress_tasks, migrations.RunPython.noop),
+    ]
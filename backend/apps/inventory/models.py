@@ -3,11 +3,14 @@ Inventory models for GZEAMS.
 
 Provides models for inventory tasks, snapshots, scans, and differences.
 """
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction
 from django.core.validators import MinValueValidator
 from django.utils.translation import gettext_lazy as _
 
 from apps.common.mixins.workflow_status import WorkflowStatusMixin
+from apps.common.managers import TenantManager
 from apps.common.models import BaseModel
 
 
@@ -426,6 +429,48 @@ class InventorySnapshot(BaseModel):
         return f"{self.task.task_code} - {self.asset_code}"
 
 
+class InventoryScanQuerySet(models.QuerySet):
+    """Keeps task scan counters in step with bulk soft deletes, restores and deletes."""
+
+    def _live_counts_by_task(self, is_deleted: bool = False) -> Counter:
+        """Lock the matching rows with the given flag and count them per task."""
+        return Counter(
+            self.filter(is_deleted=is_deleted).order_by()
+            .select_for_update().values_list('task_id', flat=True)
+        )
+
+    def _apply_scan_deltas(self, counts: Counter, sign: int) -> None:
+        from apps.inventory.services.inventory_service import InventoryService
+
+        service = InventoryService()
+        for task_id, count in counts.items():
+            service.apply_scan_delta(task_id, sign * count)
+
+    def update(self, **kwargs):
+        if 'is_deleted' not in kwargs:
+            return super().update(**kwargs)
+
+        deleting = bool(kwargs['is_deleted'])
+        with transaction.atomic(using=self.db):
+            # Only rows whose flag actually flips change the counters
+            counts = self._live_counts_by_task(is_deleted=not deleting)
+            updated = super().update(**kwargs)
+            self._apply_scan_deltas(counts, -1 if deleting else 1)
+        return updated
+
+    update.alters_data = True
+
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            counts = self._live_counts_by_task()
+            result = super().delete()
+            self._apply_scan_deltas(counts, -1)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
 class InventoryScan(BaseModel):
     """
     Inventory Scan Record Model.
@@ -435,6 +480,10 @@ class InventoryScan(BaseModel):
     Inherits from BaseModel for organization isolation and audit trail.
     """
 
+    # Bulk soft deletes through either manager keep the task counters right
+    objects = TenantManager.from_queryset(InventoryScanQuerySet)()
+    all_objects = models.Manager.from_queryset(InventoryScanQuerySet)()
+
     class Meta:
         db_table = 'inventory_scans'
         verbose_name = _('Inventory Scan')
@@ -604,6 +653,15 @@ class InventoryScan(BaseModel):
     def __str__(self):
         return f"{self.task.task_code} - {self.qr_code}"
 
+    def soft_delete(self, user=None):
+        """Soft delete the scan and take it out of the task counters."""
+        from apps.inventory.services.inventory_service import InventoryService
+
+        was_deleted = self.is_deleted
+        super().soft_delete(user=user)
+        if not was_deleted:
+            InventoryService().apply_scan_delta(self.task_id, -1)
+
     def get_scan_status_label(self):
         """Get scan status display label."""
         return dict(self.SCAN_STATUS_CHOICES).get(self.scan_status, self.scan_status)
@@ -4,6 +4,7 @@ Difference service for managing inventory differences.
 import uuid
 from typing import List, Dict, Optional, Any
 from django.db import transaction
+from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -27,6 +28,10 @@ class DifferenceService(BaseCRUDService):
     """Service for inventory difference management."""
 
     MANUAL_FOLLOW_UP_NOTIFICATION_TYPE = 'inventory_difference_follow_up'
+    # Snapshots compared per chunk in streaming generation
+    STREAM_CHUNK_SIZE = 2000
+    # Rows per INSERT statement when writing differences
+    BULK_BATCH_SIZE = 500
 
     ACTIVE_STATUSES = [
         InventoryDifference.STATUS_PENDING,
@@ -61,6 +66,9 @@ class DifferenceService(BaseCRUDService):
         """
         Generate differences for a task by comparing snapshots and scans.
 
+        Loads the whole task into memory; use generate_differences_streaming
+        for large tasks.
+
         Args:
             task_id: Task ID
 
@@ -88,32 +96,9 @@ class DifferenceService(BaseCRUDService):
             differences_to_create = []
 
             for snapshot in snapshots:
-                asset_id = snapshot.asset_id
-                scan = scans.get(asset_id)
-
-                # Check for missing assets
-                if scan is None:
-                    differences_to_create.append(
-                        self._create_missing_difference(snapshot)
-                    )
-                else:
-                    # Check for location change
-                    if self._has_location_changed(snapshot, scan):
-                        differences_to_create.append(
-                            self._create_location_difference(snapshot, scan)
-                        )
-
-                    # Check for custodian change
-                    if self._has_custodian_changed(snapshot, scan):
-                        differences_to_create.append(
-                            self._create_custodian_difference(snapshot, scan)
-                        )
-
-                    # Check for damaged status
-                    if scan.scan_status == 'damaged':
-                        differences_to_create.append(
-                            self._create_damaged_difference(snapshot, scan)
-                        )
+                differences_to_create.extend(
+                    self._build_snapshot_differences(snapshot, scans.get(snapshot.asset_id))
+                )
 
             # Check for surplus (scanned assets not in snapshot)
             scanned_asset_ids = set(scans.keys())
@@ -135,6 +120,135 @@ class DifferenceService(BaseCRUDService):
                 is_deleted=False
             ))
 
+    def generate_differences_streaming(
+        self,
+        task_id: str,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Generate differences for a task with bounded memory.
+
+        Walks snapshots in keyset-ordered chunks, loads only the scans of
+        each chunk's assets and writes each chunk's differences in bounded
+        batches. Surplus scans are found with a single anti-join against
+        the snapshots. Only the columns used for comparison are loaded.
+
+        Args:
+            task_id: Task ID
+            chunk_size: Snapshots compared per chunk
+
+        Returns:
+            Dictionary of created difference counts by type plus 'total'
+        """
+        task = InventoryTask.objects.get(id=task_id)
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        counts = {
+            difference_type: 0
+            for difference_type, _ in InventoryDifference.DIFFERENCE_TYPE_CHOICES
+        }
+        counts['total'] = 0
+
+        def write(differences):
+            if not differences:
+                return
+            InventoryDifference.objects.bulk_create(differences, batch_size=self.BULK_BATCH_SIZE)
+            for difference in differences:
+                counts[difference.difference_type] = counts.get(difference.difference_type, 0) + 1
+            counts['total'] += len(differences)
+
+        snapshots = InventorySnapshot.objects.filter(
+            task_id=task_id,
+            is_deleted=False
+        ).only(
+            'id', 'task_id', 'asset_id', 'organization_id',
+            'location_name', 'custodian_name',
+        ).order_by('pk')
+
+        with transaction.atomic():
+            last_pk = None
+            while True:
+                chunk_qs = snapshots if last_pk is None else snapshots.filter(pk__gt=last_pk)
+                chunk = list(chunk_qs[:chunk_size])
+                if not chunk:
+                    break
+                last_pk = chunk[-1].pk
+
+                scans = self._latest_scans_by_asset(
+                    InventoryScan.objects.filter(
+                        task_id=task_id,
+                        is_deleted=False,
+                        asset_id__in=[s.asset_id for s in chunk if s.asset_id],
+                    )
+                )
+                differences = []
+                for snapshot in chunk:
+                    scan = scans.get(snapshot.asset_id) if snapshot.asset_id else None
+                    differences.extend(self._build_snapshot_differences(snapshot, scan))
+                write(differences)
+
+            # Surplus: scans whose asset has no snapshot in this task
+            surplus_scans = InventoryScan.objects.filter(
+                task_id=task_id,
+                is_deleted=False
+            ).exclude(
+                Exists(InventorySnapshot.objects.filter(
+                    task_id=task_id,
+                    is_deleted=False,
+                    asset_id=OuterRef('asset_id'),
+                ))
+            ).only(
+                'id', 'asset_id', 'actual_location_name', 'actual_custodian_name', 'scanned_at',
+            ).order_by('asset_id', '-scanned_at')
+
+            differences = []
+            previous_asset_id = object()
+            for scan in surplus_scans.iterator(chunk_size=chunk_size):
+                if scan.asset_id == previous_asset_id:
+                    continue
+                previous_asset_id = scan.asset_id
+                differences.append(self._create_surplus_difference(task, scan))
+                if len(differences) >= chunk_size:
+                    write(differences)
+                    differences = []
+            write(differences)
+
+        return counts
+
+    def _latest_scans_by_asset(self, scans) -> Dict[Any, InventoryScan]:
+        """Map asset id to its most recent scan, loading comparison columns only."""
+        latest = {}
+        for scan in scans.only(
+            'id', 'asset_id', 'scan_status', 'scanned_at',
+            'actual_location_name', 'actual_custodian_name',
+        ).order_by('-scanned_at'):
+            latest.setdefault(scan.asset_id, scan)
+        return latest
+
+    def _build_snapshot_differences(
+        self,
+        snapshot: InventorySnapshot,
+        scan: Optional[InventoryScan],
+    ) -> List[InventoryDifference]:
+        """Compare one snapshot with its scan and build unsaved differences."""
+        # Check for missing assets
+        if scan is None:
+            return [self._create_missing_difference(snapshot)]
+
+        differences = []
+        # Check for location change
+        if self._has_location_changed(snapshot, scan):
+            differences.append(self._create_location_difference(snapshot, scan))
+
+        # Check for custodian change
+        if self._has_custodian_changed(snapshot, scan):
+            differences.append(self._create_custodian_difference(snapshot, scan))
+
+        # Check for damaged status
+        if scan.scan_status == 'damaged':
+            differences.append(self._create_damaged_difference(snapshot, scan))
+
+        return differences
+
     def _create_missing_difference(self, snapshot: InventorySnapshot) -> InventoryDifference:
         """Create a missing asset difference record."""
         return InventoryDifference(
@@ -6,7 +6,8 @@ import uuid
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from django.db import transaction
-from django.db.models import Count, Max, Q
+from django.db.models import Count, F, Max, Q, QuerySet, Value
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
@@ -18,7 +19,6 @@ from apps.inventory.models import (
     InventorySnapshot,
     InventoryTaskExecutor,
 )
-from apps.assets.models import Asset
 
 logger = logging.getLogger(__name__)
 
@@ -118,11 +118,11 @@ class InventoryService(BaseCRUDService):
             assets = self._get_assets_for_inventory(
                 organization_id, inventory_type, department_id, category_id, sample_ratio
             )
-            snapshot_service.create_snapshots(task.id, assets)
+            snapshot_count = snapshot_service.stream_snapshots(task.id, assets)
 
             # Update task counts
             task.refresh_from_db()
-            task.total_count = task.snapshots.count()
+            task.total_count = snapshot_count
             task.save(update_fields=['total_count'])
 
         return task
@@ -160,15 +160,15 @@ class InventoryService(BaseCRUDService):
         department_id: Optional[str] = None,
         category_id: Optional[str] = None,
         sample_ratio: Optional[float] = None,
-    ) -> List[Asset]:
-        """Get asset list for inventory based on type."""
+    ) -> QuerySet:
+        """Get the (unevaluated) asset queryset for inventory based on type."""
         from apps.assets.models import Asset
 
         # Base queryset - active assets in organization
         queryset = Asset.objects.filter(
             organization_id=organization_id,
             is_deleted=False
-        ).select_related('asset_category', 'location', 'custodian', 'department')
+        )
 
         # Filter by inventory type
         if inventory_type == InventoryTask.TYPE_FULL:
@@ -181,12 +181,34 @@ class InventoryService(BaseCRUDService):
         elif inventory_type == InventoryTask.TYPE_PARTIAL:
             # Sample ratio-based selection
             if sample_ratio and 0 < sample_ratio < 1:
-                total = queryset.count()
-                sample_size = int(total * sample_ratio)
-                # Simple random sampling - in production use more sophisticated method
-                queryset = queryset.order_by('?')[:sample_size]
+                queryset = self._sample_assets(queryset, sample_ratio)
+
+        return queryset
 
-        return list(queryset)
+    def _sample_assets(self, queryset: QuerySet, sample_ratio: float) -> QuerySet:
+        """
+        Keyed random sample of an asset queryset.
+
+        Asset ids are random UUIDs, so the next N ids after a random pivot
+        (wrapping around the key space) form a uniform random sample. The
+        sample is expressed as primary-key ranges found through the pk
+        index, avoiding ORDER BY random() over the whole table.
+        """
+        sample_size = int(queryset.count() * sample_ratio)
+        if sample_size <= 0:
+            return queryset.none()
+
+        pivot = uuid.uuid4()
+        ordered_ids = queryset.order_by('pk').values_list('pk', flat=True)
+        upper_ids = ordered_ids.filter(pk__gte=pivot)
+
+        upper_end = upper_ids[sample_size - 1:sample_size].first()
+        if upper_end is not None:
+            return queryset.filter(pk__gte=pivot, pk__lte=upper_end)
+
+        remaining = sample_size - upper_ids.count()
+        lower_end = ordered_ids.filter(pk__lt=pivot)[remaining - 1:remaining].first()
+        return queryset.filter(Q(pk__gte=pivot) | Q(pk__lte=lower_end))
 
     def start_task(self, task_id: str, user_id: str) -> InventoryTask:
         """
@@ -314,7 +336,7 @@ class InventoryService(BaseCRUDService):
         with transaction.atomic():
             # Generate differences for any discrepancies
             diff_service = DifferenceService()
-            diff_service.generate_differences(task_id)
+            diff_service.generate_differences_streaming(task_id)
 
             # Update task status
             task.status = InventoryTask.STATUS_COMPLETED
@@ -323,6 +345,9 @@ class InventoryService(BaseCRUDService):
                 task.notes = (task.notes or '') + f"\n\nCompletion: {notes}"
             task.save(update_fields=['status', 'completed_at', 'notes'])
 
+            # Reconcile counters now that differences exist
+            self.update_statistics(task_id)
+
             # Refresh to get updated counts
             task.refresh_from_db()
 
@@ -380,6 +405,9 @@ class InventoryService(BaseCRUDService):
         """
         Update task statistics from scan results.
 
+        Full recount used for reconciliation: one COUNT per table, with the
+        pending difference counts computed by conditional aggregation.
+
         Args:
             task_id: Task ID
 
@@ -399,34 +427,24 @@ class InventoryService(BaseCRUDService):
             is_deleted=False
         ).count()
 
-        # Count differences by type
-        missing_count = InventoryDifference.objects.filter(
-            task_id=task_id,
-            difference_type=InventoryDifference.TYPE_MISSING,
-            status=InventoryDifference.STATUS_PENDING,
-            is_deleted=False
-        ).count()
-
-        surplus_count = InventoryDifference.objects.filter(
-            task_id=task_id,
-            difference_type=InventoryDifference.TYPE_SURPLUS,
-            status=InventoryDifference.STATUS_PENDING,
-            is_deleted=False
-        ).count()
-
-        damaged_count = InventoryDifference.objects.filter(
+        # Count pending differences by type in a single pass
+        difference_counts = InventoryDifference.objects.filter(
             task_id=task_id,
-            difference_type=InventoryDifference.TYPE_DAMAGED,
             status=InventoryDifference.STATUS_PENDING,
             is_deleted=False
-        ).count()
-
-        location_changed_count = InventoryDifference.objects.filter(
-            task_id=task_id,
-            difference_type=InventoryDifference.TYPE_LOCATION_MISMATCH,
-            status=InventoryDifference.STATUS_PENDING,
-            is_deleted=False
-        ).count()
+        ).aggregate(
+            missing=Count('id', filter=Q(difference_type=InventoryDifference.TYPE_MISSING)),
+            surplus=Count('id', filter=Q(difference_type=InventoryDifference.TYPE_SURPLUS)),
+            damaged=Count('id', filter=Q(difference_type=InventoryDifference.TYPE_DAMAGED)),
+            location_changed=Count(
+                'id',
+                filter=Q(difference_type=InventoryDifference.TYPE_LOCATION_MISMATCH)
+            ),
+        )
+        missing_count = difference_counts['missing']
+        surplus_count = difference_counts['surplus']
+        damaged_count = difference_counts['damaged']
+        location_changed_count = difference_counts['location_changed']
 
         # Calculate normal count (scanned - all abnormal)
         normal_count = scanned_count - missing_count - surplus_count - damaged_count
@@ -447,6 +465,27 @@ class InventoryService(BaseCRUDService):
 
         return task
 
+    def apply_scan_delta(self, task_id: str, scan_delta: int) -> None:
+        """
+        Incrementally adjust task counters for created or removed scans.
+
+        New scans raise the scanned and normal counts and soft-deleted
+        scans lower them; re-scans of an asset already scanned do not
+        change them. Differences are only generated at completion, so
+        update_statistics remains the reconciliation path.
+
+        Args:
+            task_id: Task ID
+            scan_delta: Scans created (positive) or deleted (negative)
+        """
+        if not scan_delta:
+            return
+
+        InventoryTask.all_objects.filter(id=task_id).update(
+            scanned_count=Greatest(F('scanned_count') + scan_delta, Value(0)),
+            normal_count=Greatest(F('normal_count') + scan_delta, Value(0)),
+        )
+
     def get_task_progress(self, task_id: str) -> Dict[str, Any]:
         """
         Get detailed progress information for a task.
@@ -11,12 +11,32 @@ from django.core.exceptions import ValidationError
 
 from apps.common.services.base_crud import BaseCRUDService
 from apps.inventory.models import InventoryScan, InventorySnapshot, InventoryTask, InventoryTaskExecutor
+from apps.inventory.services.inventory_service import InventoryService
 from apps.assets.models import Asset
 
 
 class ScanService(BaseCRUDService):
     """Service for inventory scan management."""
 
+    # Rows written per statement during batch ingestion
+    BULK_BATCH_SIZE = 500
+    # Scan fields refreshed when an asset is scanned again
+    RESCAN_UPDATE_FIELDS = [
+        'scan_method', 'scan_status',
+        'original_location_id', 'original_location_name',
+        'original_custodian_id', 'original_custodian_name',
+        'actual_location_id', 'actual_location_name',
+        'actual_custodian_id', 'actual_custodian_name',
+        'photos', 'remark', 'latitude', 'longitude', 'scanned_at',
+    ]
+    # Payload fields whose database constraints are checked per batch entry
+    PAYLOAD_FIELDS = [
+        'qr_code', 'scan_method', 'scan_status',
+        'actual_location_id', 'actual_location_name',
+        'actual_custodian_id', 'actual_custodian_name',
+        'latitude', 'longitude',
+    ]
+
     def __init__(self):
         super().__init__(InventoryScan)
 
@@ -63,27 +83,10 @@ class ScanService(BaseCRUDService):
 
         with transaction.atomic():
             # Validate task exists and is in progress
-            try:
-                task = InventoryTask.objects.get(
-                    id=task_id,
-                    organization_id=organization_id,
-                    is_deleted=False
-                )
-            except InventoryTask.DoesNotExist:
-                raise ValidationError(_("Inventory task not found."))
-
-            if task.status != InventoryTask.STATUS_IN_PROGRESS:
-                raise ValidationError(_("Inventory task is not in progress."))
+            self._get_in_progress_task(task_id, organization_id)
 
             # Parse and validate QR code
-            qr_generator = QRCodeGenerator()
-            qr_data = qr_generator.parse_qr_code(qr_code)
-
-            if qr_data.get('type') != QRCodeGenerator.TYPE_ASSET:
-                raise ValidationError(_("Invalid QR code type. Expected asset QR code."))
-
-            asset_id = qr_data.get('asset_id')
-            asset_code = qr_data.get('asset_code')
+            asset_id, asset_code = self._parse_asset_qr(QRCodeGenerator(), qr_code)
 
             # Validate asset exists
             try:
@@ -175,9 +178,36 @@ class ScanService(BaseCRUDService):
                     executor_id=scanned_by_id,
                     is_deleted=False,
                 ).update(completed_count=F('completed_count') + 1)
+                InventoryService().apply_scan_delta(task_id, 1)
 
                 return scan
 
+    def _get_in_progress_task(self, task_id: str, organization_id: str) -> InventoryTask:
+        """Get the task being scanned, ensuring it is in progress."""
+        try:
+            task = InventoryTask.objects.get(
+                id=task_id,
+                organization_id=organization_id,
+                is_deleted=False
+            )
+        except InventoryTask.DoesNotExist:
+            raise ValidationError(_("Inventory task not found."))
+
+        if task.status != InventoryTask.STATUS_IN_PROGRESS:
+            raise ValidationError(_("Inventory task is not in progress."))
+        return task
+
+    def _parse_asset_qr(self, qr_generator, qr_code: str):
+        """Parse an asset QR payload into (asset_id, asset_code)."""
+        from apps.inventory.utils.qr_code import QRCodeGenerator
+
+        qr_data = qr_generator.parse_qr_code(qr_code)
+
+        if qr_data.get('type') != QRCodeGenerator.TYPE_ASSET:
+            raise ValidationError(_("Invalid QR code type. Expected asset QR code."))
+
+        return qr_data.get('asset_id'), qr_data.get('asset_code')
+
     def _update_snapshot_scan(self, snapshot: InventorySnapshot, scan: InventoryScan) -> None:
         """Update snapshot scan information."""
         snapshot.scanned = True
@@ -195,6 +225,13 @@ class ScanService(BaseCRUDService):
         """
         Batch record scan operations.
 
+        Applies the same rules as record_scan to every entry, in order, but
+        validates the task once, resolves assets, snapshots and existing
+        scans with one query each and writes scans and snapshot flags with
+        bulk operations in a single transaction. Payload values are checked
+        against the scan fields first, so entries the database would reject
+        are reported by index like any other failed entry.
+
         Args:
             task_id: Inventory task ID
             scans_data: List of scan data dictionaries
@@ -204,41 +241,204 @@ class ScanService(BaseCRUDService):
         Returns:
             Dictionary with results summary
         """
+        from apps.inventory.utils.qr_code import QRCodeGenerator
+
         results = {
             'total': len(scans_data),
             'succeeded': 0,
             'failed': 0,
             'errors': []
         }
+        if not scans_data:
+            return results
+
+        try:
+            self._get_in_progress_task(task_id, organization_id)
+        except ValidationError as e:
+            results['failed'] = len(scans_data)
+            results['errors'] = [
+                {'index': idx, 'error': str(e)} for idx in range(len(scans_data))
+            ]
+            return results
+
+        # Parse all QR payloads up front
+        qr_generator = QRCodeGenerator()
+        parsed = {}
+        parse_errors = {}
+        for idx, scan_data in enumerate(scans_data):
+            try:
+                asset_id, asset_code = self._parse_asset_qr(qr_generator, scan_data.get('qr_code'))
+                parsed[idx] = (self._normalize_asset_id(asset_id), asset_code)
+            except Exception as e:
+                parse_errors[idx] = str(e)
+
+        asset_ids = {asset_id for asset_id, _ in parsed.values() if asset_id}
+        asset_codes = {
+            str(asset_id): asset_code
+            for asset_id, asset_code in Asset.objects.filter(
+                id__in=asset_ids,
+                organization_id=organization_id,
+                is_deleted=False
+            ).values_list('id', 'asset_code')
+        }
+        snapshots = {
+            str(snapshot.asset_id): snapshot
+            for snapshot in InventorySnapshot.objects.filter(
+                task_id=task_id,
+                asset_id__in=list(asset_codes),
+                is_deleted=False
+            )
+        }
+        scans_by_asset = {}
+        for scan in InventoryScan.objects.filter(
+            task_id=task_id,
+            asset_id__in=list(snapshots),
+            is_deleted=False
+        ).order_by('-scanned_at'):
+            scans_by_asset.setdefault(str(scan.asset_id), scan)
 
+        scans_to_create = {}
+        scans_to_update = {}
+        touched_snapshots = {}
         for idx, scan_data in enumerate(scans_data):
+            if idx in parse_errors:
+                self._add_batch_error(results, idx, parse_errors[idx])
+                continue
+
+            asset_id, asset_code = parsed[idx]
+            if not asset_id or asset_codes.get(asset_id) != asset_code:
+                self._add_batch_error(results, idx, str(ValidationError(_("Asset not found."))))
+                continue
+
+            snapshot = snapshots.get(asset_id)
+            if snapshot is None:
+                self._add_batch_error(
+                    results, idx, str(ValidationError(_("Asset not in inventory snapshot.")))
+                )
+                continue
+
             try:
-                self.record_scan(
+                scan_data = {**scan_data, **self._clean_scan_payload(scan_data)}
+            except ValidationError as e:
+                self._add_batch_error(results, idx, str(e))
+                continue
+
+            scan = scans_by_asset.get(asset_id)
+            if scan is None:
+                scan = InventoryScan(
+                    id=uuid.uuid4(),
                     task_id=task_id,
+                    asset_id=asset_id,
                     qr_code=scan_data.get('qr_code'),
                     scanned_by_id=scanned_by_id,
                     organization_id=organization_id,
-                    scan_method=scan_data.get('scan_method', InventoryScan.METHOD_QR),
-                    scan_status=scan_data.get('scan_status', 'normal'),
-                    actual_location_id=scan_data.get('actual_location_id'),
-                    actual_location_name=scan_data.get('actual_location_name'),
-                    actual_custodian_id=scan_data.get('actual_custodian_id'),
-                    actual_custodian_name=scan_data.get('actual_custodian_name'),
-                    photos=scan_data.get('photos'),
-                    remark=scan_data.get('remark'),
-                    latitude=scan_data.get('latitude'),
-                    longitude=scan_data.get('longitude'),
                 )
-                results['succeeded'] += 1
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append({
-                    'index': idx,
-                    'error': str(e)
-                })
+                scans_by_asset[asset_id] = scan
+                scans_to_create[asset_id] = scan
+            elif asset_id not in scans_to_create:
+                scans_to_update[asset_id] = scan
+
+            self._apply_scan_values(scan, snapshot, scan_data)
+            snapshot.scanned = True
+            snapshot.scanned_at = scan.scanned_at
+            snapshot.scan_count += 1
+            touched_snapshots[asset_id] = snapshot
+            results['succeeded'] += 1
+
+        now = timezone.now()
+        for scan in scans_to_update.values():
+            scan.updated_at = now
+
+        with transaction.atomic():
+            InventoryScan.objects.bulk_create(
+                list(scans_to_create.values()),
+                batch_size=self.BULK_BATCH_SIZE
+            )
+            InventoryScan.objects.bulk_update(
+                list(scans_to_update.values()),
+                self.RESCAN_UPDATE_FIELDS + ['updated_at'],
+                batch_size=self.BULK_BATCH_SIZE
+            )
+            InventorySnapshot.objects.bulk_update(
+                list(touched_snapshots.values()),
+                ['scanned', 'scanned_at', 'scan_count'],
+                batch_size=self.BULK_BATCH_SIZE
+            )
+            if scans_to_create:
+                InventoryTaskExecutor.objects.filter(
+                    task_id=task_id,
+                    executor_id=scanned_by_id,
+                    is_deleted=False,
+                ).update(completed_count=F('completed_count') + len(scans_to_create))
+                InventoryService().apply_scan_delta(task_id, len(scans_to_create))
 
         return results
 
+    def _normalize_asset_id(self, asset_id) -> Optional[str]:
+        """Normalize a QR asset id to its canonical UUID string."""
+        if not asset_id:
+            return None
+        try:
+            return str(uuid.UUID(str(asset_id)))
+        except ValueError:
+            return None
+
+    def _clean_scan_payload(self, scan_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert payload values and run the scan field validators on them.
+
+        Catches what the database would reject (lengths, decimal digits)
+        so one bad entry is reported by index instead of aborting the
+        bulk write. Choices are not enforced, matching record_scan.
+        """
+        cleaned = {}
+        errors = {}
+        for name in self.PAYLOAD_FIELDS:
+            if name not in scan_data:
+                continue
+            field = InventoryScan._meta.get_field(name)
+            try:
+                value = field.to_python(scan_data[name])
+                field.run_validators(value)
+            except ValidationError as e:
+                errors[name] = e.messages
+            else:
+                cleaned[name] = value
+        if errors:
+            raise ValidationError(errors)
+        return cleaned
+
+    def _apply_scan_values(
+        self,
+        scan: InventoryScan,
+        snapshot: InventorySnapshot,
+        scan_data: Dict[str, Any],
+    ) -> None:
+        """Apply scan payload and snapshot originals to a scan instance."""
+        scan.scan_method = scan_data.get('scan_method', InventoryScan.METHOD_QR)
+        scan.scan_status = scan_data.get('scan_status', 'normal')
+        scan.original_location_id = snapshot.location_id
+        scan.original_location_name = snapshot.location_name or ''
+        scan.original_custodian_id = snapshot.custodian_id
+        scan.original_custodian_name = snapshot.custodian_name or ''
+        scan.actual_location_id = scan_data.get('actual_location_id')
+        scan.actual_location_name = scan_data.get('actual_location_name') or ''
+        scan.actual_custodian_id = scan_data.get('actual_custodian_id')
+        scan.actual_custodian_name = scan_data.get('actual_custodian_name') or ''
+        scan.photos = scan_data.get('photos') or []
+        scan.remark = scan_data.get('remark') or ''
+        scan.latitude = scan_data.get('latitude')
+        scan.longitude = scan_data.get('longitude')
+        scan.scanned_at = timezone.now()
+
+    def _add_batch_error(self, results: Dict[str, Any], index: int, error: str) -> None:
+        """Record a failed batch entry."""
+        results['failed'] += 1
+        results['errors'].append({
+            'index': index,
+            'error': error
+        })
+
     def validate_qr_code(
         self,
         qr_code: str,
@@ -5,6 +5,7 @@ import uuid
 import json
 from typing import List, Dict, Optional, Any
 from django.db import transaction
+from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -17,6 +18,20 @@ from apps.assets.models import Asset
 class SnapshotService(BaseCRUDService):
     """Service for inventory snapshot management."""
 
+    # Asset rows streamed from the database per round trip
+    STREAM_CHUNK_SIZE = 2000
+    BULK_BATCH_SIZE = 500
+
+    # Flat asset columns needed to build a snapshot without loading models
+    SNAPSHOT_ASSET_FIELDS = (
+        'id', 'asset_code', 'asset_name', 'asset_status', 'organization_id',
+        'asset_category_id', 'asset_category__name',
+        'location_id', 'location__name',
+        'custodian_id', 'custodian__first_name', 'custodian__last_name',
+        'department_id', 'department__name',
+        'purchase_date', 'purchase_price',
+    )
+
     def __init__(self):
         super().__init__(InventorySnapshot)
 
@@ -71,6 +86,122 @@ class SnapshotService(BaseCRUDService):
             asset_id__in=[a.id for a in assets]
         ))
 
+    def stream_snapshots(
+        self,
+        task_id: str,
+        assets: QuerySet,
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Create snapshots for an asset queryset without loading Asset models.
+
+        Asset rows are streamed as flat values with a server-side cursor and
+        written with bulk_create chunk by chunk, so memory stays bounded by
+        the chunk size. Created snapshots are not read back.
+
+        Args:
+            task_id: Inventory task ID
+            assets: Unevaluated Asset queryset to snapshot
+            chunk_size: Rows per streamed chunk (defaults to STREAM_CHUNK_SIZE)
+
+        Returns:
+            Number of snapshots created
+        """
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        rows = assets.order_by('pk').values(*self.SNAPSHOT_ASSET_FIELDS).iterator(
+            chunk_size=chunk_size
+        )
+
+        created = 0
+        pending = []
+        for row in rows:
+            pending.append(self._build_snapshot_from_row(task_id, row))
+            if len(pending) >= chunk_size:
+                InventorySnapshot.objects.bulk_create(pending, batch_size=self.BULK_BATCH_SIZE)
+                created += len(pending)
+                pending = []
+
+        if pending:
+            InventorySnapshot.objects.bulk_create(pending, batch_size=self.BULK_BATCH_SIZE)
+            created += len(pending)
+
+        return created
+
+    def _build_snapshot_from_row(self, task_id: str, row: Dict[str, Any]) -> InventorySnapshot:
+        """Build an unsaved snapshot from a SNAPSHOT_ASSET_FIELDS values row."""
+        custodian_name = None
+        if row['custodian_id']:
+            custodian_name = (
+                f"{row['custodian__first_name'] or ''} {row['custodian__last_name'] or ''}"
+            ).strip()
+
+        snapshot_data = self._snapshot_payload(
+            asset_id=row['id'],
+            asset_code=row['asset_code'],
+            asset_name=row['asset_name'],
+            category=(row['asset_category_id'], row['asset_category__name']),
+            location=(row['location_id'], row['location__name']),
+            custodian=(row['custodian_id'], custodian_name),
+            department=(row['department_id'], row['department__name']),
+            status=row['asset_status'],
+            purchase_date=row['purchase_date'],
+            purchase_price=row['purchase_price'],
+        )
+        return InventorySnapshot(
+            id=uuid.uuid4(),
+            task_id=task_id,
+            asset_id=row['id'],
+            asset_code=row['asset_code'],
+            asset_name=row['asset_name'],
+            asset_category_id=str(row['asset_category_id']) if row['asset_category_id'] else None,
+            asset_category_name=row['asset_category__name'] or '',
+            location_id=str(row['location_id']) if row['location_id'] else None,
+            location_name=row['location__name'] or '',
+            custodian_id=str(row['custodian_id']) if row['custodian_id'] else None,
+            custodian_name=custodian_name or '',
+            department_id=str(row['department_id']) if row['department_id'] else None,
+            department_name=row['department__name'] or '',
+            asset_status=row['asset_status'],
+            snapshot_data=snapshot_data,
+            organization_id=row['organization_id'],
+            scanned=False,
+            scan_count=0,
+        )
+
+    def _snapshot_payload(
+        self,
+        asset_id,
+        asset_code,
+        asset_name,
+        category,
+        location,
+        custodian,
+        department,
+        status,
+        purchase_date,
+        purchase_price,
+    ) -> Dict[str, Any]:
+        """Build the snapshot_data JSON from (id, name) reference pairs."""
+        def ref(pair):
+            ref_id, ref_name = pair
+            return {
+                'id': str(ref_id) if ref_id else None,
+                'name': ref_name if ref_id else None,
+            }
+
+        return {
+            'asset_id': str(asset_id),
+            'asset_code': asset_code,
+            'asset_name': asset_name,
+            'category': ref(category),
+            'location': ref(location),
+            'custodian': ref(custodian),
+            'department': ref(department),
+            'status': status,
+            'purchase_date': purchase_date.isoformat() if purchase_date else None,
+            'purchase_price': float(purchase_price) if purchase_price else None,
+        }
+
     def _generate_snapshot_data(self, asset: Asset) -> Dict[str, Any]:
         """
         Generate snapshot data JSON for an asset.
@@ -81,30 +212,24 @@ class SnapshotService(BaseCRUDService):
         Returns:
             Dictionary with snapshot data
         """
-        return {
-            'asset_id': str(asset.id),
-            'asset_code': asset.asset_code,
-            'asset_name': asset.asset_name,
-            'category': {
-                'id': str(asset.asset_category_id) if asset.asset_category_id else None,
-                'name': asset.asset_category.name if asset.asset_category else None,
-            },
-            'location': {
-                'id': str(asset.location_id) if asset.location_id else None,
-                'name': asset.location.name if asset.location else None,
-            },
-            'custodian': {
-                'id': str(asset.custodian_id) if asset.custodian_id else None,
-                'name': asset.custodian.get_full_name() if asset.custodian else None,
-            },
-            'department': {
-                'id': str(asset.department_id) if asset.department_id else None,
-                'name': asset.department.name if asset.department else None,
-            },
-            'status': asset.asset_status,
-            'purchase_date': asset.purchase_date.isoformat() if asset.purchase_date else None,
-            'purchase_price': float(asset.purchase_price) if asset.purchase_price else None,
-        }
+        return self._snapshot_payload(
+            asset_id=asset.id,
+            asset_code=asset.asset_code,
+            asset_name=asset.asset_name,
+            category=(
+                asset.asset_category_id,
+                asset.asset_category.name if asset.asset_category else None
+            ),
+            location=(asset.location_id, asset.location.name if asset.location else None),
+            custodian=(
+                asset.custodian_id,
+                asset.custodian.get_full_name() if asset.custodian else None
+            ),
+            department=(asset.department_id, asset.department.name if asset.department else None),
+            status=asset.asset_status,
+            purchase_date=asset.purchase_date,
+            purchase_price=asset.purchase_price,
+        )
 
     def get_snapshot_by_asset(
         self,
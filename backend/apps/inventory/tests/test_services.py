@@ -185,6 +185,51 @@ class InventoryServiceTests(TestCase):
         snapshots = InventorySnapshot.objects.filter(task=task)
         self.assertEqual(snapshots.count(), 5)
 
+    def test_create_partial_inventory_task_samples_assets(self):
+        """Partial inventory snapshots a keyed random sample of the ratio size."""
+        for _ in range(3):
+            task = self.service.create_task(
+                task_name="Partial Inventory",
+                inventory_type=InventoryTask.TYPE_PARTIAL,
+                sample_ratio=0.6,
+                planned_date="2024-01-01",
+                organization_id=str(self.organization.id),
+                created_by_id=str(self.user.id)
+            )
+
+            snapshots = InventorySnapshot.objects.filter(task=task)
+            self.assertEqual(task.total_count, 3)
+            self.assertEqual(snapshots.count(), 3)
+            self.assertEqual(len(set(snapshots.values_list('asset_id', flat=True))), 3)
+
+    def test_stream_snapshots_builds_snapshot_data(self):
+        """Streamed snapshots carry the same reference data as model snapshots."""
+        self.owner.first_name = "Ada"
+        self.owner.last_name = "Lovelace"
+        self.owner.save(update_fields=['first_name', 'last_name'])
+        Asset.objects.filter(organization=self.organization).update(custodian=self.owner)
+        task = InventoryTask.objects.create(
+            task_name="Stream Inventory",
+            task_code=f"STREAM_{self.unique_suffix}",
+            planned_date="2024-01-01",
+            inventory_type=InventoryTask.TYPE_FULL,
+            organization=self.organization,
+            created_by=self.user
+        )
+
+        created = SnapshotService().stream_snapshots(
+            task.id,
+            Asset.objects.filter(organization=self.organization),
+            chunk_size=2
+        )
+
+        self.assertEqual(created, 5)
+        snapshot = InventorySnapshot.objects.filter(task=task).first()
+        self.assertEqual(snapshot.custodian_name, "Ada Lovelace")
+        self.assertEqual(snapshot.location_name, "Test Location")
+        self.assertEqual(snapshot.snapshot_data['category']['name'], "Test Category")
+        self.assertEqual(snapshot.snapshot_data['purchase_date'], "2024-01-01")
+
     def test_start_task(self):
         """Test starting an inventory task."""
         task = self.service.create_task(
@@ -271,6 +316,35 @@ class InventoryServiceTests(TestCase):
         self.assertEqual(task.scanned_count, 3)
         self.assertEqual(task.total_count, 5)
 
+    def test_update_statistics_counts_pending_differences_by_type(self):
+        """Test difference counts are aggregated per type."""
+        task = self.service.create_task(
+            task_name="Test Task",
+            inventory_type=InventoryTask.TYPE_FULL,
+            planned_date="2024-01-01",
+            organization_id=str(self.organization.id),
+            created_by_id=str(self.user.id)
+        )
+        assets = list(Asset.objects.filter(organization=self.organization)[:3])
+        for asset, difference_type in zip(assets, [
+            InventoryDifference.TYPE_MISSING,
+            InventoryDifference.TYPE_MISSING,
+            InventoryDifference.TYPE_LOCATION_MISMATCH,
+        ]):
+            InventoryDifference.objects.create(
+                task=task,
+                asset=asset,
+                difference_type=difference_type,
+                organization=self.organization,
+                created_by=self.user
+            )
+
+        task = self.service.update_statistics(str(task.id))
+
+        self.assertEqual(task.missing_count, 2)
+        self.assertEqual(task.location_changed_count, 1)
+        self.assertEqual(task.surplus_count, 0)
+
 
 class ScanServiceTests(TestCase):
     """Tests for ScanService."""
@@ -368,6 +442,167 @@ class ScanServiceTests(TestCase):
         self.assertTrue(snapshot.scanned)
         self.assertGreater(snapshot.scan_count, 0)
 
+    def test_record_scan_increments_task_counters(self):
+        """Test new scans advance task counters and re-scans do not."""
+        qr_data = self.qr_generator.generate_asset_qr_data(
+            str(self.asset.id),
+            self.asset.asset_code,
+            str(self.organization.id)
+        )
+
+        for _ in range(2):
+            self.service.record_scan(
+                task_id=str(self.task.id),
+                qr_code=qr_data,
+                scanned_by_id=str(self.user.id),
+                organization_id=str(self.organization.id)
+            )
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.scanned_count, 1)
+        self.assertEqual(self.task.normal_count, 1)
+
+    def test_soft_deleted_scan_decrements_task_counters(self):
+        """Test deleting a scan takes it out of the task counters once."""
+        qr_data = self.qr_generator.generate_asset_qr_data(
+            str(self.asset.id),
+            self.asset.asset_code,
+            str(self.organization.id)
+        )
+        scan = self.service.record_scan(
+            task_id=str(self.task.id),
+            qr_code=qr_data,
+            scanned_by_id=str(self.user.id),
+            organization_id=str(self.organization.id)
+        )
+
+        scan.soft_delete(self.user)
+        scan.soft_delete(self.user)
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.scanned_count, 0)
+        self.assertEqual(self.task.normal_count, 0)
+
+    def test_bulk_soft_delete_and_restore_adjust_task_counters(self):
+        """Test queryset soft deletes and restores move the task counters too."""
+        qr_data = self.qr_generator.generate_asset_qr_data(
+            str(self.asset.id),
+            self.asset.asset_code,
+            str(self.organization.id)
+        )
+        self.service.record_scan(
+            task_id=str(self.task.id),
+            qr_code=qr_data,
+            scanned_by_id=str(self.user.id),
+            organization_id=str(self.organization.id)
+        )
+        scans = InventoryScan.all_objects.filter(task=self.task)
+
+        scans.update(is_deleted=True, deleted_at=timezone.now())
+        scans.update(is_deleted=True, deleted_at=timezone.now())
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.scanned_count, 0)
+
+        scans.update(is_deleted=False, deleted_at=None)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.scanned_count, 1)
+        self.assertEqual(self.task.normal_count, 1)
+
+        scans.delete()
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.scanned_count, 0)
+
+    def test_batch_record_scans(self):
+        """Test batch scans upsert scans and report per-index errors."""
+        other_asset = Asset.objects.create(
+            asset_code=f"ASSET_{self.unique_suffix}_002",
+            asset_name="Not In Snapshot",
+            asset_category=self.category,
+            purchase_price=0,
+            purchase_date="2024-01-01",
+            organization=self.organization,
+            created_by=self.user
+        )
+        qr_data = self.qr_generator.generate_asset_qr_data(
+            str(self.asset.id),
+            self.asset.asset_code,
+            str(self.organization.id)
+        )
+        other_qr = self.qr_generator.generate_asset_qr_data(
+            str(other_asset.id),
+            other_asset.asset_code,
+            str(self.organization.id)
+        )
+
+        results = self.service.batch_record_scans(
+            task_id=str(self.task.id),
+            scans_data=[
+                {'qr_code': qr_data},
+                {'qr_code': 'not-a-qr-code'},
+                {'qr_code': other_qr},
+                {'qr_code': qr_data, 'scan_status': InventoryScan.STATUS_DAMAGED},
+            ],
+            scanned_by_id=str(self.user.id),
+            organization_id=str(self.organization.id)
+        )
+
+        self.assertEqual(results['total'], 4)
+        self.assertEqual(results['succeeded'], 2)
+        self.assertEqual(results['failed'], 2)
+        self.assertEqual([error['index'] for error in results['errors']], [1, 2])
+        self.assertIn('Asset not in inventory snapshot.', results['errors'][1]['error'])
+
+        scans = InventoryScan.objects.filter(task=self.task, asset=self.asset)
+        self.assertEqual(scans.count(), 1)
+        self.assertEqual(scans.first().scan_status, InventoryScan.STATUS_DAMAGED)
+        snapshot = InventorySnapshot.objects.get(task=self.task, asset=self.asset)
+        self.assertTrue(snapshot.scanned)
+        self.assertEqual(snapshot.scan_count, 2)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.scanned_count, 1)
+
+    def test_batch_record_scans_reports_invalid_payload_per_index(self):
+        """Test values the database would reject fail only their own entry."""
+        qr_data = self.qr_generator.generate_asset_qr_data(
+            str(self.asset.id),
+            self.asset.asset_code,
+            str(self.organization.id)
+        )
+
+        results = self.service.batch_record_scans(
+            task_id=str(self.task.id),
+            scans_data=[
+                {'qr_code': qr_data, 'latitude': '12345.6789'},
+                {'qr_code': qr_data, 'actual_location_id': 'x' * 51},
+                {'qr_code': qr_data, 'latitude': '31.2304', 'longitude': '121.4737'},
+            ],
+            scanned_by_id=str(self.user.id),
+            organization_id=str(self.organization.id)
+        )
+
+        self.assertEqual(results['succeeded'], 1)
+        self.assertEqual([error['index'] for error in results['errors']], [0, 1])
+        self.assertIn('latitude', results['errors'][0]['error'])
+        self.assertIn('actual_location_id', results['errors'][1]['error'])
+        scan = InventoryScan.objects.get(task=self.task, asset=self.asset)
+        self.assertEqual(str(scan.latitude), '31.2304000')
+
+    def test_batch_record_scans_requires_in_progress_task(self):
+        """Test batch scans fail every entry when the task is not in progress."""
+        self.task.status = InventoryTask.STATUS_COMPLETED
+        self.task.save(update_fields=['status'])
+
+        results = self.service.batch_record_scans(
+            task_id=str(self.task.id),
+            scans_data=[{'qr_code': 'a'}, {'qr_code': 'b'}],
+            scanned_by_id=str(self.user.id),
+            organization_id=str(self.organization.id)
+        )
+
+        self.assertEqual(results['failed'], 2)
+        self.assertEqual(results['succeeded'], 0)
+        self.assertFalse(InventoryScan.objects.filter(task=self.task).exists())
+
     def test_validate_qr_code(self):
         """Test QR code validation."""
         qr_data = self.qr_generator.generate_asset_qr_data(
@@ -561,6 +796,68 @@ class DifferenceServiceTests(TestCase):
         location_diffs = [d for d in differences if d.difference_type == InventoryDifference.TYPE_LOCATION_MISMATCH]
         self.assertEqual(len(location_diffs), 1)
 
+    def test_generate_differences_streaming(self):
+        """Test streaming generation returns counts across chunks."""
+        assets = []
+        for suffix in ('S1', 'S2', 'S3'):
+            asset = Asset.objects.create(
+                asset_code=f"ASSET_{self.unique_suffix}_{suffix}",
+                purchase_price=0,
+                purchase_date="2024-01-01",
+                asset_name=f"Stream Asset {suffix}",
+                asset_category=self.category,
+                location=self.location1,
+                organization=self.organization,
+                created_by=self.user
+            )
+            InventorySnapshot.objects.create(
+                task=self.task,
+                asset=asset,
+                asset_code=asset.asset_code,
+                asset_name=asset.asset_name,
+                location_name=self.location1.name,
+                organization=self.organization,
+                created_by=self.user
+            )
+            assets.append(asset)
+        surplus_asset = Asset.objects.create(
+            asset_code=f"ASSET_{self.unique_suffix}_SUR",
+            purchase_price=0,
+            purchase_date="2024-01-01",
+            asset_name="Surplus Asset",
+            asset_category=self.category,
+            organization=self.organization,
+            created_by=self.user
+        )
+        for asset, location_name, scan_status in [
+            (assets[1], self.location2.name, InventoryScan.STATUS_NORMAL),
+            (assets[2], self.location1.name, InventoryScan.STATUS_DAMAGED),
+            (surplus_asset, self.location2.name, InventoryScan.STATUS_NORMAL),
+        ]:
+            InventoryScan.objects.create(
+                task=self.task,
+                asset=asset,
+                qr_code=f"QR_{asset.asset_code}",
+                scanned_by=self.user,
+                scanned_at=timezone.now(),
+                scan_status=scan_status,
+                actual_location_name=location_name,
+                organization=self.organization,
+                created_by=self.user
+            )
+
+        counts = self.service.generate_differences_streaming(str(self.task.id), chunk_size=2)
+
+        self.assertEqual(counts[InventoryDifference.TYPE_MISSING], 1)
+        self.assertEqual(counts[InventoryDifference.TYPE_LOCATION_MISMATCH], 1)
+        self.assertEqual(counts[InventoryDifference.TYPE_DAMAGED], 1)
+        self.assertEqual(counts[InventoryDifference.TYPE_SURPLUS], 1)
+        self.assertEqual(counts['total'], 4)
+        self.assertEqual(
+            InventoryDifference.objects.filter(task=self.task).count(),
+            4
+        )
+
     def test_resolve_difference(self):
         """Test resolving a difference."""
         asset = Asset.objects.create(
@@ -236,8 +236,10 @@ class InventoryTaskViewSet(BaseModelViewSetWithBatch):
         task = self.get_object()
         service = InventoryService()
 
-        # Update statistics first
-        service.update_statistics(str(task.id))
+        # Scan counters are maintained incrementally while the task runs;
+        # recount only once differences can exist.
+        if task.status != InventoryTask.STATUS_IN_PROGRESS:
+            service.update_statistics(str(task.id))
 
         # Get progress data
         progress_data = service.get_task_progress(str(task.id))
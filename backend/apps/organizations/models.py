@@ -2,6 +2,7 @@
 Organization models for multi-tenant support.
 """
 from django.db import models
+from django.db.models import Q
 import uuid
 import secrets
 from datetime import timedelta
@@ -10,6 +11,7 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 from apps.common.models import BaseModel
+from apps.common.mixins.tree_path import TreePathMixin
 
 User = get_user_model()
 
@@ -322,13 +324,20 @@ class Organization(models.Model):
         return cls.get_default_organization()
 
 
-class Department(BaseModel):
+class Department(BaseModel, TreePathMixin):
     """
     Department model - inherits from BaseModel.
 
     Supports hierarchical department structure with parent-child relationships.
     Includes leader designation, full path tracking, and SSO sync fields.
+    Subtree queries use the materialized tree_path from TreePathMixin.
     """
+    TREE_NODE_FIELDS = (
+        'id', 'parent_id', 'code', 'name', 'full_path', 'full_path_name',
+        'level', 'order', 'leader_id', 'is_active',
+    )
+    TREE_NODE_ORDERING = ('order', 'code')
+    TREE_PREFIXED_FIELDS = ('path', 'full_path', 'full_path_name')
 
     # Basic Information
     code = models.CharField(
@@ -477,16 +486,9 @@ class Department(BaseModel):
             self.full_path = self.name
             self.full_path_name = self.name
 
+        # TreePathMixin rewrites the descendants' paths in one UPDATE
         super().save(*args, **kwargs)
 
-        # Recursively update children paths
-        self._update_children_paths()
-
-    def _update_children_paths(self):
-        """Update all children department paths."""
-        for child in self.children.filter(is_deleted=False):
-            child.save(update_fields=['level', 'path', 'full_path', 'full_path_name'])
-
     def get_descendant_ids(self):
         """
         Get all descendant department IDs.
@@ -494,10 +496,37 @@ class Department(BaseModel):
         Returns:
             list: List of department IDs including self and all descendants
         """
-        ids = [self.id]
-        for child in self.children.filter(is_deleted=False):
-            ids.extend(child.get_descendant_ids())
-        return ids
+        return [self.id] + list(
+            self.get_descendants(include_self=False).values_list('id', flat=True)
+        )
+
+    def get_ancestors(self, include_self: bool = False):
+        """
+        Get the live ancestor chain, nearest first, in one query.
+
+        The chain stops at the first soft-deleted ancestor.
+
+        Returns:
+            list: Department instances (with leader loaded)
+        """
+        chain_ids = self.get_ancestor_ids_from_path()
+        if not chain_ids and self.parent_id:
+            # Path not materialized yet; fall back to the parent link
+            chain_ids = [self.parent_id]
+        departments = {
+            dept.id: dept
+            for dept in Department.all_objects.filter(
+                id__in=chain_ids
+            ).select_related('leader')
+        }
+
+        chain = [self] if include_self else []
+        for dept_id in reversed(chain_ids):
+            dept = departments.get(dept_id)
+            if dept is None or dept.is_deleted:
+                break
+            chain.append(dept)
+        return chain
 
     def get_ancestor_ids(self):
         """
@@ -506,12 +535,60 @@ class Department(BaseModel):
         Returns:
             list: List of ancestor department IDs
         """
-        ids = []
-        current = self.parent
-        while current and not current.is_deleted:
-            ids.append(current.id)
-            current = current.parent
-        return ids
+        return [dept.id for dept in self.get_ancestors()]
+
+    @classmethod
+    def get_subtree_ids(cls, department_ids) -> set:
+        """
+        Get the given departments and all their live descendants.
+
+        Uses one prefix match per subtree root in a single query.
+        """
+        paths = [
+            path for path in cls.all_objects.filter(
+                id__in=list(department_ids)
+            ).values_list('tree_path', flat=True)
+            if path
+        ]
+        result = set(department_ids)
+        if paths:
+            subtree = Q()
+            for path in paths:
+                subtree |= Q(tree_path__startswith=path)
+            result.update(
+                cls.objects.filter(subtree, is_deleted=False).values_list('id', flat=True)
+            )
+        return result
+
+    @classmethod
+    def get_tree(cls, organization_id, ordering=None):
+        """
+        Get the active department tree of an organization.
+
+        Built from the cached per-organization node list, so it costs no
+        queries until a department changes.
+
+        Returns:
+            list: Root department dicts with nested children
+        """
+        nodes = [node for node in cls.get_cached_tree_nodes(organization_id) if node['is_active']]
+        if ordering:
+            nodes = sorted(nodes, key=lambda node: tuple(node[key] for key in ordering))
+
+        def serialize(node, children):
+            return {
+                'id': str(node['id']),
+                'code': node['code'],
+                'name': node['name'],
+                'full_path': node['full_path'],
+                'full_path_name': node['full_path_name'],
+                'level': node['level'],
+                'order': node['order'],
+                'leader_id': str(node['leader_id']) if node['leader_id'] else None,
+                'is_active': node['is_active'],
+            }
+
+        return cls.build_nested_tree(nodes, serialize)
 
     def get_full_tree(self):
         """
@@ -520,6 +597,10 @@ class Department(BaseModel):
         Returns:
             dict: Tree structure with descendants
         """
+        for root in Department.get_tree(self.organization_id):
+            found = _find_tree_node(root, str(self.id))
+            if found is not None:
+                return found
         return {
             'id': str(self.id),
             'code': self.code,
@@ -527,12 +608,10 @@ class Department(BaseModel):
             'full_path': self.full_path,
             'full_path_name': self.full_path_name,
             'level': self.level,
+            'order': self.order,
             'leader_id': str(self.leader_id) if self.leader_id else None,
             'is_active': self.is_active,
-            'children': [
-                child.get_full_tree()
-                for child in self.children.filter(is_deleted=False, is_active=True)
-            ]
+            'children': [],
         }
 
     def clean(self):
@@ -541,13 +620,23 @@ class Department(BaseModel):
         if self.parent and self.parent_id == self.pk:
             raise ValidationError({"parent": "A department cannot be its own parent."})
 
-        # Prevent circular references
-        if self.parent:
-            descendant_ids = self.get_descendant_ids()
-            if self.parent_id in descendant_ids:
+        # Prevent circular references (parent inside this subtree)
+        if self.parent and self.pk and self.tree_path:
+            if self.parent.tree_path.startswith(self.tree_path):
                 raise ValidationError({"parent": "Circular parent reference detected."})
 
 
+def _find_tree_node(node, node_id):
+    """Find a node by id in a nested department tree dict."""
+    if node['id'] == node_id:
+        return node
+    for child in node['children']:
+        found = _find_tree_node(child, node_id)
+        if found is not None:
+            return found
+    return None
+
+
 class UserDepartment(BaseModel):
     """
     User-Department association model - supports multiple departments per user.
@@ -121,8 +121,9 @@ class DepartmentSerializer(BaseModelSerializer):
             instance = self.instance
             if instance and instance.pk:
                 # Check if parent is a descendant of current dept
-                descendant_ids = instance.get_descendant_ids()
-                if parent.id in descendant_ids:
+                if parent.id == instance.id or (
+                    instance.tree_path and parent.tree_path.startswith(instance.tree_path)
+                ):
                     raise serializers.ValidationError({
                         'parent': 'Cannot set a descendant department as parent.'
                     })
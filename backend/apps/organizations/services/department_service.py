@@ -28,32 +28,25 @@ class DepartmentService(BaseCRUDService):
         Returns:
             List of root department dicts with nested children
         """
-        def build_tree(parent_id=None) -> List[Dict[str, Any]]:
-            """Recursively build department tree."""
-            departments = Department.objects.filter(
-                organization_id=organization_id,
-                parent_id=parent_id,
-                is_deleted=False,
-                is_active=True
-            ).order_by('order', 'name')
-
-            result = []
-            for dept in departments:
-                children = build_tree(dept.id)
-                result.append({
-                    'id': str(dept.id),
-                    'code': dept.code,
-                    'name': dept.name,
-                    'level': dept.level,
-                    'full_path': dept.full_path,
-                    'full_path_name': dept.full_path_name,
-                    'is_active': dept.is_active,
-                    'order': dept.order,
-                    'children': children
-                })
-            return result
-
-        return build_tree()
+        tree = Department.get_tree(organization_id, ordering=('order', 'name'))
+
+        def strip(nodes):
+            return [
+                {
+                    'id': node['id'],
+                    'code': node['code'],
+                    'name': node['name'],
+                    'level': node['level'],
+                    'full_path': node['full_path'],
+                    'full_path_name': node['full_path_name'],
+                    'is_active': node['is_active'],
+                    'order': node['order'],
+                    'children': strip(node['children'])
+                }
+                for node in nodes
+            ]
+
+        return strip(tree)
 
     def get_department_path(
         self,
@@ -75,20 +68,19 @@ class DepartmentService(BaseCRUDService):
             organization_id=organization_id,
             user=user,
         )
-        path = []
-        current = department
+        if department.is_deleted:
+            return []
 
-        while current and not current.is_deleted:
-            path.append({
+        return [
+            {
                 'id': str(current.id),
                 'code': current.code,
                 'name': current.name,
                 'level': current.level,
                 'full_path_name': current.full_path_name
-            })
-            current = current.parent
-
-        return list(reversed(path))
+            }
+            for current in reversed(department.get_ancestors(include_self=True))
+        ]
 
     def get_select_options(self, organization_id: str) -> List[Dict[str, Any]]:
         """
@@ -100,24 +92,26 @@ class DepartmentService(BaseCRUDService):
         Returns:
             List of dicts with value, label, and code
         """
-        departments = Department.objects.filter(
-            organization_id=organization_id,
-            is_deleted=False,
-            is_active=True
-        ).order_by('level', 'order', 'name')
-
-        options = []
-        for dept in departments:
-            path = self.get_department_path(
-                dept.id,
-                organization_id=organization_id,
-            )
-            path_name = ' / '.join([p['name'] for p in path])
-            options.append({
-                'value': str(dept.id),
-                'label': path_name,
-                'code': dept.code,
-                'level': dept.level
-            })
-
-        return options
+        nodes = Department.get_cached_tree_nodes(organization_id)
+        nodes_by_id = {node['id']: node for node in nodes}
+
+        def path_names(node):
+            names = []
+            while node is not None:
+                names.append(node['name'])
+                node = nodes_by_id.get(node['parent_id'])
+            return reversed(names)
+
+        active = sorted(
+            (node for node in nodes if node['is_active']),
+            key=lambda node: (node['level'], node['order'], node['name'])
+        )
+        return [
+            {
+                'value': str(node['id']),
+                'label': ' / '.join(path_names(node)),
+                'code': node['code'],
+                'level': node['level']
+            }
+            for node in active
+        ]
@@ -72,10 +72,8 @@ class OrgDataPermissionService:
             is_deleted=False
         )
 
-        for dept in led_depts:
-            dept_ids.add(dept.id)
-            if recursive:
-                dept_ids.update(dept.get_descendant_ids())
+        led_ids = set(led_depts.values_list('id', flat=True))
+        dept_ids.update(Department.get_subtree_ids(led_ids) if recursive else led_ids)
 
         self._viewable_department_ids = dept_ids
         return dept_ids
@@ -102,10 +100,8 @@ class OrgDataPermissionService:
             is_deleted=False
         )
 
-        for dept in led_depts:
-            dept_ids.add(dept.id)
-            if recursive:
-                dept_ids.update(dept.get_descendant_ids())
+        led_ids = set(led_depts.values_list('id', flat=True))
+        dept_ids.update(Department.get_subtree_ids(led_ids) if recursive else led_ids)
 
         # Also check UserDepartment for is_leader flag
         user_leader_depts = UserDepartment.objects.filter(
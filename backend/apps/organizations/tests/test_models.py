@@ -97,3 +97,70 @@ class OrganizationModelTest(TestCase):
         org.save()
         org.refresh_from_db()
         self.assertTrue(org.is_deleted)
+
+
+class DepartmentTreeTest(TestCase):
+    """Test Department materialized tree paths."""
+
+    def setUp(self):
+        """Set up a HQ > TECH > DEV tree and a separate OPS root."""
+        from apps.organizations.models import Department
+        self.org = Organization.objects.create(name='Tree Org', code='TREE')
+        self.hq = Department.objects.create(organization=self.org, code='HQ', name='Headquarters')
+        self.tech = Department.objects.create(
+            organization=self.org, code='TECH', name='Technology', parent=self.hq
+        )
+        self.dev = Department.objects.create(
+            organization=self.org, code='DEV', name='Backend', parent=self.tech
+        )
+        self.ops = Department.objects.create(organization=self.org, code='OPS', name='Operations')
+
+    def test_descendant_and_ancestor_ids(self):
+        """Test subtree lookups use the materialized path."""
+        with self.assertNumQueries(1):
+            descendant_ids = self.hq.get_descendant_ids()
+        self.assertEqual(descendant_ids[0], self.hq.id)
+        self.assertEqual(set(descendant_ids), {self.hq.id, self.tech.id, self.dev.id})
+        with self.assertNumQueries(1):
+            self.assertEqual(self.dev.get_ancestor_ids(), [self.tech.id, self.hq.id])
+
+    def test_move_subtree_rewrites_paths_in_one_update(self):
+        """Test re-parenting rewrites descendants' paths and levels."""
+        from apps.organizations.models import Department
+        tech = Department.objects.get(pk=self.tech.pk)
+        tech.parent = self.ops
+        tech.save()
+
+        dev = Department.objects.get(pk=self.dev.pk)
+        self.assertEqual(dev.level, 2)
+        self.assertEqual(dev.path, '/OPS/TECH/DEV')
+        self.assertEqual(dev.full_path_name, 'Operations/Technology/Backend')
+        self.assertTrue(dev.tree_path.startswith(self.ops.tree_path))
+        self.assertEqual(set(self.hq.get_descendant_ids()), {self.hq.id})
+
+    def test_rename_rewrites_descendant_names(self):
+        """Test renaming a department updates descendants' name paths."""
+        from apps.organizations.models import Department
+        hq = Department.objects.get(pk=self.hq.pk)
+        hq.name = 'Head Office'
+        hq.save()
+
+        dev = Department.objects.get(pk=self.dev.pk)
+        self.assertEqual(dev.full_path_name, 'Head Office/Technology/Backend')
+
+    def test_cannot_move_under_descendant(self):
+        """Test circular parent references are rejected."""
+        from django.core.exceptions import ValidationError
+        hq = self.hq
+        hq.parent = self.dev
+        with self.assertRaises(ValidationError):
+            hq.clean()
+
+    def test_tree_is_served_from_cache(self):
+        """Test the tree endpoint data comes from the cached node list."""
+        from apps.organizations.models import Department
+        Department.get_tree(self.org.id)
+        with self.assertNumQueries(0):
+            tree = Department.get_tree(self.org.id)
+        self.assertEqual([node['code'] for node in tree], ['HQ', 'OPS'])
+        self.assertEqual(tree[0]['children'][0]['children'][0]['code'], 'DEV')
@@ -344,25 +344,14 @@ class DepartmentViewSet(BaseModelViewSetWithBatch):
                 }
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Get root departments (no parent) for this organization
-        roots = Department.objects.filter(
-            organization_id=organization_id,
-            parent=None,
-            is_deleted=False,
-            is_active=True
-        ).order_by('order', 'code')
-
-        # Build tree structure
-        tree = [dept.get_full_tree() for dept in roots]
+        # Build from the cached per-organization node list
+        tree = Department.get_tree(organization_id)
 
         return Response({
             'success': True,
             'data': {
                 'tree': tree,
-                'count': Department.objects.filter(
-                    organization_id=organization_id,
-                    is_deleted=False
-                ).count()
+                'count': len(Department.get_cached_tree_nodes(organization_id))
             }
         })
 
@@ -15,6 +15,5 @@ class PermissionsConfig(AppConfig):
 
     def ready(self):
         """Perform initialization when app is ready."""
-        # Import signal handlers if needed
-        # from apps.permissions import signals
-        pass
+        # Import signal handlers
+        from apps.permissions import signals  # noqa: F401 - register signal handlers
@@ -152,8 +152,9 @@ class DataPermission(BaseModel):
             if user_dept:
                 dept_ids = {user_dept.department_id}
                 # Add descendant departments
-                descendants = user_dept.department.get_descendants()
-                dept_ids.update(d.id for d in descendants)
+                dept_ids.update(
+                    user_dept.department.get_descendants().values_list('id', flat=True)
+                )
                 return dept_ids
             return set()
 
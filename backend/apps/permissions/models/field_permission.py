@@ -12,6 +12,65 @@ from django.utils.translation import gettext_lazy as _
 from apps.common.models import BaseModel
 
 
+def mask_value(value, mask_rule=None):
+    """
+    Mask a non-null value with a FieldPermission mask rule.
+
+    Unknown or empty rules mask the whole value as '***'.
+    """
+    value_str = str(value)
+
+    if mask_rule == 'phone':
+        # Keep first 3 and last 4 digits
+        if len(value_str) >= 7:
+            return f'{value_str[:3]}****{value_str[-4:]}'
+        return '****'
+
+    elif mask_rule == 'id_card':
+        # Keep first 3 and last 4 digits
+        if len(value_str) >= 7:
+            return f'{value_str[:3]}***********{value_str[-4:]}'
+        return '***********'
+
+    elif mask_rule == 'bank_card':
+        # Keep last 4 digits
+        if len(value_str) >= 4:
+            return f'{"*" * (len(value_str) - 4)}{value_str[-4:]}'
+        return '****'
+
+    elif mask_rule == 'name':
+        # Keep last character only
+        if len(value_str) > 1:
+            return f'{"*" * (len(value_str) - 1)}{value_str[-1]}'
+        return value_str
+
+    elif mask_rule == 'email':
+        # Mask local part before @
+        if '@' in value_str:
+            local, domain = value_str.split('@', 1)
+            if len(local) > 2:
+                return f'{local[0]}***{local[-1] if len(local) > 3 else ""}@{domain}'
+            return f'***@{domain}'
+        return '***@***'
+
+    elif mask_rule == 'amount':
+        # Show range only
+        try:
+            amount = float(value_str)
+            if amount < 1000:
+                return '< 1K'
+            elif amount < 10000:
+                return '1K-10K'
+            elif amount < 100000:
+                return '1W-10W'
+            else:
+                return '> 10W'
+        except (ValueError, TypeError):
+            return '***'
+
+    return '***'
+
+
 class FieldPermission(BaseModel):
     """
     Field-level permission for controlling access to specific model fields.
@@ -147,57 +206,7 @@ class FieldPermission(BaseModel):
         if not self.permission_type == 'masked':
             return value
 
-        value_str = str(value)
-
-        if self.mask_rule == 'phone':
-            # Keep first 3 and last 4 digits
-            if len(value_str) >= 7:
-                return f'{value_str[:3]}****{value_str[-4:]}'
-            return '****'
-
-        elif self.mask_rule == 'id_card':
-            # Keep first 3 and last 4 digits
-            if len(value_str) >= 7:
-                return f'{value_str[:3]}***********{value_str[-4:]}'
-            return '***********'
-
-        elif self.mask_rule == 'bank_card':
-            # Keep last 4 digits
-            if len(value_str) >= 4:
-                return f'{"*" * (len(value_str) - 4)}{value_str[-4:]}'
-            return '****'
-
-        elif self.mask_rule == 'name':
-            # Keep last character only
-            if len(value_str) > 1:
-                return f'{"*" * (len(value_str) - 1)}{value_str[-1]}'
-            return value_str
-
-        elif self.mask_rule == 'email':
-            # Mask local part before @
-            if '@' in value_str:
-                local, domain = value_str.split('@', 1)
-                if len(local) > 2:
-                    return f'{local[0]}***{local[-1] if len(local) > 3 else ""}@{domain}'
-                return f'***@{domain}'
-            return '***@***'
-
-        elif self.mask_rule == 'amount':
-            # Show range only
-            try:
-                amount = float(value_str)
-                if amount < 1000:
-                    return '< 1K'
-                elif amount < 10000:
-                    return '1K-10K'
-                elif amount < 100000:
-                    return '1W-10W'
-                else:
-                    return '> 10W'
-            except (ValueError, TypeError):
-                return '***'
-
-        return '***'
+        return mask_value(value, self.mask_rule)
 
     @classmethod
     def get_effective_permission(cls, user, content_type, field_name, action='view'):
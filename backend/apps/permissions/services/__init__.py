@@ -4,9 +4,11 @@ Services for permission management.
 from apps.permissions.services.permission_engine import PermissionEngine
 from apps.permissions.services.field_permission_service import FieldPermissionService
 from apps.permissions.services.data_permission_service import DataPermissionService
+from apps.permissions.services.bulk_permission_resolver import BulkPermissionResolver
 
 __all__ = [
     'PermissionEngine',
     'FieldPermissionService',
     'DataPermissionService',
+    'BulkPermissionResolver',
 ]
@@ -0,0 +1,234 @@
+"""
+BulkPermissionResolver - permission evaluation for many users at once.
+
+Loads field permissions and data scopes for a whole set of users with
+one cache get_many and one grouped query per permission type, and fills
+the shared cache with set_many, instead of building one PermissionEngine
+(and issuing one query) per user.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+from apps.permissions.models import DataPermission, FieldPermission
+from apps.permissions.services.permission_engine import (
+    CACHE_TIMEOUT,
+    FieldPermissionPlan,
+    PermissionEngine,
+    _compiled_plans,
+)
+
+
+class BulkPermissionResolver:
+    """
+    Resolve permissions of many users for a content type.
+
+    Usage:
+        resolver = BulkPermissionResolver(approvers)
+        matrix = resolver.get_field_matrix(content_type, ['amount', 'phone'])
+        engines = resolver.get_engines(content_type)
+    """
+
+    def __init__(self, users: Iterable):
+        self.users = list({user.id: user for user in users}.values())
+        self._versions: Optional[Dict[Any, int]] = None
+
+    def _get_versions(self) -> Dict[Any, int]:
+        """Permission cache version of every user in one get_many."""
+        if self._versions is None:
+            keys = {PermissionEngine._version_key(user.id): user.id for user in self.users}
+            stored = cache.get_many(list(keys))
+            # A missing version reads as 1, as in PermissionEngine
+            self._versions = {
+                user_id: stored.get(key, 1) for key, user_id in keys.items()
+            }
+        return self._versions
+
+    def _cache_keys(self, content_type: ContentType, permission_type: str) -> Dict[str, Any]:
+        versions = self._get_versions()
+        return {
+            PermissionEngine.get_cache_key(
+                user.id, content_type.id, permission_type, versions[user.id]
+            ): user.id
+            for user in self.users
+        }
+
+    def get_field_plans(self, content_type: ContentType) -> Dict[Any, FieldPermissionPlan]:
+        """
+        Get the compiled field permission plan of every user.
+
+        Returns:
+            Dict mapping user id to FieldPermissionPlan
+        """
+        keys = self._cache_keys(content_type, 'field')
+        plans: Dict[Any, FieldPermissionPlan] = {}
+
+        pending = {}
+        for cache_key, user_id in keys.items():
+            plan = _compiled_plans.get(cache_key)
+            if plan is not None:
+                plans[user_id] = plan
+            else:
+                pending[cache_key] = user_id
+
+        if pending:
+            for cache_key, data in cache.get_many(list(pending)).items():
+                plan = FieldPermissionPlan.from_data(data)
+                plans[pending.pop(cache_key)] = plan
+                _compiled_plans.set(cache_key, plan)
+
+        if pending:
+            permissions = {user_id: {} for user_id in pending.values()}
+            mask_rules = {user_id: {} for user_id in pending.values()}
+            rows = FieldPermission.objects.filter(
+                user_id__in=list(pending.values()),
+                content_type=content_type,
+                is_deleted=False
+            ).values_list('user_id', 'field_name', 'permission_type', 'mask_rule')
+            for user_id, field_name, permission_type, mask_rule in rows:
+                permissions[user_id][field_name] = permission_type
+                if permission_type == 'masked':
+                    mask_rules[user_id][field_name] = mask_rule
+
+            to_cache = {}
+            for cache_key, user_id in pending.items():
+                plan = FieldPermissionPlan(permissions[user_id], mask_rules[user_id])
+                plans[user_id] = plan
+                to_cache[cache_key] = plan.to_data()
+                _compiled_plans.set(cache_key, plan)
+            cache.set_many(to_cache, CACHE_TIMEOUT)
+
+        return plans
+
+    def get_field_permissions(self, content_type: ContentType) -> Dict[Any, Dict[str, str]]:
+        """
+        Get {field_name: permission_type} of every user.
+
+        Returns:
+            Dict mapping user id to field permissions
+        """
+        return {
+            user_id: dict(plan.permissions)
+            for user_id, plan in self.get_field_plans(content_type).items()
+        }
+
+    def get_field_matrix(
+        self,
+        content_type: ContentType,
+        field_names: Optional[List[str]] = None,
+        action: str = 'view'
+    ) -> Dict[str, Any]:
+        """
+        Get a compact user x field matrix of effective permissions.
+
+        Cells use the values of PermissionEngine.check_field_permission:
+        'read'/'masked'/'hidden' for view, 'write'/'denied' for edit.
+
+        Args:
+            content_type: ContentType to evaluate
+            field_names: Columns (defaults to every field with a permission)
+            action: 'view' or 'edit'
+
+        Returns:
+            Dict with 'fields', 'users' and 'matrix' (one row per user)
+        """
+        plans = self.get_field_plans(content_type)
+        if field_names is None:
+            field_names = sorted({
+                field for plan in plans.values() for field in plan.permissions
+            })
+
+        user_ids = [user.id for user in self.users]
+        matrix = []
+        for user_id in user_ids:
+            permissions = plans[user_id].permissions
+            if action == 'edit':
+                row = [
+                    'write' if permissions.get(field) == 'write' else 'denied'
+                    for field in field_names
+                ]
+            else:
+                row = []
+                for field in field_names:
+                    perm = permissions.get(field)
+                    row.append(perm if perm in ('masked', 'hidden') else 'read')
+            matrix.append(row)
+
+        return {
+            'fields': list(field_names),
+            'users': [str(user_id) for user_id in user_ids],
+            'matrix': matrix,
+        }
+
+    def get_data_scopes(self, content_type: ContentType) -> Dict[Any, Dict[str, Any]]:
+        """
+        Get the data scope config of every user, as PermissionEngine.get_data_scope.
+
+        Returns:
+            Dict mapping user id to scope config
+        """
+        keys = self._cache_keys(content_type, 'data')
+        scopes: Dict[Any, Dict[str, Any]] = {}
+        for cache_key, scope in cache.get_many(list(keys)).items():
+            scopes[keys.pop(cache_key)] = scope
+
+        if not keys:
+            return scopes
+
+        users = {user.id: user for user in self.users}
+        pending_ids = [
+            user_id for user_id in keys.values()
+            if getattr(users[user_id], 'is_authenticated', False)
+            and not users[user_id].is_superuser
+        ]
+        effective = {}
+        if pending_ids:
+            # Model ordering decides which permission is effective, as in .first()
+            for perm in DataPermission.objects.filter(
+                user_id__in=pending_ids,
+                content_type=content_type,
+                is_deleted=False
+            ):
+                effective.setdefault(perm.user_id, perm)
+
+        to_cache = {}
+        for cache_key, user_id in keys.items():
+            user = users[user_id]
+            if getattr(user, 'is_authenticated', False) and user.is_superuser:
+                scope = {
+                    'scope_type': 'all',
+                    'department_field': 'department',
+                    'user_field': 'created_by',
+                }
+            else:
+                perm = effective.get(user_id)
+                scope = {
+                    'scope_type': perm.scope_type if perm is not None else 'self',
+                    'department_field': getattr(perm, 'department_field', 'department'),
+                    'user_field': getattr(perm, 'user_field', 'created_by'),
+                }
+                if perm is not None:
+                    scope['scope_value'] = perm.scope_value
+            scopes[user_id] = scope
+            to_cache[cache_key] = scope
+
+        cache.set_many(to_cache, CACHE_TIMEOUT)
+        return scopes
+
+    def get_engines(self, content_type: ContentType) -> Dict[Any, PermissionEngine]:
+        """
+        Get a PermissionEngine per user with the field plan preloaded.
+
+        Returns:
+            Dict mapping user id to PermissionEngine
+        """
+        plans = self.get_field_plans(content_type)
+        versions = self._get_versions()
+        engines = {}
+        for user in self.users:
+            engine = PermissionEngine(user)
+            engine._cache_version = versions[user.id]
+            engine._field_plans[content_type.id] = plans[user.id]
+            engines[user.id] = engine
+        return engines
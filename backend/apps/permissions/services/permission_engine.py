@@ -2,27 +2,89 @@
 PermissionEngine - Core permission evaluation engine.
 
 Central service for checking and applying field-level and data-level permissions.
-Uses caching for performance optimization.
+Uses caching for performance optimization: field permissions are compiled
+once per (user, content type) into a FieldPermissionPlan, and cache keys
+carry a per-user version so invalidation is a single increment.
 """
-from typing import Dict, List, Set, Any, Optional
+from functools import partial
+from typing import Callable, Dict, List, Set, Any, Optional
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.db.models import Q, QuerySet
 from django.conf import settings
 
+from apps.common.utils import LocalLRUCache
 from apps.permissions.models import (
     FieldPermission,
     DataPermission,
     DataPermissionExpand,
     PermissionAuditLog,
 )
+from apps.permissions.models.field_permission import mask_value
 
 User = get_user_model()
 
 # Cache timeout in seconds (default 5 minutes)
 CACHE_TIMEOUT = getattr(settings, 'PERMISSION_CACHE_TIMEOUT', 300)
 
+# Compiled plans by versioned cache key; a version bump makes old ones unreachable
+_compiled_plans = LocalLRUCache(max_entries=2048, timeout=CACHE_TIMEOUT)
+
+
+class FieldPermissionPlan:
+    """
+    Field permissions of one user for one content type, compiled for use.
+
+    Holds the permission map, the set of hidden fields and one prebuilt
+    mask callable per masked field, so whole result pages are filtered
+    without per-value lookups.
+    """
+
+    __slots__ = ('permissions', 'mask_rules', 'hidden', 'maskers')
+
+    def __init__(self, permissions: Dict[str, str], mask_rules: Dict[str, Optional[str]]):
+        self.permissions = permissions
+        self.mask_rules = mask_rules
+        self.hidden = frozenset(
+            field for field, perm in permissions.items() if perm == 'hidden'
+        )
+        self.maskers: Dict[str, Callable[[Any], Any]] = {
+            field: partial(mask_value, mask_rule=mask_rules.get(field))
+            for field, perm in permissions.items() if perm == 'masked'
+        }
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'FieldPermissionPlan':
+        return cls(data['permissions'], data['mask_rules'])
+
+    def to_data(self) -> Dict[str, Any]:
+        """Picklable form stored in the shared cache."""
+        return {'permissions': self.permissions, 'mask_rules': self.mask_rules}
+
+    def apply(self, records: List[Dict]) -> List[Dict]:
+        """
+        Drop hidden fields and mask masked ones across all records.
+
+        Masking runs column by column over the page.
+        """
+        hidden = self.hidden
+        if hidden:
+            result = [
+                {field: value for field, value in record.items() if field not in hidden}
+                for record in records
+            ]
+        else:
+            result = [dict(record) for record in records]
+
+        for field, masker in self.maskers.items():
+            for record in result:
+                value = record.get(field)
+                if value is not None:
+                    record[field] = masker(value)
+
+        return result
+
 
 class PermissionEngine:
     """
@@ -48,11 +110,26 @@ class PermissionEngine:
         self.organization_id = organization_id or getattr(user, 'current_organization_id', None) or getattr(user, 'organization_id', None)
 
         # Cache for this instance
-        self._field_permissions_cache: Dict[str, Dict[str, str]] = {}
-        self._data_permissions_cache: Dict[str, Any] = {}
+        self._cache_version: Optional[int] = None
+        self._field_plans: Dict[int, FieldPermissionPlan] = {}
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f'perm:version:{user_id}'
+
+    @staticmethod
+    def get_user_cache_version(user_id: int) -> int:
+        """Get the permission cache version of a user."""
+        version_key = PermissionEngine._version_key(user_id)
+        version = cache.get(version_key)
+        if version is None:
+            version = 1
+            cache.add(version_key, version, None)
+        return version
 
     @staticmethod
-    def get_cache_key(user_id: int, content_type_id: int, permission_type: str) -> str:
+    def get_cache_key(user_id: int, content_type_id: int, permission_type: str,
+                      version: Optional[int] = None) -> str:
         """
         Generate cache key for permission data.
 
@@ -60,28 +137,39 @@ class PermissionEngine:
             user_id: User ID
             content_type_id: ContentType ID
             permission_type: Type of permission ('field' or 'data')
+            version: User cache version (looked up when omitted)
 
         Returns:
             Cache key string
         """
-        return f'perm:{permission_type}:{user_id}:{content_type_id}'
+        if version is None:
+            version = PermissionEngine.get_user_cache_version(user_id)
+        return f'perm:{permission_type}:{user_id}:v{version}:{content_type_id}'
+
+    def _get_cache_key(self, content_type_id: int, permission_type: str) -> str:
+        """Cache key using this engine's memoized user version."""
+        if self._cache_version is None:
+            self._cache_version = self.get_user_cache_version(self.user.id)
+        return self.get_cache_key(
+            self.user.id, content_type_id, permission_type, self._cache_version
+        )
 
     @staticmethod
     def invalidate_user_cache(user_id: int):
         """
         Invalidate all cached permissions for a user.
 
+        Bumps the user's cache version; entries under the old version
+        are never read again and expire on their own.
+
         Args:
             user_id: User ID to invalidate cache for
         """
-        # Delete all permission cache keys for this user
-        # In production with Redis, use pattern matching or scan
-        keys_to_delete = []
-        for content_type in ContentType.objects.all():
-            keys_to_delete.append(PermissionEngine.get_cache_key(user_id, content_type.id, 'field'))
-            keys_to_delete.append(PermissionEngine.get_cache_key(user_id, content_type.id, 'data'))
-
-        cache.delete_many(keys_to_delete)
+        version_key = PermissionEngine._version_key(user_id)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 2, None)
 
     def get_field_permissions(self, content_type: ContentType, action: str = 'view') -> Dict[str, str]:
         """
@@ -97,27 +185,51 @@ class PermissionEngine:
             Dict of {field_name: permission_type}
             Permission types: 'read', 'write', 'hidden', 'masked'
         """
-        cache_key = self.get_cache_key(self.user.id, content_type.id, 'field')
+        return dict(self.get_field_permission_plan(content_type).permissions)
 
-        # Check cache first
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return cached
+    def get_field_permission_plan(self, content_type: ContentType) -> FieldPermissionPlan:
+        """
+        Get the compiled field permission plan for a content type.
 
-        # Get user-specific permissions
-        field_perms = {}
-        user_perms = FieldPermission.objects.filter(
-            user=self.user,
-            content_type=content_type,
-            is_deleted=False
-        )
-        for perm in user_perms:
-            field_perms[perm.field_name] = perm.permission_type
+        Looked up in this engine, then the process-local compiled plans,
+        then the shared cache; built with one query on a miss.
 
-        # Store in cache
-        cache.set(cache_key, field_perms, CACHE_TIMEOUT)
+        Args:
+            content_type: ContentType to get permissions for
+
+        Returns:
+            FieldPermissionPlan for the user and content type
+        """
+        plan = self._field_plans.get(content_type.id)
+        if plan is not None:
+            return plan
+
+        cache_key = self._get_cache_key(content_type.id, 'field')
+        plan = _compiled_plans.get(cache_key)
+        if plan is None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                plan = FieldPermissionPlan.from_data(cached)
+            else:
+                permissions = {}
+                mask_rules = {}
+                user_perms = FieldPermission.objects.filter(
+                    user=self.user,
+                    content_type=content_type,
+                    is_deleted=False
+                ).values_list('field_name', 'permission_type', 'mask_rule')
+                for field_name, permission_type, mask_rule in user_perms:
+                    permissions[field_name] = permission_type
+                    if permission_type == 'masked':
+                        mask_rules[field_name] = mask_rule
+                plan = FieldPermissionPlan(permissions, mask_rules)
 
-        return field_perms
+                # Store in cache
+                cache.set(cache_key, plan.to_data(), CACHE_TIMEOUT)
+            _compiled_plans.set(cache_key, plan)
+
+        self._field_plans[content_type.id] = plan
+        return plan
 
     def check_field_permission(self, content_type: ContentType, field_name: str, action: str = 'view') -> str:
         """
@@ -168,36 +280,7 @@ class PermissionEngine:
         Returns:
             Filtered list of records with permissions applied
         """
-        field_perms = self.get_field_permissions(content_type, action)
-
-        result = []
-        for record in data:
-            filtered_record = {}
-            for field_name, value in record.items():
-                perm = field_perms.get(field_name)
-
-                if perm == 'hidden':
-                    continue  # Skip this field
-
-                elif perm == 'masked' and value is not None:
-                    # Apply masking
-                    masked_perm = FieldPermission.objects.filter(
-                        content_type=content_type,
-                        field_name=field_name,
-                        is_deleted=False
-                    ).first()
-
-                    if masked_perm and masked_perm.mask_rule:
-                        filtered_record[field_name] = masked_perm.apply_mask(value)
-                    else:
-                        filtered_record[field_name] = '***'
-                else:
-                    # Include field as-is (read or write permission, or no restriction)
-                    filtered_record[field_name] = value
-
-            result.append(filtered_record)
-
-        return result
+        return self.get_field_permission_plan(content_type).apply(data)
 
     def get_data_scope(self, content_type: ContentType) -> Dict[str, Any]:
         """
@@ -211,7 +294,7 @@ class PermissionEngine:
         Returns:
             Dict with keys: scope_type, scope_value, department_field, user_field
         """
-        cache_key = self.get_cache_key(self.user.id, content_type.id, 'data')
+        cache_key = self._get_cache_key(content_type.id, 'data')
 
         # Check cache first
         cached = cache.get(cache_key)
@@ -289,8 +372,9 @@ class PermissionEngine:
 
             if scope['scope_type'] == 'self_and_sub':
                 # Add descendant departments
-                descendants = user_dept.department.get_descendants()
-                dept_ids.update(d.id for d in descendants)
+                dept_ids.update(
+                    user_dept.department.get_descendants().values_list('id', flat=True)
+                )
 
             return dept_ids
 
@@ -338,31 +422,7 @@ class PermissionEngine:
         Returns:
             Dictionary with sensitive fields masked
         """
-        field_perms = self.get_field_permissions(content_type, 'view')
-
-        result = {}
-        for field_name, value in data.items():
-            perm = field_perms.get(field_name)
-
-            if perm == 'masked' and value is not None:
-                # Apply masking
-                masked_perm = FieldPermission.objects.filter(
-                    content_type=content_type,
-                    field_name=field_name,
-                    is_deleted=False
-                ).first()
-
-                if masked_perm:
-                    result[field_name] = masked_perm.apply_mask(value)
-                else:
-                    result[field_name] = '***'
-            elif perm == 'hidden':
-                # Skip hidden fields
-                continue
-            else:
-                result[field_name] = value
-
-        return result
+        return self.get_field_permission_plan(content_type).apply([data])[0]
 
     def get_accessible_fields(self, content_type: ContentType, action: str = 'view') -> List[str]:
         """
@@ -412,20 +472,12 @@ class PermissionEngine:
         Returns:
             Dict of {field_name: mask_rule}
         """
-        field_perms = self.get_field_permissions(content_type, 'view')
+        plan = self.get_field_permission_plan(content_type)
 
-        masked = {}
-        for field_name, perm in field_perms.items():
-            if perm == 'masked':
-                perm_obj = FieldPermission.objects.filter(
-                    content_type=content_type,
-                    field_name=field_name,
-                    is_deleted=False
-                ).first()
-                if perm_obj:
-                    masked[field_name] = perm_obj.mask_rule or 'default'
-
-        return masked
+        return {
+            field_name: plan.mask_rules.get(field_name) or 'default'
+            for field_name in plan.maskers
+        }
 
     @classmethod
     def batch_check_permissions(cls, users: List[User], content_type: ContentType,
@@ -441,13 +493,10 @@ class PermissionEngine:
         Returns:
             Dict mapping user_id to their field permissions
         """
-        result = {}
+        from apps.permissions.services.bulk_permission_resolver import BulkPermissionResolver
 
-        for user in users:
-            engine = cls(user)
-            result[user.id] = engine.get_field_permissions(content_type, action)
-
-        return result
+        # One get_many and at most one query for all users
+        return BulkPermissionResolver(users).get_field_permissions(content_type)
 
     @classmethod
     def get_permission_summary(cls, user: User, content_type: ContentType) -> Dict[str, Any]:
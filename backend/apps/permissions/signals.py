@@ -0,0 +1,19 @@
+"""
+Signal handlers for the permissions app.
+
+Bumps a user's permission cache version whenever one of their field or
+data permissions changes, so cached plans and scopes are never stale.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.permissions.models import DataPermission, FieldPermission
+
+
+@receiver([post_save, post_delete], sender=FieldPermission)
+@receiver([post_save, post_delete], sender=DataPermission)
+def invalidate_user_permission_cache(sender, instance, **kwargs):
+    """Invalidate cached permissions of the affected user."""
+    if instance.user_id:
+        from apps.permissions.services.permission_engine import PermissionEngine
+        PermissionEngine.invalidate_user_cache(instance.user_id)
@@ -318,6 +318,83 @@ class TestPermissionEngine:
         )
         assert user.id in result
         assert user2.id in result
+        assert result[user.id] == {'email': 'masked'}
+        assert result[user2.id] == {}
+
+    def test_batch_resolver_constant_query_count(
+        self, user, user_content_type, django_assert_num_queries
+    ):
+        """Verify many users resolve with one query, then from cache."""
+        from apps.permissions.services import BulkPermissionResolver
+
+        users = [user] + [
+            User.objects.create_user(
+                username=f'bulk{i}',
+                email=f'bulk{i}@example.com',
+                password='testpass123',
+                current_organization=user.current_organization
+            )
+            for i in range(20)
+        ]
+        for other, perm in ((users[1], 'hidden'), (users[2], 'write')):
+            FieldPermission.objects.create(
+                user=other,
+                content_type=user_content_type,
+                field_name='email',
+                permission_type=perm,
+                created_by=user,
+                organization=user.current_organization
+            )
+        cache.clear()
+
+        with django_assert_num_queries(1):
+            matrix = BulkPermissionResolver(users).get_field_matrix(
+                user_content_type, ['email', 'phone']
+            )
+        assert matrix['fields'] == ['email', 'phone']
+        assert len(matrix['matrix']) == 21
+        assert matrix['matrix'][0] == ['read', 'read']
+        assert matrix['matrix'][1] == ['hidden', 'read']
+
+        with django_assert_num_queries(0):
+            edit = BulkPermissionResolver(users).get_field_matrix(
+                user_content_type, ['email'], action='edit'
+            )
+        assert edit['matrix'][2] == ['write']
+        assert edit['matrix'][0] == ['denied']
+
+    def test_batch_resolver_matches_single_engine(self, user, superuser, user_content_type):
+        """Verify bulk data scopes and engines match per-user evaluation."""
+        from apps.permissions.services import BulkPermissionResolver
+
+        DataPermission.objects.create(
+            user=user,
+            content_type=user_content_type,
+            scope_type='self_dept',
+            created_by=user,
+            organization=user.current_organization
+        )
+        FieldPermission.objects.create(
+            user=user,
+            content_type=user_content_type,
+            field_name='phone',
+            permission_type='masked',
+            mask_rule='phone',
+            created_by=user,
+            organization=user.current_organization
+        )
+        cache.clear()
+
+        resolver = BulkPermissionResolver([user, superuser])
+        scopes = resolver.get_data_scopes(user_content_type)
+        engines = resolver.get_engines(user_content_type)
+        cache.clear()
+
+        assert scopes[user.id] == PermissionEngine(user).get_data_scope(user_content_type)
+        assert scopes[superuser.id]['scope_type'] == 'all'
+        assert engines[user.id].mask_sensitive_data(
+            {'phone': '13800138000'}, user_content_type
+        ) == {'phone': '138****8000'}
 
     def test_invalidate_user_cache(self, user):
         """Verify cache invalidation for user."""
@@ -328,6 +405,72 @@ class TestPermissionEngine:
         # Note: This tests the method runs without error
         # Actual cache clearing depends on cache backend
 
+    def test_invalidate_user_cache_bumps_version(self, user, user_content_type):
+        """Verify invalidation moves the user to new cache keys."""
+        before = PermissionEngine.get_cache_key(user.id, user_content_type.id, 'field')
+        PermissionEngine.invalidate_user_cache(user.id)
+        after = PermissionEngine.get_cache_key(user.id, user_content_type.id, 'field')
+        assert before != after
+
+    def test_permission_change_refreshes_plan(self, user, user_content_type):
+        """Verify saving a field permission invalidates the cached plan."""
+        assert PermissionEngine(user).get_hidden_fields(user_content_type) == []
+        FieldPermission.objects.create(
+            user=user,
+            content_type=user_content_type,
+            field_name='phone',
+            permission_type='hidden',
+            created_by=user,
+            organization=user.current_organization
+        )
+        assert PermissionEngine(user).get_hidden_fields(user_content_type) == ['phone']
+
+    def test_apply_field_permissions_page_without_extra_queries(
+        self, user, user_content_type, django_assert_num_queries
+    ):
+        """Verify a page is filtered and masked with a constant query count."""
+        for field_name, mask_rule in (('email', 'email'), ('phone', 'phone'), ('last_name', None)):
+            FieldPermission.objects.create(
+                user=user,
+                content_type=user_content_type,
+                field_name=field_name,
+                permission_type='masked',
+                mask_rule=mask_rule,
+                created_by=user,
+                organization=user.current_organization
+            )
+        FieldPermission.objects.create(
+            user=user,
+            content_type=user_content_type,
+            field_name='secret',
+            permission_type='hidden',
+            created_by=user,
+            organization=user.current_organization
+        )
+        records = [
+            {
+                'username': f'user{i}',
+                'email': f'person{i}@example.com',
+                'phone': '13800138000',
+                'last_name': 'Smith',
+                'secret': 'x',
+            }
+            for i in range(100)
+        ]
+        engine = PermissionEngine(user)
+        engine.get_field_permission_plan(user_content_type)
+
+        with django_assert_num_queries(0):
+            result = engine.apply_field_permissions(records, user_content_type)
+
+        assert len(result) == 100
+        assert 'secret' not in result[0]
+        assert result[0]['username'] == 'user0'
+        assert result[0]['phone'] == '138****8000'
+        assert result[0]['last_name'] == '***'
+        assert result[0]['email'].endswith('@example.com')
+        assert records[0]['secret'] == 'x'
+
     def test_superuser_bypass(self, superuser, user_content_type):
         """Verify superuser bypasses permission checks."""
         engine = PermissionEngine(superuser)
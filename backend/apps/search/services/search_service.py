@@ -365,6 +365,32 @@ class AssetSearchService(BaseCRUDService):
         )
         return True
 
+    def sync_asset_documents(self, assets) -> int:
+        """
+        Index many asset documents with one bulk request and a single refresh.
+
+        Soft-deleted assets are removed from the index in the same request.
+        Returns the number of bulk actions sent.
+        """
+        client = self._get_es_client()
+        if client is None:
+            return 0
+
+        index_name = self._get_asset_index_name()
+        operations = []
+        for asset in assets:
+            if asset.is_deleted:
+                operations.append({'delete': {'_index': index_name, '_id': str(asset.id)}})
+                continue
+            operations.append({'index': {'_index': index_name, '_id': str(asset.id)}})
+            operations.append(self._build_asset_document(asset))
+        if not operations:
+            return 0
+
+        self.ensure_asset_index()
+        client.bulk(operations=operations, refresh='wait_for')
+        return sum(1 for operation in operations if 'index' in operation or 'delete' in operation)
+
     def delete_asset_document(self, asset_id: str) -> bool:
         """Delete the Elasticsearch document for an asset if present."""
         client = self._get_es_client()
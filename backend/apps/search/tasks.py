@@ -1,7 +1,8 @@
 """Celery tasks for asynchronous search-index synchronization."""
 from celery import shared_task
+from django.db.models import Prefetch
 
-from apps.assets.models import Asset
+from apps.assets.models import Asset, AssetTagRelation
 from apps.search.services import AssetSearchService
 
 
@@ -28,6 +29,38 @@ def sync_asset_to_search_index(self, asset_id: str):
     return {'synced': synced, 'asset_id': asset_id}
 
 
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+)
+def sync_assets_batch_to_search_index(self, asset_ids: list, batch_size: int = 500):
+    """Synchronize many asset documents with one bulk request per batch."""
+    service = AssetSearchService()
+    synced = 0
+    for start in range(0, len(asset_ids), batch_size):
+        assets = Asset.all_objects.select_related(
+            'asset_category',
+            'department',
+            'location',
+            'custodian',
+            'supplier',
+        ).prefetch_related(
+            Prefetch(
+                'asset_tag_relations',
+                queryset=AssetTagRelation.all_objects.filter(
+                    is_deleted=False,
+                    tag__is_deleted=False,
+                ).select_related('tag'),
+                to_attr='prefetched_asset_tag_relations',
+            )
+        ).filter(pk__in=asset_ids[start:start + batch_size])
+        synced += service.sync_asset_documents(assets)
+    return {'synced': synced, 'requested': len(asset_ids)}
+
+
 @shared_task(
     bind=True,
     max_retries=3,
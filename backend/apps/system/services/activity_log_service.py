@@ -1,10 +1,27 @@
 import copy
+import logging
+import threading
+from contextlib import contextmanager
 from datetime import date, datetime
 from decimal import Decimal
+from functools import partial
 from typing import Any, Dict, Iterable, List, Optional
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.common.utils import LocalLRUCache
+
+logger = logging.getLogger(__name__)
+
+# Field label maps per model / dynamic business object
+_field_labels = LocalLRUCache(max_entries=512, timeout=300)
+# Activity logs queued by the innermost buffered() scope of this thread
+_buffer_state = threading.local()
 
 
 class ActivityLogService:
@@ -51,7 +68,7 @@ class ActivityLogService:
         content_type = ContentType.objects.get_for_model(instance)
         org = organization or getattr(instance, 'organization', None)
 
-        return ActivityLog.objects.create(
+        log = ActivityLog(
             actor=actor,
             action=action,
             content_type=content_type,
@@ -62,6 +79,124 @@ class ActivityLogService:
             created_by=actor
         )
 
+        # Inside buffered() the row is written with the rest of the batch
+        pending = getattr(_buffer_state, 'entries', None)
+        if pending is not None:
+            # Kept for the async write, which runs after a queue delay
+            log.created_at = timezone.now()
+            pending.append(log)
+            return log
+
+        log.save(force_insert=True)
+        return log
+
+    @classmethod
+    @contextmanager
+    def buffered(cls):
+        """
+        Collect activity logs written inside the block into one bulk insert.
+
+        The batch is written when the current transaction commits (at the
+        end of the block under autocommit) and dropped if the block raises.
+        With ACTIVITY_LOG_ASYNC the insert runs in a Celery task. Nested
+        scopes join the outer one.
+
+        Usage:
+            with ActivityLogService.buffered():
+                for instance in instances:
+                    ActivityLogService.log_update(...)
+        """
+        if getattr(_buffer_state, 'entries', None) is not None:
+            yield
+            return
+
+        entries = _buffer_state.entries = []
+        try:
+            yield
+        finally:
+            _buffer_state.entries = None
+        if entries:
+            transaction.on_commit(partial(cls.write_entries, entries))
+
+    @classmethod
+    def flush_buffer(cls) -> int:
+        """
+        Write the logs queued by the active buffered() scope now.
+
+        For requests that read their own activity logs back.
+        """
+        pending = getattr(_buffer_state, 'entries', None)
+        if not pending:
+            return 0
+        entries = list(pending)
+        pending.clear()
+        cls.write_entries(entries, use_async=False)
+        return len(entries)
+
+    @classmethod
+    def write_entries(cls, entries: List[Any], use_async: Optional[bool] = None) -> None:
+        """Insert unsaved ActivityLog instances in one bulk_create."""
+        from apps.system.activity_log import ActivityLog
+
+        if use_async is None:
+            use_async = getattr(settings, 'ACTIVITY_LOG_ASYNC', False)
+        if use_async:
+            try:
+                from apps.system.tasks import write_activity_logs_task
+                write_activity_logs_task.delay([cls.entry_to_row(entry) for entry in entries])
+                return
+            except Exception as exc:
+                logger.warning("Activity log task dispatch failed, writing inline. error=%s", exc)
+
+        try:
+            ActivityLog.objects.bulk_create(entries, batch_size=500)
+        except Exception as exc:
+            # Runs after the response work is done; never fail the request
+            logger.warning("Activity log batch write failed. rows=%s error=%s", len(entries), exc)
+
+    @staticmethod
+    def entry_to_row(entry) -> Dict[str, Any]:
+        """JSON-safe column values of an unsaved ActivityLog."""
+        def as_str(value):
+            return str(value) if value is not None else None
+
+        return {
+            'id': str(entry.pk),
+            'actor_id': as_str(entry.actor_id),
+            'action': entry.action,
+            'content_type_id': entry.content_type_id,
+            'object_id': entry.object_id,
+            'changes': entry.changes,
+            'description': entry.description,
+            'organization_id': as_str(entry.organization_id),
+            'created_by_id': as_str(entry.created_by_id),
+            'created_at': entry.created_at.isoformat() if entry.created_at else None,
+        }
+
+    @staticmethod
+    def restore_created_at(rows: List[Dict[str, Any]], batch_size: int = 500) -> None:
+        """
+        Set created_at of inserted rows back to the time they were logged.
+
+        created_at is auto_now_add, so bulk_create stamps the insert time,
+        which for the Celery path includes queueing and retry delays.
+        One UPDATE per batch.
+        """
+        from apps.system.activity_log import ActivityLog
+
+        stamped = [
+            (row['id'], parse_datetime(row['created_at']))
+            for row in rows if row.get('created_at')
+        ]
+        for start in range(0, len(stamped), batch_size):
+            batch = stamped[start:start + batch_size]
+            ActivityLog.all_objects.filter(pk__in=[pk for pk, _ in batch]).update(
+                created_at=Case(
+                    *[When(pk=pk, then=Value(created_at)) for pk, created_at in batch],
+                    output_field=DateTimeField(),
+                )
+            )
+
     @classmethod
     def log_create(cls, *, actor, instance, organization=None):
         if not actor or instance is None:
@@ -146,6 +281,28 @@ class ActivityLogService:
         if instance is None:
             return {}
 
+        if hasattr(instance, 'dynamic_fields') and hasattr(instance, 'business_object'):
+            cache_key = ('dynamic', getattr(instance, 'business_object_id', None))
+        else:
+            cache_key = ('model', instance._meta.label_lower)
+
+        labels = _field_labels.get(cache_key)
+        if labels is None:
+            labels = cls._build_field_labels(instance)
+            if cache_key[1] is not None:
+                _field_labels.set(cache_key, labels)
+        return dict(labels)
+
+    @classmethod
+    def invalidate_field_labels(cls, business_object_id=None) -> None:
+        """Drop cached labels of a dynamic business object (all when None)."""
+        if business_object_id is None:
+            _field_labels.clear()
+        else:
+            _field_labels.delete(('dynamic', business_object_id))
+
+    @classmethod
+    def _build_field_labels(cls, instance) -> Dict[str, str]:
         if hasattr(instance, 'dynamic_fields') and hasattr(instance, 'business_object'):
             labels = {}
             try:
@@ -6,14 +6,24 @@ Provides caching for:
 - Page layouts
 - Business rules
 - Business object metadata
+- Versioned runtime metadata snapshots (object router metadata endpoint)
 """
-from typing import Dict, List, Optional, Any
+import hashlib
+import json
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from django.core.cache import cache
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 import logging
 
+from apps.common.utils.local_cache import LocalLRUCache
+
 logger = logging.getLogger(__name__)
 
+# Per-process front cache for metadata snapshots; keys embed the shared
+# version so entries for superseded versions are never served.
+_metadata_snapshot_local_cache = LocalLRUCache(max_entries=512, timeout=30)
+
 
 class MetadataCacheService:
     """
@@ -27,12 +37,18 @@ class MetadataCacheService:
 
     # Cache TTL in seconds (default 1 hour)
     DEFAULT_TTL = getattr(settings, 'METADATA_CACHE_TTL', 3600)
+    # Snapshots built from fallbacks after an error are retried soon
+    FALLBACK_TTL = 60
     
     # Cache key prefixes
     PREFIX_FIELDS = 'fields'
     PREFIX_LAYOUT = 'layout'
     PREFIX_RULES = 'rules'
     PREFIX_META = 'meta'
+    PREFIX_SNAPSHOT = 'metadata_snapshot'
+
+    # Version counter bumped for changes that affect every object
+    GLOBAL_VERSION_SCOPE = '*'
 
     @classmethod
     def _cache_key(cls, prefix: str, object_code: str, *args) -> str:
@@ -152,6 +168,105 @@ class MetadataCacheService:
             for rule_type in ['all', 'validation', 'visibility', 'computed', 'linkage', 'trigger']:
                 cache.delete(cls._cache_key(cls.PREFIX_RULES, object_code, rule_type))
 
+    # =========================================================================
+    # Metadata Snapshots
+    # =========================================================================
+
+    @classmethod
+    def _snapshot_version_key(cls, scope: str) -> str:
+        return f"{cls.PREFIX_SNAPSHOT}:version:{scope}"
+
+    @classmethod
+    def get_snapshot_version(cls, object_code: str) -> str:
+        """Get the combined (global, per-object) snapshot version."""
+        global_key = cls._snapshot_version_key(cls.GLOBAL_VERSION_SCOPE)
+        object_key = cls._snapshot_version_key(object_code)
+        try:
+            versions = cache.get_many([global_key, object_key])
+        except Exception as e:
+            logger.warning(f"Cache get failed for snapshot version of {object_code}: {e}")
+            versions = {}
+        return f"{versions.get(global_key, 0)}.{versions.get(object_key, 0)}"
+
+    @classmethod
+    def get_metadata_snapshot(
+        cls,
+        object_code: str,
+        builder: Callable[[], Tuple[Dict[str, Any], bool]],
+        organization_id: str = None,
+        locale: str = '',
+        variant: str = '',
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Get a metadata snapshot, building and caching it on a miss.
+
+        Lookup order is the per-process LRU, then the shared cache, then
+        builder(). Keys embed the snapshot version, so invalidation is a
+        counter increment rather than a key scan.
+
+        Args:
+            object_code: Business object code
+            builder: Callable returning (snapshot payload, complete); an
+                incomplete payload is only cached for FALLBACK_TTL
+            organization_id: Organization ID the snapshot was built for
+            locale: Request locale
+            variant: Extra request options that change the payload
+
+        Returns:
+            Tuple of (snapshot, snapshot_digest)
+        """
+        version = cls.get_snapshot_version(object_code)
+        cache_key = cls._cache_key(
+            cls.PREFIX_SNAPSHOT, object_code, f"v{version}",
+            organization_id or 'global', locale or '', variant or ''
+        )
+
+        entry = _metadata_snapshot_local_cache.get(cache_key)
+        if entry is None:
+            try:
+                entry = cache.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Cache get failed for {cache_key}: {e}")
+                entry = None
+            if entry is None:
+                snapshot, complete = builder()
+                digest = hashlib.sha1(
+                    json.dumps(snapshot, sort_keys=True, cls=DjangoJSONEncoder).encode('utf-8')
+                ).hexdigest()
+                entry = (snapshot, digest)
+                try:
+                    cache.set(
+                        cache_key, entry, cls.DEFAULT_TTL if complete else cls.FALLBACK_TTL
+                    )
+                except Exception as e:
+                    logger.warning(f"Cache set failed for {cache_key}: {e}")
+            _metadata_snapshot_local_cache.set(cache_key, entry)
+
+        return entry
+
+    @classmethod
+    def invalidate_metadata_snapshot(cls, object_code: str = None):
+        """
+        Invalidate metadata snapshots of one object, or of all objects.
+
+        Args:
+            object_code: Business object code; None invalidates every object
+        """
+        scope = object_code or cls.GLOBAL_VERSION_SCOPE
+        version_key = cls._snapshot_version_key(scope)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, None)
+        except Exception as e:
+            logger.warning(f"Cache incr failed for {version_key}: {e}")
+
+        prefix = (
+            f"{cls.PREFIX_SNAPSHOT}:{object_code}:" if object_code
+            else f"{cls.PREFIX_SNAPSHOT}:"
+        )
+        _metadata_snapshot_local_cache.delete_matching(lambda key: key.startswith(prefix))
+
     # =========================================================================
     # Batch Operations
     # =========================================================================
@@ -162,6 +277,7 @@ class MetadataCacheService:
         cls.invalidate_field_definitions(object_code)
         cls.invalidate_page_layout(object_code)
         cls.invalidate_business_rules(object_code)
+        cls.invalidate_metadata_snapshot(object_code)
 
     @classmethod
     def warm_cache(cls, object_code: str, organization=None):
@@ -3,11 +3,15 @@ Object Registry - Central service for business object registration and managemen
 
 This service provides:
 1. Auto-registration of standard business objects on app startup
-2. Runtime metadata caching for fast object lookup
+2. Two-tier runtime metadata caching (process-local resolved metadata,
+   validated against a shared version counter)
 3. Mapping between object codes and their model/viewset classes
 4. Field synchronization for hardcoded Django models
 """
-from typing import Dict, Optional, Type, List
+import threading
+import time
+from typing import Any, Dict, Optional, Type, List
+from django.conf import settings
 from django.core.cache import cache
 from django.utils.module_loading import import_string
 from apps.system.object_catalog import get_hardcoded_viewset_map
@@ -66,6 +70,17 @@ class ObjectRegistry:
     # In-memory registry for fast lookup
     _registry: Dict[str, ObjectMeta] = {}
 
+    # Process-local ObjectMeta resolved from the database (classes imported)
+    _resolved: Dict[str, ObjectMeta] = {}
+    _resolved_version: Optional[int] = None
+    _version_checked_at: float = 0.0
+    _version_lock = threading.Lock()
+
+    CACHE_PREFIX = 'object_meta'
+    CACHE_TIMEOUT = 3600
+    # Seconds the local tier trusts its version before re-reading it
+    VERSION_CHECK_INTERVAL = getattr(settings, 'OBJECT_REGISTRY_VERSION_CHECK_INTERVAL', 5)
+
     # ViewSet class path mapping for hardcoded objects
     _viewset_map: Dict[str, str] = get_hardcoded_viewset_map()
 
@@ -132,13 +147,44 @@ class ObjectRegistry:
                 pass
         return None
 
+    @classmethod
+    def _version_key(cls) -> str:
+        return f"{cls.CACHE_PREFIX}:version"
+
+    @classmethod
+    def _sync_local_version(cls) -> int:
+        """
+        Drop the process-local tier if the shared version moved.
+
+        The shared version is read at most once per VERSION_CHECK_INTERVAL.
+        """
+        now = time.monotonic()
+        if (cls._resolved_version is not None
+                and now - cls._version_checked_at < cls.VERSION_CHECK_INTERVAL):
+            return cls._resolved_version
+
+        try:
+            version = int(cache.get(cls._version_key()) or 0)
+        except Exception:
+            # Redis unavailable: keep serving the local tier
+            version = cls._resolved_version or 0
+
+        with cls._version_lock:
+            if version != cls._resolved_version:
+                cls._resolved = {}
+                cls._resolved_version = version
+            cls._version_checked_at = now
+        return version
+
     @classmethod
     def get_or_create_from_db(cls, code: str) -> Optional[ObjectMeta]:
         """
         Get object metadata from database with caching.
 
-        This method first checks the cache, then the database,
-        creating ObjectMeta from BusinessObject record.
+        Lookup order:
+        1. Process-local resolved ObjectMeta (model/viewset classes imported)
+        2. Shared cache entry for the current version
+        3. BusinessObject record
 
         Args:
             code: Object code
@@ -146,46 +192,47 @@ class ObjectRegistry:
         Returns:
             ObjectMeta instance or None if BusinessObject doesn't exist
         """
-        # Check cache first (with fallback for Redis unavailability)
-        cache_key = f"object_meta:{code}"
+        version = cls._sync_local_version()
+        meta = cls._resolved.get(code)
+        if meta is not None:
+            return meta
+
+        # Shared cache holds plain descriptors; classes are imported once per process
+        cache_key = f"{cls.CACHE_PREFIX}:v{version}:{code}"
+        descriptor = None
         try:
-            cached = cache.get(cache_key)
-            if cached:
-                # Hot-fix: viewset mappings evolve over time, but cached ObjectMeta may lag behind.
-                # Refresh critical hardcoded bindings to avoid routing to MetadataDrivenViewSet by mistake.
-                try:
-                    mapped_viewset = cls.get_viewset_class(code)
-                    if mapped_viewset:
-                        # Hardcoded mappings take precedence over stale cache payloads.
-                        # This prevents old cache entries (is_hardcoded=False) from breaking custom actions.
-                        cached.is_hardcoded = True
-                        cached.viewset_class = mapped_viewset
-
-                    if getattr(cached, "is_hardcoded", False):
-                        if getattr(cached, "viewset_class", None) is None:
-                            cached.viewset_class = cls.get_viewset_class(code)
-                        if getattr(cached, "model_class", None) is None and getattr(cached, "django_model_path", None):
-                            cached.model_class = import_string(cached.django_model_path)
-                except Exception:
-                    pass
-                return cached
+            descriptor = cache.get(cache_key)
         except Exception:
             # Redis unavailable, continue to database query
             pass
 
-        # Query database - BusinessObject uses GlobalMetadataManager
-        # which does NOT filter by organization (metadata is global)
-        try:
-            bo = BusinessObject.objects.get(code=code)
-            meta = cls._build_meta_from_business_object(bo)
-            # Try to cache for 1 hour (ignore failures)
+        if descriptor is None:
+            # Query database - BusinessObject uses GlobalMetadataManager
+            # which does NOT filter by organization (metadata is global)
+            bo = BusinessObject.objects.filter(code=code).first()
+            if bo is None:
+                return None
+            descriptor = cls._describe_business_object(bo)
             try:
-                cache.set(cache_key, meta, timeout=3600)
+                cache.set(cache_key, descriptor, timeout=cls.CACHE_TIMEOUT)
             except Exception:
                 pass
-            return meta
-        except BusinessObject.DoesNotExist:
-            return None
+
+        meta = cls._build_meta(**descriptor)
+        with cls._version_lock:
+            # Skip the local tier if the version moved while meta was built
+            if cls._resolved_version == version:
+                cls._resolved[code] = meta
+        return meta
+
+    @staticmethod
+    def _describe_business_object(bo: BusinessObject) -> Dict[str, Any]:
+        return {
+            'code': bo.code,
+            'name': bo.name,
+            'is_hardcoded': bool(bo.is_hardcoded),
+            'django_model_path': bo.django_model_path,
+        }
 
     @classmethod
     def _build_meta_from_business_object(cls, bo: BusinessObject) -> ObjectMeta:
@@ -198,27 +245,33 @@ class ObjectRegistry:
         Returns:
             ObjectMeta instance
         """
+        return cls._build_meta(**cls._describe_business_object(bo))
+
+    @classmethod
+    def _build_meta(cls, code: str, name: str, is_hardcoded: bool,
+                    django_model_path: Optional[str]) -> ObjectMeta:
+        """Build ObjectMeta from a descriptor, importing model and viewset classes."""
         model_class = None
-        viewset_class = cls.get_viewset_class(bo.code)
+        viewset_class = cls.get_viewset_class(code)
 
         # Hardcoded status is derived from DB flag OR hardcoded viewset mapping.
         # This makes routing resilient when BusinessObject seed data has stale flags.
-        is_hardcoded = bool(bo.is_hardcoded or viewset_class)
+        is_hardcoded = bool(is_hardcoded or viewset_class)
 
         # Import model class when it is a hardcoded object and model path is available.
-        if is_hardcoded and bo.django_model_path:
+        if is_hardcoded and django_model_path:
             try:
-                model_class = import_string(bo.django_model_path)
+                model_class = import_string(django_model_path)
             except ImportError:
                 pass
 
         return ObjectMeta(
-            code=bo.code,
-            name=bo.name,
+            code=code,
+            name=name,
             model_class=model_class,
             viewset_class=viewset_class,
             is_hardcoded=is_hardcoded,
-            django_model_path=bo.django_model_path,
+            django_model_path=django_model_path,
         )
 
     @classmethod
@@ -400,20 +453,31 @@ class ObjectRegistry:
         """
         Invalidate cached metadata for a specific object.
 
+        Metadata is versioned globally, so this bumps the shared version;
+        every process drops its local tier on its next version check.
+
         Args:
             code: Object code
         """
-        try:
-            cache.delete(f"object_meta:{code}")
-        except Exception:
-            pass
+        cls.invalidate_all_cache()
 
     @classmethod
     def invalidate_all_cache(cls) -> None:
-        """Invalidate all cached metadata."""
-        # This would require cache key pattern deletion
-        # For now, objects expire after 1 hour automatically
-        pass
+        """Invalidate all cached metadata in every process."""
+        version_key = cls._version_key()
+        try:
+            try:
+                version = cache.incr(version_key)
+            except ValueError:
+                version = 1
+                cache.set(version_key, version, None)
+        except Exception:
+            version = (cls._resolved_version or 0) + 1
+
+        with cls._version_lock:
+            cls._resolved = {}
+            cls._resolved_version = version
+            cls._version_checked_at = time.monotonic()
 
     @classmethod
     def get_all_codes(cls) -> List[str]:
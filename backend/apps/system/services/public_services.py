@@ -4,11 +4,17 @@ Public System Services for Dictionary, Sequence, and Config management.
 These services provide the core functionality for the Public Models,
 enabling dynamic configuration without code changes.
 """
+import threading
 from typing import Dict, List, Optional, Any
-from django.db import transaction
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.utils import timezone
 from django.db.models import Q
 from apps.common.services.base_crud import BaseCRUDService
+from apps.common.utils.local_cache import LocalLRUCache
+
+# Per-process tier in front of the shared dictionary cache
+_dictionary_local_cache = LocalLRUCache(max_entries=1024, timeout=30)
 
 
 class DictionaryService(BaseCRUDService):
@@ -21,34 +27,66 @@ class DictionaryService(BaseCRUDService):
     - Caching for performance
     """
 
+    CACHE_PREFIX = 'gzeams:dictionary'
+    CACHE_TIMEOUT = 3600  # 1 hour
+
     def __init__(self):
         from apps.system.models import DictionaryType
         super().__init__(DictionaryType)
 
     @classmethod
-    def get_items(cls, type_code: str, organization_id=None, active_only: bool = True) -> List[Dict]:
-        """
-        Get all items for a dictionary type.
+    def _version_key(cls, type_code: str) -> str:
+        return f'{cls.CACHE_PREFIX}:version:{type_code}'
 
-        Args:
-            type_code: Dictionary type code (e.g., 'ASSET_STATUS')
-            organization_id: Organization ID for multi-tenant filtering
-            active_only: Only return active items
+    @classmethod
+    def _resolve_cache_context(cls, organization_id=None, lang: str = None):
+        from apps.common.middleware import get_current_organization
+        from django.utils.translation import get_language
 
-        Returns:
-            List of dictionary items as dicts
+        resolved_org_id = organization_id or get_current_organization()
+        return (str(resolved_org_id) if resolved_org_id else ''), (lang or get_language() or '')
+
+    @classmethod
+    def _get_cached_entry(cls, type_code: str, organization_id=None,
+                          lang: str = None) -> Dict[str, Any]:
         """
+        Get the cached {'items': [...], 'labels': {...}} entry for a type.
+
+        Lookup order is the per-process LRU, then the shared cache, then
+        the database. Shared-cache keys embed a per-type version counter so
+        invalidate_cache() drops every organization/language variant at once.
+        """
+        org_key, lang_key = cls._resolve_cache_context(organization_id, lang)
+        local_key = (org_key, type_code, lang_key)
+        entry = _dictionary_local_cache.get(local_key)
+        if entry is not None:
+            return entry
+
+        version = cache.get(cls._version_key(type_code)) or 0
+        shared_key = f'{cls.CACHE_PREFIX}:{type_code}:v{version}:{org_key or "global"}:{lang_key}'
+        entry = cache.get(shared_key)
+        if entry is None:
+            entry = cls._load_entry(type_code, org_key or None, lang_key)
+            if entry is None:
+                return {'items': [], 'labels': {}}
+            cache.set(shared_key, entry, cls.CACHE_TIMEOUT)
+
+        _dictionary_local_cache.set(local_key, entry)
+        return entry
+
+    @classmethod
+    def _load_entry(cls, type_code: str, organization_id, lang: str) -> Optional[Dict[str, Any]]:
+        """Load all items of a type from the database; None on lookup errors."""
         from apps.system.models import DictionaryType, DictionaryItem
-        from apps.common.middleware import get_current_organization
+        from django.utils.translation import gettext, override
 
         try:
-            resolved_org_id = organization_id or get_current_organization()
-            candidates = DictionaryType.objects.filter(code=type_code)
+            candidates = list(DictionaryType.objects.filter(code=type_code))
 
             # Prioritize organization specific match
             dict_type = None
             for dt in candidates:
-                if resolved_org_id and str(dt.organization_id) == str(resolved_org_id):
+                if organization_id and str(dt.organization_id) == str(organization_id):
                     dict_type = dt
                     break
 
@@ -59,20 +97,14 @@ class DictionaryService(BaseCRUDService):
                         dict_type = dt
                         break
 
-            if not dict_type:
+            if not dict_type and candidates:
                 # Final fallback to any matching shared metadata row.
-                dict_type = candidates.first()
+                dict_type = candidates[0]
 
             if not dict_type:
-                return []
+                return {'items': [], 'labels': {}}
 
-            item_filters = {'dictionary_type': dict_type}
-            if active_only:
-                item_filters['is_active'] = True
-
-            items = DictionaryItem.objects.filter(**item_filters).order_by('sort_order', 'code')
-
-            return [
+            items = [
                 {
                     'code': item.code,
                     'name': item.name,
@@ -81,11 +113,50 @@ class DictionaryService(BaseCRUDService):
                     'icon': item.icon,
                     'is_default': item.is_default,
                     'extra_data': item.extra_data,
+                    'is_active': item.is_active,
                 }
-                for item in items
+                for item in DictionaryItem.objects.filter(
+                    dictionary_type=dict_type
+                ).order_by('sort_order', 'code')
             ]
         except Exception:
-            return []
+            return None
+
+        # Since names are now in English, we use gettext to allow translation
+        # dictionary items should have entries in .po files if translation is needed
+        with override(lang or None):
+            labels = {item['code']: gettext(item['name']) for item in items}
+        return {'items': items, 'labels': labels}
+
+    @classmethod
+    def invalidate_cache(cls, type_code: str) -> None:
+        """Drop cached entries of a dictionary type for all organizations and languages."""
+        version_key = cls._version_key(type_code)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, None)
+        _dictionary_local_cache.delete_matching(lambda key: key[1] == type_code)
+
+    @classmethod
+    def get_items(cls, type_code: str, organization_id=None, active_only: bool = True) -> List[Dict]:
+        """
+        Get all items for a dictionary type.
+
+        Args:
+            type_code: Dictionary type code (e.g., 'ASSET_STATUS')
+            organization_id: Organization ID for multi-tenant filtering
+            active_only: Only return active items
+
+        Returns:
+            List of dictionary items as dicts
+        """
+        items = cls._get_cached_entry(type_code, organization_id)['items']
+        return [
+            {key: value for key, value in item.items() if key != 'is_active'}
+            for item in items
+            if item['is_active'] or not active_only
+        ]
 
     @classmethod
     def get_item(cls, type_code: str, item_code: str, organization_id=None) -> Optional[Dict]:
@@ -100,10 +171,9 @@ class DictionaryService(BaseCRUDService):
         Returns:
             Dictionary item as dict or None
         """
-        items = cls.get_items(type_code, organization_id, active_only=False)
-        for item in items:
+        for item in cls._get_cached_entry(type_code, organization_id)['items']:
             if item['code'] == item_code:
-                return item
+                return {key: value for key, value in item.items() if key != 'is_active'}
         return None
 
     @classmethod
@@ -120,13 +190,26 @@ class DictionaryService(BaseCRUDService):
         Returns:
             Display label or the item_code if not found
         """
-        item = cls.get_item(type_code, item_code, organization_id)
-        if item:
-            # Since names are now in English, we use gettext to allow translation
-            # dictionary items should have entries in .po files if translation is needed
-            from django.utils.translation import gettext
-            return gettext(item['name'])
-        return item_code
+        return cls.get_label_map(type_code, organization_id, lang).get(item_code, item_code)
+
+    @classmethod
+    def get_label_map(cls, type_code: str, organization_id=None,
+                      lang: str = None) -> Dict[str, str]:
+        """
+        Get display labels for all items of a dictionary type.
+
+        Intended for serializers: fetch the map once per response and look
+        up each row's code in it instead of calling get_label per row.
+
+        Args:
+            type_code: Dictionary type code
+            organization_id: Organization ID
+            lang: Language code ('zh' or 'en')
+
+        Returns:
+            Dict mapping item code to display label
+        """
+        return dict(cls._get_cached_entry(type_code, organization_id, lang)['labels'])
 
     @classmethod
     def validate_value(cls, type_code: str, value: str, organization_id=None) -> bool:
@@ -171,8 +254,19 @@ class SequenceService(BaseCRUDService):
     - Configurable patterns
     - Automatic period-based reset
     - Database-level locking to prevent duplicates
+    - Block allocation: one row lock reserves a range of values
     """
 
+    # Values reserved per SequenceRule lock for single-value allocation
+    BLOCK_SIZE = 20
+    CACHE_PREFIX = 'gzeams:sequence'
+    # Counter fields advanced by allocation; saving only these keeps blocks valid
+    COUNTER_FIELDS = frozenset({'current_value', 'last_reset_date', 'updated_at'})
+
+    # Process-local reserved blocks keyed by (rule_code, organization_id)
+    _blocks: Dict[tuple, Dict[str, Any]] = {}
+    _blocks_lock = threading.Lock()
+
     def __init__(self):
         from apps.system.models import SequenceRule
         super().__init__(SequenceRule)
@@ -185,6 +279,13 @@ class SequenceService(BaseCRUDService):
         Uses database-level locking (select_for_update) to ensure
         thread-safety and prevent duplicate numbers.
 
+        Outside of a transaction, values are handed out from a process-local
+        block of BLOCK_SIZE values reserved with a single lock, so concurrent
+        writers rarely contend on the rule row. Inside a transaction a single
+        value is reserved, so a rollback cannot leave reissued numbers in a
+        local block. Block allocation may leave gaps when a process exits
+        with unused values.
+
         Args:
             rule_code: Sequence rule code (e.g., 'ASSET_CODE')
             organization_id: Organization ID
@@ -192,6 +293,90 @@ class SequenceService(BaseCRUDService):
         Returns:
             Generated sequence string (e.g., 'ZC2026010001')
         """
+        if cls.BLOCK_SIZE <= 1 or cls._in_transaction():
+            return cls.reserve_values(rule_code, 1, organization_id)[0]
+
+        block_key = (rule_code, str(organization_id) if organization_id else None)
+        today = timezone.now().date()
+        version = cache.get(cls._version_key(rule_code)) or 0
+        with cls._blocks_lock:
+            block = cls._blocks.get(block_key)
+            if (
+                block is None
+                or block['next'] > block['last']
+                or block['period'] != cls._period_token(block['reset_period'], today)
+                or block['version'] != version
+            ):
+                rule, first_value = cls._reserve_range(rule_code, cls.BLOCK_SIZE, organization_id)
+                block = {
+                    'rule': rule,
+                    'reset_period': rule.reset_period,
+                    'period': cls._period_token(rule.reset_period, today),
+                    'next': first_value,
+                    'last': rule.current_value,
+                    'version': version,
+                }
+                cls._blocks[block_key] = block
+            value = block['next']
+            block['next'] += 1
+
+        return cls._format_value(block['rule'], value)
+
+    @classmethod
+    def _version_key(cls, rule_code: str) -> str:
+        return f'{cls.CACHE_PREFIX}:version:{rule_code}'
+
+    @classmethod
+    def invalidate_blocks(cls, rule_code: str) -> None:
+        """
+        Drop reserved blocks of a rule in every process.
+
+        Blocks hold the rule they were reserved from, so a changed pattern,
+        prefix or padding would otherwise keep being used until the block
+        runs out. Unused values of the dropped blocks become gaps.
+        """
+        version_key = cls._version_key(rule_code)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, None)
+        with cls._blocks_lock:
+            for block_key in [key for key in cls._blocks if key[0] == rule_code]:
+                del cls._blocks[block_key]
+
+    @classmethod
+    def reserve_values(cls, rule_code: str, count: int, organization_id=None) -> List[str]:
+        """
+        Reserve and format `count` consecutive sequence values with one lock.
+
+        Intended for bulk creation: reserve codes for every new row up front
+        instead of taking the rule row lock once per row.
+
+        Args:
+            rule_code: Sequence rule code (e.g., 'ASSET_CODE')
+            count: Number of values to reserve
+            organization_id: Organization ID
+
+        Returns:
+            List of generated sequence strings in ascending order
+        """
+        if count <= 0:
+            return []
+        rule, first_value = cls._reserve_range(rule_code, count, organization_id)
+        return [
+            cls._format_value(rule, value)
+            for value in range(first_value, first_value + count)
+        ]
+
+    @classmethod
+    def _reserve_range(cls, rule_code: str, count: int, organization_id=None):
+        """
+        Advance the rule counter by `count` under a row lock.
+
+        Returns:
+            Tuple of (rule with current_value at the last reserved value,
+            first reserved value)
+        """
         from apps.system.models import SequenceRule
 
         with transaction.atomic():
@@ -214,12 +399,26 @@ class SequenceService(BaseCRUDService):
                 rule.current_value = 0
                 rule.last_reset_date = today
 
-            # Increment value
-            rule.current_value += 1
+            first_value = rule.current_value + 1
+            rule.current_value += count
             rule.save(update_fields=['current_value', 'last_reset_date', 'updated_at'])
 
-            # Generate the formatted value
-            return cls._format_sequence(rule)
+        return rule, first_value
+
+    @classmethod
+    def _in_transaction(cls) -> bool:
+        return connection.in_atomic_block
+
+    @classmethod
+    def _period_token(cls, reset_period: str, today) -> str:
+        """Identify the reset period a value belongs to."""
+        if reset_period == 'daily':
+            return today.isoformat()
+        if reset_period == 'monthly':
+            return today.strftime('%Y-%m')
+        if reset_period == 'yearly':
+            return today.strftime('%Y')
+        return ''
 
     @classmethod
     def _should_reset(cls, rule, today) -> bool:
@@ -243,7 +442,12 @@ class SequenceService(BaseCRUDService):
 
     @classmethod
     def _format_sequence(cls, rule) -> str:
-        """Format the sequence value according to the pattern."""
+        """Format the rule's current value according to the pattern."""
+        return cls._format_value(rule, rule.current_value)
+
+    @classmethod
+    def _format_value(cls, rule, value: int) -> str:
+        """Format a sequence value according to the rule's pattern."""
         now = timezone.now()
         pattern = rule.pattern
 
@@ -254,7 +458,7 @@ class SequenceService(BaseCRUDService):
             '{YY}': now.strftime('%y'),
             '{MM}': now.strftime('%m'),
             '{DD}': now.strftime('%d'),
-            '{SEQ}': str(rule.current_value).zfill(rule.seq_length),
+            '{SEQ}': str(value).zfill(rule.seq_length),
         }
 
         result = pattern
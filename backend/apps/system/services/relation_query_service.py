@@ -37,6 +37,8 @@ class RelationQueryService:
             bo.code: bo
             for bo in BusinessObject.objects.filter(code__in=target_codes)
         }
+        for label_locale in {TranslationService.DEFAULT_LANGUAGE, 'en-US', resolved_locale}:
+            TranslationService.prefetch_object_translations(bo_map.values(), label_locale)
 
         payload = []
         for row in rows:
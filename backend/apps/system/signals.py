@@ -2,12 +2,26 @@
 Signal handlers for the system app.
 
 Handles cleanup tasks when objects are deleted, such as
-removing associated translations.
+removing associated translations, and dictionary and metadata cache
+invalidation.
 """
-from django.db.models.signals import post_delete
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.contenttypes.models import ContentType
-from apps.system.models import Translation
+from apps.system.models import (
+    BusinessObject,
+    DictionaryItem,
+    DictionaryType,
+    FieldDefinition,
+    ModelFieldDefinition,
+    PageLayout,
+    SequenceRule,
+    SystemConfig,
+    Translation,
+)
 
 
 # Define which models have translatable fields
@@ -52,3 +66,81 @@ def cleanup_translations(sender, instance, **kwargs):
     except Exception:
         # Silently fail - cleanup is not critical
         pass
+
+
+@receiver([post_save, post_delete], sender=DictionaryType)
+def invalidate_dictionary_type_cache(sender, instance, **kwargs):
+    """Drop cached items and labels when a dictionary type changes."""
+    from apps.system.services.public_services import DictionaryService
+    DictionaryService.invalidate_cache(instance.code)
+
+
+@receiver([post_save, post_delete], sender=DictionaryItem)
+def invalidate_dictionary_item_cache(sender, instance, **kwargs):
+    """Drop cached items and labels of the item's dictionary type."""
+    from apps.system.services.public_services import DictionaryService
+    type_code = DictionaryType.all_objects.filter(
+        pk=instance.dictionary_type_id
+    ).values_list('code', flat=True).first()
+    if type_code:
+        DictionaryService.invalidate_cache(type_code)
+
+
+@receiver([post_save, post_delete], sender=SequenceRule)
+def invalidate_sequence_blocks(sender, instance, update_fields=None, **kwargs):
+    """Drop reserved sequence blocks when a rule's format changes."""
+    from apps.system.services.public_services import SequenceService
+    if update_fields and set(update_fields) <= SequenceService.COUNTER_FIELDS:
+        return
+    # After commit, so no process reserves a block from the old row under the new version
+    transaction.on_commit(partial(SequenceService.invalidate_blocks, instance.code))
+
+
+@receiver([post_save, post_delete], sender=BusinessObject)
+def invalidate_business_object_metadata(sender, instance, **kwargs):
+    """Drop cached registry entries and metadata snapshots of a business object."""
+    from apps.system.services.metadata_cache_service import MetadataCacheService
+    from apps.system.services.object_registry import ObjectRegistry
+    # After commit, so no request rebuilds registry entries or snapshots
+    # from the old rows under the new version
+    transaction.on_commit(partial(ObjectRegistry.invalidate_cache, instance.code))
+    transaction.on_commit(
+        partial(MetadataCacheService.invalidate_metadata_snapshot, instance.code)
+    )
+
+
+@receiver([post_save, post_delete], sender=FieldDefinition)
+@receiver([post_save, post_delete], sender=ModelFieldDefinition)
+@receiver([post_save, post_delete], sender=PageLayout)
+def invalidate_object_metadata(sender, instance, **kwargs):
+    """Drop cached metadata snapshots of the owning business object."""
+    from apps.system.services.metadata_cache_service import MetadataCacheService
+    object_code = BusinessObject.all_objects.filter(
+        pk=instance.business_object_id
+    ).values_list('code', flat=True).first()
+    if object_code:
+        transaction.on_commit(
+            partial(MetadataCacheService.invalidate_metadata_snapshot, object_code)
+        )
+
+
+@receiver([post_save, post_delete], sender=FieldDefinition)
+def invalidate_activity_field_labels(sender, instance, **kwargs):
+    """Drop cached activity log field labels of the owning business object."""
+    from apps.system.services.activity_log_service import ActivityLogService
+    ActivityLogService.invalidate_field_labels(instance.business_object_id)
+
+
+@receiver([post_save, post_delete], sender=Translation)
+def invalidate_translation_cache(sender, instance, **kwargs):
+    """Move translation caches to a new version, dropping cached misses too."""
+    from apps.common.services.i18n_service import TranslationCache
+    TranslationCache.bump_version()
+
+
+@receiver([post_save, post_delete], sender=Translation)
+@receiver([post_save, post_delete], sender=SystemConfig)
+def invalidate_all_object_metadata(sender, instance, **kwargs):
+    """Translations and feature flags can change any object's metadata."""
+    from apps.system.services.metadata_cache_service import MetadataCacheService
+    transaction.on_commit(MetadataCacheService.invalidate_metadata_snapshot)
@@ -0,0 +1,37 @@
+"""
+Celery tasks for system background jobs.
+"""
+import logging
+from typing import Dict, List
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, acks_late=True, max_retries=3, default_retry_delay=30)
+def write_activity_logs_task(self, rows: List[Dict]):
+    """
+    Insert a batch of activity logs queued by ActivityLogService.buffered().
+
+    Returns:
+        Number of rows written
+    """
+    from apps.system.activity_log import ActivityLog
+    from apps.system.services.activity_log_service import ActivityLogService
+
+    try:
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(**{key: value for key, value in row.items() if key != 'created_at'})
+                for row in rows
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+        # Keep the time the logs were recorded, not the time the task ran
+        ActivityLogService.restore_created_at(rows)
+    except Exception as exc:
+        logger.warning("Activity log batch write failed. rows=%s error=%s", len(rows), exc)
+        raise self.retry(exc=exc)
+    return len(rows)
@@ -1,15 +1,20 @@
+from datetime import timedelta
+
 import pytest
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 from rest_framework.test import APIClient
 
 from apps.accounts.models import User
 from apps.organizations.models import Organization
 from apps.system.activity_log import ActivityLog
 from apps.system.models import BusinessObject
+from apps.system.services.activity_log_service import ActivityLogService
+from apps.system.tasks import write_activity_logs_task
 
 
 @pytest.mark.django_db
-def test_object_router_update_creates_activity_log():
+def test_object_router_update_creates_activity_log(django_capture_on_commit_callbacks):
     organization = Organization.objects.create(name='Audit Org', code='audit-org')
     user = User.objects.create(username='audit-user', organization=organization)
 
@@ -25,11 +30,13 @@ def test_object_router_update_creates_activity_log():
     client = APIClient()
     client.force_authenticate(user=user)
 
-    response = client.patch(
-        f'/api/system/objects/Organization/{target.id}/',
-        {'name': 'New Name'},
-        format='json',
-    )
+    # Activity logs are written when the request's transaction commits
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.patch(
+            f'/api/system/objects/Organization/{target.id}/',
+            {'name': 'New Name'},
+            format='json',
+        )
 
     assert response.status_code == 200
 
@@ -46,3 +53,73 @@ def test_object_router_update_creates_activity_log():
     assert log.changes[0]['fieldCode'] == 'name'
     assert log.changes[0]['oldValue'] == 'Old Name'
     assert log.changes[0]['newValue'] == 'New Name'
+
+
+@pytest.mark.django_db
+def test_buffered_activity_logs_are_written_in_one_insert_on_commit(
+    django_capture_on_commit_callbacks,
+    django_assert_num_queries,
+):
+    organization = Organization.objects.create(name='Buffer Org', code='buffer-org')
+    user = User.objects.create(username='buffer-user', organization=organization)
+    targets = [
+        Organization.objects.create(name=f'Target {index}', code=f'buffer-target-{index}')
+        for index in range(5)
+    ]
+    content_type = ContentType.objects.get_for_model(Organization)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        with ActivityLogService.buffered():
+            for target in targets:
+                ActivityLogService.log_create(
+                    actor=user, instance=target, organization=organization
+                )
+
+    assert not ActivityLog.objects.filter(content_type=content_type).exists()
+    assert len(callbacks) == 1
+
+    with django_assert_num_queries(1):
+        callbacks[0]()
+
+    assert ActivityLog.objects.filter(content_type=content_type, action='create').count() == 5
+
+
+@pytest.mark.django_db
+def test_buffered_activity_logs_are_dropped_when_block_fails(django_capture_on_commit_callbacks):
+    organization = Organization.objects.create(name='Failed Org', code='failed-org')
+    user = User.objects.create(username='failed-user', organization=organization)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(RuntimeError):
+            with ActivityLogService.buffered():
+                ActivityLogService.log_create(actor=user, instance=organization)
+                raise RuntimeError('mutation failed')
+
+    assert not ActivityLog.objects.filter(object_id=str(organization.id)).exists()
+
+
+@pytest.mark.django_db
+def test_field_labels_are_cached_per_model():
+    organization = Organization.objects.create(name='Label Org', code='label-org')
+    ActivityLogService.invalidate_field_labels()
+
+    labels = ActivityLogService.get_field_labels(organization)
+    labels['name'] = 'Changed'
+
+    assert ActivityLogService.get_field_labels(organization)['name'] != 'Changed'
+    assert 'id' not in labels
+
+
+@pytest.mark.django_db
+def test_async_activity_log_write_keeps_logged_time():
+    organization = Organization.objects.create(name='Async Org', code='async-org')
+    user = User.objects.create(username='async-user', organization=organization)
+
+    with ActivityLogService.buffered():
+        entry = ActivityLogService.log_create(actor=user, instance=organization)
+    logged_at = timezone.now() - timedelta(seconds=90)
+    entry.created_at = logged_at
+
+    assert write_activity_logs_task([ActivityLogService.entry_to_row(entry)]) == 1
+
+    assert ActivityLog.objects.get(pk=entry.pk).created_at == logged_at
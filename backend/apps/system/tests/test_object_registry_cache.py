@@ -0,0 +1,87 @@
+import uuid
+
+import pytest
+from django.core.cache import cache
+
+from apps.system.models import BusinessObject
+from apps.system.services.object_registry import ObjectRegistry
+
+
+def _create_business_object(name='Registry Probe'):
+    code = f'RegistryProbe{uuid.uuid4().hex[:8]}'
+    BusinessObject.objects.create(code=code, name=name)
+    return code
+
+
+@pytest.mark.django_db
+def test_registry_serves_resolved_meta_from_process_local_tier(django_assert_num_queries):
+    code = _create_business_object()
+
+    first = ObjectRegistry.get_or_create_from_db(code)
+    with django_assert_num_queries(0):
+        second = ObjectRegistry.get_or_create_from_db(code)
+
+    assert first is second
+    assert first.name == 'Registry Probe'
+
+
+@pytest.mark.django_db
+def test_registry_local_tier_follows_business_object_changes(
+    django_capture_on_commit_callbacks
+):
+    code = _create_business_object()
+    assert ObjectRegistry.get_or_create_from_db(code).name == 'Registry Probe'
+
+    business_object = BusinessObject.objects.get(code=code)
+    business_object.name = 'Renamed Probe'
+    with django_capture_on_commit_callbacks() as callbacks:
+        business_object.save()
+
+    # Not invalidated until the transaction commits
+    assert ObjectRegistry.get_or_create_from_db(code).name == 'Registry Probe'
+    for callback in callbacks:
+        callback()
+
+    assert ObjectRegistry.get_or_create_from_db(code).name == 'Renamed Probe'
+
+
+@pytest.mark.django_db
+def test_registry_drops_local_tier_when_shared_version_moves():
+    code = _create_business_object()
+    first = ObjectRegistry.get_or_create_from_db(code)
+
+    # Simulate another process bumping the version after the check window
+    BusinessObject.objects.filter(code=code).update(name='Updated Elsewhere')
+    cache.set(ObjectRegistry._version_key(), ObjectRegistry._resolved_version + 1, None)
+    ObjectRegistry._version_checked_at = 0.0
+
+    second = ObjectRegistry.get_or_create_from_db(code)
+    assert second is not first
+    assert second.name == 'Updated Elsewhere'
+
+
+@pytest.mark.django_db
+def test_invalidate_all_cache_clears_resolved_metadata():
+    code = _create_business_object()
+    first = ObjectRegistry.get_or_create_from_db(code)
+
+    ObjectRegistry.invalidate_all_cache()
+
+    assert ObjectRegistry.get_or_create_from_db(code) is not first
+
+
+@pytest.mark.django_db
+def test_registry_does_not_keep_meta_built_across_a_version_swap(monkeypatch):
+    code = _create_business_object()
+    ObjectRegistry.invalidate_all_cache()
+    build_meta = ObjectRegistry._build_meta.__func__
+
+    def build_during_swap(cls, **descriptor):
+        meta = build_meta(cls, **descriptor)
+        ObjectRegistry.invalidate_all_cache()
+        return meta
+
+    monkeypatch.setattr(ObjectRegistry, '_build_meta', classmethod(build_during_swap))
+    ObjectRegistry.get_or_create_from_db(code)
+
+    assert code not in ObjectRegistry._resolved
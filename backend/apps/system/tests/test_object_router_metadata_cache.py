@@ -0,0 +1,140 @@
+import uuid
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.organizations.models import Organization
+from apps.system.models import BusinessObject, FieldDefinition
+from apps.system.services.metadata_cache_service import (
+    MetadataCacheService, _metadata_snapshot_local_cache
+)
+from apps.system.services.object_registry import ObjectRegistry
+from apps.system.viewsets.object_router import ObjectRouterViewSet
+
+
+def _setup_object():
+    cache.clear()
+    _metadata_snapshot_local_cache.clear()
+
+    suffix = uuid.uuid4().hex[:8]
+    org = Organization.objects.create(
+        name=f'Metadata Cache Org {suffix}', code=f'META_CACHE_{suffix}'
+    )
+    user = User.objects.create_user(
+        username=f'metadata_cache_{suffix}',
+        password='pass123456',
+        organization=org,
+    )
+    code = f'CacheProbe{suffix}'
+    bo = BusinessObject.objects.create(code=code, name='Cache Probe', organization=org)
+    FieldDefinition.objects.create(
+        business_object=bo,
+        code='title',
+        name='Title',
+        field_type='text',
+        sort_order=1,
+        organization=org,
+    )
+    ObjectRegistry.invalidate_cache(code)
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    client.credentials(HTTP_X_ORGANIZATION_ID=str(org.id))
+    return client, org, bo
+
+
+def _field_codes(response):
+    return [
+        field.get('fieldCode') or field.get('code')
+        for field in response.data['data']['fields']
+    ]
+
+
+@pytest.mark.django_db
+def test_metadata_snapshot_is_cached_and_supports_etag():
+    client, _, bo = _setup_object()
+    url = f'/api/system/objects/{bo.code}/metadata/'
+
+    with patch.object(
+        ObjectRouterViewSet,
+        '_build_metadata_snapshot',
+        autospec=True,
+        side_effect=ObjectRouterViewSet._build_metadata_snapshot,
+    ) as build:
+        first = client.get(url)
+        second = client.get(url)
+        not_modified = client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+    assert first.status_code == status.HTTP_200_OK
+    assert 'permissions' in first.data['data']
+    assert second.data['data'] == first.data['data']
+    assert second['ETag'] == first['ETag']
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert build.call_count == 1
+
+
+@pytest.mark.django_db
+def test_metadata_snapshot_invalidated_by_field_definition_change(
+    django_capture_on_commit_callbacks
+):
+    client, org, bo = _setup_object()
+    url = f'/api/system/objects/{bo.code}/metadata/'
+
+    first = client.get(url)
+    assert 'notes' not in _field_codes(first)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldDefinition.objects.create(
+            business_object=bo,
+            code='notes',
+            name='Notes',
+            field_type='textarea',
+            sort_order=2,
+            organization=org,
+        )
+
+    second = client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+    assert second.status_code == status.HTTP_200_OK
+    assert 'notes' in _field_codes(second)
+    assert second['ETag'] != first['ETag']
+
+
+@pytest.mark.django_db
+def test_metadata_snapshot_view_mode_is_case_insensitive():
+    client, _, bo = _setup_object()
+    url = f'/api/system/objects/{bo.code}/metadata/'
+
+    with patch.object(
+        ObjectRouterViewSet,
+        '_build_metadata_snapshot',
+        autospec=True,
+        side_effect=ObjectRouterViewSet._build_metadata_snapshot,
+    ) as build:
+        client.get(url, {'view_mode': 'compact'})
+        client.get(url, {'view_mode': 'Compact'})
+
+    assert build.call_count == 1
+    assert build.call_args.args[3] == 'Compact'
+
+
+@pytest.mark.django_db
+def test_metadata_snapshot_with_layout_fallback_uses_short_ttl():
+    client, _, bo = _setup_object()
+    url = f'/api/system/objects/{bo.code}/metadata/'
+
+    with patch(
+        'apps.system.services.layout_generator.LayoutGenerator.get_or_generate_layout',
+        side_effect=RuntimeError('layout store unavailable'),
+    ), patch('apps.system.services.metadata_cache_service.cache.set') as cache_set:
+        response = client.get(url)
+
+    snapshot_ttls = [
+        call.args[2] for call in cache_set.call_args_list
+        if call.args[0].startswith(f'{MetadataCacheService.PREFIX_SNAPSHOT}:')
+    ]
+    assert response.status_code == status.HTTP_200_OK
+    assert snapshot_ttls == [MetadataCacheService.FALLBACK_TTL]
@@ -7,7 +7,12 @@ Tests cover:
 - DynamicDataService CRUD operations
 - DynamicDataService formula calculation
 - DynamicDataService data number generation
+- DictionaryService caching and label maps
+- SequenceService range reservation and block allocation
 """
+from datetime import timedelta
+from unittest import mock
+
 from django.test import TestCase
 from django.utils import timezone
 from apps.system.models import (
@@ -15,10 +20,14 @@ from apps.system.models import (
     FieldDefinition,
     PageLayout,
     DynamicData,
-    DynamicSubTableData
+    DynamicSubTableData,
+    DictionaryType,
+    DictionaryItem,
+    SequenceRule,
 )
 from apps.system.services.metadata_service import MetadataService
 from apps.system.services.dynamic_data_service import DynamicDataService
+from apps.system.services.public_services import DictionaryService, SequenceService
 from apps.organizations.models import Organization
 from apps.accounts.models import User
 
@@ -582,3 +591,164 @@ class FormulaCalculationTest(TestCase):
         # grand_total = 1000 * (1 + 10/100) = 1100
         self.assertEqual(result['total'], 1000)
         self.assertEqual(result['grand_total'], 1100)
+
+
+class DictionaryServiceCacheTest(TestCase):
+    """Test DictionaryService caching, invalidation and label maps."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.organization = Organization.objects.create(
+            name='Dictionary Organization',
+            code='DICT_ORG'
+        )
+        self.dict_type = DictionaryType.objects.create(
+            code='CACHE_TEST_STATUS',
+            name='Cache Test Status',
+            organization=self.organization
+        )
+        self.item = DictionaryItem.objects.create(
+            dictionary_type=self.dict_type,
+            code='in_use',
+            name='In Use',
+            sort_order=1,
+            organization=self.organization
+        )
+        DictionaryItem.objects.create(
+            dictionary_type=self.dict_type,
+            code='retired',
+            name='Retired',
+            sort_order=2,
+            is_active=False,
+            organization=self.organization
+        )
+
+    def test_repeated_lookups_hit_cache(self):
+        """After the first lookup, items and labels are served without queries."""
+        org_id = str(self.organization.id)
+        DictionaryService.get_items('CACHE_TEST_STATUS', organization_id=org_id)
+
+        with self.assertNumQueries(0):
+            items = DictionaryService.get_items('CACHE_TEST_STATUS', organization_id=org_id)
+            label = DictionaryService.get_label(
+                'CACHE_TEST_STATUS', 'retired', organization_id=org_id
+            )
+
+        self.assertEqual([item['code'] for item in items], ['in_use'])
+        self.assertNotIn('is_active', items[0])
+        self.assertEqual(label, 'Retired')
+
+    def test_get_label_map_includes_inactive_items(self):
+        """Label maps cover every item code of the type."""
+        label_map = DictionaryService.get_label_map(
+            'CACHE_TEST_STATUS', organization_id=str(self.organization.id)
+        )
+
+        self.assertEqual(label_map, {'in_use': 'In Use', 'retired': 'Retired'})
+
+    def test_item_save_invalidates_cache(self):
+        """Saving a dictionary item drops the cached entries of its type."""
+        org_id = str(self.organization.id)
+        self.assertEqual(
+            DictionaryService.get_label('CACHE_TEST_STATUS', 'in_use', organization_id=org_id),
+            'In Use'
+        )
+
+        self.item.name = 'Assigned'
+        self.item.save()
+
+        self.assertEqual(
+            DictionaryService.get_label('CACHE_TEST_STATUS', 'in_use', organization_id=org_id),
+            'Assigned'
+        )
+
+
+class SequenceServiceAllocationTest(TestCase):
+    """Test SequenceService range reservation and block allocation."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.organization = Organization.objects.create(
+            name='Sequence Organization',
+            code='SEQ_ORG'
+        )
+        self.rule = SequenceRule.objects.create(
+            code='BLOCK_SEQ',
+            name='Block Sequence',
+            prefix='BS',
+            pattern='{PREFIX}{SEQ}',
+            seq_length=4,
+            reset_period='never',
+            organization=self.organization
+        )
+        SequenceService._blocks.clear()
+
+    def tearDown(self):
+        SequenceService._blocks.clear()
+        super().tearDown()
+
+    def test_reserve_values_takes_consecutive_range(self):
+        """Reserving K values advances the counter once by K."""
+        codes = SequenceService.reserve_values(
+            'BLOCK_SEQ', 3, organization_id=self.organization.id
+        )
+        next_code = SequenceService.get_next_value(
+            'BLOCK_SEQ', organization_id=self.organization.id
+        )
+
+        self.assertEqual(codes, ['BS0001', 'BS0002', 'BS0003'])
+        self.assertEqual(next_code, 'BS0004')
+        self.rule.refresh_from_db()
+        self.assertEqual(self.rule.current_value, 4)
+
+    def test_get_next_value_serves_from_reserved_block(self):
+        """Outside transactions one lock reserves a whole block of values."""
+        with mock.patch.object(SequenceService, '_in_transaction', return_value=False), \
+                mock.patch.object(SequenceService, 'BLOCK_SIZE', 5):
+            codes = [
+                SequenceService.get_next_value('BLOCK_SEQ', organization_id=self.organization.id)
+                for _ in range(6)
+            ]
+
+        self.assertEqual(codes, [f'BS{value:04d}' for value in range(1, 7)])
+        self.rule.refresh_from_db()
+        self.assertEqual(self.rule.current_value, 10)
+
+    def test_block_is_discarded_when_period_resets(self):
+        """Unused block values are dropped once the reset period changes."""
+        self.rule.reset_period = 'daily'
+        self.rule.save()
+        today = timezone.now()
+
+        with mock.patch.object(SequenceService, '_in_transaction', return_value=False), \
+                mock.patch.object(SequenceService, 'BLOCK_SIZE', 5):
+            first = SequenceService.get_next_value(
+                'BLOCK_SEQ', organization_id=self.organization.id
+            )
+            with mock.patch(
+                'apps.system.services.public_services.timezone.now',
+                return_value=today + timedelta(days=1)
+            ):
+                second = SequenceService.get_next_value(
+                    'BLOCK_SEQ', organization_id=self.organization.id
+                )
+
+        self.assertEqual(first, 'BS0001')
+        self.assertEqual(second, 'BS0001')
+
+    def test_block_is_discarded_when_rule_pattern_changes(self):
+        """A saved pattern change drops reserved blocks instead of serving the old format."""
+        with mock.patch.object(SequenceService, '_in_transaction', return_value=False), \
+                mock.patch.object(SequenceService, 'BLOCK_SIZE', 5):
+            first = SequenceService.get_next_value(
+                'BLOCK_SEQ', organization_id=self.organization.id
+            )
+            self.rule.pattern = 'NEW-{SEQ}'
+            with self.captureOnCommitCallbacks(execute=True):
+                self.rule.save()
+            second = SequenceService.get_next_value(
+                'BLOCK_SEQ', organization_id=self.organization.id
+            )
+
+        self.assertEqual(first, 'BS0001')
+        self.assertEqual(second, 'NEW-0006')
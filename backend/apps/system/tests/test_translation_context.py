@@ -0,0 +1,86 @@
+import uuid
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+from apps.common.services.i18n_service import TranslationService, translation_context
+from apps.system.models import BusinessObject, Translation
+
+
+def _create_business_objects(count):
+    suffix = uuid.uuid4().hex[:8]
+    return [
+        BusinessObject.objects.create(code=f'I18nProbe{suffix}{index}', name=f'Probe {index}')
+        for index in range(count)
+    ]
+
+
+def _translate(obj, field_name, text, lang_code='en-US'):
+    return Translation.objects.create(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+        field_name=field_name,
+        language_code=lang_code,
+        text=text,
+    )
+
+
+@pytest.mark.django_db
+def test_translate_objects_uses_constant_queries(django_assert_num_queries):
+    cache.clear()
+    objects = _create_business_objects(5)
+    _translate(objects[0], 'name', 'Probe EN')
+    _translate(objects[0], 'description', 'Described')
+    ContentType.objects.get_for_model(BusinessObject)
+
+    with django_assert_num_queries(1):
+        result = TranslationService.translate_objects(objects, ['name', 'description'], 'en-US')
+
+    assert result[str(objects[0].pk)] == {'name': 'Probe EN', 'description': 'Described'}
+    assert result[str(objects[1].pk)]['name'] == 'Probe 1'
+
+    # Hits and misses are both served from the shared cache afterwards
+    with django_assert_num_queries(0):
+        again = TranslationService.translate_objects(objects, ['name', 'description'], 'en-US')
+    assert again == result
+
+
+@pytest.mark.django_db
+def test_context_memoizes_namespaces_and_negative_lookups(django_assert_num_queries):
+    cache.clear()
+    Translation.objects.create(
+        namespace='probe', key='button.save', language_code='en-US', text='Save'
+    )
+
+    with translation_context():
+        with django_assert_num_queries(1):
+            assert TranslationService.get_text('probe', 'button.save', 'en-US') == 'Save'
+            assert TranslationService.get_text('probe', 'button.cancel', 'en-US') == 'button.cancel'
+            assert TranslationService.get_text(
+                'probe', 'button.cancel', 'en-US', default='Cancel'
+            ) == 'Cancel'
+
+    # Outside a context the miss is still cached
+    TranslationService.get_text('probe', 'missing.key', 'ja-JP')
+    with django_assert_num_queries(0):
+        assert TranslationService.get_text('probe', 'missing.key', 'ja-JP') == 'missing.key'
+
+
+@pytest.mark.django_db
+def test_cached_misses_are_dropped_when_translation_is_added():
+    cache.clear()
+    business_object = _create_business_objects(1)[0]
+
+    assert TranslationService.get_object_translation(business_object, 'name', 'en-US') is None
+    assert TranslationService.get_text('probe', 'late.key', 'en-US') == 'late.key'
+
+    _translate(business_object, 'name', 'Added Later')
+    Translation.objects.create(
+        namespace='probe', key='late.key', language_code='en-US', text='Late'
+    )
+
+    assert TranslationService.get_object_translation(
+        business_object, 'name', 'en-US'
+    ) == 'Added Later'
+    assert TranslationService.get_text('probe', 'late.key', 'en-US') == 'Late'
@@ -10,7 +10,9 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import NotFound, ValidationError, PermissionDenied
 from typing import Any, Dict, List, Optional, Tuple
+import hashlib
 import inspect
+import json
 import re
 import logging
 from types import SimpleNamespace
@@ -551,6 +553,16 @@ class ObjectRouterViewSet(
             'detail_regions': detail_regions,
         })
 
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Dispatch with activity logs buffered for the whole request.
+
+        Mutations queue their logs and the request writes them in one
+        bulk insert on commit instead of one INSERT per record.
+        """
+        with ActivityLogService.buffered():
+            return super().dispatch(request, *args, **kwargs)
+
     def initial(self, request, *args, **kwargs):
         """
         Initialize ViewSet by loading object metadata and creating delegate.
@@ -1495,6 +1507,8 @@ class ObjectRouterViewSet(
                 page_mode='edit',
             )
             self._safe_log_create(request, instance)
+            # The document response includes the activity log just written
+            ActivityLogService.flush_buffer()
             response_payload = service.build_document_response(
                 object_code=self._object_meta.code,
                 instance=instance,
@@ -1567,6 +1581,7 @@ class ObjectRouterViewSet(
                 before_snapshot=before_snapshot,
                 instance=instance,
             )
+            ActivityLogService.flush_buffer()
             response_payload = service.build_document_response(
                 object_code=self._object_meta.code,
                 instance=instance,
@@ -1712,22 +1727,67 @@ class ObjectRouterViewSet(
             if not self._object_meta:
                 return BaseResponse.not_found(f"Business object '{object_code}' not found")
 
-        from apps.system.models import FieldDefinition, PageLayout
+        from apps.system.services.metadata_cache_service import MetadataCacheService
 
-        # Get field definitions from both sources:
-        # 1. FieldDefinition for low-code custom fields
-        # 2. ModelFieldDefinition for hardcoded Django model fields
         request_locale = self._get_request_locale(request)
         runtime_i18n_enabled = self._is_feature_enabled(
             'runtime_i18n_enabled',
             default=True,
             request=request,
         )
+        # Parse optional view_mode query parameter ('Detail' or 'Compact'),
+        # normalized once so the cache key and the builder agree
+        requested_view_mode = (request.query_params.get('view_mode') or '').strip().capitalize()
+        organization_id = getattr(request, 'organization_id', None)
+
+        # Everything except permissions is shared by all users of the
+        # organization and served from the versioned snapshot cache.
+        snapshot, snapshot_digest = MetadataCacheService.get_metadata_snapshot(
+            self._object_meta.code,
+            lambda: self._build_metadata_snapshot(
+                request_locale, runtime_i18n_enabled, requested_view_mode
+            ),
+            organization_id=str(organization_id) if organization_id else None,
+            locale=request_locale,
+            variant=f"{requested_view_mode}:{int(runtime_i18n_enabled)}",
+        )
+
+        # Get permissions for current user
+        permissions = self._get_user_permissions(request.user, self._object_meta.code)
+
+        etag_source = f"{snapshot_digest}:{json.dumps(permissions, sort_keys=True)}"
+        etag = f'"{hashlib.sha1(etag_source.encode("utf-8")).hexdigest()}"'
+        if_none_match = request.headers.get('If-None-Match', '')
+        if etag in [tag.strip() for tag in if_none_match.split(',')]:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = BaseResponse.success({**snapshot, 'permissions': permissions})
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def _build_metadata_snapshot(self, request_locale: str, runtime_i18n_enabled: bool,
+                                 requested_view_mode: str) -> Tuple[dict, bool]:
+        """
+        Build the user-independent part of the metadata payload.
+
+        Returns (payload, complete): fields, layouts and object flags, and
+        False when a layout fell back to a default after an error so the
+        snapshot is not cached for long. Permissions are added per request
+        by metadata().
+        """
+        from apps.system.models import FieldDefinition, PageLayout
+
+        # Get field definitions from both sources:
+        # 1. FieldDefinition for low-code custom fields
+        # 2. ModelFieldDefinition for hardcoded Django model fields
         fields = []
 
         # For hardcoded objects, get fields from ModelFieldDefinition
         if self._object_meta.is_hardcoded:
             model_fields = self._get_hardcoded_model_fields()
+            if runtime_i18n_enabled:
+                TranslationService.prefetch_object_translations(model_fields, request_locale)
 
             for fd in model_fields:
                 fields.append(
@@ -1741,9 +1801,11 @@ class ObjectRouterViewSet(
         else:
             # For dynamic objects, get fields from FieldDefinition
             # FieldDefinition uses GlobalMetadataManager (no org filtering)
-            fields_query = FieldDefinition.objects.filter(
+            fields_query = list(FieldDefinition.objects.filter(
                 business_object__code=self._object_meta.code
-            ).order_by('sort_order')
+            ).order_by('sort_order'))
+            if runtime_i18n_enabled:
+                TranslationService.prefetch_object_translations(fields_query, request_locale)
 
             for fd in fields_query:
                 fields.append(
@@ -1761,12 +1823,10 @@ class ObjectRouterViewSet(
         from apps.system.models import BusinessObject
 
         layouts = {}
+        complete = True
         # Get BusinessObject for layout generation
         bo = BusinessObject.objects.filter(code=self._object_meta.code).first()
 
-        # Parse optional view_mode query parameter ('Detail' or 'Compact')
-        requested_view_mode = (request.query_params.get('view_mode') or '').strip()
-
         if bo:
             # Auto-generate layouts using LayoutGenerator
             # This will return existing PageLayout configs or generate defaults
@@ -1784,9 +1844,10 @@ class ObjectRouterViewSet(
                         layout_err,
                     )
                     layouts[layout_type] = get_default_layout_config(layout_type)
+                    complete = False
 
             # When Compact is specifically requested, also try to fetch a dedicated Compact layout
-            if requested_view_mode.lower() == 'compact':
+            if requested_view_mode == 'Compact':
                 try:
                     compact_layout = LayoutGenerator.get_or_generate_layout(
                         bo, 'form', view_mode='Compact'
@@ -1794,7 +1855,7 @@ class ObjectRouterViewSet(
                     if compact_layout:
                         layouts['compact'] = compact_layout
                 except Exception:
-                    pass
+                    complete = False
         else:
             # Fallback to PageLayout query for backward compatibility
             try:
@@ -1809,20 +1870,18 @@ class ObjectRouterViewSet(
                     self._object_meta.code,
                     layout_query_err,
                 )
+                complete = False
 
         # Ensure core layout keys always exist to avoid frontend null checks exploding.
         for layout_type in ['list', 'form', 'detail']:
             if layout_type not in layouts or not layouts.get(layout_type):
                 layouts[layout_type] = get_default_layout_config(layout_type)
 
-        # Get permissions for current user
-        permissions = self._get_user_permissions(request.user, self._object_meta.code)
-
         object_name = self._object_meta.name
         if runtime_i18n_enabled and bo:
             object_name = self._localize_field_value(bo, 'name', request_locale, bo.name)
 
-        return BaseResponse.success({
+        return {
             'code': self._object_meta.code,
             'name': object_name,
             'is_hardcoded': self._object_meta.is_hardcoded,
@@ -1831,8 +1890,7 @@ class ObjectRouterViewSet(
             'enable_version': self._get_business_object_flag('enable_version'),
             'fields': fields,
             'layouts': layouts,
-            'permissions': permissions,
-        })
+        }, complete
 
     def _get_business_object_flag(self, flag_name: str) -> bool:
         """Get a flag value from the BusinessObject."""
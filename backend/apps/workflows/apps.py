@@ -30,6 +30,7 @@ class WorkflowsConfig(AppConfig):
         )
         from apps.workflows.services.business_state_sync import BusinessStateSyncService
         from apps.workflows.services.notification_service import notification_service
+        from apps.workflows.services.workflow_statistics import workflow_statistics_service
 
         sync_service = BusinessStateSyncService()
 
@@ -38,6 +39,7 @@ class WorkflowsConfig(AppConfig):
             try:
                 sync_service.sync_business_status(instance)
                 redis_service.on_workflow_started(instance)
+                workflow_statistics_service.record_instance_event(instance, 'started')
             except Exception:
                 logger.exception('Workflow started handler failed for instance %s', getattr(instance, 'id', None))
 
@@ -47,6 +49,7 @@ class WorkflowsConfig(AppConfig):
                 sync_service.sync_business_status(instance)
                 notification_service.notify_workflow_completed(instance)
                 redis_service.on_workflow_completed(instance)
+                workflow_statistics_service.record_instance_event(instance, 'approved')
             except Exception:
                 logger.exception('Workflow completed handler failed for instance %s', getattr(instance, 'id', None))
 
@@ -60,6 +63,7 @@ class WorkflowsConfig(AppConfig):
                 rejector = rejected_task.completed_by if rejected_task else None
                 notification_service.notify_workflow_rejected(instance, rejector)
                 redis_service.on_workflow_rejected(instance)
+                workflow_statistics_service.record_instance_event(instance, 'rejected')
             except Exception:
                 logger.exception('Workflow rejected handler failed for instance %s', getattr(instance, 'id', None))
 
@@ -81,14 +85,18 @@ class WorkflowsConfig(AppConfig):
             """Store task state before save so post-save handlers can detect transitions."""
             instance._previous_status = None
             instance._previous_assignee_id = None
+            instance._previous_is_deleted = False
 
             if not instance.pk:
                 return
 
-            previous_task = sender.all_objects.filter(pk=instance.pk).only('status', 'assignee_id').first()
+            previous_task = sender.all_objects.filter(pk=instance.pk).only(
+                'status', 'assignee_id', 'is_deleted'
+            ).first()
             if previous_task:
                 instance._previous_status = previous_task.status
                 instance._previous_assignee_id = previous_task.assignee_id
+                instance._previous_is_deleted = previous_task.is_deleted
 
         def _on_task_saved(sender, instance, created, **kwargs):
             """Send task notifications and invalidate task caches on task lifecycle changes."""
@@ -110,9 +118,32 @@ class WorkflowsConfig(AppConfig):
                 ):
                     notification_service.notify_task_completed(instance, instance.completed_by)
                     redis_service.on_task_completed(instance)
+                    workflow_statistics_service.record_task_completions([instance])
+
+                if instance.is_deleted and not getattr(instance, '_previous_is_deleted', True):
+                    workflow_statistics_service.retract_task_completions([instance])
             except Exception:
                 logger.exception('Task lifecycle handler failed for task %s', getattr(instance, 'id', None))
 
+        def _capture_previous_instance_state(sender, instance, update_fields=None, **kwargs):
+            """Remember whether a soft delete is about to hide a live instance."""
+            instance._previous_is_deleted = True
+            if instance.pk and update_fields and 'is_deleted' in update_fields:
+                instance._previous_is_deleted = sender.all_objects.filter(
+                    pk=instance.pk, is_deleted=True
+                ).exists()
+
+        def _on_instance_saved(sender, instance, **kwargs):
+            """Take soft-deleted instances out of the statistics rollups."""
+            try:
+                if instance.is_deleted and not getattr(instance, '_previous_is_deleted', True):
+                    workflow_statistics_service.retract_instance(instance)
+            except Exception:
+                logger.exception(
+                    'Instance soft delete handler failed for instance %s',
+                    getattr(instance, 'id', None)
+                )
+
         workflow_started.connect(
             _on_workflow_started,
             sender=WorkflowInstance,
@@ -149,3 +180,15 @@ class WorkflowsConfig(AppConfig):
             weak=False,
             dispatch_uid='workflows.workflow_task.post_save'
         )
+        pre_save.connect(
+            _capture_previous_instance_state,
+            sender=WorkflowInstance,
+            weak=False,
+            dispatch_uid='workflows.workflow_instance.pre_save'
+        )
+        post_save.connect(
+            _on_instance_saved,
+            sender=WorkflowInstance,
+            weak=False,
+            dispatch_uid='workflows.workflow_instance.post_save'
+        )
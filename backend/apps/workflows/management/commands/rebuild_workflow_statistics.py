@@ -0,0 +1,58 @@
+"""
+Rebuild the daily workflow statistics rollups from the raw instance and task rows.
+
+Backfills history after deploying the rollup tables and heals days older
+than the nightly compaction window.
+
+Usage:
+    python manage.py rebuild_workflow_statistics [--since YYYY-MM-DD] [--until YYYY-MM-DD]
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+
+from apps.workflows.models import WorkflowInstance
+from apps.workflows.services.workflow_statistics import workflow_statistics_service
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily workflow statistics rollups over a date range'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            help='First local date to rebuild (YYYY-MM-DD); defaults to the oldest instance'
+        )
+        parser.add_argument(
+            '--until',
+            help='Last local date to rebuild (YYYY-MM-DD); defaults to today'
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        until = self._parse_date(options['until']) or timezone.localdate()
+        since = self._parse_date(options['since'])
+        if since is None:
+            oldest = WorkflowInstance.all_objects.aggregate(oldest=Min('created_at'))['oldest']
+            if oldest is None:
+                self.stdout.write('No workflow instances; nothing to rebuild.')
+                return
+            since = timezone.localdate(oldest)
+        if since > until:
+            raise CommandError('--since must not be after --until')
+
+        written = workflow_statistics_service.rebuild_range(since, until)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Workflow statistics rebuilt from {since} to {until}: {written} rollup rows"
+        ))
+
+    def _parse_date(self, value):
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise CommandError(f'Invalid date: {value} (expected YYYY-MM-DD)')
@@ -0,0 +1,53 @@
+# Generated by Django 5.0.1 on 2026-10-16 22:05
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0004_alter_workflowoperationlog_operation_type'),
+        ('organizations', '0004_delete_department_department_userdepartment_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkflowDefinitionVersion',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_deleted', models.BooleanField(db_comment='Soft delete flag, records are filtered out by default', db_index=True, default=False, verbose_name='Is Deleted')),
+                ('deleted_at', models.DateTimeField(blank=True, db_comment='Timestamp when record was soft deleted', null=True, verbose_name='Deleted At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='Timestamp when record was created', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='Timestamp when record was last updated', verbose_name='Updated At')),
+                ('custom_fields', models.JSONField(blank=True, db_comment='Dynamic fields for metadata-driven extensions', default=dict, verbose_name='Custom Fields')),
+                ('version', models.IntegerField(db_comment='Definition version number when the graph was captured', default=1, verbose_name='Version')),
+                ('graph_hash', models.CharField(db_comment='SHA-256 of the canonical graph JSON', max_length=64, verbose_name='Graph Hash')),
+                ('graph_data', models.JSONField(db_comment='Workflow graph data in LogicFlow format (immutable)', default=dict, verbose_name='Graph Data')),
+                ('is_valid', models.BooleanField(db_comment='Result of graph validation at capture time', default=True, verbose_name='Is Valid')),
+                ('validation_errors', models.JSONField(blank=True, db_comment='Validation errors at capture time', default=list, verbose_name='Validation Errors')),
+                ('validation_warnings', models.JSONField(blank=True, db_comment='Validation warnings at capture time', default=list, verbose_name='Validation Warnings')),
+                ('created_by', models.ForeignKey(blank=True, db_comment='User who created this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('deleted_by', models.ForeignKey(blank=True, db_comment='User who soft deleted this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_deleted', to=settings.AUTH_USER_MODEL, verbose_name='Deleted By')),
+                ('updated_by', models.ForeignKey(blank=True, db_comment='User who last updated this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Updated By')),
+                ('organization', models.ForeignKey(blank=True, db_comment='Organization for multi-tenant data isolation', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_set', to='organizations.organization', verbose_name='Organization')),
+                ('definition', models.ForeignKey(db_comment='Definition this graph version belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='graph_versions', to='workflows.workflowdefinition', verbose_name='Workflow Definition')),
+            ],
+            options={
+                'verbose_name': 'Workflow Definition Version',
+                'verbose_name_plural': 'Workflow Definition Versions',
+                'db_table': 'workflow_definition_versions',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['definition', '-version'], name='workflow_de_definit_0deb4e_idx')],
+                'unique_together': {('definition', 'graph_hash')},
+            },
+        ),
+        migrations.AddField(
+            model_name='workflowinstance',
+            name='definition_version',
+            field=models.ForeignKey(blank=True, help_text='Published graph version this instance executes', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='instances', to='workflows.workflowdefinitionversion', verbose_name='Definition Version'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.0.1 on 2026-10-16 23:40
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0005_workflow_definition_version'),
+        ('organizations', '0004_delete_department_department_userdepartment_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkflowDailyStat',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_deleted', models.BooleanField(db_comment='Soft delete flag, records are filtered out by default', db_index=True, default=False, verbose_name='Is Deleted')),
+                ('deleted_at', models.DateTimeField(blank=True, db_comment='Timestamp when record was soft deleted', null=True, verbose_name='Deleted At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='Timestamp when record was created', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='Timestamp when record was last updated', verbose_name='Updated At')),
+                ('custom_fields', models.JSONField(blank=True, db_comment='Dynamic fields for metadata-driven extensions', default=dict, verbose_name='Custom Fields')),
+                ('day', models.DateField(db_comment='Local date the events happened on', verbose_name='Day')),
+                ('started_count', models.PositiveIntegerField(db_comment='Instances started on this day', default=0, verbose_name='Started Count')),
+                ('approved_count', models.PositiveIntegerField(db_comment='Instances approved on this day', default=0, verbose_name='Approved Count')),
+                ('rejected_count', models.PositiveIntegerField(db_comment='Instances rejected on this day', default=0, verbose_name='Rejected Count')),
+                ('duration_count', models.PositiveIntegerField(db_comment='Approved instances with a known completion duration', default=0, verbose_name='Duration Count')),
+                ('duration_sum', models.FloatField(db_comment='Sum of completion durations in seconds', default=0, verbose_name='Duration Sum')),
+                ('created_by', models.ForeignKey(blank=True, db_comment='User who created this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('deleted_by', models.ForeignKey(blank=True, db_comment='User who soft deleted this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_deleted', to=settings.AUTH_USER_MODEL, verbose_name='Deleted By')),
+                ('updated_by', models.ForeignKey(blank=True, db_comment='User who last updated this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Updated By')),
+                ('organization', models.ForeignKey(blank=True, db_comment='Organization for multi-tenant data isolation', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_set', to='organizations.organization', verbose_name='Organization')),
+                ('definition', models.ForeignKey(db_comment='Definition the statistics belong to', on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='workflows.workflowdefinition', verbose_name='Workflow Definition')),
+            ],
+            options={
+                'verbose_name': 'Workflow Daily Statistic',
+                'verbose_name_plural': 'Workflow Daily Statistics',
+                'db_table': 'workflow_daily_stats',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['organization', 'day'], name='workflow_da_organiz_8a15c2_idx')],
+                'unique_together': {('organization', 'definition', 'day')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WorkflowNodeDailyStat',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_deleted', models.BooleanField(db_comment='Soft delete flag, records are filtered out by default', db_index=True, default=False, verbose_name='Is Deleted')),
+                ('deleted_at', models.DateTimeField(blank=True, db_comment='Timestamp when record was soft deleted', null=True, verbose_name='Deleted At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='Timestamp when record was created', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='Timestamp when record was last updated', verbose_name='Updated At')),
+                ('custom_fields', models.JSONField(blank=True, db_comment='Dynamic fields for metadata-driven extensions', default=dict, verbose_name='Custom Fields')),
+                ('node_id', models.CharField(db_comment='ID of the node in the workflow graph', max_length=50, verbose_name='Node ID')),
+                ('node_name', models.CharField(blank=True, db_comment='Display name of the node', max_length=200, verbose_name='Node Name')),
+                ('day', models.DateField(db_comment='Local date the tasks were completed on', verbose_name='Day')),
+                ('completed_count', models.PositiveIntegerField(db_comment='Tasks completed (approved, rejected or returned)', default=0, verbose_name='Completed Count')),
+                ('approved_count', models.PositiveIntegerField(db_comment='Tasks approved', default=0, verbose_name='Approved Count')),
+                ('rejected_count', models.PositiveIntegerField(db_comment='Tasks rejected', default=0, verbose_name='Rejected Count')),
+                ('returned_count', models.PositiveIntegerField(db_comment='Tasks returned', default=0, verbose_name='Returned Count')),
+                ('duration_sum', models.FloatField(db_comment='Sum of task durations in seconds', default=0, verbose_name='Duration Sum')),
+                ('duration_min', models.FloatField(blank=True, db_comment='Shortest task duration in seconds', null=True, verbose_name='Duration Min')),
+                ('duration_max', models.FloatField(blank=True, db_comment='Longest task duration in seconds', null=True, verbose_name='Duration Max')),
+                ('duration_sketch', models.JSONField(blank=True, db_comment='Task counts per duration bucket, for percentile estimates', default=list, verbose_name='Duration Sketch')),
+                ('sla_breach_count', models.PositiveIntegerField(db_comment='Tasks that took longer than the node SLA', default=0, verbose_name='SLA Breach Count')),
+                ('created_by', models.ForeignKey(blank=True, db_comment='User who created this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('deleted_by', models.ForeignKey(blank=True, db_comment='User who soft deleted this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_deleted', to=settings.AUTH_USER_MODEL, verbose_name='Deleted By')),
+                ('updated_by', models.ForeignKey(blank=True, db_comment='User who last updated this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Updated By')),
+                ('organization', models.ForeignKey(blank=True, db_comment='Organization for multi-tenant data isolation', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_set', to='organizations.organization', verbose_name='Organization')),
+                ('definition', models.ForeignKey(db_comment='Definition the node belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='node_daily_stats', to='workflows.workflowdefinition', verbose_name='Workflow Definition')),
+            ],
+            options={
+                'verbose_name': 'Workflow Node Daily Statistic',
+                'verbose_name_plural': 'Workflow Node Daily Statistics',
+                'db_table': 'workflow_node_daily_stats',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['organization', 'day'], name='workflow_no_organiz_9757ff_idx')],
+                'unique_together': {('organization', 'definition', 'node_id', 'day')},
+            },
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 5.0.1 on 2026-10-16 23:55
+
+from django.db import migrations, models
+
+
+def _merge_sketches(left, right):
+    if not left:
+        return list(right or [])
+    if not right:
+        return list(left)
+    return [a + b for a, b in zip(left, right)]
+
+
+def merge_duplicate_rollups_without_org(apps, schema_editor):
+    """Fold rollup rows that the old unique_together let through for NULL organizations."""
+    WorkflowDailyStat = apps.get_model('workflows', 'WorkflowDailyStat')
+    WorkflowNodeDailyStat = apps.get_model('workflows', 'WorkflowNodeDailyStat')
+
+    kept = {}
+    for row in WorkflowDailyStat._base_manager.filter(
+        organization__isnull=True
+    ).order_by('created_at', 'id'):
+        key = (row.definition_id, row.day)
+        target = kept.setdefault(key, row)
+        if target is row:
+            continue
+        for field in ('started_count', 'approved_count', 'rejected_count',
+                      'duration_count', 'duration_sum'):
+            setattr(target, field, getattr(target, field) + getattr(row, field))
+        target.save()
+        row.delete()
+
+    kept = {}
+    for row in WorkflowNodeDailyStat._base_manager.filter(
+        organization__isnull=True
+    ).order_by('created_at', 'id'):
+        key = (row.definition_id, row.node_id, row.day)
+        target = kept.setdefault(key, row)
+        if target is row:
+            continue
+        for field in ('completed_count', 'approved_count', 'rejected_count',
+                      'returned_count', 'duration_sum', 'sla_breach_count'):
+            setattr(target, field, getattr(target, field) + getattr(row, field))
+        bounds = [value for value in (target.duration_min, row.duration_min) if value is not None]
+        target.duration_min = min(bounds) if bounds else None
+        bounds = [value for value in (target.duration_max, row.duration_max) if value is not None]
+        target.duration_max = max(bounds) if bounds else None
+        target.duration_sketch = _merge_sketches(target.duration_sketch, row.duration_sketch)
+        target.save()
+        row.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0006_workflow_daily_stats'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='workflowdailystat',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='workflownodedailystat',
+            unique_together=set(),
+        ),
+        migrations.RunPython(merge_duplicate_rollups_without_org, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='workflowdailystat',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('organization__isnull', False)),
+                fields=('organization', 'definition', 'day'),
+                name='unique_workflow_daily_stat_per_org',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='workflowdailystat',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('organization__isnull', True)),
+                fields=('definition', 'day'),
+                name='unique_workflow_daily_stat_without_org',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='workflownodedailystat',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('organization__isnull', False)),
+                fields=('organization', 'definition', 'node_id', 'day'),
+                name='unique_workflow_node_daily_stat_per_org',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='workflownodedailystat',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('organization__isnull', True)),
+                fields=('definition', 'node_id', 'day'),
+                name='unique_workflow_node_daily_stat_without_org',
+            ),
+        ),
+    ]
@@ -2,17 +2,22 @@
 Workflow models for workflow definition and execution.
 """
 from apps.workflows.models.workflow_definition import WorkflowDefinition
+from apps.workflows.models.workflow_definition_version import WorkflowDefinitionVersion
 from apps.workflows.models.workflow_template import WorkflowTemplate
 from apps.workflows.models.workflow_operation_log import WorkflowOperationLog
 from apps.workflows.models.workflow_instance import WorkflowInstance
 from apps.workflows.models.workflow_task import WorkflowTask
 from apps.workflows.models.workflow_approval import WorkflowApproval
+from apps.workflows.models.workflow_statistics import WorkflowDailyStat, WorkflowNodeDailyStat
 
 __all__ = [
     'WorkflowDefinition',
+    'WorkflowDefinitionVersion',
     'WorkflowTemplate',
     'WorkflowOperationLog',
     'WorkflowInstance',
     'WorkflowTask',
     'WorkflowApproval',
+    'WorkflowDailyStat',
+    'WorkflowNodeDailyStat',
 ]
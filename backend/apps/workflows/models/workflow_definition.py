@@ -323,6 +323,10 @@ class WorkflowDefinition(BaseModel):
         self.published_at = timezone.now()
         self.published_by = user
         self.save(update_fields=['status', 'published_at', 'published_by', 'updated_at'])
+
+        # Store and validate the published graph once
+        from apps.workflows.models.workflow_definition_version import WorkflowDefinitionVersion
+        WorkflowDefinitionVersion.capture(self)
         return True
 
     def unpublish(self):
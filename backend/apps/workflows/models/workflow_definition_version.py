@@ -0,0 +1,125 @@
+"""
+WorkflowDefinitionVersion Model - Immutable published workflow graphs.
+
+Stores one copy of a definition's graph per published version so
+instances reference the graph they were started with instead of each
+holding a full snapshot.
+"""
+import hashlib
+import json
+
+from django.db import IntegrityError, models, transaction
+from django.utils.translation import gettext_lazy as _
+
+from apps.common.models import BaseModel
+
+
+class WorkflowDefinitionVersion(BaseModel):
+    """
+    Immutable graph of a workflow definition at publish time.
+
+    A definition edited in place keeps its version number, so rows are
+    keyed by the graph content hash as well; an unchanged graph is
+    stored (and validated) once.
+    """
+
+    definition = models.ForeignKey(
+        'workflows.WorkflowDefinition',
+        on_delete=models.CASCADE,
+        related_name='graph_versions',
+        verbose_name=_('Workflow Definition'),
+        db_comment='Definition this graph version belongs to'
+    )
+    version = models.IntegerField(
+        default=1,
+        verbose_name=_('Version'),
+        db_comment='Definition version number when the graph was captured'
+    )
+    graph_hash = models.CharField(
+        max_length=64,
+        verbose_name=_('Graph Hash'),
+        db_comment='SHA-256 of the canonical graph JSON'
+    )
+    graph_data = models.JSONField(
+        default=dict,
+        verbose_name=_('Graph Data'),
+        db_comment='Workflow graph data in LogicFlow format (immutable)'
+    )
+    is_valid = models.BooleanField(
+        default=True,
+        verbose_name=_('Is Valid'),
+        db_comment='Result of graph validation at capture time'
+    )
+    validation_errors = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_('Validation Errors'),
+        db_comment='Validation errors at capture time'
+    )
+    validation_warnings = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_('Validation Warnings'),
+        db_comment='Validation warnings at capture time'
+    )
+
+    class Meta:
+        db_table = 'workflow_definition_versions'
+        verbose_name = _('Workflow Definition Version')
+        verbose_name_plural = _('Workflow Definition Versions')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['definition', '-version']),
+        ]
+        unique_together = [
+            ['definition', 'graph_hash'],
+        ]
+
+    def __str__(self):
+        return f'{self.definition_id} v{self.version} ({self.graph_hash[:8]})'
+
+    @staticmethod
+    def compute_graph_hash(graph_data) -> str:
+        """Hash of the canonical (key-sorted) graph JSON."""
+        payload = json.dumps(graph_data or {}, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def capture(cls, definition):
+        """
+        Get or create the version row for a definition's current graph.
+
+        Validation runs only when a new row is created.
+
+        Args:
+            definition: WorkflowDefinition instance
+
+        Returns:
+            WorkflowDefinitionVersion instance
+        """
+        graph_hash = cls.compute_graph_hash(definition.graph_data)
+        existing = cls.all_objects.filter(
+            definition_id=definition.pk, graph_hash=graph_hash
+        ).first()
+        if existing is not None:
+            return existing
+
+        from apps.workflows.services.workflow_validation import WorkflowValidationService
+        is_valid, errors, warnings = WorkflowValidationService().validate(definition.graph_data)
+
+        try:
+            with transaction.atomic():
+                return cls.all_objects.create(
+                    definition=definition,
+                    version=definition.version,
+                    graph_hash=graph_hash,
+                    graph_data=definition.graph_data,
+                    is_valid=is_valid,
+                    validation_errors=[str(error) for error in errors],
+                    validation_warnings=[str(warning) for warning in warnings],
+                    organization=definition.organization,
+                    created_by=definition.published_by or definition.created_by,
+                )
+        except IntegrityError:
+            # Captured concurrently by another request
+            return cls.all_objects.get(definition_id=definition.pk, graph_hash=graph_hash)
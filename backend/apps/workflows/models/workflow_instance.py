@@ -186,7 +186,19 @@ class WorkflowInstance(BaseModel):
         help_text=_('Workflow variables and form data')
     )
 
-    # Snapshot of graph data at time of instance creation
+    # Immutable published graph this instance executes
+    definition_version = models.ForeignKey(
+        'workflows.WorkflowDefinitionVersion',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='instances',
+        verbose_name=_('Definition Version'),
+        help_text=_('Published graph version this instance executes')
+    )
+
+    # Snapshot of graph data at time of instance creation (legacy instances;
+    # new instances reference definition_version instead)
     graph_snapshot = models.JSONField(
         default=dict,
         blank=True,
@@ -307,6 +319,17 @@ class WorkflowInstance(BaseModel):
         delta = end_time - self.started_at
         return round(delta.total_seconds() / 3600, 2)
 
+    def get_graph_data(self):
+        """
+        Get the workflow graph this instance executes.
+
+        Falls back to the stored snapshot for legacy instances and to the
+        definition's current graph when neither is present.
+        """
+        if self.definition_version_id:
+            return self.definition_version.graph_data
+        return self.graph_snapshot or getattr(self.definition, 'graph_data', {}) or {}
+
     def start(self, user=None):
         """
         Start the workflow instance.
@@ -367,6 +367,33 @@ class WorkflowOperationLog(BaseModel):
         Returns:
             WorkflowOperationLog: The created log entry
         """
+        entry = cls.build_operation(
+            operation_type, actor, workflow_instance=workflow_instance,
+            workflow_task=workflow_task, result=result, details=details, **kwargs
+        )
+        entry.save(force_insert=True)
+        return entry
+
+    @classmethod
+    def build_operation(cls, operation_type, actor, workflow_instance=None,
+                        workflow_task=None, result='success', details=None, **kwargs):
+        """
+        Build an unsaved log entry for a generic workflow operation.
+
+        Used by batch code paths that write entries with bulk_create.
+
+        Args:
+            operation_type: Type of operation (start, complete, approve, reject, etc.)
+            actor: User performing the operation
+            workflow_instance: Related workflow instance (optional)
+            workflow_task: Related workflow task (optional)
+            result: Operation result (success, failure, partial)
+            details: Additional operation details
+            **kwargs: Additional fields
+
+        Returns:
+            WorkflowOperationLog: Unsaved log entry
+        """
         # Determine target type and name
         if workflow_instance:
             target_type = 'workflow_instance'
@@ -381,7 +408,7 @@ class WorkflowOperationLog(BaseModel):
             target_name = None
             target_code = None
 
-        return cls.objects.create(
+        return cls(
             actor=actor,
             operation_type=operation_type,
             target_type=target_type,
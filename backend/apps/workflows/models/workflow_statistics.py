@@ -0,0 +1,178 @@
+"""
+Daily workflow statistics rollups.
+
+Rows are maintained incrementally as instances finish and tasks
+complete, and rebuilt from the raw rows by the nightly compaction job.
+Statistics and SLA reports aggregate these rows instead of scanning
+WorkflowInstance and WorkflowTask.
+"""
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.common.models import BaseModel
+
+
+class WorkflowDailyStat(BaseModel):
+    """Per-day instance counts and completion durations of one definition."""
+
+    definition = models.ForeignKey(
+        'workflows.WorkflowDefinition',
+        on_delete=models.CASCADE,
+        related_name='daily_stats',
+        verbose_name=_('Workflow Definition'),
+        db_comment='Definition the statistics belong to'
+    )
+    day = models.DateField(
+        verbose_name=_('Day'),
+        db_comment='Local date the events happened on'
+    )
+    started_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Started Count'),
+        db_comment='Instances started on this day'
+    )
+    approved_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Approved Count'),
+        db_comment='Instances approved on this day'
+    )
+    rejected_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Rejected Count'),
+        db_comment='Instances rejected on this day'
+    )
+    duration_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Duration Count'),
+        db_comment='Approved instances with a known completion duration'
+    )
+    duration_sum = models.FloatField(
+        default=0,
+        verbose_name=_('Duration Sum'),
+        db_comment='Sum of completion durations in seconds'
+    )
+
+    class Meta:
+        db_table = 'workflow_daily_stats'
+        verbose_name = _('Workflow Daily Statistic')
+        verbose_name_plural = _('Workflow Daily Statistics')
+        ordering = ['-day']
+        indexes = [
+            models.Index(fields=['organization', 'day']),
+        ]
+        # NULL organizations never collide in a plain unique index
+        constraints = [
+            models.UniqueConstraint(
+                fields=['organization', 'definition', 'day'],
+                condition=models.Q(organization__isnull=False),
+                name='unique_workflow_daily_stat_per_org'
+            ),
+            models.UniqueConstraint(
+                fields=['definition', 'day'],
+                condition=models.Q(organization__isnull=True),
+                name='unique_workflow_daily_stat_without_org'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.definition_id} {self.day}'
+
+
+class WorkflowNodeDailyStat(BaseModel):
+    """Per-day completed task statistics of one workflow node."""
+
+    definition = models.ForeignKey(
+        'workflows.WorkflowDefinition',
+        on_delete=models.CASCADE,
+        related_name='node_daily_stats',
+        verbose_name=_('Workflow Definition'),
+        db_comment='Definition the node belongs to'
+    )
+    node_id = models.CharField(
+        max_length=50,
+        verbose_name=_('Node ID'),
+        db_comment='ID of the node in the workflow graph'
+    )
+    node_name = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name=_('Node Name'),
+        db_comment='Display name of the node'
+    )
+    day = models.DateField(
+        verbose_name=_('Day'),
+        db_comment='Local date the tasks were completed on'
+    )
+    completed_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Completed Count'),
+        db_comment='Tasks completed (approved, rejected or returned)'
+    )
+    approved_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Approved Count'),
+        db_comment='Tasks approved'
+    )
+    rejected_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Rejected Count'),
+        db_comment='Tasks rejected'
+    )
+    returned_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Returned Count'),
+        db_comment='Tasks returned'
+    )
+    duration_sum = models.FloatField(
+        default=0,
+        verbose_name=_('Duration Sum'),
+        db_comment='Sum of task durations in seconds'
+    )
+    duration_min = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name=_('Duration Min'),
+        db_comment='Shortest task duration in seconds'
+    )
+    duration_max = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name=_('Duration Max'),
+        db_comment='Longest task duration in seconds'
+    )
+    duration_sketch = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_('Duration Sketch'),
+        db_comment='Task counts per duration bucket, for percentile estimates'
+    )
+    sla_breach_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('SLA Breach Count'),
+        db_comment='Tasks that took longer than the node SLA'
+    )
+
+    class Meta:
+        db_table = 'workflow_node_daily_stats'
+        verbose_name = _('Workflow Node Daily Statistic')
+        verbose_name_plural = _('Workflow Node Daily Statistics')
+        ordering = ['-day']
+        indexes = [
+            models.Index(fields=['organization', 'day']),
+        ]
+        # NULL organizations never collide in a plain unique index
+        constraints = [
+            models.UniqueConstraint(
+                fields=['organization', 'definition', 'node_id', 'day'],
+                condition=models.Q(organization__isnull=False),
+                name='unique_workflow_node_daily_stat_per_org'
+            ),
+            models.UniqueConstraint(
+                fields=['definition', 'node_id', 'day'],
+                condition=models.Q(organization__isnull=True),
+                name='unique_workflow_node_daily_stat_without_org'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.definition_id}:{self.node_id} {self.day}'
@@ -77,6 +77,7 @@ class WorkflowInstanceDetailSerializer(BaseModelSerializer):
     is_terminal = serializers.BooleanField(read_only=True)
     pending_tasks_count = serializers.IntegerField(read_only=True)
     approval_chain = serializers.SerializerMethodField()
+    graph_snapshot = serializers.SerializerMethodField()
 
     class Meta(BaseModelSerializer.Meta):
         model = WorkflowInstance
@@ -123,6 +124,10 @@ class WorkflowInstanceDetailSerializer(BaseModelSerializer):
             'version': obj.definition.version,
         }
 
+    def get_graph_snapshot(self, obj):
+        """Get the graph the instance executes (shared definition version)."""
+        return obj.get_graph_data()
+
     def get_approval_chain(self, obj):
         """Get approval chain."""
         return obj.get_approval_chain()
@@ -321,24 +321,18 @@ class ApproverResolver:
         if not user_dept or not user_dept.department:
             return []
 
-        current_department = user_dept.department
-        leaders = []
-
-        for _ in range(level):
-            if not current_department or current_department.is_deleted:
-                break
+        department = user_dept.department
+        if department.is_deleted:
+            return []
 
+        # Own department plus live ancestors, nearest first, in one query
+        leaders = []
+        for current_department in department.get_ancestors(include_self=True)[:level]:
             if current_department.leader:
                 leader = current_department.leader
                 if leader.is_active:
                     leaders.append(leader)
 
-            # Move to parent department
-            if current_department.parent and not current_department.parent.is_deleted:
-                current_department = current_department.parent
-            else:
-                break
-
         return leaders
 
     def _resolve_initiator_type(self, instance):
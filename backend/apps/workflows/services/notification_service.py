@@ -8,6 +8,8 @@ Handles sending notifications for workflow lifecycle events:
 - Task overdue alerts
 """
 
+import threading
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from django.conf import settings
 from django.template.loader import render_to_string
@@ -19,6 +21,9 @@ import logging
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+# Notifications held by NotificationService.coalesce() on this thread
+_coalesce_state = threading.local()
+
 
 class NotificationService:
     """
@@ -96,9 +101,95 @@ class NotificationService:
             logger.warning(f"No recipients for notification: {event_type}")
             return {}
         
+        pending = getattr(_coalesce_state, 'pending', None)
+        if pending is not None:
+            pending.append((event_type, context, list(recipients), channels))
+            return {}
+
+        return self._deliver(event_type, [context], recipients, channels)
+
+    @contextmanager
+    def coalesce(self):
+        """
+        Hold notifications sent in this block and deliver them on exit.
+
+        Notifications of the same event type are merged per recipient, so
+        a recipient gets one message per event type however many events
+        the block produced. Nested blocks join the outermost one.
+        """
+        if getattr(_coalesce_state, 'pending', None) is not None:
+            yield
+            return
+
+        _coalesce_state.pending = []
+        try:
+            yield
+        finally:
+            pending, _coalesce_state.pending = _coalesce_state.pending, None
+            self._send_coalesced(pending)
+
+    def _send_coalesced(self, pending) -> None:
+        """Deliver held notifications, one message per recipient and event type."""
+        by_recipient = {}
+        for index, (event_type, _context, recipients, channels) in enumerate(pending):
+            for user in recipients:
+                if user is None:
+                    continue
+                key = (event_type, tuple(channels or ()), user.pk)
+                by_recipient.setdefault(key, (user, []))[1].append(index)
+
+        # Recipients of exactly the same events share one message
+        batches = {}
+        for (event_type, channels, _user_id), (user, indexes) in by_recipient.items():
+            batches.setdefault((event_type, channels, tuple(indexes)), []).append(user)
+
+        for (event_type, channels, indexes), recipients in batches.items():
+            try:
+                self._deliver(
+                    event_type,
+                    [pending[index][1] for index in indexes],
+                    recipients,
+                    list(channels) or None
+                )
+            except Exception as e:
+                logger.error(f"Failed to send coalesced notification {event_type}: {e}")
+
+    def _deliver(
+        self,
+        event_type: str,
+        contexts: List[Dict[str, Any]],
+        recipients: List[User],
+        channels: Optional[List[str]] = None
+    ) -> Dict[str, bool]:
+        """Render and send one message covering one or more events."""
+        config = self.NOTIFICATION_TYPES[event_type]
+
         # Use provided channels or default from config
         use_channels = channels or config['channels']
-        
+
+        rendered = [self._render(config, context) for context in contexts]
+        subject, html_content = rendered[0]
+        if len(rendered) > 1:
+            subject = str(_('{subject} (+{count} more)')).format(
+                subject=subject, count=len(rendered) - 1
+            )
+            html_content = '<hr>'.join(html for _subject, html in rendered)
+
+        results = {}
+
+        # Send via each configured channel
+        for channel in use_channels:
+            if channel == 'email':
+                results['email'] = self._send_email(recipients, subject, html_content)
+            elif channel == 'push':
+                results['push'] = self._send_push(recipients, subject, contexts)
+            elif channel == 'in_app':
+                results['in_app'] = self._send_in_app(recipients, subject, contexts)
+
+        return results
+
+    def _render(self, config: Dict[str, Any], context: Dict[str, Any]):
+        """Render the subject and HTML body of one notification."""
         # Render subject with context
         try:
             subject = str(config['subject']).format(**context)
@@ -112,19 +203,8 @@ class NotificationService:
         except Exception as e:
             logger.error(f"Failed to render notification template: {e}")
             html_content = f"<p>{subject}</p>"
-        
-        results = {}
-        
-        # Send via each configured channel
-        for channel in use_channels:
-            if channel == 'email':
-                results['email'] = self._send_email(recipients, subject, html_content)
-            elif channel == 'push':
-                results['push'] = self._send_push(recipients, subject, context)
-            elif channel == 'in_app':
-                results['in_app'] = self._send_in_app(recipients, subject, context)
-        
-        return results
+
+        return subject, html_content
     
     def _send_email(
         self,
@@ -169,9 +249,14 @@ class NotificationService:
         self,
         recipients: List[User],
         title: str,
-        context: Dict[str, Any]
+        contexts: List[Dict[str, Any]]
     ) -> bool:
-        """Send push notification (placeholder for future implementation)."""
+        """
+        Send push notification (placeholder for future implementation).
+
+        contexts holds one entry per event covered by the message, so a
+        coalesced push can link every task rather than just the first.
+        """
         if not self.push_enabled:
             logger.debug("Push notifications disabled")
             return False
@@ -188,10 +273,12 @@ class NotificationService:
         self,
         recipients: List[User],
         title: str,
-        context: Dict[str, Any]
+        contexts: List[Dict[str, Any]]
     ) -> bool:
         """Send in-app notification.
         
+        contexts holds one entry per event covered by the message.
+
         Note: In-app notifications are fully implemented via Notification model
         and NotificationViewSet with inbox channel. See apps/notifications module.
         """
@@ -179,6 +179,7 @@ class SLAService:
         Generate bottleneck report.
         
         Identifies tasks/nodes that are taking longer than expected.
+        Reads the per-node daily rollups of the tasks completed in the period.
         
         Args:
             days: Number of days to analyze
@@ -187,60 +188,40 @@ class SLAService:
         Returns:
             List of bottleneck entries
         """
-        from apps.workflows.models import WorkflowTask
-        
-        start_date = timezone.now() - timedelta(days=days)
+        from apps.workflows.models import WorkflowDefinition, WorkflowNodeDailyStat
+        from apps.workflows.services.workflow_statistics import workflow_statistics_service
         
-        # Get completed tasks with duration
-        tasks = WorkflowTask.objects.filter(
-            created_at__gte=start_date,
-            completed_at__isnull=False,
-            status__in=['approved', 'rejected', 'returned']
-        ).select_related(
-            'instance__definition'
-        )
+        since = timezone.localdate() - timedelta(days=days)
         
+        # Per-node durations merged from the daily rollups
+        rollups = WorkflowNodeDailyStat.objects.all()
         if organization_id:
-            tasks = tasks.filter(
-                instance__organization_id=organization_id
+            rollups = rollups.filter(organization_id=organization_id)
+        summaries = workflow_statistics_service.get_node_summaries(since=since, queryset=rollups)
+        
+        # SLA thresholds of all involved definitions, read once
+        definitions = {
+            str(definition.id): definition
+            for definition in WorkflowDefinition.objects.filter(
+                id__in={summary['workflow_definition_id'] for summary in summaries}
             )
-        
-        # Group by workflow definition and node
-        bottlenecks = {}
-        
-        for task in tasks:
-            key = (
-                task.instance.definition.id,
-                task.node_id
-            )
-            
-            if key not in bottlenecks:
-                bottlenecks[key] = {
-                    'workflow_definition_id': str(task.instance.definition.id),
-                    'workflow_name': task.instance.definition.name,
-                    'node_id': task.node_id,
-                    'node_name': task.node_name or task.node_id,
-                    'durations': [],
-                    'task_count': 0
-                }
-            
-            duration = (task.completed_at - task.created_at).total_seconds() / 3600
-            bottlenecks[key]['durations'].append(duration)
-            bottlenecks[key]['task_count'] += 1
+        }
         
         # Calculate statistics and identify bottlenecks
         result = []
         
-        for key, data in bottlenecks.items():
-            durations = data['durations']
-            avg_duration = sum(durations) / len(durations)
-            max_duration = max(durations)
-            min_duration = min(durations)
+        for summary in summaries:
+            avg_duration = summary['avg_duration_hours']
             
             # Get SLA threshold for this node
-            sla_hours = self._get_sla_hours_for_node(
-                data['workflow_definition_id'],
-                data['node_id']
+            definition = definitions.get(summary['workflow_definition_id'])
+            sla_config = (
+                self._get_sla_from_definition(definition, summary['node_id'])
+                if definition else None
+            )
+            sla_hours = (
+                sla_config.get('sla_hours', self.DEFAULT_SLA_HOURS)
+                if sla_config else self.DEFAULT_SLA_HOURS
             )
             
             # Determine if this is a bottleneck
@@ -248,16 +229,21 @@ class SLAService:
             severity = 'high' if avg_duration > sla_hours * 1.5 else ('medium' if avg_duration > sla_hours else 'low')
             
             result.append({
-                **data,
+                **summary,
                 'avg_duration_hours': round(avg_duration, 2),
-                'max_duration_hours': round(max_duration, 2),
-                'min_duration_hours': round(min_duration, 2),
+                'max_duration_hours': round(summary['max_duration_hours'], 2),
+                'min_duration_hours': round(summary['min_duration_hours'], 2),
+                'p50_duration_hours': round(summary['p50_duration_hours'], 2),
+                'p90_duration_hours': round(summary['p90_duration_hours'], 2),
                 'sla_hours': sla_hours,
                 'is_bottleneck': is_bottleneck,
                 'severity': severity if is_bottleneck else 'none',
+                # Breaches are counted against the node SLA when each task completed
                 'sla_compliance_rate': round(
-                    (len([d for d in durations if d <= sla_hours]) / len(durations)) * 100, 1
-                ) if durations else 0
+                    (summary['task_count'] - summary['sla_breach_count'])
+                    / summary['task_count'] * 100,
+                    1
+                )
             })
         
         # Sort by average duration (descending)
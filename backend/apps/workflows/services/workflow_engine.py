@@ -9,18 +9,29 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 
+import json
+import logging
 import uuid
 from collections import deque
 
 from apps.workflows.models import (
-    WorkflowDefinition, WorkflowInstance, WorkflowTask, WorkflowApproval
+    WorkflowDefinition, WorkflowInstance, WorkflowTask, WorkflowApproval,
+    WorkflowOperationLog
 )
 from apps.workflows.services.approver_resolver import ApproverResolver
 from apps.workflows.services.condition_evaluator import ConditionEvaluator
+from apps.workflows.services.workflow_graph import (
+    find_default_edge, get_compiled_graph, get_definition_version, get_instance_graph
+)
 from apps.workflows.signals import (
     workflow_started, workflow_completed, workflow_rejected, workflow_cancelled
 )
 
+logger = logging.getLogger(__name__)
+
+# Node types whose processing creates tasks when a workflow moves on
+TASK_CREATING_NODE_TYPES = ('approval', 'condition', 'cc', 'parallel')
+
 
 class WorkflowEngine:
     """
@@ -47,6 +58,8 @@ class WorkflowEngine:
         self.definition = definition
         self.approver_resolver = ApproverResolver()
         self.condition_evaluator = ConditionEvaluator()
+        # Resolved approvers shared across one execute_tasks() batch
+        self._approver_cache = None
 
     def start_workflow(self, definition, business_object_code, business_id,
                       business_no=None, initiator=None, variables=None,
@@ -75,13 +88,12 @@ class WorkflowEngine:
         if definition.status != 'published':
             return False, None, _('Only published workflows can be started.')
 
-        # Validate graph structure
-        from apps.workflows.services.workflow_validation import WorkflowValidationService
-        validator = WorkflowValidationService()
-        is_valid, errors, warnings = validator.validate(definition.graph_data)
-        if not is_valid:
+        # Compiled graph of the published version; validated once per version
+        definition_version = get_definition_version(definition)
+        graph = get_compiled_graph(definition_version)
+        if not graph.is_valid:
             return False, None, _('Workflow definition is invalid: %(errors)s') % {
-                'errors': '; '.join(errors)
+                'errors': '; '.join(graph.errors)
             }
 
         try:
@@ -90,9 +102,7 @@ class WorkflowEngine:
                 instance_no = self._generate_instance_no(definition)
 
                 # Get start node
-                graph_data = definition.graph_data
-                nodes = graph_data.get('nodes', [])
-                start_node = next((n for n in nodes if n.get('type') == 'start'), None)
+                start_node = graph.start_node
 
                 if not start_node:
                     return False, None, _('Workflow must have a start node.')
@@ -107,7 +117,7 @@ class WorkflowEngine:
                     initiator=initiator,
                     status=WorkflowInstance.STATUS_RUNNING,
                     variables=variables or {},
-                    graph_snapshot=graph_data,
+                    definition_version=definition_version,
                     title=title,
                     description=description,
                     priority=priority,
@@ -128,10 +138,10 @@ class WorkflowEngine:
                 )
 
                 # Get next nodes after start
-                next_nodes = self._get_next_nodes(graph_data, start_node['id'])
+                next_nodes = graph.get_next_nodes(start_node['id'])
 
                 # Create tasks for next nodes
-                self._create_tasks_for_nodes(instance, next_nodes, graph_data)
+                self._create_tasks_for_nodes(instance, next_nodes, graph)
 
                 # Update instance progress
                 instance.update_progress()
@@ -186,12 +196,8 @@ class WorkflowEngine:
 
         try:
             with transaction.atomic():
-                # Fall back to the workflow definition graph for legacy instances
-                # that were created without a graph snapshot.
-                graph_data = instance.graph_snapshot or getattr(
-                    instance.definition, 'graph_data', {}
-                )
-                node = self._get_node_by_id(graph_data, task.node_id)
+                graph = get_instance_graph(instance)
+                node = graph.get_node(task.node_id)
 
                 if not node:
                     return False, None, _('Node not found in workflow graph.')
@@ -225,7 +231,7 @@ class WorkflowEngine:
 
                 if should_proceed:
                     # Get next nodes
-                    next_nodes = self._get_next_nodes(graph_data, task.node_id)
+                    next_nodes = graph.get_next_nodes(task.node_id)
 
                     if not next_nodes:
                         # No more nodes, workflow is complete
@@ -237,7 +243,7 @@ class WorkflowEngine:
                     else:
                         # Process next nodes
                         pending_created = self._process_next_nodes(
-                            instance, next_nodes, graph_data, task.node_id
+                            instance, next_nodes, graph, task.node_id
                         )
 
                         if not pending_created:
@@ -259,6 +265,246 @@ class WorkflowEngine:
         except Exception as e:
             return False, None, _('Failed to execute task: %(error)s') % {'error': str(e)}
 
+    def execute_tasks(self, tasks, action, actor, comment=None):
+        """
+        Execute the same action on many tasks (bulk approve/reject).
+
+        Results match calling execute_task() once per task, in order.
+        Transitions that only change task and instance state (rejections,
+        approvals that wait for other approvers or finish the workflow)
+        are written with bulk statements in one transaction; approvals
+        that move a workflow on to new task-creating nodes, later tasks
+        of an already handled instance and other actions go through
+        execute_task(). Compiled graphs and resolved approvers are reused
+        across the batch and notifications are coalesced per recipient.
+
+        Args:
+            tasks: WorkflowTask objects to execute
+            action: The action to take ('approve', 'reject', 'return')
+            actor: User performing the action
+            comment: Optional comment
+
+        Returns:
+            list: (success, instance, error) tuples aligned with tasks
+        """
+        from apps.workflows.services.notification_service import notification_service
+
+        tasks = list(tasks)
+        results = [None] * len(tasks)
+        self._approver_cache = {}
+        try:
+            with notification_service.coalesce():
+                deferred = self._execute_tasks_in_bulk(tasks, action, actor, comment, results)
+                for index in deferred:
+                    results[index] = self.execute_task(tasks[index], action, actor, comment)
+        finally:
+            self._approver_cache = None
+
+        return results
+
+    def _execute_tasks_in_bulk(self, tasks, action, actor, comment, results):
+        """
+        Apply the bulk-writable transitions of a batch.
+
+        Fills results for handled and invalid tasks and returns the indexes
+        of tasks left for execute_task().
+        """
+        deferred = []
+        candidates = {}
+        for index, task in enumerate(tasks):
+            if task.status != WorkflowTask.STATUS_PENDING:
+                results[index] = (False, None, _('Task is not pending.'))
+            elif task.assignee_id != actor.pk:
+                results[index] = (False, None, _('You are not authorized to perform this action.'))
+            elif action not in ('approve', 'reject') or task.instance_id in candidates:
+                deferred.append(index)
+            else:
+                candidates[task.instance_id] = index
+
+        if not candidates:
+            return deferred
+
+        instances = WorkflowInstance.all_objects.select_related(
+            'definition', 'definition_version', 'initiator'
+        ).in_bulk(list(candidates))
+        instance_tasks = {}
+        for sibling in WorkflowTask.objects.filter(instance_id__in=list(candidates)):
+            instance_tasks.setdefault(sibling.instance_id, []).append(sibling)
+
+        now = timezone.now()
+        handled = []
+        completed, rejected, progressed = [], [], []
+        for instance_id, index in candidates.items():
+            task = tasks[index]
+            instance = instances.get(instance_id)
+            if instance is None or instance.status not in WorkflowInstance.ACTIVE_STATUSES:
+                deferred.append(index)
+                continue
+
+            graph = get_instance_graph(instance)
+            node = graph.get_node(task.node_id)
+            if not node:
+                deferred.append(index)
+                continue
+
+            # Sibling tasks as they will be once this task is completed
+            siblings = [
+                sibling for sibling in instance_tasks.get(instance_id, [])
+                if sibling.pk != task.pk
+            ]
+            statuses = [(sibling.node_id, sibling.status, sibling.sequence) for sibling in siblings]
+            task_status = (
+                WorkflowTask.STATUS_APPROVED if action == 'approve'
+                else WorkflowTask.STATUS_REJECTED
+            )
+            statuses.append((task.node_id, task_status, task.sequence))
+
+            if action == 'reject':
+                rejected.append(instance)
+            else:
+                approve_type = node.get('properties', {}).get('approveType', 'or')
+                node_statuses = [
+                    (status, sequence) for node_id, status, sequence in statuses
+                    if node_id == task.node_id
+                ]
+                if not self._node_statuses_allow_proceed(node_statuses, approve_type):
+                    progressed.append((instance, statuses))
+                else:
+                    next_nodes = graph.get_next_nodes(task.node_id)
+                    if any(next_node.get('type') in TASK_CREATING_NODE_TYPES
+                           for next_node in next_nodes):
+                        deferred.append(index)
+                        continue
+                    has_pending = any(
+                        status == WorkflowTask.STATUS_PENDING
+                        for _node_id, status, _sequence in statuses
+                    )
+                    if next_nodes and has_pending:
+                        progressed.append((instance, statuses))
+                    else:
+                        completed.append(instance)
+
+            task.instance = instance
+            handled.append(index)
+
+        if handled:
+            self._write_bulk_transitions(
+                [tasks[index] for index in handled], action, actor, comment, now,
+                completed, rejected, progressed, handled, results
+            )
+
+        return sorted(deferred)
+
+    def _write_bulk_transitions(self, tasks, action, actor, comment, now,
+                                completed, rejected, progressed, handled, results):
+        """Write a batch of task transitions with bulk statements."""
+        task_status = (
+            WorkflowTask.STATUS_APPROVED if action == 'approve' else WorkflowTask.STATUS_REJECTED
+        )
+        approval_action = (
+            WorkflowApproval.ACTION_APPROVE if action == 'approve'
+            else WorkflowApproval.ACTION_REJECT
+        )
+
+        try:
+            with transaction.atomic():
+                WorkflowTask.all_objects.filter(pk__in=[task.pk for task in tasks]).update(
+                    status=task_status,
+                    completed_at=now,
+                    completed_by=actor,
+                    updated_at=now,
+                )
+                WorkflowApproval.objects.bulk_create([
+                    WorkflowApproval(
+                        task=task, approver=actor, action=approval_action, comment=comment
+                    )
+                    for task in tasks
+                ])
+
+                for instance in rejected:
+                    instance.status = WorkflowInstance.STATUS_REJECTED
+                    instance.completed_at = now
+                    instance.termination_reason = comment
+                    instance.updated_at = now
+                WorkflowInstance.all_objects.bulk_update(
+                    rejected, ['status', 'completed_at', 'termination_reason', 'updated_at']
+                )
+
+                for instance in completed:
+                    instance.status = WorkflowInstance.STATUS_APPROVED
+                    instance.completed_at = now
+                    instance.current_node_id = None
+                    instance.current_node_name = None
+                    instance.updated_at = now
+                WorkflowInstance.all_objects.bulk_update(
+                    completed,
+                    ['status', 'completed_at', 'current_node_id', 'current_node_name', 'updated_at']
+                )
+                WorkflowOperationLog.objects.bulk_create([
+                    WorkflowOperationLog.build_operation(
+                        operation_type='complete',
+                        actor=instance.initiator,
+                        workflow_instance=instance,
+                        result='success'
+                    )
+                    for instance in completed
+                ])
+
+                for instance, statuses in progressed:
+                    instance.total_tasks = len(statuses)
+                    instance.completed_tasks = sum(
+                        1 for _node_id, status, _sequence in statuses
+                        if status in (WorkflowTask.STATUS_APPROVED, WorkflowTask.STATUS_REJECTED)
+                    )
+                    instance.updated_at = now
+                WorkflowInstance.all_objects.bulk_update(
+                    [instance for instance, _statuses in progressed],
+                    ['total_tasks', 'completed_tasks', 'updated_at']
+                )
+
+                for instance in rejected:
+                    workflow_rejected.send(
+                        sender=WorkflowInstance,
+                        instance=instance,
+                        reason=comment,
+                    )
+                for instance in completed:
+                    workflow_completed.send(
+                        sender=WorkflowInstance,
+                        instance=instance,
+                    )
+        except Exception as e:
+            error = _('Failed to execute task: %(error)s') % {'error': str(e)}
+            for index in handled:
+                results[index] = (False, None, error)
+            return
+
+        for index, task in zip(handled, tasks):
+            task.status = task_status
+            task.completed_at = now
+            task.completed_by = actor
+            results[index] = (True, task.instance, None)
+
+        self._after_bulk_task_completion(tasks, actor)
+
+    def _after_bulk_task_completion(self, tasks, actor):
+        """Run the task post_save side effects skipped by bulk updates."""
+        from apps.common.services.redis_service import redis_service
+        from apps.workflows.services.notification_service import notification_service
+        from apps.workflows.services.workflow_statistics import workflow_statistics_service
+
+        try:
+            workflow_statistics_service.record_task_completions(tasks)
+            for task in tasks:
+                notification_service.notify_task_completed(task, actor)
+            for organization_id in {task.organization_id for task in tasks}:
+                redis_service.invalidate_workflow_stats(
+                    redis_service._normalize_organization_id(organization_id)
+                )
+            redis_service.invalidate_user_tasks_cache(str(actor.pk))
+        except Exception:
+            logger.exception('Bulk task completion handler failed for %s tasks', len(tasks))
+
     def withdraw_instance(self, instance, user):
         """
         Withdraw a workflow instance.
@@ -364,27 +610,15 @@ class WorkflowEngine:
         random_suffix = uuid.uuid4().hex[:6].upper()
         return f'WI-{prefix}-{timestamp}-{random_suffix}'
 
-    def _get_node_by_id(self, graph_data, node_id):
-        """Get a node from graph data by ID."""
-        if not isinstance(graph_data, dict):
-            return None
-        nodes = graph_data.get('nodes', [])
-        return next((n for n in nodes if n.get('id') == node_id), None)
+    def _get_node_by_id(self, graph, node_id):
+        """Get a node from a compiled graph by ID."""
+        return graph.get_node(node_id)
 
-    def _get_next_nodes(self, graph_data, node_id):
+    def _get_next_nodes(self, graph, node_id):
         """Get the next nodes after a given node."""
-        if not isinstance(graph_data, dict):
-            return []
-        edges = graph_data.get('edges', [])
-        next_node_ids = [
-            e.get('targetNodeId') for e in edges
-            if e.get('sourceNodeId') == node_id
-        ]
-
-        nodes = graph_data.get('nodes', [])
-        return [n for n in nodes if n.get('id') in next_node_ids]
+        return graph.get_next_nodes(node_id)
 
-    def _create_tasks_for_nodes(self, instance, nodes, graph_data):
+    def _create_tasks_for_nodes(self, instance, nodes, graph):
         """Create workflow tasks for the given nodes."""
         for node in nodes:
             node_type = node.get('type')
@@ -395,34 +629,32 @@ class WorkflowEngine:
 
             elif node_type == 'approval':
                 # Create approval task(s)
-                self._create_approval_tasks(instance, node, graph_data)
+                self._create_approval_tasks(instance, node, graph)
 
             elif node_type == 'condition':
                 # Evaluate condition and create tasks for matching branch
-                self._process_condition_node(instance, node, graph_data)
+                self._process_condition_node(instance, node, graph)
 
             elif node_type == 'cc':
                 # Carbon copy - create notification task
-                self._create_cc_tasks(instance, node, graph_data)
+                self._create_cc_tasks(instance, node, graph)
 
             elif node_type == 'parallel':
                 # Parallel gateway - create tasks for all branches
-                self._process_parallel_node(instance, node, graph_data)
+                self._process_parallel_node(instance, node, graph)
 
             elif node_type == 'notify':
                 # Notification - no task needed, just log
                 continue
 
-    def _create_approval_tasks(self, instance, node, graph_data):
+    def _create_approval_tasks(self, instance, node, graph):
         """Create approval tasks for an approval node."""
         properties = node.get('properties', {})
         approve_type = properties.get('approveType', 'or')
         approvers_config = properties.get('approvers', [])
 
         # Resolve approvers
-        assignees = self.approver_resolver.resolve(
-            approvers_config, instance, graph_data
-        )
+        assignees = self._resolve_approvers(approvers_config, instance, graph)
 
         if not assignees:
             # No assignees found, skip this node
@@ -443,6 +675,27 @@ class WorkflowEngine:
                     instance, node, assignee, approve_type, sequence=idx
                 )
 
+    def _resolve_approvers(self, approvers_config, instance, graph):
+        """
+        Resolve approvers, reusing results within an execute_tasks() batch.
+
+        Resolution depends only on the configuration, the organization and
+        the initiator, so instances sharing those get the same users.
+        """
+        if self._approver_cache is None:
+            return self.approver_resolver.resolve(approvers_config, instance, graph.graph_data)
+
+        cache_key = (
+            json.dumps(approvers_config, sort_keys=True, default=str),
+            instance.organization_id,
+            instance.initiator_id,
+        )
+        if cache_key not in self._approver_cache:
+            self._approver_cache[cache_key] = self.approver_resolver.resolve(
+                approvers_config, instance, graph.graph_data
+            )
+        return list(self._approver_cache[cache_key])
+
     def _create_single_task(self, instance, node, assignee, approve_type, sequence=0):
         """Create a single workflow task."""
         properties = node.get('properties', {})
@@ -469,14 +722,12 @@ class WorkflowEngine:
 
         return task
 
-    def _create_cc_tasks(self, instance, node, graph_data):
+    def _create_cc_tasks(self, instance, node, graph):
         """Create carbon copy tasks (for informational purposes)."""
         properties = node.get('properties', {})
         cc_users_config = properties.get('ccUsers', [])
 
-        assignees = self.approver_resolver.resolve(
-            cc_users_config, instance, graph_data
-        )
+        assignees = self._resolve_approvers(cc_users_config, instance, graph)
 
         for assignee in assignees:
             # CC tasks are just for notification, no approval needed
@@ -494,7 +745,7 @@ class WorkflowEngine:
                 organization=instance.organization
             )
 
-    def _process_condition_node(self, instance, node, graph_data):
+    def _process_condition_node(self, instance, node, graph):
         """
         Process a condition node and create tasks for matching branches.
 
@@ -503,73 +754,43 @@ class WorkflowEngine:
            each outgoing edge's properties
         2. Node-level branches: evaluate node properties.branches[]
         3. Default branch fallback: follow the edge marked as default
+
+        Routes are precomputed per condition node when the graph is compiled.
         """
-        edges = graph_data.get('edges', [])
-        outgoing_edges = [
-            e for e in edges if e.get('sourceNodeId') == node['id']
-        ]
+        routing = graph.get_condition_routing(node['id'])
 
         # --- Strategy 1: Edge-level conditions ---
-        edge_matched = False
-        for edge in outgoing_edges:
-            edge_props = edge.get('properties', {})
-            # Skip default edges during condition evaluation
-            if edge_props.get('isDefault'):
-                continue
-
-            has_conditions = (
-                edge_props.get('conditions') or
-                edge_props.get('conditionGroups')
-            )
-            if has_conditions:
-                if self.condition_evaluator.evaluate_edge_conditions(edge, instance):
-                    next_node = self._get_node_by_id(
-                        graph_data, edge.get('targetNodeId')
+        for edge in routing.conditional_edges:
+            if self.condition_evaluator.evaluate_edge_conditions(edge, instance):
+                next_node = graph.get_node(edge.get('targetNodeId'))
+                if next_node:
+                    self._create_tasks_for_nodes(
+                        instance, [next_node], graph
                     )
-                    if next_node:
-                        self._create_tasks_for_nodes(
-                            instance, [next_node], graph_data
-                        )
-                    edge_matched = True
-                    break  # First matching edge wins
-
-        if edge_matched:
-            self.condition_evaluator.clear_cache()
-            return True
+                # First matching edge wins
+                self.condition_evaluator.clear_cache()
+                return True
 
         # --- Strategy 2: Node-level branch conditions ---
-        properties = node.get('properties', {})
-        branches = properties.get('branches', [])
-
-        for branch in branches:
+        for branch, target_ids in routing.branches:
             if self.condition_evaluator.evaluate_branch(branch, instance):
-                # Find edges from this node that carry the branch ID
-                branch_edges = [
-                    e for e in outgoing_edges
-                    if e.get('properties', {}).get('branchId') == branch.get('id')
-                ]
-
-                for edge in branch_edges:
-                    next_node = self._get_node_by_id(
-                        graph_data, edge.get('targetNodeId')
-                    )
+                # Follow the edges from this node that carry the branch ID
+                for target_id in target_ids:
+                    next_node = graph.get_node(target_id)
                     if next_node:
                         self._create_tasks_for_nodes(
-                            instance, [next_node], graph_data
+                            instance, [next_node], graph
                         )
 
                 self.condition_evaluator.clear_cache()
                 return True  # Branch found and processed
 
         # --- Strategy 3: Default branch fallback ---
-        default_edge = self._find_default_edge(outgoing_edges, properties)
-        if default_edge:
-            next_node = self._get_node_by_id(
-                graph_data, default_edge.get('targetNodeId')
-            )
+        if routing.default_target_id:
+            next_node = graph.get_node(routing.default_target_id)
             if next_node:
                 self._create_tasks_for_nodes(
-                    instance, [next_node], graph_data
+                    instance, [next_node], graph
                 )
                 self.condition_evaluator.clear_cache()
                 return True
@@ -578,40 +799,17 @@ class WorkflowEngine:
         return False
 
     def _find_default_edge(self, outgoing_edges, node_properties):
-        """
-        Find the default outgoing edge for a condition node.
-
-        Checks for:
-        1. Edge with properties.isDefault == true
-        2. Edge whose id matches the node's defaultFlow property
-        3. Falls back to the last outgoing edge (common convention)
-        """
-        # Check for explicitly marked default edge
-        for edge in outgoing_edges:
-            if edge.get('properties', {}).get('isDefault'):
-                return edge
-
-        # Check for edge matching defaultFlow id
-        default_flow = node_properties.get('defaultFlow')
-        if default_flow:
-            for edge in outgoing_edges:
-                if edge.get('id') == default_flow:
-                    return edge
+        """Find the default outgoing edge for a condition node."""
+        return find_default_edge(outgoing_edges, node_properties)
 
-        # Fallback: last edge is conventionally the default
-        if outgoing_edges:
-            return outgoing_edges[-1]
-
-        return None
-
-    def _process_parallel_node(self, instance, node, graph_data):
+    def _process_parallel_node(self, instance, node, graph):
         """Process a parallel gateway node."""
         # Get all next nodes and create tasks for all
-        next_nodes = self._get_next_nodes(graph_data, node['id'])
+        next_nodes = graph.get_next_nodes(node['id'])
         for next_node in next_nodes:
-            self._create_tasks_for_nodes(instance, [next_node], graph_data)
+            self._create_tasks_for_nodes(instance, [next_node], graph)
 
-    def _process_next_nodes(self, instance, next_nodes, graph_data, current_node_id):
+    def _process_next_nodes(self, instance, next_nodes, graph, current_node_id):
         """Process next nodes and return True if pending tasks were created."""
         for node in next_nodes:
             node_type = node.get('type')
@@ -622,19 +820,19 @@ class WorkflowEngine:
 
             elif node_type == 'approval':
                 # Create approval tasks
-                self._create_approval_tasks(instance, node, graph_data)
+                self._create_approval_tasks(instance, node, graph)
 
             elif node_type == 'condition':
                 # Process condition
-                self._process_condition_node(instance, node, graph_data)
+                self._process_condition_node(instance, node, graph)
 
             elif node_type == 'cc':
                 # Create CC tasks
-                self._create_cc_tasks(instance, node, graph_data)
+                self._create_cc_tasks(instance, node, graph)
 
             elif node_type == 'parallel':
                 # Process parallel
-                self._process_parallel_node(instance, node, graph_data)
+                self._process_parallel_node(instance, node, graph)
 
         # Check if any pending tasks were created
         return instance.tasks.filter(status='pending').exists()
@@ -669,23 +867,38 @@ class WorkflowEngine:
 
         return False
 
+    def _node_statuses_allow_proceed(self, node_statuses, approve_type):
+        """
+        In-memory counterpart of _should_proceed_after_task().
+
+        Args:
+            node_statuses: (status, sequence) of every task of the node
+            approve_type: The node's approve type
+        """
+        approved = [
+            sequence for status, sequence in node_statuses
+            if status == WorkflowTask.STATUS_APPROVED
+        ]
+        if approve_type == 'or':
+            return len(approved) >= 1
+        elif approve_type == 'and':
+            return len(approved) == len(node_statuses)
+        elif approve_type == 'sequence':
+            return bool(approved) and sorted(approved) == list(range(len(approved)))
+        return False
+
     def _handle_return_task(self, instance, task, actor, comment):
         """Handle a returned task by going back to previous state."""
         # Find the previous approval node
-        graph_data = instance.graph_snapshot or getattr(
-            instance.definition, 'graph_data', {}
-        )
-        current_edges = [
-            e for e in graph_data.get('edges', [])
-            if e.get('targetNodeId') == task.node_id
-        ]
+        graph = get_instance_graph(instance)
+        current_edges = graph.get_incoming_edges(task.node_id)
 
         if not current_edges:
             return False, None, _('Cannot return: no previous node found.')
 
         # Get previous node
         prev_node_id = current_edges[0].get('sourceNodeId')
-        prev_node = self._get_node_by_id(graph_data, prev_node_id)
+        prev_node = graph.get_node(prev_node_id)
 
         if not prev_node or prev_node.get('type') != 'approval':
             return False, None, _('Cannot return: previous node is not an approval node.')
@@ -0,0 +1,213 @@
+"""
+Compiled workflow graphs.
+
+A definition version's LogicFlow graph is compiled once into an
+immutable index (node map, outgoing/incoming adjacency, condition
+routing and the stored validation result) and cached in-process per
+definition version, so the engine resolves nodes and transitions with
+dict lookups instead of scanning the node and edge lists.
+"""
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from apps.common.utils import LocalLRUCache
+
+# Compiled graphs of immutable definition versions, keyed by version id
+_compiled_graphs = LocalLRUCache(max_entries=256, timeout=None)
+# (definition id, version, updated_at) -> WorkflowDefinitionVersion
+_definition_versions = LocalLRUCache(max_entries=256, timeout=300)
+
+
+class ConditionRouting(NamedTuple):
+    """Precomputed outgoing routes of a condition node."""
+
+    # Non-default edges carrying conditions, in edge order
+    conditional_edges: Tuple[Dict[str, Any], ...]
+    # (branch config, target node ids) in branch order
+    branches: Tuple[Tuple[Dict[str, Any], Tuple[str, ...]], ...]
+    default_target_id: Optional[str]
+
+
+def find_default_edge(outgoing_edges, node_properties) -> Optional[Dict[str, Any]]:
+    """
+    Find the default outgoing edge for a condition node.
+
+    Checks for:
+    1. Edge with properties.isDefault == true
+    2. Edge whose id matches the node's defaultFlow property
+    3. Falls back to the last outgoing edge (common convention)
+    """
+    # Check for explicitly marked default edge
+    for edge in outgoing_edges:
+        if edge.get('properties', {}).get('isDefault'):
+            return edge
+
+    # Check for edge matching defaultFlow id
+    default_flow = node_properties.get('defaultFlow')
+    if default_flow:
+        for edge in outgoing_edges:
+            if edge.get('id') == default_flow:
+                return edge
+
+    # Fallback: last edge is conventionally the default
+    if outgoing_edges:
+        return outgoing_edges[-1]
+
+    return None
+
+
+class CompiledWorkflowGraph:
+    """
+    Immutable, indexed view of a workflow graph.
+
+    Usage:
+        graph = CompiledWorkflowGraph.compile(definition.graph_data)
+        node = graph.get_node('approval_1')
+        next_nodes = graph.get_next_nodes('approval_1')
+    """
+
+    __slots__ = (
+        'graph_data', 'nodes', 'start_node', 'is_valid', 'errors', 'warnings',
+        '_outgoing', '_incoming', '_next_nodes', '_conditions',
+    )
+
+    def __init__(self, graph_data, is_valid: bool = True,
+                 errors: Tuple[str, ...] = (), warnings: Tuple[str, ...] = ()):
+        graph_data = graph_data if isinstance(graph_data, dict) else {}
+        node_list = graph_data.get('nodes', []) or []
+        edge_list = graph_data.get('edges', []) or []
+
+        nodes: Dict[str, Dict[str, Any]] = {}
+        positions: Dict[str, int] = {}
+        for position, node in enumerate(node_list):
+            # First node wins for duplicate ids, as in a linear scan
+            if node.get('id') not in nodes:
+                nodes[node.get('id')] = node
+                positions[node.get('id')] = position
+
+        outgoing: Dict[str, List[Dict[str, Any]]] = {}
+        incoming: Dict[str, List[Dict[str, Any]]] = {}
+        for edge in edge_list:
+            outgoing.setdefault(edge.get('sourceNodeId'), []).append(edge)
+            incoming.setdefault(edge.get('targetNodeId'), []).append(edge)
+
+        next_nodes = {}
+        for node_id, edges in outgoing.items():
+            target_ids = {edge.get('targetNodeId') for edge in edges}
+            # Targets in node-list order, each once
+            next_nodes[node_id] = tuple(
+                nodes[target_id]
+                for target_id in sorted(
+                    (target_id for target_id in target_ids if target_id in nodes),
+                    key=positions.__getitem__
+                )
+            )
+
+        self.graph_data = graph_data
+        self.nodes = MappingProxyType(nodes)
+        self.start_node = next((node for node in node_list if node.get('type') == 'start'), None)
+        self.is_valid = is_valid
+        self.errors = tuple(errors)
+        self.warnings = tuple(warnings)
+        self._outgoing = {node_id: tuple(edges) for node_id, edges in outgoing.items()}
+        self._incoming = {node_id: tuple(edges) for node_id, edges in incoming.items()}
+        self._next_nodes = next_nodes
+        self._conditions = {
+            node_id: self._compile_condition(node)
+            for node_id, node in nodes.items()
+            if node.get('type') == 'condition'
+        }
+
+    def _compile_condition(self, node) -> ConditionRouting:
+        outgoing_edges = self._outgoing.get(node['id'], ())
+        properties = node.get('properties', {})
+
+        conditional_edges = tuple(
+            edge for edge in outgoing_edges
+            if not edge.get('properties', {}).get('isDefault') and (
+                edge.get('properties', {}).get('conditions')
+                or edge.get('properties', {}).get('conditionGroups')
+            )
+        )
+        branches = tuple(
+            (branch, tuple(
+                edge.get('targetNodeId') for edge in outgoing_edges
+                if edge.get('properties', {}).get('branchId') == branch.get('id')
+            ))
+            for branch in properties.get('branches', [])
+        )
+        default_edge = find_default_edge(outgoing_edges, properties)
+        return ConditionRouting(
+            conditional_edges=conditional_edges,
+            branches=branches,
+            default_target_id=default_edge.get('targetNodeId') if default_edge else None,
+        )
+
+    @classmethod
+    def compile(cls, graph_data, validate: bool = True) -> 'CompiledWorkflowGraph':
+        """Compile graph data, running validation unless validate is False."""
+        if not validate:
+            return cls(graph_data)
+        from apps.workflows.services.workflow_validation import WorkflowValidationService
+        is_valid, errors, warnings = WorkflowValidationService().validate(graph_data)
+        return cls(graph_data, is_valid, errors, warnings)
+
+    def get_node(self, node_id) -> Optional[Dict[str, Any]]:
+        return self.nodes.get(node_id)
+
+    def get_next_nodes(self, node_id) -> List[Dict[str, Any]]:
+        return list(self._next_nodes.get(node_id, ()))
+
+    def get_outgoing_edges(self, node_id) -> Tuple[Dict[str, Any], ...]:
+        return self._outgoing.get(node_id, ())
+
+    def get_incoming_edges(self, node_id) -> Tuple[Dict[str, Any], ...]:
+        return self._incoming.get(node_id, ())
+
+    def get_condition_routing(self, node_id) -> ConditionRouting:
+        routing = self._conditions.get(node_id)
+        if routing is None:
+            return ConditionRouting((), (), None)
+        return routing
+
+
+def get_definition_version(definition):
+    """
+    Get the immutable version row of a definition's current graph.
+
+    Cached per (definition id, version, updated_at); any save of the
+    definition moves updated_at, so edited graphs get a new row.
+    """
+    from apps.workflows.models import WorkflowDefinitionVersion
+
+    cache_key = (definition.pk, definition.version, definition.updated_at)
+    version = _definition_versions.get(cache_key)
+    if version is None:
+        version = WorkflowDefinitionVersion.capture(definition)
+        _definition_versions.set(cache_key, version)
+    return version
+
+
+def get_compiled_graph(definition_version) -> CompiledWorkflowGraph:
+    """Get the compiled graph of a definition version, using its stored validation."""
+    graph = _compiled_graphs.get(definition_version.pk)
+    if graph is None:
+        graph = CompiledWorkflowGraph(
+            definition_version.graph_data,
+            is_valid=definition_version.is_valid,
+            errors=definition_version.validation_errors or (),
+            warnings=definition_version.validation_warnings or (),
+        )
+        _compiled_graphs.set(definition_version.pk, graph)
+    return graph
+
+
+def get_instance_graph(instance) -> CompiledWorkflowGraph:
+    """Get the compiled graph a workflow instance executes."""
+    if instance.definition_version_id:
+        graph = _compiled_graphs.get(instance.definition_version_id)
+        if graph is None:
+            graph = get_compiled_graph(instance.definition_version)
+        return graph
+    # Legacy instances carry their own snapshot
+    return CompiledWorkflowGraph(instance.get_graph_data())
@@ -0,0 +1,484 @@
+"""
+Workflow Statistics Service
+
+Maintains the daily rollups in WorkflowDailyStat and WorkflowNodeDailyStat
+and answers statistics queries from them:
+
+- Instance starts/finishes and task completions are folded into the
+  rollup row of their day after the surrounding transaction commits.
+- Soft-deleted instances and completed tasks are retracted the same way.
+  Counts, sums and the sketch are exact; duration min/max cannot be
+  un-merged and are corrected by the next rebuild of that day.
+- compact() rebuilds recent finished days (WORKFLOW_STATISTICS_COMPACT_DAYS)
+  from the raw rows, so rollups converge even for rows written outside the
+  engine (imports, admin edits, bulk updates, restores). Changes to days
+  older than that window stay in the rollups until rebuild_range() (the
+  rebuild_workflow_statistics command) is run over them.
+- Task durations are kept as sum/min/max plus a fixed-bucket histogram
+  (sketch) that merges by addition and yields percentile estimates.
+"""
+import logging
+from bisect import bisect_left
+from datetime import datetime, time, timedelta
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from apps.workflows.models import (
+    WorkflowDailyStat, WorkflowDefinition, WorkflowInstance, WorkflowNodeDailyStat,
+    WorkflowTask
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds (seconds) of the duration sketch buckets; one overflow bucket follows
+DURATION_BUCKETS = (
+    60, 300, 900, 1800, 3600, 7200, 14400, 28800, 43200,
+    86400, 172800, 259200, 604800, 1209600,
+)
+
+
+def sketch_add(sketch: List[int], seconds: float, count: int = 1) -> List[int]:
+    """Count a duration into (or, with a negative count, out of) a sketch."""
+    counts = list(sketch) or [0] * (len(DURATION_BUCKETS) + 1)
+    index = bisect_left(DURATION_BUCKETS, seconds)
+    counts[index] = max(counts[index] + count, 0)
+    return counts
+
+
+def sketch_merge(left: List[int], right: List[int]) -> List[int]:
+    """Merge two sketches."""
+    if not left:
+        return list(right)
+    if not right:
+        return list(left)
+    return [a + b for a, b in zip(left, right)]
+
+
+def sketch_percentile(sketch: List[int], quantile: float,
+                      max_seconds: Optional[float] = None) -> float:
+    """Estimate a duration percentile (seconds) as its bucket's upper bound."""
+    total = sum(sketch)
+    if not total:
+        return 0.0
+    target = quantile * total
+    running = 0
+    for index, count in enumerate(sketch):
+        running += count
+        if running >= target:
+            bound = DURATION_BUCKETS[index] if index < len(DURATION_BUCKETS) else None
+            if max_seconds is not None:
+                bound = max_seconds if bound is None else min(bound, max_seconds)
+            return float(bound if bound is not None else DURATION_BUCKETS[-1])
+    return float(max_seconds or 0)
+
+
+def day_bounds(day) -> Tuple[datetime, datetime]:
+    """Aware [start, end) datetimes of a local date."""
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+class WorkflowStatisticsService:
+    """
+    Daily workflow rollups.
+
+    Usage:
+        workflow_statistics_service.record_task_completions([task])
+        workflow_statistics_service.compact()
+        nodes = workflow_statistics_service.get_node_summaries(since=day)
+    """
+
+    INSTANCE_EVENTS = ('started', 'approved', 'rejected')
+
+    def __init__(self):
+        from apps.workflows.services.sla_service import SLAService
+        self.sla_service = SLAService()
+
+    # --- Incremental maintenance ---
+
+    def record_task_completions(self, tasks: Iterable) -> None:
+        """Fold completed tasks into their node rollups once the transaction commits."""
+        entries = self._task_entries(tasks)
+        if entries:
+            transaction.on_commit(partial(self._apply_safely, self._apply_node_entries, entries))
+
+    def record_instance_event(self, instance, event: str) -> None:
+        """Fold an instance start/approval/rejection into its daily rollup on commit."""
+        if event not in self.INSTANCE_EVENTS:
+            raise ValueError(f'Unknown workflow statistics event: {event}')
+
+        key, entry = self._instance_entry(instance, event)
+        transaction.on_commit(partial(
+            self._apply_safely, self._apply_instance_entries, {key: [entry]}
+        ))
+
+    def retract_instance(self, instance) -> None:
+        """Take a soft-deleted instance out of its daily rollups on commit."""
+        events = ['started']
+        if instance.status == WorkflowInstance.STATUS_APPROVED:
+            events.append('approved')
+        elif instance.status == WorkflowInstance.STATUS_REJECTED:
+            events.append('rejected')
+
+        entries = {}
+        for event in events:
+            key, entry = self._instance_entry(instance, event)
+            entries.setdefault(key, []).append(entry)
+        transaction.on_commit(partial(
+            self._apply_safely, partial(self._apply_instance_entries, sign=-1), entries
+        ))
+
+    def retract_task_completions(self, tasks: Iterable) -> None:
+        """Take soft-deleted completed tasks out of their node rollups on commit."""
+        entries = self._task_entries(tasks)
+        if entries:
+            transaction.on_commit(partial(
+                self._apply_safely, partial(self._apply_node_entries, sign=-1), entries
+            ))
+
+    def _instance_entry(self, instance, event: str) -> Tuple[tuple, tuple]:
+        """((organization, definition, day), (event, seconds)) of one instance event."""
+        moment = instance.created_at if event == 'started' else instance.completed_at
+        seconds = None
+        if event == 'approved' and instance.started_at and instance.completed_at:
+            seconds = max((instance.completed_at - instance.started_at).total_seconds(), 0)
+
+        key = (
+            instance.organization_id,
+            instance.definition_id,
+            timezone.localdate(moment or timezone.now()),
+        )
+        return key, (event, seconds)
+
+    def _apply_safely(self, apply, entries) -> None:
+        try:
+            apply(entries)
+        except Exception:
+            logger.exception('Failed to update workflow statistics rollups')
+
+    def _task_entries(self, tasks: Iterable) -> Dict[tuple, Dict]:
+        """Group completed tasks by (organization, definition, node, day)."""
+        entries = {}
+        sla_hours = {}
+        for task in tasks:
+            if task.status not in WorkflowTask.COMPLETED_STATUSES or not task.completed_at:
+                continue
+            instance = task.instance
+            seconds = max((task.completed_at - task.created_at).total_seconds(), 0)
+            sla_key = (instance.definition_id, task.node_id)
+            if sla_key not in sla_hours:
+                sla_hours[sla_key] = self._sla_hours(instance.definition, task.node_id)
+
+            key = (
+                instance.organization_id,
+                instance.definition_id,
+                task.node_id,
+                timezone.localdate(task.completed_at),
+            )
+            group = entries.setdefault(key, {'node_name': task.node_name, 'tasks': []})
+            group['tasks'].append((task.status, seconds, seconds > sla_hours[sla_key] * 3600))
+        return entries
+
+    def _apply_node_entries(self, entries: Dict[tuple, Dict], sign: int = 1) -> None:
+        for (organization_id, definition_id, node_id, day), group in entries.items():
+            with transaction.atomic():
+                row = self._locked_row(WorkflowNodeDailyStat, {
+                    'organization_id': organization_id,
+                    'definition_id': definition_id,
+                    'node_id': node_id,
+                    'day': day,
+                }, create=sign > 0)
+                if row is None:
+                    continue
+                self._merge_node_tasks(row, group['node_name'], group['tasks'], sign=sign)
+                row.save()
+
+    def _apply_instance_entries(self, entries: Dict[tuple, List], sign: int = 1) -> None:
+        for (organization_id, definition_id, day), events in entries.items():
+            with transaction.atomic():
+                row = self._locked_row(WorkflowDailyStat, {
+                    'organization_id': organization_id,
+                    'definition_id': definition_id,
+                    'day': day,
+                }, create=sign > 0)
+                if row is None:
+                    continue
+                self._merge_instance_events(row, events, sign=sign)
+                row.save()
+
+    def _locked_row(self, model, lookup, create: bool = True):
+        """Get (or create) a rollup row locked for update."""
+        row = model.all_objects.select_for_update().filter(**lookup).first()
+        if row is None and create:
+            try:
+                with transaction.atomic():
+                    row = model.all_objects.create(**lookup)
+            except IntegrityError:
+                # Created concurrently by another transaction
+                row = model.all_objects.select_for_update().get(**lookup)
+        return row
+
+    def _merge_node_tasks(self, row, node_name, tasks, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) completed tasks; removal keeps min/max."""
+        row.node_name = node_name or row.node_name or row.node_id
+        sketch = row.duration_sketch or []
+        status_counts = {
+            WorkflowTask.STATUS_APPROVED: 'approved_count',
+            WorkflowTask.STATUS_REJECTED: 'rejected_count',
+            WorkflowTask.STATUS_RETURNED: 'returned_count',
+        }
+        for status, seconds, breached in tasks:
+            counters = ['completed_count']
+            if status in status_counts:
+                counters.append(status_counts[status])
+            if breached:
+                counters.append('sla_breach_count')
+            for counter in counters:
+                setattr(row, counter, max(getattr(row, counter) + sign, 0))
+            row.duration_sum = max(row.duration_sum + sign * seconds, 0)
+            sketch = sketch_add(sketch, seconds, count=sign)
+            if sign > 0:
+                row.duration_min = (
+                    seconds if row.duration_min is None else min(row.duration_min, seconds)
+                )
+                row.duration_max = (
+                    seconds if row.duration_max is None else max(row.duration_max, seconds)
+                )
+        row.duration_sketch = sketch
+
+    def _merge_instance_events(self, row, events, sign: int = 1) -> None:
+        for event, seconds in events:
+            counter = f'{event}_count'
+            setattr(row, counter, max(getattr(row, counter) + sign, 0))
+            if seconds is not None:
+                row.duration_count = max(row.duration_count + sign, 0)
+                row.duration_sum = max(row.duration_sum + sign * seconds, 0)
+
+    def _sla_hours(self, definition, node_id) -> float:
+        sla_config = None
+        if definition:
+            sla_config = self.sla_service._get_sla_from_definition(definition, node_id)
+        if sla_config:
+            return sla_config.get('sla_hours', self.sla_service.DEFAULT_SLA_HOURS)
+        return self.sla_service.DEFAULT_SLA_HOURS
+
+    # --- Compaction ---
+
+    def compact(self, days: Optional[int] = None) -> int:
+        """
+        Rebuild the rollups of the last `days` finished local dates.
+
+        Defaults to WORKFLOW_STATISTICS_COMPACT_DAYS. Today is left to
+        incremental updates, which a concurrent rebuild could otherwise
+        overwrite.
+
+        Returns:
+            Number of rollup rows written
+        """
+        days = days or getattr(settings, 'WORKFLOW_STATISTICS_COMPACT_DAYS', 7)
+        today = timezone.localdate()
+        return self.rebuild_range(today - timedelta(days=days), today - timedelta(days=1))
+
+    def rebuild_range(self, since, until) -> int:
+        """
+        Rebuild the rollups of every local date from `since` to `until` inclusive.
+
+        Used to backfill history and to heal days outside the compaction
+        window. Each day is rebuilt in its own transaction.
+
+        Returns:
+            Number of rollup rows written
+        """
+        written = 0
+        day = since
+        while day <= until:
+            written += self.rebuild_day(day)
+            day += timedelta(days=1)
+        return written
+
+    def rebuild_day(self, day) -> int:
+        """Recompute one day's rollups from WorkflowInstance and WorkflowTask rows."""
+        start, end = day_bounds(day)
+
+        instance_events = {}
+        started = WorkflowInstance.all_objects.filter(
+            is_deleted=False, created_at__gte=start, created_at__lt=end
+        ).values('organization_id', 'definition_id').annotate(count=Count('id'))
+        for row in started:
+            instance_events.setdefault(
+                (row['organization_id'], row['definition_id'], day), []
+            ).extend([('started', None)] * row['count'])
+
+        finished = WorkflowInstance.all_objects.filter(
+            is_deleted=False,
+            status__in=[WorkflowInstance.STATUS_APPROVED, WorkflowInstance.STATUS_REJECTED],
+            completed_at__gte=start,
+            completed_at__lt=end,
+        ).values_list('organization_id', 'definition_id', 'status', 'started_at', 'completed_at')
+        for organization_id, definition_id, status, started_at, completed_at in finished:
+            seconds = None
+            if status == WorkflowInstance.STATUS_APPROVED and started_at:
+                seconds = max((completed_at - started_at).total_seconds(), 0)
+            instance_events.setdefault((organization_id, definition_id, day), []).append(
+                ('approved' if status == WorkflowInstance.STATUS_APPROVED else 'rejected', seconds)
+            )
+
+        completed_tasks = list(WorkflowTask.all_objects.filter(
+            is_deleted=False,
+            status__in=WorkflowTask.COMPLETED_STATUSES,
+            completed_at__gte=start,
+            completed_at__lt=end,
+        ).values_list(
+            'instance__organization_id', 'instance__definition_id', 'node_id', 'node_name',
+            'status', 'created_at', 'completed_at'
+        ))
+        definitions = WorkflowDefinition.all_objects.in_bulk(
+            {row[1] for row in completed_tasks}
+        )
+        sla_hours = {}
+        node_entries = {}
+        for (organization_id, definition_id, node_id, node_name, status,
+             created_at, completed_at) in completed_tasks:
+            sla_key = (definition_id, node_id)
+            if sla_key not in sla_hours:
+                sla_hours[sla_key] = self._sla_hours(definitions.get(definition_id), node_id)
+            seconds = max((completed_at - created_at).total_seconds(), 0)
+            group = node_entries.setdefault(
+                (organization_id, definition_id, node_id, day),
+                {'node_name': node_name, 'tasks': []}
+            )
+            group['tasks'].append((status, seconds, seconds > sla_hours[sla_key] * 3600))
+
+        daily_rows = []
+        for (organization_id, definition_id, _day), events in instance_events.items():
+            row = WorkflowDailyStat(
+                organization_id=organization_id, definition_id=definition_id, day=day
+            )
+            self._merge_instance_events(row, events)
+            daily_rows.append(row)
+
+        node_rows = []
+        for (organization_id, definition_id, node_id, _day), group in node_entries.items():
+            row = WorkflowNodeDailyStat(
+                organization_id=organization_id, definition_id=definition_id,
+                node_id=node_id, day=day
+            )
+            self._merge_node_tasks(row, group['node_name'], group['tasks'])
+            node_rows.append(row)
+
+        with transaction.atomic():
+            WorkflowDailyStat.all_objects.filter(day=day).delete()
+            WorkflowNodeDailyStat.all_objects.filter(day=day).delete()
+            WorkflowDailyStat.all_objects.bulk_create(daily_rows, batch_size=500)
+            WorkflowNodeDailyStat.all_objects.bulk_create(node_rows, batch_size=500)
+
+        return len(daily_rows) + len(node_rows)
+
+    # --- Queries ---
+
+    def get_daily_trends(self, since, queryset=None) -> Dict:
+        """{day: {'started', 'completed', 'rejected'}} from `since` on."""
+        queryset = queryset if queryset is not None else WorkflowDailyStat.objects.all()
+        rows = queryset.filter(day__gte=since).values('day').annotate(
+            started=Sum('started_count'),
+            completed=Sum('approved_count'),
+            rejected=Sum('rejected_count'),
+        )
+        return {
+            row['day']: {
+                'started': row['started'] or 0,
+                'completed': row['completed'] or 0,
+                'rejected': row['rejected'] or 0,
+            }
+            for row in rows
+        }
+
+    def get_completion_hours(self, queryset=None) -> Dict:
+        """{definition_id: average approved-instance completion hours}."""
+        queryset = queryset if queryset is not None else WorkflowDailyStat.objects.all()
+        rows = queryset.values('definition_id').annotate(
+            seconds=Sum('duration_sum'),
+            count=Sum('duration_count'),
+        )
+        return {
+            row['definition_id']: (row['seconds'] or 0) / row['count'] / 3600
+            for row in rows if row['count']
+        }
+
+    def get_average_completion_hours(self, queryset=None) -> float:
+        """Average approved-instance completion hours over all rollups."""
+        queryset = queryset if queryset is not None else WorkflowDailyStat.objects.all()
+        totals = queryset.aggregate(seconds=Sum('duration_sum'), count=Sum('duration_count'))
+        if not totals['count']:
+            return 0.0
+        return (totals['seconds'] or 0) / totals['count'] / 3600
+
+    def get_node_summaries(self, since=None, queryset=None) -> List[Dict]:
+        """
+        Per (definition, node) task statistics merged over the rollup days.
+
+        Returns:
+            List of dicts with counts, duration hours (avg/min/max/p50/p90)
+            and SLA breaches, unsorted
+        """
+        queryset = queryset if queryset is not None else WorkflowNodeDailyStat.objects.all()
+        if since is not None:
+            queryset = queryset.filter(day__gte=since)
+
+        summaries = {}
+        rows = queryset.values_list(
+            'definition_id', 'definition__name', 'node_id', 'node_name', 'completed_count',
+            'duration_sum', 'duration_min', 'duration_max', 'duration_sketch', 'sla_breach_count'
+        )
+        for (definition_id, definition_name, node_id, node_name, completed_count,
+             duration_sum, duration_min, duration_max, duration_sketch, sla_breach_count) in rows:
+            summary = summaries.setdefault((definition_id, node_id), {
+                'workflow_definition_id': str(definition_id),
+                'workflow_name': definition_name,
+                'node_id': node_id,
+                'node_name': node_name or node_id,
+                'task_count': 0,
+                'sla_breach_count': 0,
+                '_sum': 0.0,
+                '_min': None,
+                '_max': None,
+                '_sketch': [],
+            })
+            summary['task_count'] += completed_count
+            summary['sla_breach_count'] += sla_breach_count
+            summary['_sum'] += duration_sum
+            if duration_min is not None and (
+                    summary['_min'] is None or duration_min < summary['_min']):
+                summary['_min'] = duration_min
+            if duration_max is not None and (
+                    summary['_max'] is None or duration_max > summary['_max']):
+                summary['_max'] = duration_max
+            summary['_sketch'] = sketch_merge(summary['_sketch'], duration_sketch or [])
+
+        result = []
+        for summary in summaries.values():
+            if not summary['task_count']:
+                continue
+            duration_sum = summary.pop('_sum')
+            duration_min = summary.pop('_min') or 0
+            duration_max = summary.pop('_max') or 0
+            sketch = summary.pop('_sketch')
+            summary.update({
+                'avg_duration_hours': duration_sum / summary['task_count'] / 3600,
+                'min_duration_hours': duration_min / 3600,
+                'max_duration_hours': duration_max / 3600,
+                'p50_duration_hours': sketch_percentile(sketch, 0.5, duration_max) / 3600,
+                'p90_duration_hours': sketch_percentile(sketch, 0.9, duration_max) / 3600,
+            })
+            result.append(summary)
+        return result
+
+
+# Singleton instance
+workflow_statistics_service = WorkflowStatisticsService()
@@ -0,0 +1,30 @@
+"""
+Celery tasks for workflow background jobs.
+"""
+import logging
+from typing import Optional
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def compact_workflow_statistics_task(self, days: Optional[int] = None):
+    """
+    Rebuild the daily workflow statistics rollups of recent finished days.
+
+    `days` defaults to settings.WORKFLOW_STATISTICS_COMPACT_DAYS.
+
+    Returns:
+        Number of rollup rows written
+    """
+    from apps.workflows.services.workflow_statistics import workflow_statistics_service
+
+    try:
+        written = workflow_statistics_service.compact(days=days)
+    except Exception as exc:
+        logger.warning("Workflow statistics compaction failed. days=%s error=%s", days, exc)
+        raise self.retry(exc=exc)
+    logger.info("Workflow statistics compacted. days=%s rows=%s", days, written)
+    return written
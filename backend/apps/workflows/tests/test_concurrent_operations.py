@@ -16,8 +16,10 @@ from rest_framework.test import APIClient
 
 from apps.accounts.models import UserOrganization
 from apps.workflows.models import (
-    WorkflowDefinition, WorkflowInstance, WorkflowTask
+    WorkflowDefinition, WorkflowInstance, WorkflowTask, WorkflowApproval,
+    WorkflowOperationLog
 )
+from apps.workflows.services.notification_service import notification_service
 from apps.workflows.services.workflow_engine import WorkflowEngine
 from apps.workflows.tests.test_api import WorkflowAPITestCase
 
@@ -405,3 +407,90 @@ class TestBulkOperations(WorkflowAPITestCase):
         # Some should succeed, some may fail (already completed)
         successful = [r for r in results if r.get('success')]
         self.assertGreater(len(successful), 0)
+
+    def test_bulk_approval_completes_instances(self):
+        """
+        Test bulk approval writes approvals and completes each instance.
+        """
+        results = WorkflowEngine().execute_tasks(
+            self.tasks, action='approve', actor=self.initiator, comment='Bulk approved'
+        )
+
+        self.assertEqual([success for success, _, _ in results], [True] * 5)
+        instance_ids = [task.instance_id for task in self.tasks]
+        self.assertEqual(
+            WorkflowInstance.objects.filter(
+                id__in=instance_ids, status=WorkflowInstance.STATUS_APPROVED
+            ).count(),
+            5
+        )
+        self.assertEqual(
+            WorkflowApproval.objects.filter(
+                task__in=self.tasks, action=WorkflowApproval.ACTION_APPROVE
+            ).count(),
+            5
+        )
+        self.assertEqual(
+            WorkflowOperationLog.objects.filter(
+                workflow_instance_id__in=instance_ids, operation_type='complete'
+            ).count(),
+            5
+        )
+
+    def test_bulk_results_keep_task_order(self):
+        """
+        Test invalid tasks fail in place without affecting the others.
+        """
+        self.tasks[2].status = WorkflowTask.STATUS_APPROVED
+        self.tasks[2].save()
+
+        results = WorkflowEngine().execute_tasks(
+            self.tasks + [self.tasks[0]], action='reject', actor=self.initiator
+        )
+
+        self.assertEqual(
+            [success for success, _, _ in results],
+            [True, True, False, True, True, False]
+        )
+        self.assertEqual(results[2][2], 'Task is not pending.')
+        self.assertEqual(results[5][2], 'Task is not pending.')
+        self.assertEqual(
+            WorkflowInstance.objects.get(id=self.tasks[0].instance_id).status,
+            WorkflowInstance.STATUS_REJECTED
+        )
+
+    def test_bulk_notifications_are_coalesced_per_recipient(self):
+        """
+        Test the initiator gets one message per event type for the batch.
+        """
+        with patch.object(notification_service, '_send_email', return_value=True) as send_email:
+            WorkflowEngine().execute_tasks(
+                self.tasks, action='approve', actor=self.initiator
+            )
+
+        # One task_completed and one workflow_completed digest
+        self.assertEqual(send_email.call_count, 2)
+        for call in send_email.call_args_list:
+            recipients, subject, _ = call.args
+            self.assertEqual(recipients, [self.initiator])
+            self.assertIn('(+4 more)', subject)
+
+    def test_coalesced_push_receives_every_event_context(self):
+        """
+        Test push and in-app channels get the context of every merged event.
+        """
+        with patch.object(notification_service, '_send_email', return_value=True), \
+                patch.object(notification_service, '_send_push', return_value=True) as send_push:
+            with notification_service.coalesce():
+                for task in self.tasks:
+                    notification_service.send_notification(
+                        'task_overdue', {'task_name': task.node_name}, [self.initiator]
+                    )
+
+        send_push.assert_called_once()
+        recipients, _subject, contexts = send_push.call_args.args
+        self.assertEqual(recipients, [self.initiator])
+        self.assertEqual(
+            [context['task_name'] for context in contexts],
+            [task.node_name for task in self.tasks]
+        )
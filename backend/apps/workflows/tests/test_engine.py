@@ -9,13 +9,15 @@ from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 
 from apps.workflows.models import (
-    WorkflowDefinition, WorkflowInstance, WorkflowTask, WorkflowApproval
+    WorkflowDefinition, WorkflowDefinitionVersion, WorkflowInstance, WorkflowTask,
+    WorkflowApproval
 )
 from apps.workflows.services.workflow_engine import WorkflowEngine
+from apps.workflows.services.workflow_graph import CompiledWorkflowGraph
 from apps.workflows.services.approver_resolver import ApproverResolver
 from apps.workflows.services.condition_evaluator import ConditionEvaluator
 from apps.organizations.models import Organization, Department, UserDepartment
-from apps.accounts.models import User, UserOrganization
+from apps.accounts.models import UserOrganization
 
 User = get_user_model()
 
@@ -980,3 +982,98 @@ class TestWorkflowApprovalModel(WorkflowExecutionEngineTest):
         self.assertEqual(approval.action, 'approve')
         self.assertEqual(approval.approver, self.approver1)
         self.assertEqual(approval.comment, 'Approved this request')
+
+
+class TestCompiledWorkflowGraph(WorkflowExecutionEngineTest):
+    """Tests for compiled graphs and definition versions."""
+
+    def test_compiled_graph_indexes_nodes_and_edges(self):
+        """Test node lookup and adjacency of a compiled graph."""
+        graph = CompiledWorkflowGraph.compile(self.simple_graph_data)
+
+        self.assertTrue(graph.is_valid)
+        self.assertEqual(graph.start_node['id'], 'start_1')
+        self.assertEqual(graph.get_node('approval_1')['type'], 'approval')
+        self.assertIsNone(graph.get_node('missing'))
+        self.assertEqual([n['id'] for n in graph.get_next_nodes('start_1')], ['approval_1'])
+        self.assertEqual([e['id'] for e in graph.get_incoming_edges('end_1')], ['edge_2'])
+        self.assertEqual(graph.get_next_nodes('end_1'), [])
+
+    def test_condition_routing_is_precomputed(self):
+        """Test default edge and conditional edges of a condition node."""
+        graph = CompiledWorkflowGraph({
+            'nodes': [
+                {'id': 'start_1', 'type': 'start'},
+                {'id': 'cond_1', 'type': 'condition'},
+                {'id': 'high', 'type': 'end'},
+                {'id': 'low', 'type': 'end'},
+            ],
+            'edges': [
+                {'id': 'e0', 'sourceNodeId': 'start_1', 'targetNodeId': 'cond_1'},
+                {'id': 'e1', 'sourceNodeId': 'cond_1', 'targetNodeId': 'high',
+                 'properties': {'conditions': [
+                     {'field': 'amount', 'operator': 'gt', 'value': 100}
+                 ]}},
+                {'id': 'e2', 'sourceNodeId': 'cond_1', 'targetNodeId': 'low',
+                 'properties': {'isDefault': True}},
+            ]
+        })
+
+        routing = graph.get_condition_routing('cond_1')
+        self.assertEqual([e['id'] for e in routing.conditional_edges], ['e1'])
+        self.assertEqual(routing.default_target_id, 'low')
+        self.assertIsNone(graph.get_condition_routing('start_1').default_target_id)
+
+    def test_start_workflow_references_definition_version(self):
+        """Test instances share one stored graph version instead of snapshots."""
+        definition = WorkflowDefinition.objects.create(
+            organization=self.organization,
+            code='simple_approval',
+            name='Simple Approval',
+            business_object_code='asset_pickup',
+            status='published',
+            graph_data=self.simple_graph_data,
+            created_by=self.initiator
+        )
+        engine = WorkflowEngine()
+
+        _, first, _ = engine.start_workflow(
+            definition=definition,
+            business_object_code='asset_pickup',
+            business_id='ASSET_001',
+            initiator=self.initiator
+        )
+        _, second, _ = engine.start_workflow(
+            definition=definition,
+            business_object_code='asset_pickup',
+            business_id='ASSET_002',
+            initiator=self.initiator
+        )
+
+        self.assertIsNotNone(first.definition_version_id)
+        self.assertEqual(first.definition_version_id, second.definition_version_id)
+        self.assertFalse(first.graph_snapshot)
+        self.assertEqual(first.get_graph_data(), self.simple_graph_data)
+        self.assertEqual(
+            WorkflowDefinitionVersion.objects.filter(definition=definition).count(), 1
+        )
+
+    def test_edited_graph_gets_new_version(self):
+        """Test an in-place graph edit captures a new version row."""
+        definition = WorkflowDefinition.objects.create(
+            organization=self.organization,
+            code='simple_approval',
+            name='Simple Approval',
+            business_object_code='asset_pickup',
+            status='published',
+            graph_data=self.simple_graph_data,
+            created_by=self.initiator
+        )
+        original = WorkflowDefinitionVersion.capture(definition)
+
+        definition.graph_data = self.multi_approver_graph_data
+        definition.save()
+        edited = WorkflowDefinitionVersion.capture(definition)
+
+        self.assertNotEqual(original.pk, edited.pk)
+        self.assertEqual(WorkflowDefinitionVersion.capture(definition).pk, edited.pk)
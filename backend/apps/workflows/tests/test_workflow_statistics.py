@@ -0,0 +1,211 @@
+"""
+Tests for daily workflow statistics rollups.
+"""
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from apps.workflows.models import (
+    WorkflowDailyStat, WorkflowInstance, WorkflowNodeDailyStat, WorkflowTask
+)
+from apps.workflows.services.sla_service import SLAService
+from apps.workflows.services.workflow_engine import WorkflowEngine
+from apps.workflows.services.workflow_statistics import (
+    sketch_add, sketch_percentile, workflow_statistics_service
+)
+from apps.workflows.tests.test_api import WorkflowAPITestCase
+
+
+class TestDurationSketch(SimpleTestCase):
+    """Tests for the duration histogram helpers."""
+
+    def test_percentiles_use_bucket_bounds_capped_by_max(self):
+        sketch = []
+        for seconds in [30] * 8 + [5000, 90000]:
+            sketch = sketch_add(sketch, seconds)
+
+        self.assertEqual(sum(sketch), 10)
+        self.assertEqual(sketch_percentile(sketch, 0.5, 90000), 60)
+        self.assertEqual(sketch_percentile(sketch, 0.9, 90000), 7200)
+        self.assertEqual(sketch_percentile(sketch, 1.0, 90000), 90000)
+        self.assertEqual(sketch_percentile([], 0.5), 0)
+
+
+class TestWorkflowStatisticsRollups(WorkflowAPITestCase):
+    """Tests for incremental maintenance and compaction of the rollups."""
+
+    def _yesterday_noon(self):
+        noon = timezone.localtime().replace(hour=12, minute=0, second=0, microsecond=0)
+        return noon - timedelta(days=1)
+
+    def _create_finished_instance(self, completed_at, task_hours):
+        instance = WorkflowInstance.objects.create(
+            organization=self.organization,
+            definition=self.workflow_definition,
+            instance_no=self._make_instance_no('STAT'),
+            business_object_code='asset_pickup',
+            business_id='ASSET_STAT',
+            initiator=self.initiator,
+            status=WorkflowInstance.STATUS_APPROVED,
+            started_at=completed_at - timedelta(hours=task_hours),
+            completed_at=completed_at,
+            created_by=self.initiator,
+        )
+        task = WorkflowTask.objects.create(
+            organization=self.organization,
+            instance=instance,
+            node_id='approval_1',
+            node_name='Department Approval',
+            node_type='approval',
+            assignee=self.approver,
+            status=WorkflowTask.STATUS_APPROVED,
+            completed_at=completed_at,
+            created_by=self.initiator,
+        )
+        WorkflowInstance.all_objects.filter(pk=instance.pk).update(
+            created_at=completed_at - timedelta(hours=task_hours)
+        )
+        WorkflowTask.all_objects.filter(pk=task.pk).update(
+            created_at=completed_at - timedelta(hours=task_hours)
+        )
+        return instance
+
+    def test_engine_transitions_update_rollups_on_commit(self):
+        """Test starting and approving a workflow folds into today's rollups."""
+        engine = WorkflowEngine()
+        with self.captureOnCommitCallbacks(execute=True):
+            _, instance, _ = engine.start_workflow(
+                definition=self.workflow_definition,
+                business_object_code='asset_pickup',
+                business_id='ASSET_001',
+                initiator=self.initiator
+            )
+        task = instance.tasks.get(assignee=self.approver)
+        with self.captureOnCommitCallbacks(execute=True):
+            success, _, error = engine.execute_task(task, 'approve', self.approver)
+        self.assertTrue(success, error)
+
+        daily = WorkflowDailyStat.all_objects.get(definition=self.workflow_definition)
+        self.assertEqual(daily.started_count, 1)
+        self.assertEqual(daily.approved_count, 1)
+        self.assertEqual(daily.duration_count, 1)
+
+        node = WorkflowNodeDailyStat.all_objects.get(
+            definition=self.workflow_definition, node_id='approval_1'
+        )
+        self.assertEqual(node.completed_count, 1)
+        self.assertEqual(node.approved_count, 1)
+        self.assertEqual(sum(node.duration_sketch), 1)
+        self.assertEqual(node.sla_breach_count, 0)
+
+    def test_compaction_rebuilds_finished_days_from_raw_rows(self):
+        """Test compaction recomputes rollups, replacing stale rows."""
+        yesterday = self._yesterday_noon()
+        self._create_finished_instance(yesterday, task_hours=2)
+        self._create_finished_instance(yesterday, task_hours=30)
+        WorkflowDailyStat.all_objects.create(
+            organization=self.organization,
+            definition=self.workflow_definition,
+            day=timezone.localdate(yesterday),
+            approved_count=99,
+        )
+
+        workflow_statistics_service.compact(days=1)
+
+        daily = WorkflowDailyStat.all_objects.get(day=timezone.localdate(yesterday))
+        self.assertEqual(daily.approved_count, 2)
+        self.assertAlmostEqual(daily.duration_sum, 32 * 3600, delta=1)
+
+        summaries = workflow_statistics_service.get_node_summaries(
+            queryset=WorkflowNodeDailyStat.all_objects.all()
+        )
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0]['task_count'], 2)
+        self.assertEqual(summaries[0]['sla_breach_count'], 1)
+        self.assertAlmostEqual(summaries[0]['avg_duration_hours'], 16, places=2)
+        self.assertAlmostEqual(summaries[0]['max_duration_hours'], 30, places=2)
+
+    def test_bottleneck_report_reads_rollups(self):
+        """Test the SLA bottleneck report uses rollup durations and breaches."""
+        yesterday = self._yesterday_noon()
+        self._create_finished_instance(yesterday, task_hours=40)
+        workflow_statistics_service.compact(days=1)
+
+        report = SLAService().get_bottleneck_report(
+            days=7, organization_id=str(self.organization.id)
+        )
+
+        self.assertEqual(len(report), 1)
+        self.assertEqual(report[0]['node_id'], 'approval_1')
+        self.assertTrue(report[0]['is_bottleneck'])
+        self.assertEqual(report[0]['severity'], 'high')
+        self.assertEqual(report[0]['sla_compliance_rate'], 0)
+
+    def test_trends_endpoint_reads_rollups(self):
+        """Test daily trends come from the rollups."""
+        yesterday = self._yesterday_noon()
+        self._create_finished_instance(yesterday, task_hours=1)
+        workflow_statistics_service.compact(days=1)
+
+        response = self.client.get('/api/workflows/statistics/trends/')
+
+        self.assertEqual(response.status_code, 200)
+        points = {point['date']: point for point in response.data['data']['data']}
+        day = timezone.localdate(yesterday).isoformat()
+        self.assertEqual(points[day]['completed'], 1)
+        self.assertEqual(points[day]['started'], 1)
+
+    def test_soft_delete_retracts_rollups_on_commit(self):
+        """Test soft-deleting an instance and its task takes them out of the rollups."""
+        yesterday = self._yesterday_noon()
+        self._create_finished_instance(yesterday, task_hours=2)
+        deleted = self._create_finished_instance(yesterday, task_hours=30)
+        workflow_statistics_service.compact(days=1)
+        deleted.refresh_from_db()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            deleted.tasks.get().soft_delete(self.initiator)
+            deleted.soft_delete(self.initiator)
+
+        daily = WorkflowDailyStat.all_objects.get(day=timezone.localdate(yesterday))
+        self.assertEqual(daily.started_count, 1)
+        self.assertEqual(daily.approved_count, 1)
+        self.assertEqual(daily.duration_count, 1)
+        self.assertAlmostEqual(daily.duration_sum, 2 * 3600, delta=1)
+        node = WorkflowNodeDailyStat.all_objects.get(day=timezone.localdate(yesterday))
+        self.assertEqual(node.completed_count, 1)
+        self.assertEqual(node.sla_breach_count, 0)
+        self.assertEqual(sum(node.duration_sketch), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            deleted.soft_delete(self.initiator)
+        daily.refresh_from_db()
+        self.assertEqual(daily.approved_count, 1)
+
+    def test_rebuild_command_backfills_history(self):
+        """Test the rebuild command fills rollups for days before the compaction window."""
+        old = self._yesterday_noon() - timedelta(days=30)
+        self._create_finished_instance(old, task_hours=1)
+        out = StringIO()
+
+        call_command('rebuild_workflow_statistics', stdout=out)
+
+        daily = WorkflowDailyStat.all_objects.get(day=timezone.localdate(old))
+        self.assertEqual(daily.started_count, 1)
+        self.assertEqual(daily.approved_count, 1)
+        self.assertTrue(
+            WorkflowNodeDailyStat.all_objects.filter(day=timezone.localdate(old)).exists()
+        )
+        self.assertIn('2 rollup rows', out.getvalue())
+
+    def test_rollups_without_organization_are_unique(self):
+        """Test a second NULL-organization rollup for the same day is rejected."""
+        day = timezone.localdate()
+        WorkflowDailyStat.all_objects.create(definition=self.workflow_definition, day=day)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            WorkflowDailyStat.all_objects.create(definition=self.workflow_definition, day=day)
@@ -261,6 +261,10 @@ class WorkflowDefinitionViewSet(BaseModelViewSetWithBatch):
             workflow.published_by = request.user
             workflow.save()
 
+            # Store and validate the published graph once
+            from apps.workflows.models import WorkflowDefinitionVersion
+            WorkflowDefinitionVersion.capture(workflow)
+
             # Log publish
             from apps.workflows.models.workflow_operation_log import WorkflowOperationLog
             WorkflowOperationLog.log_publish(
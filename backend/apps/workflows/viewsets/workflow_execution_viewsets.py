@@ -8,10 +8,8 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.utils.translation import gettext_lazy as _
-from django.db.models import Count, Q, Avg, F, ExpressionWrapper, FloatField
+from django.db.models import Count, Q
 from django.utils import timezone
-from django.db.models.functions import TruncDay
-from django.db import models
 
 from apps.common.viewsets.base import BaseModelViewSetWithBatch
 from apps.common.responses.base import BaseResponse
@@ -33,6 +31,7 @@ from apps.workflows.serializers import (
 )
 from apps.workflows.filters.workflow_execution_filters import WorkflowTaskFilter
 from apps.workflows.services import WorkflowEngine
+from apps.workflows.services.workflow_statistics import workflow_statistics_service
 
 
 # === WorkflowInstance ViewSet ===
@@ -572,13 +571,18 @@ class WorkflowTaskViewSet(BaseModelViewSetWithBatch):
             queryset = queryset.filter(assignee=request.user)
 
         tasks_by_id = {str(task.id): task for task in queryset}
+        # One batch for all accessible tasks; outcomes follow task_ids order
+        outcomes = iter(WorkflowEngine().execute_tasks(
+            [tasks_by_id[str(task_id)] for task_id in task_ids if str(task_id) in tasks_by_id],
+            action=action,
+            actor=request.user,
+            comment=comment,
+        ))
         results = []
         succeeded = 0
-        engine = WorkflowEngine()
 
         for task_id in task_ids:
-            task = tasks_by_id.get(str(task_id))
-            if task is None:
+            if str(task_id) not in tasks_by_id:
                 results.append({
                     'id': str(task_id),
                     'success': False,
@@ -586,12 +590,7 @@ class WorkflowTaskViewSet(BaseModelViewSetWithBatch):
                 })
                 continue
 
-            success, instance, error = engine.execute_task(
-                task=task,
-                action=action,
-                actor=request.user,
-                comment=comment,
-            )
+            success, instance, error = next(outcomes)
             if success:
                 succeeded += 1
                 results.append({'id': str(task_id), 'success': True})
@@ -810,71 +809,33 @@ class WorkflowStatisticsViewSet(viewsets.ViewSet):
         """
         user = request.user
 
-        # Total instances count
-        total_instances = WorkflowInstance.objects.filter(
-            is_deleted=False
-        ).count()
-
-        # Pending instances
-        pending_instances = WorkflowInstance.objects.filter(
-            is_deleted=False,
-            status__in=[WorkflowInstance.STATUS_RUNNING, WorkflowInstance.STATUS_PENDING_APPROVAL]
-        ).count()
-
-        # Completed instances
-        completed_instances = WorkflowInstance.objects.filter(
-            is_deleted=False,
-            status=WorkflowInstance.STATUS_APPROVED
-        ).count()
-
-        # User's pending tasks
-        my_pending_tasks = WorkflowTask.objects.filter(
-            is_deleted=False,
-            assignee=user,
-            status='pending'
-        ).count()
-
-        # User's completed tasks
-        my_completed_tasks = WorkflowTask.objects.filter(
-            is_deleted=False,
-            assignee=user,
-            status__in=['approved', 'rejected']
-        ).count()
-
-        # User's overdue tasks
-        my_overdue_tasks = WorkflowTask.objects.filter(
-            is_deleted=False,
-            assignee=user,
-            status='pending',
-            due_date__lt=timezone.now()
-        ).count()
-
-        # Average completion time (calculated from instances)
-        completed_instances_qs = WorkflowInstance.objects.filter(
-            is_deleted=False,
-            status=WorkflowInstance.STATUS_APPROVED,
-            completed_at__isnull=False,
-            started_at__isnull=False
-        )
-
-        avg_duration = 0
-        if completed_instances_qs.exists():
-            total_seconds = 0
-            count = 0
-            for inst in completed_instances_qs:
-                if inst.completed_at and inst.started_at:
-                    delta = inst.completed_at - inst.started_at
-                    total_seconds += delta.total_seconds()
-                    count += 1
-            if count > 0:
-                avg_duration = total_seconds / count / 3600  # Convert to hours
-
-        # Instances by status
+        # Instances by status (one grouped query for all instance counts)
         instances_by_status = dict(
             WorkflowInstance.objects.filter(is_deleted=False).values('status').annotate(
                 count=Count('id')
             ).values_list('status', 'count')
         )
+        total_instances = sum(instances_by_status.values())
+        pending_instances = (
+            instances_by_status.get(WorkflowInstance.STATUS_RUNNING, 0)
+            + instances_by_status.get(WorkflowInstance.STATUS_PENDING_APPROVAL, 0)
+        )
+        completed_instances = instances_by_status.get(WorkflowInstance.STATUS_APPROVED, 0)
+
+        # User's pending, completed and overdue tasks
+        my_tasks = WorkflowTask.objects.filter(
+            is_deleted=False,
+            assignee=user,
+        ).aggregate(
+            pending=Count('id', filter=Q(status='pending')),
+            completed=Count('id', filter=Q(status__in=['approved', 'rejected'])),
+            overdue=Count('id', filter=Q(status='pending', due_date__lt=timezone.now())),
+        )
+        my_pending_tasks = my_tasks['pending']
+        my_overdue_tasks = my_tasks['overdue']
+
+        # Average completion time (from the daily rollups)
+        avg_duration = workflow_statistics_service.get_average_completion_hours()
 
         # Instances by definition
         instances_by_definition = dict(
@@ -889,12 +850,9 @@ class WorkflowStatisticsViewSet(viewsets.ViewSet):
             'total_instances': total_instances,
             'pending_instances': pending_instances,
             'completed_instances': completed_instances,
-            'rejected_instances': WorkflowInstance.objects.filter(
-                is_deleted=False,
-                status=WorkflowInstance.STATUS_REJECTED
-            ).count(),
+            'rejected_instances': instances_by_status.get(WorkflowInstance.STATUS_REJECTED, 0),
             'my_pending_tasks': my_pending_tasks,
-            'my_completed_tasks': my_completed_tasks,
+            'my_completed_tasks': my_tasks['completed'],
             'my_overdue_tasks': my_overdue_tasks,
             'average_completion_hours': round(avg_duration or 0, 2),
             'approval_rate': round(
@@ -921,59 +879,19 @@ class WorkflowStatisticsViewSet(viewsets.ViewSet):
         period_map = {'7d': 7, '14d': 14, '30d': 30}
         days = period_map.get(period_param, 7)
 
-        start_date = timezone.now() - timezone.timedelta(days=days)
-
-        # Group instances by date and status
-        started_by_day = dict(
-            WorkflowInstance.objects.filter(
-                is_deleted=False,
-                created_at__gte=start_date,
-            ).annotate(
-                day=TruncDay('created_at')
-            ).values('day').annotate(
-                count=Count('id')
-            ).values_list('day', 'count')
-        )
-
-        completed_by_day = dict(
-            WorkflowInstance.objects.filter(
-                is_deleted=False,
-                status=WorkflowInstance.STATUS_APPROVED,
-                completed_at__gte=start_date,
-            ).annotate(
-                day=TruncDay('completed_at')
-            ).values('day').annotate(
-                count=Count('id')
-            ).values_list('day', 'count')
-        )
+        start_day = timezone.localdate() - timezone.timedelta(days=days)
 
-        rejected_by_day = dict(
-            WorkflowInstance.objects.filter(
-                is_deleted=False,
-                status=WorkflowInstance.STATUS_REJECTED,
-                completed_at__gte=start_date,
-            ).annotate(
-                day=TruncDay('completed_at')
-            ).values('day').annotate(
-                count=Count('id')
-            ).values_list('day', 'count')
-        )
+        # Daily started/completed/rejected counts from the rollups
+        by_day = workflow_statistics_service.get_daily_trends(since=start_day)
 
         # Build daily data points
         trend_data = []
+        empty = {'started': 0, 'completed': 0, 'rejected': 0}
         for i in range(days):
-            day = (start_date + timezone.timedelta(days=i + 1)).date()
+            day = start_day + timezone.timedelta(days=i + 1)
             trend_data.append({
                 'date': day.isoformat(),
-                'started': started_by_day.get(
-                    timezone.datetime.combine(day, timezone.datetime.min.time(), tzinfo=timezone.get_current_timezone()), 0
-                ),
-                'completed': completed_by_day.get(
-                    timezone.datetime.combine(day, timezone.datetime.min.time(), tzinfo=timezone.get_current_timezone()), 0
-                ),
-                'rejected': rejected_by_day.get(
-                    timezone.datetime.combine(day, timezone.datetime.min.time(), tzinfo=timezone.get_current_timezone()), 0
-                ),
+                **by_day.get(day, empty),
             })
 
         return BaseResponse.success(data={
@@ -989,47 +907,34 @@ class WorkflowStatisticsViewSet(viewsets.ViewSet):
         GET /api/workflows/statistics/bottlenecks/
         Returns nodes sorted by average completion time (descending).
         """
-        # Calculate duration per completed task
-        completed_tasks = WorkflowTask.objects.filter(
-            is_deleted=False,
-            status__in=['approved', 'rejected'],
-            completed_at__isnull=False,
-            created_at__isnull=False,
-        ).values(
-            'node_name',
-            definition_name=F('instance__definition__name'),
-        ).annotate(
-            task_count=Count('id'),
-            avg_duration_seconds=Avg(
-                ExpressionWrapper(
-                    F('completed_at') - F('created_at'),
-                    output_field=models.DurationField(),
-                )
-            ),
-        ).order_by('-avg_duration_seconds')[:10]
-
-        bottleneck_list = []
-        for item in completed_tasks:
-            avg_secs = item['avg_duration_seconds'] or 0
-            if hasattr(avg_secs, 'total_seconds'):
-                avg_hours = avg_secs.total_seconds() / 3600
-            elif isinstance(avg_secs, (int, float)):
-                avg_hours = avg_secs / 3_600_000_000 if avg_secs > 86400 else avg_secs / 3600
-            else:
-                avg_hours = 0
+        # Completed task durations per node from the rollups
+        summaries = sorted(
+            workflow_statistics_service.get_node_summaries(),
+            key=lambda item: item['avg_duration_hours'],
+            reverse=True
+        )[:10]
 
-            # Get overdue count for this node
-            overdue_count = WorkflowTask.objects.filter(
+        # Overdue counts for all nodes in one grouped query
+        overdue_by_node = dict(
+            WorkflowTask.objects.filter(
                 is_deleted=False,
-                node_name=item['node_name'],
+                node_name__in={item['node_name'] for item in summaries},
                 status='pending',
                 due_date__lt=timezone.now(),
-            ).count()
+            ).values('node_name').annotate(
+                count=Count('id')
+            ).values_list('node_name', 'count')
+        )
+
+        bottleneck_list = []
+        for item in summaries:
+            overdue_count = overdue_by_node.get(item['node_name'], 0)
 
             bottleneck_list.append({
                 'node_name': item['node_name'],
-                'definition_name': item['definition_name'],
-                'avg_duration_hours': round(abs(avg_hours), 1),
+                'definition_name': item['workflow_name'],
+                'avg_duration_hours': round(item['avg_duration_hours'], 1),
+                'p90_duration_hours': round(item['p90_duration_hours'], 1),
                 'task_count': item['task_count'],
                 'overdue_count': overdue_count,
                 'overdue_rate': round(
@@ -1051,37 +956,32 @@ class WorkflowStatisticsViewSet(viewsets.ViewSet):
             is_active=True,
         )
 
+        # Instance counts per definition and status in one grouped query
+        counts = {}
+        for definition_id, instance_status, count in WorkflowInstance.objects.filter(
+            is_deleted=False,
+            definition__in=definitions,
+        ).values('definition_id', 'status').annotate(
+            count=Count('id')
+        ).values_list('definition_id', 'status', 'count'):
+            counts.setdefault(definition_id, {})[instance_status] = count
+
+        # Average completion hours from the rollups
+        completion_hours = workflow_statistics_service.get_completion_hours()
+
         perf_data = []
         for defn in definitions:
-            instances = WorkflowInstance.objects.filter(
-                is_deleted=False,
-                definition=defn,
-            )
-            total = instances.count()
+            by_status = counts.get(defn.id, {})
+            total = sum(by_status.values())
             if total == 0:
                 continue
 
-            approved = instances.filter(status=WorkflowInstance.STATUS_APPROVED).count()
-            rejected = instances.filter(status=WorkflowInstance.STATUS_REJECTED).count()
-            running = instances.filter(
-                status__in=[WorkflowInstance.STATUS_RUNNING, WorkflowInstance.STATUS_PENDING_APPROVAL]
-            ).count()
-
-            # Calculate average completion hours
-            completed_qs = instances.filter(
-                status=WorkflowInstance.STATUS_APPROVED,
-                completed_at__isnull=False,
-                started_at__isnull=False,
+            approved = by_status.get(WorkflowInstance.STATUS_APPROVED, 0)
+            rejected = by_status.get(WorkflowInstance.STATUS_REJECTED, 0)
+            running = (
+                by_status.get(WorkflowInstance.STATUS_RUNNING, 0)
+                + by_status.get(WorkflowInstance.STATUS_PENDING_APPROVAL, 0)
             )
-            avg_hours = 0
-            completed_count = completed_qs.count()
-            if completed_count > 0:
-                total_secs = sum(
-                    (i.completed_at - i.started_at).total_seconds()
-                    for i in completed_qs
-                    if i.completed_at and i.started_at
-                )
-                avg_hours = total_secs / completed_count / 3600
 
             perf_data.append({
                 'definition_name': defn.name,
@@ -1091,7 +991,7 @@ class WorkflowStatisticsViewSet(viewsets.ViewSet):
                 'rejected': rejected,
                 'running': running,
                 'approval_rate': round((approved / total * 100) if total > 0 else 0, 1),
-                'avg_completion_hours': round(avg_hours, 1),
+                'avg_completion_hours': round(completion_hours.get(defn.id, 0), 1),
             })
 
         return BaseResponse.success(data={'definitions': perf_data})
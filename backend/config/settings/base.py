@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 import dj_database_url
+from celery.schedules import crontab
 
 # Build paths
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -264,8 +265,16 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'apps.search.tasks.sync_all_assets_to_search_index',
         'schedule': 60 * 60,
     },
+    'compact-workflow-statistics-daily': {
+        'task': 'apps.workflows.tasks.compact_workflow_statistics_task',
+        # Off-peak, after midnight so the previous day is finished
+        'schedule': crontab(hour=2, minute=30),
+    },
 }
 
+# Finished days rebuilt from raw rows by the nightly workflow statistics compaction
+WORKFLOW_STATISTICS_COMPACT_DAYS = int(os.getenv('WORKFLOW_STATISTICS_COMPACT_DAYS', '7'))
+
 # Search Configuration
 ELASTICSEARCH = {
     'enabled': os.getenv('ELASTICSEARCH_ENABLED', 'False').lower() == 'true',